@@ -1,13 +1,18 @@
 """Analyze @lhtsports Polymarket trading data."""
 
 import json
-import time
-import urllib.request
+import sys
 import urllib.error
+import urllib.request
 from collections import defaultdict
 from datetime import datetime, timezone
+from pathlib import Path
 from statistics import mean, median
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.connectors.rate_limit import get_rate_limiter, parse_retry_after  # noqa: E402
+
 BASE_URL = "https://data-api.polymarket.com/activity"
 USER = "0xa6a856a8c8a7f14fd9be6ae11c367c7cbb755009"
 LIMIT = 50
@@ -22,12 +27,18 @@ HEADERS = {
 def fetch_trades(offset: int) -> list[dict]:
     """Fetch trades at given offset."""
     url = f"{BASE_URL}?user={USER}&limit={LIMIT}&offset={offset}"
+    limiter = get_rate_limiter(BASE_URL)
     try:
+        limiter.acquire()
         req = urllib.request.Request(url, headers=HEADERS)
         with urllib.request.urlopen(req, timeout=30) as resp:
+            limiter.on_response(resp.status)
             data = json.loads(resp.read().decode())
             return data if isinstance(data, list) else []
     except Exception as e:
+        # 429 は limiter が Retry-After/指数 backoff で次の acquire を待たせる
+        if isinstance(e, urllib.error.HTTPError) and e.code == 429:
+            limiter.on_response(429, parse_retry_after(e.headers.get("Retry-After")))
         print(f"  Error at offset {offset}: {e}")
         return []
 
@@ -48,7 +59,6 @@ def collect_all_trades() -> list[dict]:
         empty_count = 0
         all_trades.extend(trades)
         offset += LIMIT
-        time.sleep(0.3)  # Rate limiting
 
         # Progress
         if offset % 500 == 0:
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark: SQLite connect cost before/after the migrate-once schema manager.
+
+Usage:
+    python scripts/bench_db_connect.py
+    python scripts/bench_db_connect.py --signals 100000 --iterations 200
+
+Builds a throwaway DB with N signals, then times
+- legacy: sqlite3.connect + full DDL / _ensure_* pass on every open
+- current: src.store.schema._connect (PRAGMA user_version check only)
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.store.schema import _connect, _migrate  # noqa: E402
+
+
+def _seed(db_path: Path, n_signals: int) -> None:
+    conn = _connect(db_path)
+    now = datetime.now(timezone.utc).isoformat()
+    rows = [
+        (
+            f"Game {i}",
+            f"nba-aaa-bbb-{i}",
+            "Team",
+            "BUY",
+            0.45,
+            0.5,
+            5.0,
+            10.0,
+            f"tok{i}",
+            now,
+        )
+        for i in range(n_signals)
+    ]
+    conn.executemany(
+        """INSERT INTO signals
+           (game_title, event_slug, team, side, poly_price, book_prob,
+            edge_pct, kelly_size, token_id, created_at)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+def _legacy_connect(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+    _migrate(conn)
+    return conn
+
+
+def _time(fn, db_path: Path, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        conn = fn(db_path)
+        conn.execute("SELECT COUNT(*) FROM trade_jobs").fetchone()
+        conn.close()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark SQLite connect cost")
+    parser.add_argument("--signals", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        print(f"Seeding {args.signals:,} signals ...")
+        _seed(db_path, args.signals)
+
+        legacy_ms = _time(_legacy_connect, db_path, args.iterations)
+        current_ms = _time(_connect, db_path, args.iterations)
+
+    print(f"{'path':<10} {'ms/connect':>12}")
+    print(f"{'legacy':<10} {legacy_ms:>12.3f}")
+    print(f"{'current':<10} {current_ms:>12.3f}")
+    if current_ms > 0:
+        print(f"speedup: {legacy_ms / current_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Benchmark: one-shot httpx.get vs the shared pooled client.
+
+Usage:
+    python scripts/bench_http_client.py
+    python scripts/bench_http_client.py --requests-per-tick 40 --ticks 20 --latency-ms 20
+
+Starts a local HTTP/1.1 stand-in server (keep-alive capable) and replays a
+tick's worth of GETs (Gamma events + schedule + books) via
+- one-shot: httpx.get per request (new TCP connection every time)
+- pooled: src.connectors.http_client.http_get (keep-alive reuse)
+
+--latency-ms adds a per-accept delay to approximate the RTT of the TCP
+handshake (real endpoints also add a TLS handshake, so savings are larger).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.connectors.http_client import close_http_clients, http_get  # noqa: E402
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = 64 * 1024  # ヘッダと本文を 1 write に (Nagle/delayed-ACK 回避)
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = b'[{"slug": "nba-nyk-bos-2026-02-08", "markets": []}]'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class _SlowAcceptServer(ThreadingHTTPServer):
+    daemon_threads = True
+    accept_delay = 0.0
+
+    def get_request(self):
+        conn = super().get_request()
+        if self.accept_delay:
+            time.sleep(self.accept_delay)
+        return conn
+
+
+def _run_tick(get, base: str, n: int) -> None:
+    for i in range(n):
+        resp = get(f"{base}/events?slug=game-{i}", timeout=10)
+        resp.raise_for_status()
+
+
+def _time(get, base: str, n: int, ticks: int) -> float:
+    start = time.perf_counter()
+    for _ in range(ticks):
+        _run_tick(get, base, n)
+    return (time.perf_counter() - start) / ticks * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs one-shot HTTP")
+    parser.add_argument("--requests-per-tick", type=int, default=30)
+    parser.add_argument("--ticks", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    server = _SlowAcceptServer(("127.0.0.1", 0), _Handler)
+    server.accept_delay = args.latency_ms / 1000
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    base = f"http://{host}:{port}"
+
+    try:
+        oneshot_ms = _time(httpx.get, base, args.requests_per_tick, args.ticks)
+        pooled_ms = _time(http_get, base, args.requests_per_tick, args.ticks)
+    finally:
+        close_http_clients()
+        server.shutdown()
+        server.server_close()
+
+    print(f"{args.requests_per_tick} requests/tick, {args.ticks} ticks, "
+          f"handshake latency {args.latency_ms:.1f} ms")
+    print(f"{'path':<10} {'ms/tick':>10}")
+    print(f"{'one-shot':<10} {oneshot_ms:>10.1f}")
+    print(f"{'pooled':<10} {pooled_ms:>10.1f}")
+    if pooled_ms > 0:
+        print(f"saved: {oneshot_ms - pooled_ms:.1f} ms/tick ({oneshot_ms / pooled_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
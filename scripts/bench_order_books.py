@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Benchmark: order-book fetch for N tokens (serial vs concurrent vs bulk).
+
+Usage:
+    python scripts/bench_order_books.py
+    python scripts/bench_order_books.py --tokens 30 --latency-ms 80 --concurrency 8
+
+Starts a local stand-in CLOB (GET /book, POST /books) that sleeps
+--latency-ms per request to mimic the network round trip, then times
+- serial: one /book call per token (previous implementation)
+- concurrent: per-token /book on the bounded thread pool (bulk disabled)
+- bulk: fetch_order_books_batch via POST /books
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import settings  # noqa: E402
+from src.connectors import polymarket  # noqa: E402
+from src.connectors.http_client import close_http_clients  # noqa: E402
+
+
+def _book(tid: str) -> dict:
+    return {
+        "asset_id": tid,
+        "asks": [{"price": "0.42", "size": "120"}, {"price": "0.45", "size": "300"}],
+        "bids": [{"price": "0.40", "size": "80"}],
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = 64 * 1024
+    latency = 0.0
+    bulk_enabled = True
+
+    def _send(self, status: int, payload) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        time.sleep(self.latency)
+        tid = parse_qs(urlsplit(self.path).query).get("token_id", [""])[0]
+        self._send(200, _book(tid))
+
+    def do_POST(self) -> None:  # noqa: N802
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        time.sleep(self.latency)
+        if not _Handler.bulk_enabled:
+            self._send(404, {"error": "not found"})
+            return
+        self._send(200, [_book(p["token_id"]) for p in json.loads(body)])
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _serial(token_ids: list[str]) -> dict[str, dict]:
+    results = {}
+    for tid in token_ids:
+        book = polymarket.fetch_order_book_safe(tid)
+        if book is not None:
+            results[tid] = book
+    return results
+
+
+def _time(fn, token_ids: list[str], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        books = fn(token_ids)
+        assert len(books) == len(token_ids)
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark order-book batch fetching")
+    parser.add_argument("--tokens", type=int, default=30)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    _Handler.latency = args.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+
+    settings.polymarket_host = f"http://{host}:{port}"
+    settings.http_proxy = ""
+    settings.order_book_fetch_concurrency = args.concurrency
+    settings.http_max_connections_per_host = max(args.concurrency, 10)
+    settings.clob_requests_per_sec = 1000.0
+    settings.clob_request_burst = 1000
+
+    token_ids = [f"tok{i}" for i in range(args.tokens)]
+    try:
+        serial_ms = _time(_serial, token_ids, args.rounds)
+        _Handler.bulk_enabled = False
+        concurrent_ms = _time(polymarket.fetch_order_books_batch, token_ids, args.rounds)
+        _Handler.bulk_enabled = True
+        bulk_ms = _time(polymarket.fetch_order_books_batch, token_ids, args.rounds)
+    finally:
+        close_http_clients()
+        server.shutdown()
+        server.server_close()
+
+    print(f"{args.tokens} tokens, {args.latency_ms:.0f} ms/request, "
+          f"concurrency {args.concurrency}")
+    print(f"{'path':<12} {'ms/batch':>10}")
+    print(f"{'serial':<12} {serial_ms:>10.1f}")
+    print(f"{'concurrent':<12} {concurrent_ms:>10.1f}")
+    print(f"{'bulk':<12} {bulk_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
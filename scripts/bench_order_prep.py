@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Benchmark: decision-to-ack latency with and without pre-resolved order templates.
+
+Usage:
+    python scripts/bench_order_prep.py
+    python scripts/bench_order_prep.py --latency-ms 80 --orders 20
+
+Starts a local stand-in CLOB (GET /tick-size, /neg-risk, /fee-rate and
+POST /order) that sleeps --latency-ms per request, then times one order per
+token from the call to the POST response:
+- sdk: create_and_post_order on a fresh client (previous implementation;
+  every tick process starts with empty SDK caches)
+- cold: place_limit_buy with no template (resolve + sign + post)
+- warm: place_limit_buy after prepare_order_templates (sign + post only)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import settings  # noqa: E402
+from src.connectors import order_prep, polymarket  # noqa: E402
+
+KEY = "0x" + "11" * 32
+TOKEN_BASE = 10**20
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = 0.0
+
+    def _send(self, payload) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        time.sleep(self.latency)
+        path = self.path.split("?")[0]
+        if path == "/tick-size":
+            self._send({"minimum_tick_size": 0.01})
+        elif path == "/neg-risk":
+            self._send({"neg_risk": False})
+        else:
+            self._send({"base_fee": 0})
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        time.sleep(self.latency)
+        self._send({"success": True, "orderID": "0xabc", "status": "live"})
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _client():
+    from py_clob_client.client import ClobClient
+    from py_clob_client.clob_types import ApiCreds
+
+    client = ClobClient(settings.polymarket_host, key=KEY, chain_id=137)
+    client.set_api_creds(ApiCreds("key", "c2VjcmV0", "pass"))
+    return client
+
+
+def _sdk(token_id: str) -> float:
+    from py_clob_client.clob_types import OrderArgs
+    from py_clob_client.order_builder.constants import BUY
+
+    client = _client()
+    start = time.perf_counter()
+    client.create_and_post_order(OrderArgs(token_id=token_id, price=0.41, size=24.39, side=BUY))
+    return (time.perf_counter() - start) * 1000
+
+
+def _ours(token_id: str) -> float:
+    start = time.perf_counter()
+    polymarket.place_limit_buy(token_id, 0.41, 10.0)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark order preparation latency")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--orders", type=int, default=10)
+    args = parser.parse_args()
+
+    _Handler.latency = args.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+
+    settings.polymarket_host = f"http://{host}:{port}"
+    settings.polymarket_private_key = KEY
+    settings.http_proxy = ""
+    settings.clob_creds_cache_path = ""
+    settings.clob_requests_per_sec = 1000.0
+    settings.clob_request_burst = 1000
+    settings.order_prep_cache_path = str(Path(tempfile.mkdtemp()) / "order_templates.json")
+    polymarket._clob_clients[True] = _client()
+
+    tokens = [str(TOKEN_BASE + i) for i in range(args.orders)]
+    try:
+        sdk = [_sdk(t) for t in tokens]
+        cold = [_ours(t) for t in tokens]
+        # 窓が開く前の準備に相当 (計測外)
+        order_prep.cache.invalidate()
+        polymarket.prepare_order_templates(tokens)
+        warm = [_ours(t) for t in tokens]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"{args.orders} orders, {args.latency_ms:.0f} ms/request")
+    print(f"{'path':<8} {'p50 ms':>8} {'max ms':>8}")
+    for name, samples in (("sdk", sdk), ("cold", cold), ("warm", warm)):
+        print(f"{name:<8} {statistics.median(samples):>8.1f} {max(samples):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Build the precomputed calibration curve artifact (knots + dense lookup grid).
+
+Usage:
+    python scripts/build_calibration_artifact.py
+    python scripts/build_calibration_artifact.py --confidence 0.90 --step 0.001
+    python scripts/build_calibration_artifact.py --out data/calibration_curve.json
+    python scripts/build_calibration_artifact.py --if-stale   # cron_schedule.sh
+
+Fits the default curve from NBA_ML_CALIBRATION (needs SciPy), tabulates it
+on the --step price grid and writes it where ``get_default_curve`` looks
+(``calibration_artifact_path``), so scan processes load it with NumPy only.
+Rerun after changing the band table, ``calibration_confidence_level`` or
+``calibration_lookup_step`` — a stale artifact is ignored (source hash) and
+every process falls back to fitting at runtime. ``--if-stale`` keeps a
+valid artifact (only refreshing its mtime, which cron_schedule.sh compares
+against the inputs) and rebuilds it otherwise.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import settings  # noqa: E402
+from src.strategy.calibration import NBA_ML_CALIBRATION  # noqa: E402
+from src.strategy.calibration_curve import (  # noqa: E402
+    ContinuousCalibration,
+    load_artifact,
+    save_artifact,
+    source_hash,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build calibration curve artifact")
+    parser.add_argument(
+        "--confidence", type=float, default=settings.calibration_confidence_level,
+    )
+    parser.add_argument("--step", type=float, default=settings.calibration_lookup_step)
+    parser.add_argument("--out", type=Path, default=Path(settings.calibration_artifact_path))
+    parser.add_argument(
+        "--if-stale", action="store_true", help="Rebuild only if missing, corrupt or stale",
+    )
+    args = parser.parse_args()
+    if args.step <= 0:
+        parser.error("--step must be positive")
+
+    source = source_hash(NBA_ML_CALIBRATION, args.confidence, args.step)
+    if args.if_stale and load_artifact(args.out, source=source) is not None:
+        os.utime(args.out)
+        print(f"{args.out} is up to date")
+        return
+
+    t0 = time.perf_counter()
+    curve = ContinuousCalibration.from_bands(NBA_ML_CALIBRATION, args.confidence)
+    curve.compile(args.step)
+    fit_ms = (time.perf_counter() - t0) * 1000
+
+    path = save_artifact(curve, args.out, source)
+
+    t0 = time.perf_counter()
+    loaded = load_artifact(path, source=source)
+    load_ms = (time.perf_counter() - t0) * 1000
+    if loaded is None:
+        sys.exit(f"Artifact {path} failed to load back")
+
+    print(f"Wrote {path} ({path.stat().st_size / 1024:.0f} KiB)")
+    print(f"  knots:       {len(curve.knot_prices)}")
+    print(f"  grid:        step {args.step:g}, {len(loaded._grid_rows[0])} points")
+    print(f"  confidence:  {args.confidence}")
+    print(f"  source hash: {source[:16]}")
+    print(f"  fit+compile: {fit_ms:.1f} ms, load: {load_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
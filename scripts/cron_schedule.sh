@@ -8,10 +8,21 @@
 # - 実行窓外: NBA API + DB チェック (~3秒) で早期終了
 #
 # Logs to data/logs/scheduler-YYYY-MM-DD.log
+#
+# 引数はそのまま schedule_trades.py に渡す。`cron_schedule.sh --daemon` は常駐プロセスとして
+# 起動し (launchd/com.nbabot.scheduler-daemon.plist)、同じロックで 15 分 cron と排他になる。
+# daemon のログは起動日のファイルに追記される。
 
 set -euo pipefail
 
-LOCKDIR="/tmp/nbabot-scheduler.lock"
+# ジョブ単位の排他は trade_jobs のリース (claimed_by / lease_expires_at) が担う。
+# このロックは同一ワーカーの多重起動防止のみ — SCHEDULER_WORKER_ID を変えれば
+# 複数ワーカーを並行起動できる (同じ DB を共有してジョブを分担)。
+# リースされるのはジョブ実行だけ: MERGE / 決済 / PositionGroup / リスク snapshot・通知 /
+# order manager は SCHEDULER_PRIMARY_WORKER=true の 1 ワーカーだけで実行し、
+# 他のワーカーは SCHEDULER_PRIMARY_WORKER=false で起動すること。
+# MAX_ORDERS_PER_TICK はワーカーごとの上限 (全体では ワーカー数 × 上限)。
+LOCKDIR="/tmp/nbabot-scheduler${SCHEDULER_WORKER_ID:+-${SCHEDULER_WORKER_ID}}.lock"
 
 # 多重起動防止 (mkdir はアトミック — macOS/Linux 両対応)
 if ! mkdir "$LOCKDIR" 2>/dev/null; then
@@ -34,6 +45,20 @@ LOG_FILE="${LOG_DIR}/scheduler-${DATE}.log"
 # ログローテーション (30日超ファイル削除)
 find "$LOG_DIR" -name "scheduler-*.log" -mtime +30 -delete 2>/dev/null || true
 
+# 既定の校正カーブを事前計算アーティファクトから読めるように (起動ごとの SciPy フィットを回避)。
+# 無いか入力 (校正テーブル / カーブ実装 / .env) より古いときだけ確認・再生成する。
+# パスは settings から解決する (環境変数だけでなく .env の CALIBRATION_ARTIFACT_PATH も反映)
+ARTIFACT="$("$PYTHON" -c 'from src.config import settings; print(settings.calibration_artifact_path)' \
+    2>> "$LOG_FILE" || true)"
+ARTIFACT="${ARTIFACT:-data/calibration_curve.json}"
+if [ ! -f "$ARTIFACT" ] \
+    || [ src/strategy/calibration.py -nt "$ARTIFACT" ] \
+    || [ src/strategy/calibration_curve.py -nt "$ARTIFACT" ] \
+    || [ .env -nt "$ARTIFACT" ]; then
+    "$PYTHON" "${PROJECT_DIR}/scripts/build_calibration_artifact.py" --if-stale >> "$LOG_FILE" 2>&1 \
+        || echo "$(date -u +%FT%TZ) calibration artifact build failed" >> "$LOG_FILE"
+fi
+
 # caffeinate -i: スクリプト実行中の macOS idle sleep を防止
 # (プロセス終了時に自動解除 — バッテリ影響は最小)
-caffeinate -i "$PYTHON" "${PROJECT_DIR}/scripts/schedule_trades.py" >> "$LOG_FILE" 2>&1
+caffeinate -i "$PYTHON" "${PROJECT_DIR}/scripts/schedule_trades.py" "$@" >> "$LOG_FILE" 2>&1
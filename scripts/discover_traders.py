@@ -16,11 +16,15 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-import time
+import urllib.error
 import urllib.parse
 import urllib.request
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.connectors.rate_limit import get_rate_limiter, parse_retry_after  # noqa: E402
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 TRADERS_DIR = PROJECT_ROOT / "data" / "traders"
 REGISTRY_PATH = TRADERS_DIR / "registry.json"
@@ -35,7 +39,6 @@ HEADERS = {
     "Accept": "application/json",
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
 }
-SLEEP_SEC = 0.5
 
 
 def fetch_leaderboard(
@@ -53,11 +56,20 @@ def fetch_leaderboard(
     }
     qs = urllib.parse.urlencode(params)
     url = f"{LEADERBOARD_URL}?{qs}"
+    # リクエスト間隔は data-api 共有の rate limiter で制御
+    limiter = get_rate_limiter(LEADERBOARD_URL)
     try:
+        limiter.acquire()
         req = urllib.request.Request(url, headers=HEADERS)
         with urllib.request.urlopen(req, timeout=30) as resp:
+            limiter.on_response(resp.status)
             data = json.loads(resp.read().decode())
             return data if isinstance(data, list) else []
+    except urllib.error.HTTPError as e:
+        if e.code == 429:
+            limiter.on_response(429, parse_retry_after(e.headers.get("Retry-After")))
+        print(f"  Error fetching {category}/{time_period}: {e}", file=sys.stderr)
+        return []
     except Exception as e:
         print(f"  Error fetching {category}/{time_period}: {e}", file=sys.stderr)
         return []
@@ -113,8 +125,6 @@ def discover(
                 if entry_vol > t["volume"]:
                     t["volume"] = entry_vol
 
-            time.sleep(SLEEP_SEC)
-
     # persistent_winner: ALL と MONTH の両方に登場
     for wallet, t in traders.items():
         rank_keys = set(t["ranks"].keys())
@@ -22,17 +22,20 @@ Usage:
 import argparse
 import json
 import sys
-import time
+import urllib.error
 import urllib.parse
 import urllib.request
 from pathlib import Path
 from typing import Optional, Union
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.connectors.rate_limit import get_rate_limiter, parse_retry_after  # noqa: E402
+
 BASE_URL = "https://data-api.polymarket.com/activity"
 USER = "0xa6a856a8c8a7f14fd9be6ae11c367c7cbb755009"
 LIMIT = 500  # API max per request (docs: 0 <= limit <= 500)
 MAX_OFFSET = 10000  # API cap; we stop when empty or offset hits this
-SLEEP_SEC = 0.4  # Rate limiting
 
 HEADERS = {
     "Accept": "application/json",
@@ -52,12 +55,18 @@ def fetch_page(offset: int, end_ts: Optional[int] = None) -> list[dict]:
         params["end"] = end_ts
     qs = urllib.parse.urlencode(params)
     url = f"{BASE_URL}?{qs}"
+    limiter = get_rate_limiter(BASE_URL)
     try:
+        limiter.acquire()
         req = urllib.request.Request(url, headers=HEADERS)
         with urllib.request.urlopen(req, timeout=45) as resp:
+            limiter.on_response(resp.status)
             data = json.loads(resp.read().decode())
             return data if isinstance(data, list) else []
     except Exception as e:
+        # 429 は limiter が Retry-After/指数 backoff で次の acquire を待たせる
+        if isinstance(e, urllib.error.HTTPError) and e.code == 429:
+            limiter.on_response(429, parse_retry_after(e.headers.get("Retry-After")))
         print(f"  Error offset={offset} end={end_ts}: {e}", file=sys.stderr)
         return []
 
@@ -73,12 +82,10 @@ def fetch_batch(end_ts: Optional[int] = None, max_items: int = 3500) -> list[dic
         if not page:
             empty_streak += 1
             offset += LIMIT
-            time.sleep(SLEEP_SEC)
             continue
         empty_streak = 0
         batch.extend(page)
         offset += LIMIT
-        time.sleep(SLEEP_SEC)
         if len(batch) >= max_items:
             break
         if len(page) < LIMIT:
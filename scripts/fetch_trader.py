@@ -16,11 +16,16 @@ import argparse
 import json
 import sys
 import time
+import urllib.error
 import urllib.parse
 import urllib.request
 from pathlib import Path
 from typing import Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.connectors.rate_limit import get_rate_limiter, parse_retry_after  # noqa: E402
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 TRADERS_DIR = PROJECT_ROOT / "data" / "traders"
 REGISTRY_PATH = TRADERS_DIR / "registry.json"
@@ -28,7 +33,7 @@ REGISTRY_PATH = TRADERS_DIR / "registry.json"
 BASE_URL = "https://data-api.polymarket.com/activity"
 LIMIT = 500
 MAX_OFFSET = 3000  # API は offset>3000 で 400 を返すため
-SLEEP_SEC = 0.4
+# リクエスト間隔は data-api 共有の rate limiter (data_api_requests_per_sec) で制御
 
 HEADERS = {
     "Accept": "application/json",
@@ -62,21 +67,29 @@ def fetch_page(
     qs = urllib.parse.urlencode(params)
     url = f"{BASE_URL}?{qs}"
 
+    limiter = get_rate_limiter(BASE_URL)
     for attempt in range(MAX_RETRIES):
         try:
+            limiter.acquire()
             req = urllib.request.Request(url, headers=HEADERS)
             with urllib.request.urlopen(req, timeout=45) as resp:
+                limiter.on_response(resp.status)
                 data = json.loads(resp.read().decode())
                 return data if isinstance(data, list) else []
         except Exception as e:
-            wait = RETRY_BASE_SEC * (2**attempt)
+            # 429 は limiter が Retry-After/指数 backoff で次の acquire を待たせる
+            throttled = isinstance(e, urllib.error.HTTPError) and e.code == 429
+            if throttled:
+                limiter.on_response(429, parse_retry_after(e.headers.get("Retry-After")))
+            wait = 0.0 if throttled else RETRY_BASE_SEC * (2**attempt)
             if attempt < MAX_RETRIES - 1:
                 print(
                     f"  Retry {attempt + 1}/{MAX_RETRIES} type={activity_type} "
                     f"offset={offset}: {e} (wait {wait:.0f}s)",
                     file=sys.stderr,
                 )
-                time.sleep(wait)
+                if wait:
+                    time.sleep(wait)
             else:
                 print(
                     f"  Failed after {MAX_RETRIES} retries type={activity_type} "
@@ -132,12 +145,10 @@ def fetch_all_for_type(
             if not page:
                 empty_streak += 1
                 offset += LIMIT
-                time.sleep(SLEEP_SEC)
                 continue
             empty_streak = 0
             batch.extend(page)
             offset += LIMIT
-            time.sleep(SLEEP_SEC)
             if len(page) < LIMIT:
                 last_page_complete = False  # ページが不完全 = データ終端
                 break
@@ -1,7 +1,8 @@
 #!/bin/bash
 # Install nbabot launchd jobs (idempotent).
 #
-# Usage: bash scripts/install_launchd.sh
+# Usage: bash scripts/install_launchd.sh            # 15 分 cron の scheduler
+#        bash scripts/install_launchd.sh --daemon   # 常駐 scheduler daemon
 #
 # Actions:
 #   1. Unload existing jobs (if any)
@@ -15,8 +16,15 @@ PROJECT_DIR="$(cd "$(dirname "$0")/.." && pwd)"
 LAUNCH_AGENTS_DIR="$HOME/Library/LaunchAgents"
 DOMAIN="gui/$(id -u)"
 
+SCHEDULER_LABEL="com.nbabot.scheduler"
+OTHER_SCHEDULER_LABEL="com.nbabot.scheduler-daemon"
+if [ "${1:-}" = "--daemon" ]; then
+    SCHEDULER_LABEL="com.nbabot.scheduler-daemon"
+    OTHER_SCHEDULER_LABEL="com.nbabot.scheduler"
+fi
+
 PLISTS=(
-    "com.nbabot.scheduler"
+    "$SCHEDULER_LABEL"
     "com.nbabot.ordermgr"
     "com.nbabot.watchdog"
 )
@@ -27,6 +35,10 @@ echo ""
 
 mkdir -p "$LAUNCH_AGENTS_DIR"
 
+# cron 版と daemon 版は排他 — もう一方はアンロードして削除
+launchctl bootout "${DOMAIN}/${OTHER_SCHEDULER_LABEL}" 2>/dev/null || true
+rm -f "${LAUNCH_AGENTS_DIR}/${OTHER_SCHEDULER_LABEL}.plist"
+
 for label in "${PLISTS[@]}"; do
     plist_src="${PROJECT_DIR}/launchd/${label}.plist"
     plist_dst="${LAUNCH_AGENTS_DIR}/${label}.plist"
@@ -64,4 +76,4 @@ fi
 echo ""
 echo "=== Done ==="
 echo "Verify with: launchctl list | grep nbabot"
-echo "Kick start:  launchctl kickstart ${DOMAIN}/com.nbabot.scheduler"
+echo "Kick start:  launchctl kickstart ${DOMAIN}/${SCHEDULER_LABEL}"
@@ -66,6 +66,12 @@ def main() -> None:
         except Exception:
             log.debug("Telegram notification failed", exc_info=True)
 
+    from src.connectors.order_prep import log_order_latency_stats
+    from src.connectors.rate_limit import log_rate_limit_stats
+
+    log_rate_limit_stats()
+    log_order_latency_stats()
+
     # Heartbeat (watchdog 死活監視用)
     heartbeat = Path(__file__).resolve().parent.parent / "data" / "heartbeat_ordermgr"
     heartbeat.parent.mkdir(parents=True, exist_ok=True)
@@ -539,13 +539,18 @@ def main():
     print("\n完了。")
 
 
-def walk_forward_mode(train_months: int = 6, test_months: int = 2, step_months: int = 1):
+def walk_forward_mode(
+    train_months: int = 6,
+    test_months: int = 2,
+    step_months: int = 1,
+    workers: int | None = None,
+):
     """Walk-forward split mode (Phase M2): time-series separated validation."""
     import sys
     sys.path.insert(0, str(PROJECT_ROOT))
 
     from src.strategy.calibration_builder import (
-        evaluate_split,
+        evaluate_walk_forward,
         walk_forward_split,
     )
 
@@ -582,11 +587,9 @@ def walk_forward_mode(train_months: int = 6, test_months: int = 2, step_months:
     print(f"   {'-'*2}-+-{'-'*21}-+-{'-'*28}-+-"
           f"{'-'*5}-+-{'-'*10}-+-{'-'*10}-+-{'-'*8}-+-{'-'*6}")
 
-    all_results = []
-    for i, (train_result, test_conds) in enumerate(splits, 1):
-        ev = evaluate_split(train_result, test_conds)
-        all_results.append(ev)
-
+    # 各ウィンドウの評価はプロセスプールで並列実行
+    all_results = evaluate_walk_forward(splits, workers=workers)
+    for i, ((train_result, _), ev) in enumerate(zip(splits, all_results), 1):
         train_label = f"{train_result.train_start}..{train_result.train_end}"
         print(
             f"   {i:>2} | {train_label:>21} | {ev['period']:>28} | "
@@ -698,14 +701,14 @@ def continuous_walk_forward_mode(
     test_months: int = 2,
     step_months: int = 1,
     confidence_level: float = 0.90,
+    workers: int | None = None,
 ):
     """Walk-forward with continuous curve comparison (Phase Q + M2)."""
     import sys
     sys.path.insert(0, str(PROJECT_ROOT))
 
     from src.strategy.calibration_builder import (
-        evaluate_split,
-        evaluate_split_continuous,
+        evaluate_walk_forward,
         walk_forward_split,
     )
 
@@ -732,14 +735,11 @@ def continuous_walk_forward_mode(
     print(f"   {'#':>2} | {'Period':>28} | {'D_Gap%':>7} | {'C_Gap%':>7} | {'Improved':>8}")
     print(f"   {'-'*2}-+-{'-'*28}-+-{'-'*7}-+-{'-'*7}-+-{'-'*8}")
 
-    d_results = []
-    c_results = []
-    for i, (train_result, test_conds) in enumerate(splits, 1):
-        d_ev = evaluate_split(train_result, test_conds)
-        c_ev = evaluate_split_continuous(train_result, test_conds, confidence_level)
-        d_results.append(d_ev)
-        c_results.append(c_ev)
-
+    d_results = evaluate_walk_forward(splits, workers=workers)
+    c_results = evaluate_walk_forward(
+        splits, method="continuous", confidence_level=confidence_level, workers=workers,
+    )
+    for i, (d_ev, c_ev) in enumerate(zip(d_results, c_results), 1):
         improved = "YES" if abs(c_ev["gap_pct"]) < abs(d_ev["gap_pct"]) else "no"
         print(
             f"   {i:>2} | {d_ev['period']:>28} | "
@@ -768,15 +768,20 @@ if __name__ == "__main__":
     parser.add_argument("--test-months", type=int, default=2, help="Test window in months")
     parser.add_argument("--step-months", type=int, default=1, help="Step size in months")
     parser.add_argument("--confidence", type=float, default=0.90, help="Beta posterior confidence")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Walk-forward evaluation processes (default: CPU count)")
     args = parser.parse_args()
 
     if args.continuous and args.split:
         continuous_walk_forward_mode(
-            args.train_months, args.test_months, args.step_months, args.confidence
+            args.train_months, args.test_months, args.step_months, args.confidence,
+            args.workers,
         )
     elif args.continuous:
         continuous_mode(args.confidence)
     elif args.split:
-        walk_forward_mode(args.train_months, args.test_months, args.step_months)
+        walk_forward_mode(
+            args.train_months, args.test_months, args.step_months, args.workers,
+        )
     else:
         main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Rebuild the incremental risk ledger from scratch.
+
+Usage:
+    python scripts/rebuild_risk_ledger.py
+    python scripts/rebuild_risk_ledger.py --db data/paper_trades.db
+
+New results/signals rows are folded in automatically on the next read, so
+this is only needed after results were deleted or edited in place (the
+ledger only ever adds rows past its high-water marks).
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.store.db import DEFAULT_DB_PATH, rebuild_risk_ledger  # noqa: E402
+from src.store.risk_ledger import sharpe  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the risk ledger")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB_PATH, help="SQLite DB path")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    ledger = rebuild_risk_ledger(db_path=args.db)
+    elapsed = time.perf_counter() - t0
+
+    print(f"Rebuilt risk ledger for {args.db} in {elapsed:.2f}s")
+    print(f"  signals:          {ledger['signals_count']}")
+    print(f"  settled:          {ledger['settled_count']} ({ledger['wins']} wins)")
+    print(f"  total PnL:        ${ledger['cum_pnl']:+.2f}")
+    print(f"  max drawdown:     ${ledger['max_drawdown']:.2f}")
+    print(f"  sharpe:           {sharpe(ledger):.2f}")
+    print(f"  loss streak:      {ledger['loss_streak']}")
+    print(f"  open exposure:    ${ledger['signals_kelly'] - ledger['settled_kelly']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
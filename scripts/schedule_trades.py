@@ -13,6 +13,9 @@ Usage:
 
     # Override date (for testing)
     python scripts/schedule_trades.py --date 2026-02-10 --execution dry-run
+
+    # Daemon mode (one long-lived process, wakes when a window / DCA slice / TTL is due)
+    python scripts/schedule_trades.py --daemon --execution live --with-order-manager
 """
 
 import argparse
@@ -34,51 +37,39 @@ log = logging.getLogger(__name__)
 ET = ZoneInfo("America/New_York")
 
 
-def main() -> None:
+def run_tick(
+    execution_mode: str,
+    date: str | None = None,
+    no_settle: bool = False,
+    refresh: bool = True,
+) -> None:
+    """Run one scheduler pass (risk → refresh → jobs → settle → notify → heartbeat)."""
     from src.config import settings
+    from src.connectors.market_snapshot import tick_snapshot
     from src.scheduler.trade_scheduler import (
         format_tick_summary,
-        process_dca_active_jobs,
-        process_eligible_jobs,
         process_merge_eligible,
         process_position_groups_tick,
+        process_tick_jobs,
         refresh_schedule,
     )
     from src.store.db import cancel_expired_jobs
     from src.store.db_path import resolve_db_path
 
-    parser = argparse.ArgumentParser(description="Per-game trade scheduler")
-    parser.add_argument(
-        "--execution",
-        choices=["paper", "live", "dry-run"],
-        default=None,
-        help="Execution mode (default: from settings.execution_mode)",
-    )
-    parser.add_argument(
-        "--date",
-        type=str,
-        default=None,
-        help="Game date YYYY-MM-DD (default: today ET)",
-    )
-    parser.add_argument(
-        "--no-settle",
-        action="store_true",
-        help="Skip auto-settlement",
-    )
-    args = parser.parse_args()
-
-    execution_mode = args.execution or settings.execution_mode
     now_et = datetime.now(timezone.utc).astimezone(ET)
     now_utc = datetime.now(timezone.utc).isoformat()
     db_path = resolve_db_path(execution_mode=execution_mode)
+    # ジョブ以外 (MERGE / 決済 / PositionGroup / リスク snapshot・通知) はリースされないので
+    # primary ワーカーだけが実行する (同じ行を複数ワーカーが処理しないように)
+    primary = settings.scheduler_primary_worker
 
     # ゲーム日付: today + tomorrow (ET) の両日を探索 — タイムゾーン境界対策
     # NBA.com のゲーム日付は ET ベースだが、境界付近で日付がずれるケースがある。
     # "dumb scheduler, smart worker" パターン: cron は 24/7 ハートビート、
     # スクリプト内で実行窓 (execute_after/execute_before) 判定するため安全。
-    if args.date:
-        dates_to_refresh = [args.date]
-        game_date = args.date  # 表示用
+    if date:
+        dates_to_refresh = [date]
+        game_date = date  # 表示用
     else:
         today_et = now_et.strftime("%Y-%m-%d")
         tomorrow_et = (now_et + timedelta(days=1)).strftime("%Y-%m-%d")
@@ -90,7 +81,7 @@ def main() -> None:
         "+".join(dates_to_refresh),
         execution_mode,
     )
-    log.info("DB path: %s", db_path)
+    log.info("DB path: %s (primary=%s)", db_path, primary)
 
     # 0. リスクチェック
     risk_level_name = "GREEN"
@@ -112,8 +103,10 @@ def main() -> None:
 
         if risk_state.circuit_breaker_level >= CircuitBreakerLevel.RED:
             log.warning("Circuit breaker RED — skipping to settle-only mode")
+            if not primary:
+                return
             # RED: settle のみ実行して通知して終了
-            if not args.no_settle:
+            if not no_settle:
                 try:
                     from src.settlement.settler import auto_settle
 
@@ -123,16 +116,21 @@ def main() -> None:
                 except Exception:
                     log.exception("Auto-settle failed")
 
-            try:
-                from src.notifications.telegram import send_message
+            # 通知は RED への遷移時のみ (daemon / cron の毎 tick で繰り返さない)
+            from src.store.db import get_latest_risk_snapshot
+
+            prev = get_latest_risk_snapshot(db_path=db_path)
+            if prev is None or prev.circuit_breaker_level < CircuitBreakerLevel.RED:
+                try:
+                    from src.notifications.telegram import send_message
 
-                send_message(
-                    f"*Circuit Breaker RED*\nTrading halted. "
-                    f"Daily PnL: ${risk_state.daily_pnl:+.2f}\n"
-                    f"Flags: {', '.join(risk_state.flags) or 'none'}"
-                )
-            except Exception:
-                log.exception("Telegram notification failed")
+                    send_message(
+                        f"*Circuit Breaker RED*\nTrading halted. "
+                        f"Daily PnL: ${risk_state.daily_pnl:+.2f}\n"
+                        f"Flags: {', '.join(risk_state.flags) or 'none'}"
+                    )
+                except Exception:
+                    log.exception("Telegram notification failed")
 
             # DCA 強制停止
             from src.store.db import force_stop_dca_jobs
@@ -160,65 +158,69 @@ def main() -> None:
         sizing_multiplier = 0.5
 
     # 1. スケジュール更新 — today + tomorrow (ET) を探索
+    # daemon モードでは daemon_refresh_interval_min ごとのみ (NBA API 呼び出しを抑制)
     new_jobs = 0
-    for d in dates_to_refresh:
-        new_jobs += refresh_schedule(d, db_path=db_path)
-    log.info("Schedule refresh (%s): %d new job(s)", "+".join(dates_to_refresh), new_jobs)
+    if refresh:
+        for d in dates_to_refresh:
+            new_jobs += refresh_schedule(d, db_path=db_path)
+        log.info("Schedule refresh (%s): %d new job(s)", "+".join(dates_to_refresh), new_jobs)
 
     # 2. 期限切れ処理
     expired = cancel_expired_jobs(now_utc, db_path=db_path)
     if expired:
         log.info("Expired %d job(s)", expired)
 
-    # 3. 窓内ジョブ実行 (初回エントリー)
-    results = process_eligible_jobs(
-        execution_mode,
-        db_path=db_path,
-        sizing_multiplier=sizing_multiplier,
-    )
-
-    executed = [r for r in results if r.status == "executed"]
-    skipped = [r for r in results if r.status == "skipped"]
-    failed = [r for r in results if r.status == "failed"]
-
-    log.info(
-        "Tick results: executed=%d skipped=%d failed=%d",
-        len(executed),
-        len(skipped),
-        len(failed),
-    )
+    # 3-3c は同一 tick の市場スナップショットを共有 (moneyline/板は 1 tick 1 回取得)
+    with tick_snapshot():
+        # 3. 窓内ジョブ (初回エントリー / hedge) と DCA アクティブジョブを
+        #    期限順の 1 キューで実行 (max_orders_per_tick を共有)
+        results, dca_results = process_tick_jobs(
+            execution_mode,
+            db_path=db_path,
+            sizing_multiplier=sizing_multiplier,
+        )
 
-    # 3b. DCA アクティブジョブ処理
-    dca_results = process_dca_active_jobs(execution_mode, db_path=db_path)
-    dca_executed = [r for r in dca_results if r.status == "executed"]
-    dca_failed = [r for r in dca_results if r.status == "failed"]
+        executed = [r for r in results if r.status == "executed"]
+        skipped = [r for r in results if r.status == "skipped"]
+        failed = [r for r in results if r.status == "failed"]
 
-    if dca_results:
         log.info(
-            "DCA results: executed=%d failed=%d",
-            len(dca_executed),
-            len(dca_failed),
+            "Tick results: executed=%d skipped=%d failed=%d",
+            len(executed),
+            len(skipped),
+            len(failed),
         )
 
-    # 3c. MERGE 処理 (bothside DCA 完了後)
-    merge_results = process_merge_eligible(execution_mode, db_path=db_path)
-    merge_executed = [r for r in merge_results if r.status == "executed"]
-    merge_failed = [r for r in merge_results if r.status == "failed"]
+        dca_executed = [r for r in dca_results if r.status == "executed"]
+        dca_failed = [r for r in dca_results if r.status == "failed"]
 
-    if merge_results:
-        log.info(
-            "MERGE results: executed=%d failed=%d",
-            len(merge_executed),
-            len(merge_failed),
-        )
+        if dca_results:
+            log.info(
+                "DCA results: executed=%d failed=%d",
+                len(dca_executed),
+                len(dca_failed),
+            )
+
+        # 3c. MERGE 処理 (bothside DCA 完了後)
+        merge_results = process_merge_eligible(execution_mode, db_path=db_path) if primary else []
+        merge_executed = [r for r in merge_results if r.status == "executed"]
+        merge_failed = [r for r in merge_results if r.status == "failed"]
+
+        if merge_results:
+            log.info(
+                "MERGE results: executed=%d failed=%d",
+                len(merge_executed),
+                len(merge_failed),
+            )
 
     # 3d. PositionGroup 状態機械更新 (Track B)
-    position_group_transitions = process_position_groups_tick(db_path=db_path)
-    if position_group_transitions:
-        log.info("PositionGroup transitions: %d", position_group_transitions)
+    if primary:
+        position_group_transitions = process_position_groups_tick(db_path=db_path)
+        if position_group_transitions:
+            log.info("PositionGroup transitions: %d", position_group_transitions)
 
     # 4. 決済 (オプション)
-    if not args.no_settle:
+    if primary and not no_settle:
         try:
             from src.settlement.settler import auto_settle
 
@@ -229,30 +231,32 @@ def main() -> None:
             log.exception("Auto-settle failed (continuing)")
 
     # 4b. リスク snapshot 保存
-    try:
-        from src.risk.risk_engine import invalidate_cache, load_or_compute_risk_state
-        from src.store.db import save_risk_snapshot
+    if primary:
+        try:
+            from src.risk.risk_engine import invalidate_cache, load_or_compute_risk_state
+            from src.store.db import save_risk_snapshot
 
-        invalidate_cache()
-        risk_state = load_or_compute_risk_state(db_path)
-        save_risk_snapshot(risk_state, db_path=db_path)
-
-        # レベル変更があった場合に通知
-        if risk_state.circuit_breaker_level.name != risk_level_name:
-            try:
-                from src.notifications.telegram import send_message
-
-                new_level = risk_state.circuit_breaker_level.name
-                send_message(
-                    f"*Risk Level Changed: {risk_level_name} → "
-                    f"{new_level}*\n"
-                    f"Daily PnL: ${risk_state.daily_pnl:+.2f} | "
-                    f"Multiplier: {risk_state.sizing_multiplier:.2f}"
-                )
-            except Exception:
-                log.exception("Risk alert notification failed")
-    except Exception:
-        log.exception("Risk snapshot save failed")
+            # プロセス内キャッシュのみ破棄。決済で results の水位が動けば永続キャッシュも再計算
+            invalidate_cache()
+            risk_state = load_or_compute_risk_state(db_path)
+            save_risk_snapshot(risk_state, db_path=db_path)
+
+            # レベル変更があった場合に通知
+            if risk_state.circuit_breaker_level.name != risk_level_name:
+                try:
+                    from src.notifications.telegram import send_message
+
+                    new_level = risk_state.circuit_breaker_level.name
+                    send_message(
+                        f"*Risk Level Changed: {risk_level_name} → "
+                        f"{new_level}*\n"
+                        f"Daily PnL: ${risk_state.daily_pnl:+.2f} | "
+                        f"Multiplier: {risk_state.sizing_multiplier:.2f}"
+                    )
+                except Exception:
+                    log.exception("Risk alert notification failed")
+        except Exception:
+            log.exception("Risk snapshot save failed")
 
     # 5. Telegram 通知
     try:
@@ -272,6 +276,13 @@ def main() -> None:
     except Exception:
         log.exception("Telegram notification failed")
 
+    # ホスト別 API 使用量 (rate limit の headroom) と発注レイテンシを出力し、次 tick 用にリセット
+    from src.connectors.order_prep import log_order_latency_stats
+    from src.connectors.rate_limit import log_rate_limit_stats
+
+    log_rate_limit_stats()
+    log_order_latency_stats()
+
     # Heartbeat (watchdog 死活監視用)
     heartbeat = Path(__file__).resolve().parent.parent / "data" / "heartbeat"
     heartbeat.write_text(datetime.now(timezone.utc).isoformat() + "\n")
@@ -297,5 +308,149 @@ def main() -> None:
     print(f"{'=' * 50}")
 
 
+def _run_order_manager(execution_mode: str, db_path: Path) -> None:
+    """Order manager pass inside the daemon (replaces the 2-minute ordermgr job)."""
+    from src.scheduler.order_manager import check_and_manage_orders
+
+    try:
+        summary = check_and_manage_orders(execution_mode=execution_mode, db_path=db_path)
+    except Exception:
+        log.exception("Order manager tick failed")
+        return
+    if summary.filled or summary.replaced or summary.expired:
+        log.info(
+            "Order manager: checked=%d filled=%d replaced=%d expired=%d",
+            summary.checked,
+            summary.filled,
+            summary.replaced,
+            summary.expired,
+        )
+    heartbeat = Path(__file__).resolve().parent.parent / "data" / "heartbeat_ordermgr"
+    heartbeat.write_text(datetime.now(timezone.utc).isoformat() + "\n")
+
+
+def run_daemon_mode(
+    execution_mode: str,
+    date: str | None = None,
+    no_settle: bool = False,
+    with_order_manager: bool = False,
+) -> None:
+    """Long-running scheduler: tick when a job window, DCA slice or order TTL is due."""
+    import signal
+    import threading
+
+    from src.config import settings
+    from src.connectors.market_ws import start_market_feed, stop_market_feed
+    from src.risk.models import CircuitBreakerLevel
+    from src.scheduler.daemon import compute_wakeups, run_daemon
+    from src.scheduler.order_manager import _estimate_current_order_price
+    from src.scheduler.price_triggers import PriceTriggerEngine, dca_triggers, reprice_triggers
+    from src.scheduler.trade_scheduler import deferred_job_ids
+    from src.store.db import (
+        get_active_placed_orders,
+        get_latest_risk_snapshot,
+        get_open_job_timers,
+    )
+    from src.store.db_path import resolve_db_path
+
+    db_path = resolve_db_path(execution_mode=execution_mode)
+    manage_orders = (
+        with_order_manager
+        and execution_mode == "live"
+        and settings.order_manager_enabled
+        and settings.scheduler_primary_worker
+    )
+    stop = threading.Event()
+
+    def _on_signal(signum, frame) -> None:
+        log.info("Signal %d received — stopping daemon", signum)
+        stop.set()
+
+    signal.signal(signal.SIGTERM, _on_signal)
+    signal.signal(signal.SIGINT, _on_signal)
+
+    def _tick(refresh: bool, due) -> None:
+        run_tick(execution_mode, date=date, no_settle=no_settle, refresh=refresh)
+        if manage_orders:
+            _run_order_manager(execution_mode, db_path)
+
+    triggers: PriceTriggerEngine | None = None
+
+    def _load_wakeups(now: datetime):
+        jobs = get_open_job_timers(db_path)
+        orders = get_active_placed_orders(db_path) if manage_orders else []
+        if triggers is not None:
+            triggers.arm(dca_triggers(jobs, now) + reprice_triggers(
+                orders,
+                lambda o: _estimate_current_order_price(o, o.order_replace_count or 0, db_path),
+            ))
+        # RED 中は settle-only tick しか走らないので、ジョブでは起きず定期 refresh に任せる
+        risk = get_latest_risk_snapshot(db_path=db_path)
+        halted = risk is not None and risk.circuit_breaker_level >= CircuitBreakerLevel.RED
+        return compute_wakeups(
+            jobs, now, orders, deferred_job_ids=deferred_job_ids(), halted=halted,
+        )
+
+    log.info(
+        "=== Scheduler daemon started (execution=%s, order_manager=%s) ===",
+        execution_mode,
+        manage_orders,
+    )
+    # 常駐プロセスでは板を WebSocket で保持 (未購読の token は初回参照時に購読)
+    feed = start_market_feed()
+    if feed is not None and settings.daemon_price_triggers_enabled:
+        triggers = PriceTriggerEngine(feed)
+    try:
+        ticks = run_daemon(_tick, _load_wakeups, stop=stop, triggers=triggers)
+    finally:
+        stop_market_feed()
+    log.info("=== Scheduler daemon stopped after %d tick(s) ===", ticks)
+
+
+def main() -> None:
+    from src.config import settings
+
+    parser = argparse.ArgumentParser(description="Per-game trade scheduler")
+    parser.add_argument(
+        "--execution",
+        choices=["paper", "live", "dry-run"],
+        default=None,
+        help="Execution mode (default: from settings.execution_mode)",
+    )
+    parser.add_argument(
+        "--date",
+        type=str,
+        default=None,
+        help="Game date YYYY-MM-DD (default: today ET)",
+    )
+    parser.add_argument(
+        "--no-settle",
+        action="store_true",
+        help="Skip auto-settlement",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run as a long-lived daemon that wakes when work is due",
+    )
+    parser.add_argument(
+        "--with-order-manager",
+        action="store_true",
+        help="Daemon only: also run the order manager on order TTL wake-ups (live)",
+    )
+    args = parser.parse_args()
+
+    execution_mode = args.execution or settings.execution_mode
+    if args.daemon:
+        run_daemon_mode(
+            execution_mode,
+            date=args.date,
+            no_settle=args.no_settle,
+            with_order_manager=args.with_order_manager,
+        )
+        return
+    run_tick(execution_mode, date=args.date, no_settle=args.no_settle)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Simulation: missed-deadline rates of FIFO vs deadline-ranked tick budgets.
+
+Usage:
+    python scripts/sim_job_queue.py
+    python scripts/sim_job_queue.py --games 15 --spread-min 60 --budget 3 --seeds 50
+
+Generates heavy slates (many tipoffs packed into --spread-min) and replays
+the scheduler tick by tick with a shared ``max_orders_per_tick`` budget:
+- directional: one order, eligible from a random arrival time (edge shows up)
+  until tipoff (``execute_before``)
+- hedge: one order, created when the directional executes, same deadline
+- dca: the remaining --dca-entries - 1 slices of an executed directional,
+  due on an even schedule, until tipoff - ``dca_cutoff_before_tipoff_min``
+
+Policies, same budget:
+- fifo: claim order (job id; eligible before DCA) — previous behaviour
+- ranked: src/scheduler/job_queue.rank_work + run_queue
+
+A miss is an order still owed when its deadline passes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import sys
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import settings  # noqa: E402
+from src.scheduler.job_queue import OrderSlots, rank_work, run_queue, work_items  # noqa: E402
+
+START = datetime(2026, 2, 10, 20, 0, tzinfo=timezone.utc)
+KINDS = ("directional", "hedge", "dca")
+
+
+def _slate(rng: random.Random, games: int, spread_min: float, lead_min: float) -> list[dict]:
+    slate = []
+    for g in range(games):
+        tipoff = START + timedelta(minutes=lead_min + rng.uniform(0, spread_min))
+        # エッジが出るタイミングは試合ごとにばらつく (ティップオフ直前に偏らせる)
+        arrival = tipoff - timedelta(minutes=lead_min * rng.random() ** 2)
+        slate.append({"game": f"nba-g{g:02d}", "tipoff": tipoff, "arrival": arrival})
+    return slate
+
+
+def simulate(slate: list[dict], policy: str, budget: int, tick_min: float, entries: int):
+    """Return (owed, missed) Counters by kind."""
+    cutoff = timedelta(minutes=settings.dca_cutoff_before_tipoff_min)
+    jobs: dict[int, SimpleNamespace] = {}
+    next_id = 0
+
+    def _add(game: dict, side: str, status: str, **extra) -> SimpleNamespace:
+        nonlocal next_id
+        next_id += 1
+        job = SimpleNamespace(
+            id=next_id, event_slug=game["game"], job_side=side, status=status,
+            execute_before=game["tipoff"].isoformat(),
+            game_time_utc=game["tipoff"].isoformat(),
+            dca_max_entries=entries, tipoff=game["tipoff"], game=game, **extra,
+        )
+        jobs[job.id] = job
+        return job
+
+    for game in sorted(slate, key=lambda g: g["arrival"]):
+        _add(game, "directional", "pending")
+
+    owed: Counter = Counter()
+    missed: Counter = Counter()
+    owed["directional"] = len(slate)
+    now = START
+    end = max(g["tipoff"] for g in slate) + timedelta(minutes=tick_min)
+    while now <= end:
+        eligible, dca = [], []
+        for job in jobs.values():
+            if job.status == "pending":
+                if now >= job.tipoff:
+                    job.status = "expired"
+                    missed["hedge" if job.job_side == "hedge" else "directional"] += 1
+                elif now >= job.game["arrival"]:
+                    eligible.append(job)
+            elif job.status == "dca_active":
+                if now >= job.tipoff - cutoff:
+                    job.status = "expired"
+                    missed["dca"] += len(job.slices)
+                elif job.slices and now >= job.slices[0]:
+                    dca.append(job)
+
+        if policy == "fifo":
+            queue = work_items(
+                sorted(eligible, key=lambda j: j.id), sorted(dca, key=lambda j: j.id),
+            )
+        else:
+            queue = rank_work(work_items(eligible, dca), now)
+
+        def _run(item, now=now):
+            job = item.job
+            if item.kind == "dca":
+                job.slices.pop(0)
+                if not job.slices:
+                    job.status = "executed"
+            elif item.kind == "hedge":
+                job.status = "executed"
+            else:
+                # directional 約定 → hedge と残りの DCA スライスが発生
+                last = job.tipoff - cutoff
+                step = (last - now) / entries
+                # DCA カットオフ後の約定は追加スライスなし
+                n = entries - 1 if step > timedelta(0) else 0
+                job.slices = [now + step * (i + 1) for i in range(n)]
+                job.status = "dca_active" if job.slices else "executed"
+                _add(job.game, "hedge", "pending")
+                owed["hedge"] += 1
+                owed["dca"] += len(job.slices)
+            return SimpleNamespace(status="executed")
+
+        run_queue(queue, _run, OrderSlots(budget))
+        now += timedelta(minutes=tick_min)
+    return owed, missed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Simulate missed deadlines per queue policy")
+    parser.add_argument("--games", type=int, default=15)
+    parser.add_argument("--spread-min", type=float, default=60.0, help="tipoff spread")
+    parser.add_argument("--lead-min", type=float, default=180.0, help="edge arrival horizon")
+    parser.add_argument("--budget", type=int, default=settings.max_orders_per_tick)
+    parser.add_argument("--tick-min", type=float, default=2.0)
+    parser.add_argument("--dca-entries", type=int, default=settings.dca_max_entries)
+    parser.add_argument("--seeds", type=int, default=20)
+    args = parser.parse_args()
+    # tick ごとの "deferring" 警告は集計に不要
+    logging.getLogger("src.scheduler.job_queue").setLevel(logging.ERROR)
+
+    totals = {p: (Counter(), Counter()) for p in ("fifo", "ranked")}
+    for seed in range(args.seeds):
+        slate = _slate(random.Random(seed), args.games, args.spread_min, args.lead_min)
+        for policy, (owed, missed) in totals.items():
+            o, m = simulate(slate, policy, args.budget, args.tick_min, args.dca_entries)
+            owed.update(o)
+            missed.update(m)
+
+    print(
+        f"{args.seeds} slates x {args.games} games, tipoffs within {args.spread_min:.0f} min, "
+        f"budget {args.budget}/tick every {args.tick_min:g} min, {args.dca_entries} DCA entries"
+    )
+    print(f"{'policy':<8} " + " ".join(f"{k + ' miss%':>17}" for k in (*KINDS, "total")))
+    for policy, (owed, missed) in totals.items():
+        cells = []
+        for kind in KINDS:
+            cells.append(100.0 * missed[kind] / owed[kind] if owed[kind] else 0.0)
+        cells.append(100.0 * sum(missed.values()) / max(sum(owed.values()), 1))
+        print(f"{policy:<8} " + " ".join(f"{c:>17.1f}" for c in cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -12,12 +12,45 @@ class Settings(BaseSettings):
     polymarket_chain_id: int = 137
     polymarket_signature_type: int = 0  # 0=EOA, 1=POLY_PROXY, 2=GNOSIS_SAFE
     polymarket_funder: str = ""  # proxy wallet address (POLY_PROXY 時のみ必要)
+    # L2 API 認証情報のディスクキャッシュ (空文字で無効)。再導出の往復を省く
+    clob_creds_cache_path: str = "data/clob_api_creds.json"
+    clob_creds_cache_ttl_hours: float = 168.0
+    # CLOB 読み取り系 (板取得) の並列度とレート上限
+    order_book_fetch_concurrency: int = 8
+    clob_requests_per_sec: float = 20.0
+    clob_request_burst: int = 10
+    # ホスト別レート上限 (src/connectors/rate_limit.py)。429 で自動減速 + Retry-After 待機
+    gamma_requests_per_sec: float = 10.0
+    gamma_request_burst: int = 10
+    data_api_requests_per_sec: float = 2.5  # data-api.polymarket.com (トレーダー分析スクリプト)
+    data_api_request_burst: int = 2
+    http_default_requests_per_sec: float = 5.0  # 上記以外のホスト (NBA/ESPN/Odds API 等)
+    http_default_request_burst: int = 5
+    rate_limit_max_backoff_sec: float = 60.0  # 429 時の最大待機秒
+    rate_limit_max_retries: int = 2  # http_get/http_post の 429 自動リトライ回数
+    # 一括発注 (place_limit_buys_batch): 署名の並列度と、同 tick の発注をまとめる待ち時間
+    order_sign_concurrency: int = 4
+    order_batch_window_ms: float = 50.0  # 0 で即時 (まとめない)
+    # 発注準備キャッシュ (src/connectors/order_prep.py): tick size / neg_risk / fee を事前解決
+    order_prep_enabled: bool = True
+    order_prep_ttl_sec: float = 1800.0  # 失敗した発注の token は即時破棄して再解決
+    order_prep_cache_path: str = "data/order_templates.json"  # 空文字でディスク保存なし
+    # 板の WebSocket 購読 (src/connectors/market_ws.py, daemon のみ。要 pip install nbabot[ws])
+    market_ws_enabled: bool = False
+    clob_ws_url: str = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+    market_ws_reconnect_min_sec: float = 1.0  # 再接続バックオフ初期値 (倍々で増加)
+    market_ws_reconnect_max_sec: float = 30.0  # 再接続バックオフ上限
 
     # Gamma Markets API (for market search/filtering)
     gamma_api_url: str = "https://gamma-api.polymarket.com"
 
     # HTTP proxy for geo-restricted APIs (e.g. socks5://127.0.0.1:1080)
     http_proxy: str = ""
+    # 共有 HTTP クライアントプール (src/connectors/http_client.py)
+    http2_enabled: bool = False  # HTTP/2 (要 h2: pip install nbabot[http2])
+    http_max_connections_per_host: int = 10  # ホスト毎の同時接続上限
+    http_max_keepalive_per_host: int = 5  # ホスト毎に保持する keep-alive 接続数
+    http_keepalive_expiry_sec: float = 30.0  # アイドル接続を閉じるまでの秒数
 
     # The Odds API
     odds_api_key: str = ""
@@ -36,6 +69,7 @@ class Settings(BaseSettings):
     weekly_loss_limit_pct: float = 5.0
     max_drawdown_limit_pct: float = 15.0
     risk_check_enabled: bool = True
+    risk_state_cache_ttl_sec: float = 300.0  # RiskState のプロセス間再利用の上限 (秒, 0 で無効)
     calibration_drift_threshold: float = 2.0
     max_total_exposure_pct: float = 30.0
     risk_max_single_game_usd: float = 200.0
@@ -97,7 +131,24 @@ class Settings(BaseSettings):
     # === Scheduler ===
     schedule_window_hours: float = 8.0  # ティップオフ何時間前から発注窓 (DCA 用に拡張)
     schedule_max_retries: int = 3  # 失敗時のリトライ上限
-    max_orders_per_tick: int = 3  # 1 tick (2分) あたりの最大発注数 (暴走防止)
+    max_orders_per_tick: int = 3  # 1 tick (2分) あたりの最大発注数 (暴走防止、ワーカーごと)
+    job_concurrency: int = 4  # tick のジョブを並列処理するゲーム数 (1 = 逐次)
+    job_queue_urgent_min: float = 60.0  # 期限まで N 分以内のジョブを価値より優先 (tick 予算配分)
+    scheduler_worker_id: str = ""  # ジョブリースの所有者名 (空なら hostname:pid)
+    # MERGE / 決済 / PositionGroup / リスク snapshot・通知 / order manager を実行するワーカー。
+    # これらはリースされないので、同じ DB を共有する複数ワーカーでは 1 つだけ True にする
+    scheduler_primary_worker: bool = True
+    job_lease_sec: float = 600.0  # ジョブリースの有効期間。切れたら他ワーカーが取得/回復できる
+    market_snapshot_max_age_sec: float = 60.0  # tick 内の価格/板キャッシュの鮮度上限 (秒)
+
+    # === Scheduler daemon (schedule_trades.py --daemon) ===
+    daemon_refresh_interval_min: float = 15.0  # スケジュール再取得の間隔 (heartbeat 更新も兼ねる)
+    daemon_min_tick_interval_sec: float = 30.0  # tick 間の最小間隔 (空回り防止)
+    daemon_failed_retry_min: float = 5.0  # 窓内 failed ジョブの再試行間隔 (分)
+    # 持ち越し以外の窓内 pending ジョブ (hedge の約定待ち等) の再確認間隔 (分)
+    daemon_pending_poll_min: float = 5.0
+    daemon_dca_poll_min: float = 5.0  # DCA 窓内の価格ポーリング間隔 (favorable 前倒し判定)
+    daemon_price_triggers_enabled: bool = True  # WS 板の価格クロスで即 tick (要 market_ws_enabled)
 
     # === DCA (Dollar Cost Averaging) ===
     dca_max_entries: int = 5  # 1 アウトカムあたりの最大購入回数 (sovereign 中央値 6-7)
@@ -133,14 +184,16 @@ class Settings(BaseSettings):
 
     # === Calibration confidence (Phase Q) ===
     calibration_confidence_level: float = 0.90  # Beta posterior lower percentile
+    calibration_lookup_step: float = 0.001  # 既定カーブを展開する価格グリッド刻み (0 で PCHIP 直接)
+    calibration_artifact_path: str = "data/calibration_curve.json"  # 空文字で毎回フィット
 
     # === Order lifecycle manager (Phase O) ===
     order_manager_enabled: bool = True
     order_ttl_min: int = 5  # 未約定注文の TTL (分)
     order_max_replaces: int = 3  # 最大再発注回数
     order_min_price_move: float = 0.01  # 再発注トリガーの最小価格移動
-    order_check_batch_size: int = 10  # 1 tick あたり最大チェック数
-    order_rate_limit_sleep: float = 0.5  # API 呼び出し間の sleep 秒
+    order_check_batch_size: int = 10  # DEPRECATED: open 注文の一括取得で毎 tick 全件チェック
+    order_rate_limit_sleep: float = 0.5  # DEPRECATED: clob_requests_per_sec の token bucket に置換
 
     # === MERGE (Phase B2/H) ===
     merge_enabled: bool = True  # MERGE はデフォルト有効 (BOTHSIDE とは独立)
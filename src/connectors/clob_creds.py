@@ -0,0 +1,100 @@
+"""On-disk cache for Polymarket CLOB L2 API credentials.
+
+Deriving credentials costs a signed round-trip to the CLOB, so they are
+persisted per (host, signer address) and reused until the TTL expires.
+The file is written atomically with 0600 permissions.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def _entry_key(host: str, address: str) -> str:
+    return f"{host.rstrip('/')}|{address.lower()}"
+
+
+def _read_all(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        logger.warning("Unreadable CLOB creds cache %s, ignoring", path)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_all(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".clob_creds_")
+    try:
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def load_api_creds(
+    path: str | Path,
+    host: str,
+    address: str,
+    ttl_hours: float,
+    now: datetime | None = None,
+) -> dict | None:
+    """Return cached ``{api_key, api_secret, api_passphrase}`` or None if missing/expired."""
+    entry = _read_all(Path(path)).get(_entry_key(host, address))
+    if not isinstance(entry, dict):
+        return None
+    try:
+        created_at = datetime.fromisoformat(entry["created_at"])
+        creds = {k: str(entry[k]) for k in ("api_key", "api_secret", "api_passphrase")}
+    except (KeyError, TypeError, ValueError):
+        return None
+    now = now or datetime.now(timezone.utc)
+    if now - created_at >= timedelta(hours=ttl_hours):
+        return None
+    return creds
+
+
+def save_api_creds(
+    path: str | Path,
+    host: str,
+    address: str,
+    api_key: str,
+    api_secret: str,
+    api_passphrase: str,
+    now: datetime | None = None,
+) -> None:
+    """Persist credentials for (host, address), replacing any previous entry."""
+    path = Path(path)
+    data = _read_all(path)
+    data[_entry_key(host, address)] = {
+        "api_key": api_key,
+        "api_secret": api_secret,
+        "api_passphrase": api_passphrase,
+        "created_at": (now or datetime.now(timezone.utc)).isoformat(),
+    }
+    _write_all(path, data)
+
+
+def clear_api_creds(path: str | Path, host: str, address: str) -> None:
+    """Drop the cached entry for (host, address), e.g. after a 401."""
+    path = Path(path)
+    data = _read_all(path)
+    if data.pop(_entry_key(host, address), None) is None:
+        return
+    if not data:
+        path.unlink(missing_ok=True)
+        return
+    _write_all(path, data)
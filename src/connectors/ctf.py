@@ -140,9 +140,9 @@ def get_matic_usd_price(fallback: float = _MATIC_USD_FALLBACK) -> float:
     Falls back to hardcoded estimate on any failure.
     """
     try:
-        import httpx
+        from src.connectors.http_client import http_get
 
-        resp = httpx.get(
+        resp = http_get(
             "https://api.coingecko.com/api/v3/simple/price",
             params={"ids": "matic-network", "vs_currencies": "usd"},
             timeout=5,
@@ -0,0 +1,109 @@
+"""Process-wide pooled HTTP clients shared by all connectors.
+
+One ``httpx.Client`` is kept per origin (scheme + host + port), so each host
+gets its own keep-alive pool and connection limit. Connections are reused
+across ticks instead of paying a fresh TCP+TLS handshake per request.
+``http_get`` / ``http_post`` also apply the per-host rate limiter.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.config import settings
+from src.connectors.rate_limit import get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 30.0
+
+_clients: dict[tuple[str, bool], httpx.Client] = {}
+_clients_lock = threading.Lock()
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        raise ValueError(f"Absolute URL required: {url!r}")
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def _http2_available() -> bool:
+    if not settings.http2_enabled:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("http2_enabled=True but h2 is not installed; falling back to HTTP/1.1")
+        return False
+    return True
+
+
+def _build_client(use_proxy: bool) -> httpx.Client:
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections_per_host,
+        max_keepalive_connections=settings.http_max_keepalive_per_host,
+        keepalive_expiry=settings.http_keepalive_expiry_sec,
+    )
+    # use_proxy=False の場合は従来の httpx.get と同じく環境変数 (HTTPS_PROXY) に従う
+    proxy = (settings.http_proxy or None) if use_proxy else None
+    return httpx.Client(
+        proxy=proxy,
+        limits=limits,
+        timeout=DEFAULT_TIMEOUT,
+        http2=_http2_available(),
+    )
+
+
+def get_http_client(url: str, *, use_proxy: bool = False) -> httpx.Client:
+    """Return the shared client for the origin of ``url``.
+
+    Args:
+        url: Any absolute URL on the target host.
+        use_proxy: Route through ``settings.http_proxy`` (geo-restricted APIs).
+    """
+    key = (_origin(url), use_proxy)
+    client = _clients.get(key)
+    if client is not None and not client.is_closed:
+        return client
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None or client.is_closed:
+            client = _build_client(use_proxy)
+            _clients[key] = client
+        return client
+
+
+def http_get(url: str, *, use_proxy: bool = False, **kwargs) -> httpx.Response:
+    """Drop-in replacement for ``httpx.get`` using the pooled client.
+
+    Goes through the host's shared rate limiter; 429s are retried after backoff.
+    """
+    client = get_http_client(url, use_proxy=use_proxy)
+    return get_rate_limiter(url).send(lambda: client.get(url, **kwargs))
+
+
+def http_post(url: str, *, use_proxy: bool = False, **kwargs) -> httpx.Response:
+    """Drop-in replacement for ``httpx.post`` using the pooled client (rate limited)."""
+    client = get_http_client(url, use_proxy=use_proxy)
+    return get_rate_limiter(url).send(lambda: client.post(url, **kwargs))
+
+
+def close_http_clients() -> None:
+    """Close every pooled client (called at interpreter exit)."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            logger.debug("Failed to close HTTP client", exc_info=True)
+
+
+atexit.register(close_http_clients)
@@ -0,0 +1,213 @@
+"""Tick-scoped market data snapshot (moneylines + order books).
+
+Within one scheduler tick the directional, hedge, DCA and order-manager
+passes look at the same games and tokens. ``tick_snapshot()`` installs a
+process-wide MarketSnapshot so each moneyline / order book is fetched at
+most once per tick (bounded by ``market_snapshot_max_age_sec``) and every
+consumer sees the same prices.
+
+Outside a tick, the module-level helpers fall through to the connector.
+
+``get_liquidity`` prefers the books kept by a running WebSocket feed
+(src/connectors/market_ws.py) and only fetches the remaining tokens.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from src.config import settings
+from src.connectors import market_ws, polymarket
+from src.connectors.polymarket import MoneylineMarket
+from src.connectors.team_mapping import build_event_slug
+from src.sizing.liquidity import LiquiditySnapshot, extract_liquidity
+
+logger = logging.getLogger(__name__)
+
+
+class MarketSnapshot:
+    """Memoized moneylines (by event_slug) and order books (by token_id).
+
+    Games passed to ``register_games`` are fetched together in one batched
+    Gamma request on the first moneyline lookup; anything else falls back to
+    the per-slug call. Entries older than ``max_age_sec`` are refetched
+    (None disables expiry). Per-slug and order-book fetches run outside the
+    lock so concurrent job workers do not wait on each other's requests.
+    """
+
+    def __init__(self, max_age_sec: float | None = None, clock=time.monotonic):
+        self.max_age_sec = max_age_sec
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._pending: dict[str, tuple[str, str, str]] = {}
+        self._moneylines: dict[str, tuple[float, MoneylineMarket | None]] = {}
+        self._books: dict[str, tuple[float, dict]] = {}
+        self.moneyline_fetches = 0
+        self.book_fetches = 0
+
+    def _fresh(self, fetched_at: float) -> bool:
+        return self.max_age_sec is None or self._clock() - fetched_at < self.max_age_sec
+
+    # -- moneylines --------------------------------------------------------
+
+    def register_games(self, games: list[tuple[str, str, str]]) -> None:
+        """Queue (away_team, home_team, game_date) for the next batched fetch."""
+        with self._lock:
+            for away_team, home_team, game_date in games:
+                slug = build_event_slug(away_team, home_team, game_date)
+                if not slug:
+                    continue
+                cached = self._moneylines.get(slug)
+                if cached is None or not self._fresh(cached[0]):
+                    self._pending[slug] = (away_team, home_team, game_date)
+
+    def _flush_pending(self) -> None:
+        games = list(self._pending.values())
+        self._pending.clear()
+        batch = polymarket.fetch_moneylines_batch(games)
+        self.moneyline_fetches += 1
+        now = self._clock()
+        for slug, ml in batch.items():
+            self._moneylines[slug] = (now, ml)
+
+    def moneyline(self, away_team: str, home_team: str, game_date: str) -> MoneylineMarket | None:
+        """Drop-in for fetch_moneyline_for_game backed by the snapshot."""
+        slug = build_event_slug(away_team, home_team, game_date)
+        with self._lock:
+            if slug and slug in self._pending:
+                self._flush_pending()
+            cached = self._moneylines.get(slug) if slug else None
+            if cached is not None and self._fresh(cached[0]):
+                return cached[1]
+
+        # 個別取得はロック外 (並列ワーカー同士が互いの通信を待たない)
+        ml = polymarket.fetch_moneyline_for_game(away_team, home_team, game_date)
+        with self._lock:
+            self.moneyline_fetches += 1
+            if slug:
+                self._moneylines[slug] = (self._clock(), ml)
+        return ml
+
+    @property
+    def moneylines(self) -> dict[str, MoneylineMarket]:
+        """Resolved moneylines currently held (flushes registered games first)."""
+        with self._lock:
+            if self._pending:
+                self._flush_pending()
+            return {slug: ml for slug, (_, ml) in self._moneylines.items() if ml is not None}
+
+    # -- order books -------------------------------------------------------
+
+    def order_books(self, token_ids: list[str]) -> dict[str, dict]:
+        """Drop-in for fetch_order_books_batch; only stale/missing tokens are fetched."""
+        with self._lock:
+            missing = [
+                tid for tid in dict.fromkeys(token_ids)
+                if tid not in self._books or not self._fresh(self._books[tid][0])
+            ]
+        if missing:
+            fetched = polymarket.fetch_order_books_batch(missing)
+            with self._lock:
+                self.book_fetches += len(missing)
+                now = self._clock()
+                for tid, book in fetched.items():
+                    self._books[tid] = (now, book)
+        with self._lock:
+            return {tid: self._books[tid][1] for tid in token_ids if tid in self._books}
+
+    def order_book(self, token_id: str) -> dict | None:
+        """Drop-in for fetch_order_book_safe."""
+        return self.order_books([token_id]).get(token_id)
+
+
+# ---------------------------------------------------------------------------
+# Tick scope
+# ---------------------------------------------------------------------------
+
+_active: MarketSnapshot | None = None
+_active_lock = threading.Lock()
+
+
+def current_snapshot() -> MarketSnapshot | None:
+    """Return the snapshot of the running tick, if any."""
+    return _active
+
+
+@contextmanager
+def tick_snapshot(max_age_sec: float | None = None) -> Iterator[MarketSnapshot]:
+    """Install a MarketSnapshot for the duration of a tick.
+
+    Nested use joins the outer snapshot. Worker threads started inside the
+    block see the same snapshot.
+    """
+    global _active
+    with _active_lock:
+        outer = _active
+        if outer is None:
+            age = settings.market_snapshot_max_age_sec if max_age_sec is None else max_age_sec
+            _active = MarketSnapshot(max_age_sec=age)
+        snapshot = _active
+    try:
+        yield snapshot
+    finally:
+        if outer is None:
+            with _active_lock:
+                _active = None
+            logger.debug(
+                "Market snapshot: moneyline_fetches=%d book_fetches=%d",
+                snapshot.moneyline_fetches,
+                snapshot.book_fetches,
+            )
+
+
+def get_moneyline(away_team: str, home_team: str, game_date: str) -> MoneylineMarket | None:
+    """fetch_moneyline_for_game through the active tick snapshot."""
+    snapshot = current_snapshot()
+    if snapshot is None:
+        return polymarket.fetch_moneyline_for_game(away_team, home_team, game_date)
+    return snapshot.moneyline(away_team, home_team, game_date)
+
+
+def get_order_books(token_ids: list[str]) -> dict[str, dict]:
+    """fetch_order_books_batch through the active tick snapshot."""
+    snapshot = current_snapshot()
+    if snapshot is None:
+        return polymarket.fetch_order_books_batch(token_ids)
+    return snapshot.order_books(token_ids)
+
+
+def get_order_book(token_id: str) -> dict | None:
+    """fetch_order_book_safe through the active tick snapshot."""
+    snapshot = current_snapshot()
+    if snapshot is None:
+        return polymarket.fetch_order_book_safe(token_id)
+    return snapshot.order_book(token_id)
+
+
+def get_liquidity(token_ids: list[str]) -> dict[str, LiquiditySnapshot]:
+    """LiquiditySnapshot per token: live WS books first, REST books for the rest.
+
+    Tokens the feed does not hold yet are subscribed so later ticks hit the
+    local book.
+    """
+    out: dict[str, LiquiditySnapshot] = {}
+    missing = list(dict.fromkeys(token_ids))
+    feed = market_ws.get_market_feed()
+    if feed is not None:
+        for tid in missing:
+            snap = feed.liquidity(tid)
+            if snap is not None:
+                out[tid] = snap
+        missing = [tid for tid in missing if tid not in out]
+        if missing:
+            feed.subscribe(missing)
+    if missing:
+        for tid, book in get_order_books(missing).items():
+            snap = extract_liquidity(book, tid)
+            if snap is not None:
+                out[tid] = snap
+    return out
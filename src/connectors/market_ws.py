@@ -0,0 +1,343 @@
+"""WebSocket market-data feed with locally maintained order books.
+
+Subscribes to the CLOB market channel and keeps an in-memory book per token
+from the initial ``book`` snapshot plus ``price_change`` deltas. Readers
+(``best_bid`` / ``best_ask`` / ``liquidity``) get a cached LiquiditySnapshot
+instead of a REST round trip per decision.
+
+The feed runs its own asyncio loop on a daemon thread, so it only pays off
+in long-lived processes (``schedule_trades.py --daemon``). Books are dropped
+on disconnect and rebuilt from the fresh snapshot the server sends after
+resubscribing; until then readers see None and fall back to REST.
+
+Requires ``websockets`` (pip install nbabot[ws]).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from collections.abc import Callable, Iterable
+
+from src.config import settings
+from src.connectors import order_prep
+from src.sizing.liquidity import LiquiditySnapshot, liquidity_from_levels
+
+logger = logging.getLogger(__name__)
+
+
+class LocalOrderBook:
+    """price → size levels for one token, with a cached LiquiditySnapshot.
+
+    Not thread-safe on its own; MarketDataFeed serializes access.
+    """
+
+    def __init__(self, token_id: str):
+        self.token_id = token_id
+        self._bids: dict[float, float] = {}
+        self._asks: dict[float, float] = {}
+        self._snapshot: LiquiditySnapshot | None = None
+        self._dirty = True
+        self.updated_at: str = ""
+
+    @staticmethod
+    def _levels(raw: Iterable[dict]) -> dict[float, float]:
+        levels = {}
+        for level in raw or ():
+            size = float(level["size"])
+            if size > 0:
+                levels[float(level["price"])] = size
+        return levels
+
+    def apply_snapshot(
+        self, bids: Iterable[dict], asks: Iterable[dict], timestamp: str = "",
+    ) -> None:
+        """Replace all levels (``book`` message)."""
+        self._bids = self._levels(bids)
+        self._asks = self._levels(asks)
+        self._dirty = True
+        self.updated_at = timestamp
+
+    def apply_change(self, side: str, price: float, size: float, timestamp: str = "") -> None:
+        """Set one level (``price_change``); size 0 removes it."""
+        levels = self._bids if side.upper() == "BUY" else self._asks
+        if size > 0:
+            levels[price] = size
+        else:
+            levels.pop(price, None)
+        self._dirty = True
+        self.updated_at = timestamp
+
+    def liquidity(self) -> LiquiditySnapshot | None:
+        # 更新があった時だけ再計算 (以降の参照は O(1))
+        if self._dirty:
+            asks = sorted(self._asks.items())
+            bids = sorted(self._bids.items(), reverse=True)
+            self._snapshot = liquidity_from_levels(self.token_id, asks, bids)
+            self._dirty = False
+        return self._snapshot
+
+    def to_dict(self) -> dict:
+        """REST-shaped book (``{"bids": [...], "asks": [...]}``)."""
+        return {
+            "asset_id": self.token_id,
+            "bids": [
+                {"price": str(p), "size": str(s)} for p, s in sorted(self._bids.items())
+            ],
+            "asks": [
+                {"price": str(p), "size": str(s)}
+                for p, s in sorted(self._asks.items(), reverse=True)
+            ],
+        }
+
+
+def _websockets_available() -> bool:
+    try:
+        import websockets  # noqa: F401
+    except ImportError:
+        logger.warning("market_ws_enabled=True but websockets is not installed; using REST books")
+        return False
+    return True
+
+
+class MarketDataFeed:
+    """Background market-channel subscriber holding a LocalOrderBook per token."""
+
+    def __init__(self, url: str | None = None):
+        self.url = url or settings.clob_ws_url
+        self._lock = threading.Lock()
+        self._tokens: set[str] = set()
+        self._sent: set[str] = set()
+        self._books: dict[str, LocalOrderBook] = {}
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stopping: asyncio.Event | None = None
+        self._ws = None
+        self._listeners: list[Callable[[str, LiquiditySnapshot], None]] = []
+        self.messages = 0
+        self.connects = 0
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self._run()), name="market-ws", daemon=True,
+        )
+        self._thread.start()
+        self._ready.wait()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        loop, thread = self._loop, self._thread
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(self._stopping.set)
+        ws = self._ws
+        if ws is not None:
+            asyncio.run_coroutine_threadsafe(ws.close(), loop)
+        thread.join(timeout)
+        self._thread = None
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None
+
+    async def _run(self) -> None:
+        from websockets.asyncio.client import connect
+
+        self._loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        self._ready.set()
+        backoff = settings.market_ws_reconnect_min_sec
+        while not self._stopping.is_set():
+            try:
+                async with connect(self.url, open_timeout=10) as ws:
+                    self._ws = ws
+                    self.connects += 1
+                    backoff = settings.market_ws_reconnect_min_sec
+                    with self._lock:
+                        self._sent = set()
+                    await self._send_subscription()
+                    async for raw in ws:
+                        self._handle_raw(raw)
+            except Exception as e:
+                if not self._stopping.is_set():
+                    logger.warning("Market WS disconnected: %s", e)
+            finally:
+                self._ws = None
+                with self._lock:
+                    # 切断中の差分は失われるので再購読時の snapshot から作り直す
+                    self._books.clear()
+            if self._stopping.is_set():
+                break
+            try:
+                await asyncio.wait_for(self._stopping.wait(), backoff)
+            except TimeoutError:
+                pass
+            backoff = min(backoff * 2, settings.market_ws_reconnect_max_sec)
+
+    # -- subscriptions -----------------------------------------------------
+
+    def subscribe(self, token_ids: Iterable[str]) -> None:
+        """Add tokens; sent immediately when connected, otherwise on (re)connect."""
+        with self._lock:
+            new = set(token_ids) - self._tokens
+            self._tokens |= new
+        loop = self._loop
+        if new and loop is not None and self._ws is not None:
+            asyncio.run_coroutine_threadsafe(self._send_subscription(), loop)
+
+    async def _send_subscription(self) -> None:
+        ws = self._ws
+        if ws is None:
+            return
+        with self._lock:
+            new = sorted(self._tokens - self._sent)
+            if not new:
+                return
+            first = not self._sent
+            self._sent |= set(new)
+        if first:
+            msg = {"assets_ids": new, "type": "market"}
+        else:
+            msg = {"assets_ids": new, "operation": "subscribe"}
+        await ws.send(json.dumps(msg))
+
+    # -- messages ----------------------------------------------------------
+
+    def add_listener(self, callback: Callable[[str, LiquiditySnapshot], None]) -> None:
+        """Call ``callback(token_id, snapshot)`` after each update of a book.
+
+        Runs on the feed thread; keep it short.
+        """
+        self._listeners.append(callback)
+
+    def _handle_raw(self, raw: str | bytes) -> None:
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return  # PONG など
+        for msg in data if isinstance(data, list) else [data]:
+            if isinstance(msg, dict):
+                self.handle_message(msg)
+
+    def handle_message(self, msg: dict) -> None:
+        """Apply one market-channel message to the local books."""
+        event = msg.get("event_type")
+        ts = str(msg.get("timestamp") or "")
+        touched: set[str] = set()
+        with self._lock:
+            self.messages += 1
+            if event == "book":
+                book = self._book(msg.get("asset_id"))
+                if book is not None:
+                    book.apply_snapshot(
+                        msg.get("bids", msg.get("buys")),
+                        msg.get("asks", msg.get("sells")),
+                        ts,
+                    )
+                    touched.add(book.token_id)
+            elif event == "price_change":
+                if "price_changes" in msg:
+                    changes = msg["price_changes"]
+                else:
+                    # 旧形式: asset_id がメッセージ直下
+                    asset_id = msg.get("asset_id")
+                    changes = [{**c, "asset_id": asset_id} for c in msg.get("changes", ())]
+                for c in changes:
+                    # snapshot 前の差分は捨てる (snapshot で上書きされる)
+                    book = self._books.get(str(c.get("asset_id")))
+                    if book is not None:
+                        book.apply_change(c["side"], float(c["price"]), float(c["size"]), ts)
+                        touched.add(book.token_id)
+            elif event == "tick_size_change":
+                order_prep.cache.invalidate(str(msg.get("asset_id")))
+            if not self._listeners:
+                return
+            updates = [(tid, self._books[tid].liquidity()) for tid in touched]
+        self._notify(updates)
+
+    def _notify(self, updates: list[tuple[str, LiquiditySnapshot | None]]) -> None:
+        for token_id, snap in updates:
+            if snap is None:
+                continue
+            for callback in self._listeners:
+                try:
+                    callback(token_id, snap)
+                except Exception:
+                    logger.exception("Market WS listener failed for %s", token_id)
+
+    def _book(self, token_id) -> LocalOrderBook | None:
+        if token_id is None:
+            return None
+        token_id = str(token_id)
+        book = self._books.get(token_id)
+        if book is None:
+            book = self._books[token_id] = LocalOrderBook(token_id)
+        return book
+
+    # -- readers -----------------------------------------------------------
+
+    def has_book(self, token_id: str) -> bool:
+        with self._lock:
+            return token_id in self._books
+
+    def liquidity(self, token_id: str) -> LiquiditySnapshot | None:
+        with self._lock:
+            book = self._books.get(token_id)
+            return book.liquidity() if book is not None else None
+
+    def best_ask(self, token_id: str) -> float | None:
+        snap = self.liquidity(token_id)
+        return snap.best_ask if snap is not None else None
+
+    def best_bid(self, token_id: str) -> float | None:
+        snap = self.liquidity(token_id)
+        return snap.best_bid if snap is not None else None
+
+    def book(self, token_id: str) -> dict | None:
+        with self._lock:
+            book = self._books.get(token_id)
+            return book.to_dict() if book is not None else None
+
+
+# ---------------------------------------------------------------------------
+# Process-wide feed
+# ---------------------------------------------------------------------------
+
+_feed: MarketDataFeed | None = None
+
+
+def get_market_feed() -> MarketDataFeed | None:
+    """Return the running feed, if one was started."""
+    return _feed
+
+
+def start_market_feed(token_ids: Iterable[str] = ()) -> MarketDataFeed | None:
+    """Start the process-wide feed (no-op when disabled or websockets is missing)."""
+    global _feed
+    if _feed is not None:
+        _feed.subscribe(token_ids)
+        return _feed
+    if not settings.market_ws_enabled or not _websockets_available():
+        return None
+    feed = MarketDataFeed()
+    feed.subscribe(token_ids)
+    feed.start()
+    _feed = feed
+    logger.info("Market WS feed started (%s)", feed.url)
+    return feed
+
+
+def stop_market_feed() -> None:
+    global _feed
+    feed, _feed = _feed, None
+    if feed is not None:
+        feed.stop()
+        logger.info(
+            "Market WS feed stopped (connects=%d messages=%d)", feed.connects, feed.messages,
+        )
@@ -11,8 +11,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 
-import httpx
-
+from src.connectors.http_client import http_get
 from src.connectors.nba_schedule import _fetch_season_schedule
 from src.connectors.team_mapping import NBA_TEAMS, normalize_team_name
 
@@ -82,7 +81,7 @@ def _fetch_standings() -> dict[str, dict]:
     url = ESPN_STANDINGS_URL
     result: dict[str, dict] = {}
     try:
-        resp = httpx.get(url, timeout=15)
+        resp = http_get(url, timeout=15)
         resp.raise_for_status()
         data = resp.json()
 
@@ -133,7 +132,7 @@ def _fetch_injuries() -> dict[str, list[str]]:
     # Alternatively use the league-wide injuries endpoint
     url = f"{ESPN_BASE}/injuries"
     try:
-        resp = httpx.get(url, timeout=15)
+        resp = http_get(url, timeout=15)
         resp.raise_for_status()
         data = resp.json()
 
@@ -10,6 +10,7 @@ from zoneinfo import ZoneInfo
 import httpx
 
 from src.config import settings
+from src.connectors.http_client import http_get
 from src.connectors.team_mapping import get_team_abbr, normalize_team_name
 
 logger = logging.getLogger(__name__)
@@ -55,7 +56,7 @@ def fetch_todays_games() -> list[NBAGame]:
     logger.info("Fetching NBA schedule from %s", url)
 
     try:
-        resp = httpx.get(url, timeout=15)
+        resp = http_get(url, timeout=15)
         resp.raise_for_status()
         data = resp.json()
     except httpx.TimeoutException:
@@ -120,7 +121,7 @@ def _fetch_season_schedule() -> list[dict]:
 
     logger.info("Fetching NBA season schedule from %s", NBA_SCHEDULE_URL)
     try:
-        resp = httpx.get(NBA_SCHEDULE_URL, timeout=15)
+        resp = http_get(NBA_SCHEDULE_URL, timeout=15)
         resp.raise_for_status()
         data = resp.json()
     except httpx.TimeoutException:
@@ -10,9 +10,8 @@ import logging
 import statistics
 from dataclasses import dataclass
 
-import httpx
-
 from src.config import settings
+from src.connectors.http_client import http_get
 
 logger = logging.getLogger(__name__)
 
@@ -94,7 +93,7 @@ def fetch_nba_odds(
     regions = regions or ["us"]
     markets = markets or ["h2h"]
 
-    resp = httpx.get(
+    resp = http_get(
         f"{BASE_URL}/sports/{SPORT}/odds",
         params={
             "apiKey": settings.odds_api_key,
@@ -0,0 +1,91 @@
+"""Coalesce concurrent limit-buy calls into batched CLOB submissions.
+
+Job workers run one game each in parallel and call ``place_limit_buy`` with a
+synchronous contract (dict response, exception on failure). ``OrderBatcher``
+keeps that contract while gathering the calls that arrive within a short
+window into a single ``place_limit_buys_batch`` request.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from src.connectors.polymarket import (
+    POST_ORDERS_MAX_BATCH,
+    LimitBuyRequest,
+    OrderPlacement,
+    place_limit_buys_batch,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Pending:
+    request: LimitBuyRequest
+    done: threading.Event = field(default_factory=threading.Event)
+    result: OrderPlacement | None = None
+
+
+class OrderBatcher:
+    """Drop-in ``place_limit_buy`` that batches calls from concurrent workers.
+
+    The first caller of a batch waits up to ``window_sec`` (or until
+    ``max_batch`` orders are queued), then submits everything queued so far;
+    the other callers block until their own result is available.
+    """
+
+    def __init__(
+        self,
+        window_sec: float,
+        max_batch: int = POST_ORDERS_MAX_BATCH,
+        submit: Callable[[list[LimitBuyRequest]], list[OrderPlacement]] | None = None,
+    ):
+        self.window_sec = max(0.0, window_sec)
+        self.max_batch = max(1, max_batch)
+        self._submit = submit or place_limit_buys_batch
+        self._cond = threading.Condition()
+        self._pending: list[_Pending] = []
+        self.batches = 0
+
+    def place_limit_buy(self, token_id: str, price: float, size_usd: float) -> dict:
+        """Same contract as ``polymarket.place_limit_buy`` (raises on failure)."""
+        item = _Pending(LimitBuyRequest(token_id, price, size_usd))
+        batch: list[_Pending] = []
+        with self._cond:
+            self._pending.append(item)
+            leader = len(self._pending) == 1
+            if len(self._pending) >= self.max_batch:
+                self._cond.notify_all()
+            if leader:
+                deadline = time.monotonic() + self.window_sec
+                while len(self._pending) < self.max_batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch, self._pending = self._pending, []
+                self.batches += 1
+
+        if leader:
+            self._flush(batch)
+        item.done.wait()
+
+        result = item.result
+        if result is None or not result.ok:
+            raise RuntimeError(result.error if result else "order not submitted")
+        return result.response
+
+    def _flush(self, batch: list[_Pending]) -> None:
+        try:
+            results = self._submit([p.request for p in batch])
+        except Exception as e:
+            logger.exception("Batched order submission failed (%d orders)", len(batch))
+            results = [OrderPlacement(p.request, error=str(e)) for p in batch]
+        for i, p in enumerate(batch):
+            p.result = results[i] if i < len(results) else None
+            p.done.set()
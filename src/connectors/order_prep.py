@@ -0,0 +1,287 @@
+"""Order-preparation cache and decision-to-ack latency instrumentation.
+
+``create_and_post_order`` resolves tick size, neg-risk and fee rate per token
+and rebuilds the EIP-712 signer/domain on every call. ``OrderTemplate`` keeps
+the resolved market parameters per token, and an exchange order builder is
+kept per (client builder, neg-risk), so placing an order only computes
+amounts, salt and signature.
+
+Templates are also persisted to ``order_prep_cache_path`` so short-lived
+tick processes (launchd) reuse what the previous tick resolved.
+
+``OrderLatencyTracker`` records per-order prep (resolve + sign) and
+decision-to-ack times, split by warm (template hit) and cold paths.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import statistics
+import tempfile
+import threading
+import time
+import weakref
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class OrderTemplate:
+    """Pre-resolved per-token market parameters for order signing."""
+
+    token_id: str
+    tick_size: str
+    neg_risk: bool
+    fee_rate_bps: int
+    prepared_at: float  # unix time (プロセスを跨いで TTL 判定するため)
+
+
+def resolve_template(client, token_id: str, clock=time.time) -> OrderTemplate:
+    """Resolve tick size / neg-risk / fee rate through the SDK (network on first use)."""
+    return OrderTemplate(
+        token_id=token_id,
+        tick_size=str(client.get_tick_size(token_id)),
+        neg_risk=bool(client.get_neg_risk(token_id)),
+        fee_rate_bps=int(client.get_fee_rate_bps(token_id) or 0),
+        prepared_at=clock(),
+    )
+
+
+class OrderPrepCache:
+    """Thread-safe token_id → OrderTemplate map with a TTL (tick size can change).
+
+    With a ``path`` the map is loaded from / written through to a JSON file.
+    """
+
+    def __init__(
+        self,
+        ttl_sec: float | None = None,
+        path: str | Path | None = None,
+        clock=time.time,
+    ):
+        self._ttl_sec = ttl_sec
+        self._path = path
+        self._clock = clock
+        self._templates: dict[str, OrderTemplate] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def ttl_sec(self) -> float:
+        return settings.order_prep_ttl_sec if self._ttl_sec is None else self._ttl_sec
+
+    @property
+    def path(self) -> Path | None:
+        path = settings.order_prep_cache_path if self._path is None else self._path
+        return Path(path) if path else None
+
+    def _load(self) -> None:
+        self._loaded = True
+        path = self.path
+        if path is None:
+            return
+        try:
+            raw = json.loads(path.read_text())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            logger.warning("Unreadable order template cache %s, ignoring", path)
+            return
+        for entry in raw.values() if isinstance(raw, dict) else ():
+            try:
+                tpl = OrderTemplate(**entry)
+            except TypeError:
+                continue
+            self._templates.setdefault(tpl.token_id, tpl)
+
+    def _save(self) -> None:
+        path = self.path
+        if path is None:
+            return
+        data = {tid: asdict(tpl) for tid, tpl in self._templates.items()}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".order_templates_")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError:
+            logger.warning("Failed to write order template cache %s", path, exc_info=True)
+
+    def get(self, token_id: str) -> OrderTemplate | None:
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            tpl = self._templates.get(token_id)
+            if tpl is None:
+                return None
+            if self._clock() - tpl.prepared_at >= self.ttl_sec:
+                del self._templates[token_id]
+                return None
+            return tpl
+
+    def put(self, template: OrderTemplate) -> None:
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            self._templates[template.token_id] = template
+            now = self._clock()
+            self._templates = {
+                tid: t for tid, t in self._templates.items()
+                if now - t.prepared_at < self.ttl_sec
+            }
+            self._save()
+
+    def invalidate(self, token_id: str | None = None) -> None:
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            if token_id is None:
+                removed = bool(self._templates)
+                self._templates.clear()
+            else:
+                removed = self._templates.pop(token_id, None) is not None
+            if removed:
+                self._save()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._templates)
+
+
+# 署名用 builder は EIP-712 domain と鍵の導出を含むので client.builder ごとに再利用
+_exchange_builders: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_exchange_builders_lock = threading.Lock()
+
+
+def _exchange_builder(builder, neg_risk: bool):
+    from py_clob_client.config import get_contract_config
+    from py_order_utils.builders import OrderBuilder as UtilsOrderBuilder
+    from py_order_utils.signer import Signer as UtilsSigner
+
+    with _exchange_builders_lock:
+        per_builder = _exchange_builders.setdefault(builder, {})
+        exchange = per_builder.get(neg_risk)
+        if exchange is None:
+            chain_id = builder.signer.get_chain_id()
+            exchange = UtilsOrderBuilder(
+                get_contract_config(chain_id, neg_risk).exchange,
+                chain_id,
+                UtilsSigner(key=builder.signer.private_key),
+            )
+            per_builder[neg_risk] = exchange
+        return exchange
+
+
+def sign_limit_buy(builder, template: OrderTemplate, price: float, size: float):
+    """Build and sign a GTC BUY from a template (same order the SDK would produce).
+
+    ``builder`` is the SDK client's ``OrderBuilder`` (``client.builder``).
+    Mirrors ``OrderBuilder.create_order`` using SDK internals, so the
+    py-clob-client version is pinned below the next minor release and
+    tests/test_order_prep.py checks the output against ``ClobClient.create_order``.
+    """
+    from py_clob_client.clob_types import OrderArgs
+    from py_clob_client.order_builder.builder import ROUNDING_CONFIG
+    from py_clob_client.order_builder.constants import BUY
+    from py_clob_client.utilities import price_valid
+    from py_order_utils.model import OrderData
+
+    if not price_valid(price, template.tick_size):
+        raise ValueError(
+            f"price ({price}), min: {template.tick_size} - max: {1 - float(template.tick_size)}"
+        )
+    defaults = OrderArgs(token_id=template.token_id, price=price, size=size, side=BUY)
+    side, maker_amount, taker_amount = builder.get_order_amounts(
+        BUY, size, price, ROUNDING_CONFIG[template.tick_size],
+    )
+    data = OrderData(
+        maker=builder.funder,
+        taker=defaults.taker,
+        tokenId=template.token_id,
+        makerAmount=str(maker_amount),
+        takerAmount=str(taker_amount),
+        side=side,
+        feeRateBps=str(template.fee_rate_bps),
+        nonce=str(defaults.nonce),
+        signer=builder.signer.address(),
+        expiration=str(defaults.expiration),
+        signatureType=builder.sig_type,
+    )
+    return _exchange_builder(builder, template.neg_risk).build_signed_order(data)
+
+
+# ---------------------------------------------------------------------------
+# Latency instrumentation
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class LatencySummary:
+    path: str  # 'warm' (template hit) | 'cold' (resolve on the hot path)
+    count: int
+    prep_p50_ms: float
+    ack_p50_ms: float
+    ack_p95_ms: float
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(pct) - 1]
+
+
+class OrderLatencyTracker:
+    """Per-order prep and decision-to-ack samples, split by warm/cold path."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples: dict[str, list[tuple[float, float]]] = {"warm": [], "cold": []}
+
+    def record(self, warm: bool, prep_ms: float, ack_ms: float) -> None:
+        with self._lock:
+            self._samples["warm" if warm else "cold"].append((prep_ms, ack_ms))
+
+    def summary(self, reset: bool = False) -> list[LatencySummary]:
+        with self._lock:
+            samples = {k: list(v) for k, v in self._samples.items()}
+            if reset:
+                for v in self._samples.values():
+                    v.clear()
+        out = []
+        for path, rows in samples.items():
+            if not rows:
+                continue
+            prep = [p for p, _ in rows]
+            ack = [a for _, a in rows]
+            out.append(LatencySummary(
+                path=path,
+                count=len(rows),
+                prep_p50_ms=statistics.median(prep),
+                ack_p50_ms=statistics.median(ack),
+                ack_p95_ms=_percentile(ack, 95),
+            ))
+        return out
+
+
+cache = OrderPrepCache()
+latency = OrderLatencyTracker()
+
+
+def log_order_latency_stats(reset: bool = True) -> None:
+    """Log decision-to-ack latency per path — called at the end of each tick."""
+    for s in latency.summary(reset=reset):
+        logger.info(
+            "Order latency (%s): n=%d prep p50=%.0fms decision-to-ack p50=%.0fms p95=%.0fms",
+            s.path, s.count, s.prep_p50_ms, s.ack_p50_ms, s.ack_p95_ms,
+        )
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -12,6 +14,9 @@ from zoneinfo import ZoneInfo
 import httpx
 
 from src.config import settings
+from src.connectors import order_prep
+from src.connectors.http_client import get_http_client
+from src.connectors.rate_limit import HostRateLimiter, get_rate_limiter
 from src.connectors.team_mapping import build_event_slug
 
 logger = logging.getLogger(__name__)
@@ -93,34 +98,101 @@ def _apply_proxy() -> None:
 
 
 def _get_httpx_client() -> httpx.Client:
-    proxy = settings.http_proxy or None
-    return httpx.Client(proxy=proxy, timeout=30)
+    """Shared pooled client for the Gamma API (keep-alive across calls)."""
+    return get_http_client(settings.gamma_api_url, use_proxy=True)
 
 
-_authenticated_client = None  # モジュールレベルキャッシュ
+def _gamma_get(path: str, params) -> httpx.Response:
+    """GET on the Gamma API via the proxy client, under the Gamma rate limiter."""
+    client = _get_httpx_client()
+    url = f"{settings.gamma_api_url}{path}"
+    return get_rate_limiter(settings.gamma_api_url).send(lambda: client.get(url, params=params))
 
 
-def _create_client(authenticated: bool = False):
+# プロセス内キャッシュ: {authenticated: ClobClient}。tick_size / neg_risk 等の
+# SDK 内部キャッシュもクライアント単位なので使い回すことで再取得も減る
+_clob_clients: dict[bool, Any] = {}
+_clob_lock = threading.Lock()
+
+
+def _load_or_derive_api_creds(client):
+    """Return L2 creds from the disk cache, deriving (and caching) them on a miss."""
+    from py_clob_client.clob_types import ApiCreds
+
+    from src.connectors.clob_creds import load_api_creds, save_api_creds
+
+    cache_path = settings.clob_creds_cache_path
+    address = client.get_address() or ""
+    if cache_path and address:
+        cached = load_api_creds(
+            cache_path, settings.polymarket_host, address, settings.clob_creds_cache_ttl_hours,
+        )
+        if cached:
+            return ApiCreds(**cached)
+
+    creds = client.create_or_derive_api_creds()
+    if cache_path and address:
+        try:
+            save_api_creds(
+                cache_path,
+                settings.polymarket_host,
+                address,
+                creds.api_key,
+                creds.api_secret,
+                creds.api_passphrase,
+            )
+        except OSError:
+            logger.warning("Failed to write CLOB creds cache %s", cache_path, exc_info=True)
+    return creds
+
+
+def _build_clob_client(authenticated: bool):
     from py_clob_client.client import ClobClient
 
+    if not authenticated:
+        return ClobClient(host=settings.polymarket_host)
+
+    client = ClobClient(
+        host=settings.polymarket_host,
+        key=settings.polymarket_private_key,
+        chain_id=settings.polymarket_chain_id,
+        signature_type=settings.polymarket_signature_type,
+        funder=settings.polymarket_funder or None,
+    )
+    client.set_api_creds(_load_or_derive_api_creds(client))
+    return client
+
+
+def _create_client(authenticated: bool = False):
+    """Return the process-wide ClobClient (L2 creds resolved lazily on first use)."""
     _apply_proxy()
-    if authenticated and settings.polymarket_private_key:
-        global _authenticated_client
-        if _authenticated_client is not None:
-            return _authenticated_client
-
-        funder = settings.polymarket_funder or None
-        client = ClobClient(
-            host=settings.polymarket_host,
-            key=settings.polymarket_private_key,
-            chain_id=settings.polymarket_chain_id,
-            signature_type=settings.polymarket_signature_type,
-            funder=funder,
-        )
-        client.set_api_creds(client.create_or_derive_api_creds())
-        _authenticated_client = client
+    key = bool(authenticated and settings.polymarket_private_key)
+    client = _clob_clients.get(key)
+    if client is not None:
         return client
-    return ClobClient(host=settings.polymarket_host)
+    with _clob_lock:
+        client = _clob_clients.get(key)
+        if client is None:
+            client = _build_clob_client(key)
+            _clob_clients[key] = client
+        return client
+
+
+def reset_clob_clients(clear_creds: bool = False) -> None:
+    """Drop cached ClobClients; with clear_creds also forget the on-disk L2 creds."""
+    with _clob_lock:
+        auth_client = _clob_clients.get(True)
+        _clob_clients.clear()
+    if clear_creds and auth_client is not None and settings.clob_creds_cache_path:
+        from src.connectors.clob_creds import clear_api_creds
+
+        address = auth_client.get_address() or ""
+        if address:
+            clear_api_creds(settings.clob_creds_cache_path, settings.polymarket_host, address)
+
+
+def _is_auth_error(exc: Exception) -> bool:
+    return getattr(exc, "status_code", None) == 401
 
 
 def _is_nba_market(market: dict[str, Any]) -> bool:
@@ -174,14 +246,13 @@ def _parse_json_or_csv(value: str | list) -> list[str]:
 
 def fetch_nba_markets_gamma() -> list[NBAMarket]:
     """Fetch NBA markets via the Gamma Markets API."""
-    client = _get_httpx_client()
     markets: list[NBAMarket] = []
     offset = 0
     limit = 100
 
     for _ in range(10):  # safety limit
-        resp = client.get(
-            f"{settings.gamma_api_url}/markets",
+        resp = _gamma_get(
+            "/markets",
             params={
                 "closed": "false",
                 "active": "true",
@@ -277,26 +348,87 @@ def get_order_book(token_id: str) -> dict[str, Any]:
     return client.get_order_book(token_id)
 
 
+# CLOB /books は 1 リクエストで複数 token の板を返す (POST body = [{"token_id": ...}])
+ORDER_BOOKS_BULK_CHUNK = 50
+
+def _get_clob_rate_limiter() -> HostRateLimiter:
+    """Process-wide limiter shared by every CLOB call (REST reads and SDK calls)."""
+    return get_rate_limiter(settings.polymarket_host)
+
+
+def _note_clob_error(exc: Exception) -> None:
+    """Feed SDK errors back to the limiter so a 429 triggers backoff."""
+    status = getattr(exc, "status_code", None)
+    if status == 429:
+        _get_clob_rate_limiter().on_response(429)
+
+
+def _get_clob_http_client() -> httpx.Client:
+    """Shared pooled client for raw CLOB REST reads."""
+    return get_http_client(settings.polymarket_host, use_proxy=True)
+
+
+def _fetch_raw_order_book(token_id: str) -> dict:
+    client = _get_clob_http_client()
+    resp = _get_clob_rate_limiter().send(
+        lambda: client.get(f"{settings.polymarket_host}/book", params={"token_id": token_id}),
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
 def fetch_order_book_safe(token_id: str) -> dict | None:
-    """Fetch order book with error handling. Returns None on failure."""
+    """Fetch a raw order book dict ({"asks": [...], "bids": [...]}). None on failure."""
     try:
-        return get_order_book(token_id)
+        return _fetch_raw_order_book(token_id)
     except Exception:
         logger.warning("Failed to fetch order book for token %s", token_id, exc_info=True)
         return None
 
 
+def _fetch_order_books_bulk(token_ids: list[str]) -> dict[str, dict]:
+    """POST /books in chunks. Raises on HTTP errors so the caller can fall back."""
+    wanted = set(token_ids)
+    results: dict[str, dict] = {}
+    client = _get_clob_http_client()
+    for i in range(0, len(token_ids), ORDER_BOOKS_BULK_CHUNK):
+        chunk = token_ids[i : i + ORDER_BOOKS_BULK_CHUNK]
+        resp = _get_clob_rate_limiter().send(
+            lambda chunk=chunk: client.post(
+                f"{settings.polymarket_host}/books",
+                json=[{"token_id": tid} for tid in chunk],
+            ),
+        )
+        resp.raise_for_status()
+        for raw in resp.json() or []:
+            tid = raw.get("asset_id") if isinstance(raw, dict) else None
+            if tid in wanted:
+                results[tid] = raw
+    return results
+
+
 def fetch_order_books_batch(token_ids: list[str]) -> dict[str, dict]:
-    """Batch fetch order books for multiple tokens.
+    """Batch fetch raw order books for multiple tokens.
 
-    Uses individual get_order_book calls (py-clob-client's get_order_books
-    may not be available). Returns {token_id: order_book} for successful fetches.
+    Uses the bulk /books endpoint; if that request fails, falls back to
+    per-token /book calls on a bounded thread pool. All requests share the
+    CLOB rate limiter. Returns {token_id: order_book} for successful fetches.
     """
+    unique = list(dict.fromkeys(token_ids))
+    if not unique:
+        return {}
+
+    try:
+        return _fetch_order_books_bulk(unique)
+    except (httpx.HTTPError, ValueError):
+        logger.info("Bulk /books failed, falling back to per-token fetch", exc_info=True)
+
     results: dict[str, dict] = {}
-    for tid in token_ids:
-        book = fetch_order_book_safe(tid)
-        if book is not None:
-            results[tid] = book
+    workers = max(1, min(settings.order_book_fetch_concurrency, len(unique)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for tid, book in zip(unique, pool.map(fetch_order_book_safe, unique)):
+            if book is not None:
+                results[tid] = book
     return results
 
 
@@ -305,6 +437,7 @@ def get_balance() -> dict[str, Any]:
     from py_clob_client.clob_types import AssetType, BalanceAllowanceParams
 
     client = _create_client(authenticated=True)
+    _get_clob_rate_limiter().acquire()
     return client.get_balance_allowance(
         BalanceAllowanceParams(asset_type=AssetType.COLLATERAL)
     )
@@ -330,42 +463,60 @@ def place_limit_buy(token_id: str, price: float, size_usd: float) -> dict:
         size_usd: Dollar amount to risk.
 
     Notes:
-        - SDK auto-resolves tick_size, neg_risk, fee_rate_bps per token.
-        - size は shares 数 (= size_usd / price)。SDK が tick に丸める。
-        - create_and_post_order は OrderArgs → 署名 → POST を一括実行。
+        - tick_size, neg_risk, fee_rate_bps は order_prep のテンプレートから取得
+          (未準備なら SDK で解決してキャッシュ)。
+        - size は shares 数 (= size_usd / price)。tick に丸めて署名する。
+        - decision-to-ack (呼び出し → POST 応答) を order_prep.latency に記録。
     """
     import time
 
-    from py_clob_client.clob_types import OrderArgs
-    from py_clob_client.order_builder.constants import BUY
-
-    client = _create_client(authenticated=True)
+    from py_clob_client.clob_types import OrderType
 
-    # shares = size_usd / price
-    size = round(size_usd / price, 2)
+    started = time.perf_counter()
+    limiter = _get_clob_rate_limiter()
 
-    order_args = OrderArgs(
-        token_id=token_id,
-        price=price,
-        size=size,
-        side=BUY,
-    )
+    client = _create_client(authenticated=True)
+    req = LimitBuyRequest(token_id, price, size_usd)
+    signed = None
+    warm = False
+    prep_ms = 0.0
 
     max_retries = 3
     for attempt in range(1, max_retries + 1):
         try:
-            # create_and_post_order = create_order + post_order を一括実行
-            # tick_size, neg_risk, fee_rate_bps は SDK が自動取得
-            resp = client.create_and_post_order(order_args)
+            # 署名は 1 回だけ (リトライ時も同じ署名済み注文を再送)
+            if signed is None:
+                signed, warm = _sign_limit_buy(client, req)
+                prep_ms = (time.perf_counter() - started) * 1000
+            # 発注間隔は固定 sleep ではなく CLOB 共有の token bucket で制御
+            limiter.acquire()
+            resp = client.post_order(signed, OrderType.GTC)
+            limiter.on_response(200)
+            ack_ms = (time.perf_counter() - started) * 1000
+            order_prep.latency.record(warm, prep_ms, ack_ms)
             logger.info(
-                "Order placed: token=%s price=%.3f size=%.2f resp=%s",
-                token_id, price, size, resp,
+                "Order placed: token=%s price=%.3f size_usd=%.2f resp=%s "
+                "(prep %.0fms, ack %.0fms, %s)",
+                token_id, price, size_usd, resp, prep_ms, ack_ms, "warm" if warm else "cold",
             )
-            time.sleep(0.5)  # レート制限対策
             return resp
-        except Exception:
+        except Exception as e:
+            _note_clob_error(e)
             if attempt == max_retries:
                 raise
+            if getattr(e, "status_code", None) == 429:
+                # 待機は limiter の backoff に任せる
+                logger.warning("Order attempt %d/%d rate limited", attempt, max_retries)
+                continue
+            if _is_auth_error(e):
+                # キャッシュ済み creds が失効 → 破棄して再導出
+                logger.warning("CLOB auth rejected, re-deriving API creds")
+                reset_clob_clients(clear_creds=True)
+                client = _create_client(authenticated=True)
+            else:
+                # tick size 変更等でテンプレートが古い可能性 → 再解決して署名し直す
+                order_prep.cache.invalidate(token_id)
+                signed = None
             wait = 2 ** attempt
             logger.warning(
                 "Order attempt %d/%d failed, retrying in %ds",
@@ -375,6 +526,198 @@ def place_limit_buy(token_id: str, price: float, size_usd: float) -> dict:
     return {}  # unreachable, for type checker
 
 
+# CLOB POST /orders の 1 リクエストあたり上限
+POST_ORDERS_MAX_BATCH = 15
+
+
+@dataclass
+class LimitBuyRequest:
+    token_id: str
+    price: float
+    size_usd: float
+
+
+@dataclass
+class OrderPlacement:
+    """Per-order result of ``place_limit_buys_batch``."""
+
+    request: LimitBuyRequest
+    response: dict | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.response is not None
+
+    @property
+    def order_id(self) -> str:
+        if not self.response:
+            return ""
+        return self.response.get("orderID") or self.response.get("id", "")
+
+
+def _order_template(client, token_id: str) -> tuple[order_prep.OrderTemplate, bool]:
+    """Cached template for ``token_id`` (resolved and cached on a miss). Returns (tpl, warm)."""
+    tpl = order_prep.cache.get(token_id)
+    if tpl is not None:
+        return tpl, True
+    _get_clob_rate_limiter().acquire()
+    tpl = order_prep.resolve_template(client, token_id)
+    order_prep.cache.put(tpl)
+    return tpl, False
+
+
+def _sign_limit_buy(client, req: LimitBuyRequest) -> tuple[Any, bool]:
+    """Sign a GTC buy for ``req``. Returns (signed_order, warm)."""
+    size = round(req.size_usd / req.price, 2)
+    if not settings.order_prep_enabled:
+        from py_clob_client.clob_types import OrderArgs
+        from py_clob_client.order_builder.constants import BUY
+
+        order_args = OrderArgs(token_id=req.token_id, price=req.price, size=size, side=BUY)
+        return client.create_order(order_args), False
+    tpl, warm = _order_template(client, req.token_id)
+    return order_prep.sign_limit_buy(client.builder, tpl, req.price, size), warm
+
+
+def prepare_order_templates(token_ids: list[str]) -> int:
+    """Pre-resolve order templates so placing an order skips the lookups.
+
+    Call when the tokens are known ahead of the buy decision (window open,
+    DCA slices, re-places). Returns the number of templates newly prepared.
+    """
+    if not settings.order_prep_enabled or not settings.polymarket_private_key:
+        return 0
+    missing = [t for t in dict.fromkeys(token_ids) if t and order_prep.cache.get(t) is None]
+    if not missing:
+        return 0
+    try:
+        client = _create_client(authenticated=True)
+    except Exception:
+        logger.warning("Order template prep skipped: CLOB client unavailable", exc_info=True)
+        return 0
+
+    def _prepare(token_id: str) -> bool:
+        try:
+            _order_template(client, token_id)
+            return True
+        except Exception:
+            logger.warning("Failed to prepare order template for %s", token_id, exc_info=True)
+            return False
+
+    workers = max(1, min(settings.order_sign_concurrency, len(missing)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prep") as pool:
+        prepared = sum(pool.map(_prepare, missing))
+    logger.info("Order templates prepared: %d/%d", prepared, len(missing))
+    return prepared
+
+
+def _post_signed_orders(client, signed: list) -> list:
+    """POST /orders for one chunk, retrying 429 / auth errors like ``place_limit_buy``."""
+    import time
+
+    from py_clob_client.clob_types import OrderType, PostOrdersArgs
+
+    limiter = _get_clob_rate_limiter()
+    args = [PostOrdersArgs(order=o, orderType=OrderType.GTC) for o in signed]
+    max_retries = 3
+    for attempt in range(1, max_retries + 1):
+        try:
+            limiter.acquire()
+            resp = client.post_orders(args)
+            limiter.on_response(200)
+            return resp if isinstance(resp, list) else []
+        except Exception as e:
+            _note_clob_error(e)
+            if attempt == max_retries:
+                raise
+            if getattr(e, "status_code", None) == 429:
+                logger.warning("Batch order attempt %d/%d rate limited", attempt, max_retries)
+                continue
+            if _is_auth_error(e):
+                # 署名は秘密鍵由来なので再利用できる。L2 creds だけ再導出
+                logger.warning("CLOB auth rejected, re-deriving API creds")
+                reset_clob_clients(clear_creds=True)
+                client = _create_client(authenticated=True)
+            wait = 2 ** attempt
+            logger.warning(
+                "Batch order attempt %d/%d failed, retrying in %ds",
+                attempt, max_retries, wait,
+            )
+            time.sleep(wait)
+    return []  # unreachable, for type checker
+
+
+def place_limit_buys_batch(requests: list[LimitBuyRequest]) -> list[OrderPlacement]:
+    """Place several GTC limit buys at once. Returns one result per request, in order.
+
+    Orders are signed concurrently (tick size / neg-risk / fee lookups are
+    per token) and posted via POST /orders in chunks of
+    ``POST_ORDERS_MAX_BATCH``. A failure signing one order, or a rejection of
+    one order by the CLOB, only fails that entry; a failed chunk POST fails
+    every order in the chunk.
+    """
+    import time
+
+    results = [OrderPlacement(req) for req in requests]
+    if not requests:
+        return results
+
+    started = time.perf_counter()
+    client = _create_client(authenticated=True)
+
+    def _sign(req: LimitBuyRequest):
+        try:
+            signed, warm = _sign_limit_buy(client, req)
+            return signed, warm, (time.perf_counter() - started) * 1000
+        except Exception as e:
+            logger.warning("Failed to sign order for token %s: %s", req.token_id, e)
+            return e
+
+    workers = max(1, min(settings.order_sign_concurrency, len(requests)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sign") as pool:
+        signed = list(pool.map(_sign, requests))
+
+    ready = []
+    for i, prepared in enumerate(signed):
+        if isinstance(prepared, Exception):
+            results[i].error = f"sign failed: {prepared}"
+        else:
+            ready.append((i, prepared))
+
+    for start in range(0, len(ready), POST_ORDERS_MAX_BATCH):
+        chunk = ready[start : start + POST_ORDERS_MAX_BATCH]
+        try:
+            responses = _post_signed_orders(client, [order for _, (order, _, _) in chunk])
+        except Exception as e:
+            logger.exception("Batch order POST failed (%d orders)", len(chunk))
+            for i, _ in chunk:
+                results[i].error = str(e)
+            continue
+        ack_ms = (time.perf_counter() - started) * 1000
+        for k, (i, (_, warm, prep_ms)) in enumerate(chunk):
+            resp = responses[k] if k < len(responses) else None
+            if not isinstance(resp, dict):
+                results[i].error = "missing response"
+            elif resp.get("success") is False or not (resp.get("orderID") or resp.get("id")):
+                results[i].error = resp.get("errorMsg") or "order rejected"
+                results[i].response = resp
+                order_prep.cache.invalidate(results[i].request.token_id)
+            else:
+                results[i].response = resp
+                order_prep.latency.record(warm, prep_ms, ack_ms)
+
+    placed = sum(1 for r in results if r.ok)
+    logger.info("Batch orders placed: %d/%d", placed, len(results))
+    for r in results:
+        if not r.ok:
+            logger.warning(
+                "Batch order failed: token=%s price=%.3f error=%s",
+                r.request.token_id, r.request.price, r.error,
+            )
+    return results
+
+
 def extract_fee_rate_bps(order_status: dict) -> float:
     """Extract fee_rate_bps from a CLOB order status response.
 
@@ -391,21 +734,70 @@ def extract_fee_rate_bps(order_status: dict) -> float:
 def get_order_status(order_id: str) -> dict:
     """Get order status from CLOB."""
     client = _create_client(authenticated=True)
-    return client.get_order(order_id)
+    _get_clob_rate_limiter().acquire()
+    try:
+        return client.get_order(order_id)
+    except Exception as e:
+        _note_clob_error(e)
+        raise
+
+
+def get_open_orders() -> dict[str, dict]:
+    """All open orders for the account, keyed by order id.
+
+    The SDK follows ``next_cursor`` internally, so this is one logical call
+    (a few pages at most) instead of one request per order.
+    """
+    client = _create_client(authenticated=True)
+    _get_clob_rate_limiter().acquire()
+    try:
+        orders = client.get_orders() or []
+    except Exception as e:
+        _note_clob_error(e)
+        raise
+    return {o["id"]: o for o in orders if isinstance(o, dict) and o.get("id")}
 
 
 def cancel_order(order_id: str) -> bool:
     """Cancel an open order. Returns True on success."""
     client = _create_client(authenticated=True)
+    _get_clob_rate_limiter().acquire()
     try:
         resp = client.cancel(order_id)
         logger.info("Order cancelled: %s resp=%s", order_id, resp)
         return True
-    except Exception:
+    except Exception as e:
+        _note_clob_error(e)
         logger.exception("Failed to cancel order %s", order_id)
         return False
 
 
+def cancel_orders_batch(order_ids: list[str]) -> dict[str, bool]:
+    """Cancel several orders with one DELETE /orders. Returns {order_id: cancelled}.
+
+    If the batch request itself fails, falls back to per-order ``cancel_order``.
+    """
+    unique = [oid for oid in dict.fromkeys(order_ids) if oid]
+    if not unique:
+        return {}
+
+    client = _create_client(authenticated=True)
+    _get_clob_rate_limiter().acquire()
+    try:
+        resp = client.cancel_orders(unique) or {}
+    except Exception as e:
+        _note_clob_error(e)
+        logger.warning("Batch cancel failed, falling back to per-order cancel", exc_info=True)
+        return {oid: cancel_order(oid) for oid in unique}
+
+    canceled = set(resp.get("canceled") or [])
+    not_canceled = resp.get("not_canceled") or {}
+    for oid, reason in not_canceled.items():
+        logger.warning("Order %s not cancelled: %s", oid, reason)
+    logger.info("Orders cancelled: %d/%d", len(canceled & set(unique)), len(unique))
+    return {oid: oid in canceled for oid in unique}
+
+
 def cancel_and_replace_order(
     old_order_id: str,
     token_id: str,
@@ -417,15 +809,11 @@ def cancel_and_replace_order(
     Returns the new order response dict (with 'orderID' key) on success.
     Raises on failure (caller should handle).
     """
-    import time
-
-    # 1. Cancel old order
+    # 1. Cancel old order (cancel → place の間隔は CLOB の token bucket が制御)
     cancelled = cancel_order(old_order_id)
     if not cancelled:
         logger.warning("Could not cancel order %s, proceeding with new order anyway", old_order_id)
 
-    time.sleep(0.3)  # レート制限対策
-
     # 2. Place new order
     return place_limit_buy(token_id, new_price, size_usd)
 
@@ -449,45 +837,13 @@ class MoneylineMarket:
     active: bool
 
 
-def fetch_moneyline_for_game(
+def _parse_moneyline_event(
+    event: dict[str, Any],
+    slug: str,
     away_team: str,
     home_team: str,
-    game_date: str,
 ) -> MoneylineMarket | None:
-    """Fetch the moneyline market for a single game via the Gamma Events API.
-
-    Args:
-        away_team: Full team name from Odds API (e.g. "New York Knicks").
-        home_team: Full team name from Odds API (e.g. "Boston Celtics").
-        game_date: Date string "YYYY-MM-DD" in US Eastern time.
-    """
-    slug = build_event_slug(away_team, home_team, game_date)
-    if not slug:
-        logger.warning("Cannot build slug for %s @ %s", away_team, home_team)
-        return None
-
-    client = _get_httpx_client()
-    try:
-        resp = client.get(
-            f"{settings.gamma_api_url}/events",
-            params={"slug": slug},
-        )
-        resp.raise_for_status()
-        data = resp.json()
-    except (httpx.HTTPStatusError, httpx.TimeoutException) as e:
-        logger.error("Events API request failed for slug=%s: %s", slug, e)
-        return None
-    except httpx.HTTPError:
-        logger.exception("Events API request failed for slug=%s", slug)
-        return None
-
-    # The API returns a list; find our event
-    events = data if isinstance(data, list) else [data]
-    if not events:
-        logger.debug("No event found for slug=%s", slug)
-        return None
-
-    event = events[0]
+    """Extract the moneyline market from one Gamma event payload."""
     event_title = event.get("title", f"{away_team} vs {home_team}")
 
     # Search nested markets for the moneyline
@@ -543,14 +899,98 @@ def fetch_moneyline_for_game(
     return None
 
 
+def fetch_moneyline_for_game(
+    away_team: str,
+    home_team: str,
+    game_date: str,
+) -> MoneylineMarket | None:
+    """Fetch the moneyline market for a single game via the Gamma Events API.
+
+    Args:
+        away_team: Full team name from Odds API (e.g. "New York Knicks").
+        home_team: Full team name from Odds API (e.g. "Boston Celtics").
+        game_date: Date string "YYYY-MM-DD" in US Eastern time.
+    """
+    slug = build_event_slug(away_team, home_team, game_date)
+    if not slug:
+        logger.warning("Cannot build slug for %s @ %s", away_team, home_team)
+        return None
+
+    try:
+        resp = _gamma_get("/events", params={"slug": slug})
+        resp.raise_for_status()
+        data = resp.json()
+    except (httpx.HTTPStatusError, httpx.TimeoutException) as e:
+        logger.error("Events API request failed for slug=%s: %s", slug, e)
+        return None
+    except httpx.HTTPError:
+        logger.exception("Events API request failed for slug=%s", slug)
+        return None
+
+    # The API returns a list; find our event
+    events = data if isinstance(data, list) else [data]
+    if not events:
+        logger.debug("No event found for slug=%s", slug)
+        return None
+
+    return _parse_moneyline_event(events[0], slug, away_team, home_team)
+
+
+# Gamma /events は slug の複数指定を受け付ける。URL 長を抑えるため分割する
+GAMMA_SLUG_BATCH_SIZE = 20
+
+
+def fetch_moneylines_batch(
+    games: list[tuple[str, str, str]],
+) -> dict[str, MoneylineMarket]:
+    """Fetch moneylines for many games with one Gamma request per slug batch.
+
+    Args:
+        games: (away_team, home_team, game_date) tuples.
+
+    Returns {event_slug: MoneylineMarket} for events found. Slugs missing from
+    the result (not listed yet, or the batch request failed) are simply absent.
+    """
+    teams_by_slug: dict[str, tuple[str, str]] = {}
+    for away_team, home_team, game_date in games:
+        slug = build_event_slug(away_team, home_team, game_date)
+        if slug:
+            teams_by_slug[slug] = (away_team, home_team)
+        else:
+            logger.warning("Cannot build slug for %s @ %s", away_team, home_team)
+
+    slugs = list(teams_by_slug)
+    index: dict[str, MoneylineMarket] = {}
+    for i in range(0, len(slugs), GAMMA_SLUG_BATCH_SIZE):
+        chunk = slugs[i : i + GAMMA_SLUG_BATCH_SIZE]
+        try:
+            resp = _gamma_get("/events", params=[("slug", s) for s in chunk])
+            resp.raise_for_status()
+            data = resp.json()
+        except httpx.HTTPError as e:
+            logger.warning("Batched Events API request failed (%d slugs): %s", len(chunk), e)
+            continue
+
+        for event in data if isinstance(data, list) else [data]:
+            slug = event.get("slug", "")
+            if slug not in teams_by_slug or slug in index:
+                continue
+            away_team, home_team = teams_by_slug[slug]
+            ml = _parse_moneyline_event(event, slug, away_team, home_team)
+            if ml:
+                index[slug] = ml
+
+    logger.debug("Batched discovery: %d/%d moneylines", len(index), len(slugs))
+    return index
+
+
 def fetch_all_moneylines(games: list) -> list[MoneylineMarket]:
     """Fetch moneyline markets for all today's games.
 
     Args:
         games: list of GameOdds from the Odds API.
     """
-    moneylines: list[MoneylineMarket] = []
-
+    dated: list[tuple[str, str, str]] = []
     for game in games:
         # Convert UTC commence_time to Eastern date
         try:
@@ -560,15 +1000,22 @@ def fetch_all_moneylines(games: list) -> list[MoneylineMarket]:
         except (ValueError, AttributeError):
             logger.warning("Bad commence_time for %s @ %s", game.away_team, game.home_team)
             continue
+        dated.append((game.away_team, game.home_team, game_date))
+
+    from src.connectors.market_snapshot import MarketSnapshot
 
-        ml = fetch_moneyline_for_game(game.away_team, game.home_team, game_date)
+    snapshot = MarketSnapshot()
+    snapshot.register_games(dated)
+    moneylines: list[MoneylineMarket] = []
+    for away_team, home_team, game_date in dated:
+        ml = snapshot.moneyline(away_team, home_team, game_date)
         if ml:
             moneylines.append(ml)
         else:
             logger.info(
                 "No moneyline found: %s @ %s (%s)",
-                game.away_team,
-                game.home_team,
+                away_team,
+                home_team,
                 game_date,
             )
 
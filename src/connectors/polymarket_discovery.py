@@ -6,8 +6,9 @@ import logging
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+from src.connectors.market_snapshot import MarketSnapshot
 from src.connectors.nba_schedule import fetch_games_for_date, fetch_todays_games
-from src.connectors.polymarket import MoneylineMarket, fetch_moneyline_for_game
+from src.connectors.polymarket import MoneylineMarket
 from src.connectors.team_mapping import build_event_slug
 
 logger = logging.getLogger(__name__)
@@ -36,8 +37,7 @@ def fetch_all_nba_moneylines(
         logger.warning("No games found from NBA.com (target_date=%s)", target_date)
         return []
 
-    moneylines: list[MoneylineMarket] = []
-
+    dated: list[tuple[str, str, str]] = []
     for game in games:
         # 日付決定: target_date 指定時はそれを使用、
         # 未指定時は game_time_utc → ET 変換
@@ -63,14 +63,20 @@ def fetch_all_nba_moneylines(
                 "Cannot build slug for %s @ %s", game.away_team, game.home_team,
             )
             continue
+        dated.append((game.away_team, game.home_team, game_date))
 
-        ml = fetch_moneyline_for_game(game.away_team, game.home_team, game_date)
+    # 日付単位で一括取得 (slug バッチ)。見つからない slug のみ個別取得にフォールバック
+    snapshot = MarketSnapshot()
+    snapshot.register_games(dated)
+    moneylines: list[MoneylineMarket] = []
+    for away_team, home_team, game_date in dated:
+        ml = snapshot.moneyline(away_team, home_team, game_date)
         if ml:
             moneylines.append(ml)
         else:
             logger.info(
                 "No moneyline found: %s @ %s (slug=%s)",
-                game.away_team, game.home_team, slug,
+                away_team, home_team, build_event_slug(away_team, home_team, game_date),
             )
 
     logger.info(
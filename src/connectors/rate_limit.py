@@ -0,0 +1,290 @@
+"""Rate limiting for outbound API calls.
+
+``TokenBucket`` is the primitive. ``HostRateLimiter`` wraps one per host with
+429-aware adaptive backoff and usage counters, and ``get_rate_limiter``
+returns the process-wide limiter for a host so every connector and script
+hitting the same API shares one budget.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TypeVar
+from urllib.parse import urlsplit
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens/sec, up to ``burst`` banked.
+
+    ``acquire()`` blocks until a token is available, so concurrent workers
+    sharing one bucket stay under the rate without fixed sleeps.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token (possibly going negative) and return the wait needed."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """Block until a request may be sent. Returns seconds waited."""
+        wait = self._reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class RateLimitStats:
+    """Usage counters for one host since the last reset."""
+
+    host: str
+    requests: int
+    throttled: int  # 429 応答数
+    waited_sec: float  # acquire() でブロックした合計秒
+    rate: float  # 現在のレート (429 後は減速中)
+    base_rate: float
+    burst: int
+    window_sec: float  # 集計期間
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the configured budget used in the window (1.0 = at the limit)."""
+        budget = self.base_rate * self.window_sec + self.burst
+        return self.requests / budget if budget > 0 else 0.0
+
+
+class HostRateLimiter:
+    """Token bucket for one host with 429-aware adaptive backoff.
+
+    A 429 halves the rate (floor ``MIN_RATE_FRACTION`` of the base) and holds
+    new requests until Retry-After, or an exponential backoff capped at
+    ``max_backoff_sec``, has passed. Each later non-429 response restores
+    ``RECOVERY_FRACTION`` of the base rate.
+    """
+
+    MIN_RATE_FRACTION = 0.1
+    RECOVERY_FRACTION = 0.1
+
+    def __init__(
+        self,
+        host: str,
+        rate: float,
+        burst: int = 1,
+        *,
+        max_backoff_sec: float = 60.0,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.host = host
+        self.base_rate = rate
+        self.max_backoff_sec = max_backoff_sec
+        self._bucket = TokenBucket(rate, burst, clock=clock, sleep=sleep)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+        self._consecutive_throttles = 0
+        self._window_start = clock()
+        self.requests = 0
+        self.throttled = 0
+        self.waited_sec = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self._bucket.rate
+
+    def acquire(self) -> float:
+        """Block until a request may be sent (honours 429 backoff). Returns seconds waited."""
+        with self._lock:
+            self.requests += 1
+            hold = self._blocked_until - self._clock()
+        waited = 0.0
+        if hold > 0:
+            self._sleep(hold)
+            waited = hold
+        waited += self._bucket.acquire()
+        if waited:
+            with self._lock:
+                self.waited_sec += waited
+        return waited
+
+    def on_response(self, status_code: int | None, retry_after: float | None = None) -> None:
+        """Feed back a response status; 429 triggers backoff, anything else recovery."""
+        with self._lock:
+            if status_code == 429:
+                self.throttled += 1
+                self._consecutive_throttles += 1
+                self._bucket.rate = max(
+                    self.base_rate * self.MIN_RATE_FRACTION, self._bucket.rate / 2,
+                )
+                if retry_after is None:
+                    retry_after = 2.0 ** (self._consecutive_throttles - 1)
+                delay = min(retry_after, self.max_backoff_sec)
+                self._blocked_until = max(self._blocked_until, self._clock() + delay)
+                logger.warning(
+                    "Rate limited by %s: backing off %.1fs, rate %.2f/s",
+                    self.host, delay, self._bucket.rate,
+                )
+                return
+            self._consecutive_throttles = 0
+            if self._bucket.rate < self.base_rate:
+                self._bucket.rate = min(
+                    self.base_rate,
+                    self._bucket.rate + self.base_rate * self.RECOVERY_FRACTION,
+                )
+
+    def send(self, request: Callable[[], R], max_retries: int | None = None) -> R:
+        """Run ``request()`` (returning an httpx-style response) under the limiter.
+
+        429 responses are retried up to ``max_retries`` times after the backoff;
+        the last response is returned either way.
+        """
+        if max_retries is None:
+            max_retries = settings.rate_limit_max_retries
+        for attempt in range(max_retries + 1):
+            self.acquire()
+            resp = request()
+            status = getattr(resp, "status_code", None)
+            headers = getattr(resp, "headers", None) or {}
+            self.on_response(status, parse_retry_after(headers.get("Retry-After")))
+            if status != 429 or attempt == max_retries:
+                return resp
+        return resp  # unreachable, for type checker
+
+    def stats(self) -> RateLimitStats:
+        with self._lock:
+            return RateLimitStats(
+                host=self.host,
+                requests=self.requests,
+                throttled=self.throttled,
+                waited_sec=self.waited_sec,
+                rate=self._bucket.rate,
+                base_rate=self.base_rate,
+                burst=self._bucket.burst,
+                window_sec=self._clock() - self._window_start,
+            )
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.throttled = 0
+            self.waited_sec = 0.0
+            self._window_start = self._clock()
+
+
+# ---------------------------------------------------------------------------
+# Process-wide registry (one limiter per host)
+# ---------------------------------------------------------------------------
+
+_limiters: dict[str, HostRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _host(url_or_host: str) -> str:
+    if "://" in url_or_host:
+        return (urlsplit(url_or_host).hostname or "").lower()
+    return url_or_host.lower()
+
+
+def _budget(host: str) -> tuple[float, int]:
+    """(requests/sec, burst) for ``host`` from settings."""
+    if host == _host(settings.polymarket_host):
+        return settings.clob_requests_per_sec, settings.clob_request_burst
+    if host == _host(settings.gamma_api_url):
+        return settings.gamma_requests_per_sec, settings.gamma_request_burst
+    if host == "data-api.polymarket.com":
+        return settings.data_api_requests_per_sec, settings.data_api_request_burst
+    return settings.http_default_requests_per_sec, settings.http_default_request_burst
+
+
+def get_rate_limiter(url_or_host: str) -> HostRateLimiter:
+    """Return the shared limiter for the host of ``url_or_host``."""
+    host = _host(url_or_host)
+    limiter = _limiters.get(host)
+    if limiter is not None:
+        return limiter
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            rate, burst = _budget(host)
+            limiter = HostRateLimiter(
+                host, rate, burst, max_backoff_sec=settings.rate_limit_max_backoff_sec,
+            )
+            _limiters[host] = limiter
+        return limiter
+
+
+def rate_limit_stats(reset: bool = False) -> list[RateLimitStats]:
+    """Counters for every host used so far (optionally starting a new window)."""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    stats = [lim.stats() for lim in limiters]
+    if reset:
+        for lim in limiters:
+            lim.reset_stats()
+    return stats
+
+
+def log_rate_limit_stats(reset: bool = True) -> None:
+    """Log per-host usage (one line per host) — called at the end of each tick."""
+    for s in rate_limit_stats(reset=reset):
+        if not s.requests:
+            continue
+        logger.info(
+            "Rate limit %s: requests=%d utilization=%.0f%% throttled=%d waited=%.2fs "
+            "rate=%.1f/%.1f per sec",
+            s.host, s.requests, s.utilization * 100, s.throttled, s.waited_sec,
+            s.rate, s.base_rate,
+        )
+
+
+def reset_rate_limiters() -> None:
+    """Drop all limiters (tests / after changing budgets in settings)."""
+    with _limiters_lock:
+        _limiters.clear()
@@ -7,6 +7,7 @@ import logging
 import httpx
 
 from src.config import settings
+from src.connectors.http_client import http_post
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +26,7 @@ def send_message(text: str, parse_mode: str = "Markdown") -> bool:
     url = TELEGRAM_API.format(token=settings.telegram_bot_token)
 
     try:
-        resp = httpx.post(
+        resp = http_post(
             url,
             json={
                 "chat_id": settings.telegram_chat_id,
@@ -41,7 +42,7 @@ def send_message(text: str, parse_mode: str = "Markdown") -> bool:
             # Markdown パースエラー → plain text でリトライ
             logger.warning("Telegram Markdown parse failed, retrying as plain text")
             try:
-                resp2 = httpx.post(
+                resp2 = http_post(
                     url,
                     json={
                         "chat_id": settings.telegram_chat_id,
@@ -2,6 +2,10 @@
 
 Monitors per-band rolling win rates against the calibration table
 and flags bands where observed performance diverges significantly.
+
+All checks read the per-day/band buckets of the risk ledger
+(``get_band_daily_stats``), so one query serves every band and window;
+pass the same ``daily`` rows to each ``compute_*`` to share it.
 """
 
 from __future__ import annotations
@@ -9,6 +13,7 @@ from __future__ import annotations
 import logging
 import math
 from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from statistics import mean, pstdev
 
@@ -43,10 +48,71 @@ class StructuralChangeHealthMetrics:
     orange_triggered: bool
 
 
+def load_daily_stats(db_path: Path | str, start_date: str | None = None) -> list[dict]:
+    """Per-day/band buckets (calibration strategy) shared by the compute_* checks."""
+    from src.store.db import get_band_daily_stats
+
+    return get_band_daily_stats(start_date=start_date, db_path=db_path)
+
+
+def _window_start(as_of_date: str | None, days: int) -> str:
+    if as_of_date:
+        end_dt = datetime.strptime(as_of_date, "%Y-%m-%d")
+    else:
+        end_dt = datetime.now(timezone.utc)
+    return (end_dt - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+
+
+def _band_totals(daily: list[dict]) -> dict[str, dict]:
+    """All-time n / wins / trade_profitable per band label."""
+    totals: dict[str, dict] = {}
+    for row in daily:
+        t = totals.setdefault(row["band"], {"total": 0, "wins": 0, "trade_profitable": 0})
+        t["total"] += row["n"]
+        t["wins"] += row["wins"]
+        t["trade_profitable"] += row["trade_profitable"]
+    return totals
+
+
+def _gap_stats(expected_pnl: float, realized_pnl: float, total: int) -> dict:
+    gap_usd = realized_pnl - expected_pnl
+    gap_pct = gap_usd / abs(expected_pnl) * 100 if expected_pnl != 0 else 0.0
+    return {
+        "expected_pnl": expected_pnl,
+        "realized_pnl": realized_pnl,
+        "gap_usd": gap_usd,
+        "gap_pct": gap_pct,
+        "total": total,
+    }
+
+
+def _gap_window(
+    daily: list[dict], as_of_date: str | None, days: int,
+) -> tuple[dict, dict[str, dict]]:
+    """Expected-vs-realized gap for the window: (total, {band: stats})."""
+    if days <= 0:
+        return _gap_stats(0.0, 0.0, 0), {}
+    start = _window_start(as_of_date, days)
+    total = [0.0, 0.0, 0]
+    bands: dict[str, list] = {}
+    for row in daily:
+        if row["day"] < start or row["ev_n"] == 0:
+            continue
+        accs = [total]
+        if row["band"]:  # バンド未設定のシグナルは total のみ
+            accs.append(bands.setdefault(row["band"], [0.0, 0.0, 0]))
+        for acc in accs:
+            acc[0] += row["expected_pnl"]
+            acc[1] += row["realized_pnl"]
+            acc[2] += row["ev_n"]
+    return _gap_stats(*total), {b: _gap_stats(*acc) for b, acc in bands.items()}
+
+
 def compute_calibration_health(
     db_path: Path | str,
     min_sample: int = 20,
     drift_threshold_sigma: float = 2.0,
+    daily: list[dict] | None = None,
 ) -> list[CalibrationHealthMetrics]:
     """Compute rolling win rate and trade profit rate per band and detect drift.
 
@@ -57,14 +123,14 @@ def compute_calibration_health(
         db_path: Path to SQLite database.
         min_sample: Minimum settled conditions per band to evaluate.
         drift_threshold_sigma: Z-score threshold for flagging drift.
+        daily: Rows from ``load_daily_stats`` covering all days (loaded if None).
 
     Returns:
         List of CalibrationHealthMetrics, one per band with enough data.
     """
-    from src.store.db import get_band_decomposed_stats, get_band_win_rates
-
-    band_stats = get_band_win_rates(db_path=db_path)
-    decomposed_stats = get_band_decomposed_stats(db_path=db_path)
+    if daily is None:
+        daily = load_daily_stats(db_path)
+    band_stats = _band_totals(daily)
     results: list[CalibrationHealthMetrics] = []
 
     for band in NBA_ML_CALIBRATION:
@@ -77,13 +143,8 @@ def compute_calibration_health(
         z_game = _z_score(rolling_wr, band.expected_win_rate, stats["total"])
 
         # Trade profit z-score (trade_profitable / total)
-        decomp = decomposed_stats.get(label)
-        z_profit = 0.0
-        if decomp and decomp["total"] >= min_sample:
-            trade_profit_rate = decomp["trade_profitable"] / decomp["total"]
-            z_profit = _z_score(
-                trade_profit_rate, band.expected_win_rate, decomp["total"]
-            )
+        trade_profit_rate = stats["trade_profitable"] / stats["total"]
+        z_profit = _z_score(trade_profit_rate, band.expected_win_rate, stats["total"])
 
         # Drift if either game_correct OR trade_profit is significantly below expected
         drifted = z_game < -drift_threshold_sigma or z_profit < -drift_threshold_sigma
@@ -204,25 +265,16 @@ def compute_pnl_divergence_health(
     as_of_date: str | None = None,
     short_days: int = 7,
     long_days: int = 28,
+    daily: list[dict] | None = None,
 ) -> dict[str, dict[str, PnLGapHealthMetrics]]:
-    """Compute expected-vs-realized PnL divergence for total and per-band scopes."""
-    from src.store.db import (
-        get_expected_realized_gap_by_band,
-        get_expected_realized_gap_summary,
-    )
+    """Compute expected-vs-realized PnL divergence for total and per-band scopes.
 
-    total_short_raw = get_expected_realized_gap_summary(
-        days=short_days, as_of_date=as_of_date, db_path=db_path
-    )
-    total_long_raw = get_expected_realized_gap_summary(
-        days=long_days, as_of_date=as_of_date, db_path=db_path
-    )
-    band_short_raw = get_expected_realized_gap_by_band(
-        days=short_days, as_of_date=as_of_date, db_path=db_path
-    )
-    band_long_raw = get_expected_realized_gap_by_band(
-        days=long_days, as_of_date=as_of_date, db_path=db_path
-    )
+    ``daily`` must cover at least the longer window (loaded if None).
+    """
+    if daily is None:
+        daily = load_daily_stats(db_path, _window_start(as_of_date, max(short_days, long_days)))
+    total_short_raw, band_short_raw = _gap_window(daily, as_of_date, short_days)
+    total_long_raw, band_long_raw = _gap_window(daily, as_of_date, long_days)
 
     return {
         "total": {
@@ -357,13 +409,30 @@ def compute_structural_change_health(
     cusum_k: float = 0.5,
     cusum_h_yellow: float = 4.5,
     cusum_h_orange: float = 6.0,
+    daily: list[dict] | None = None,
 ) -> dict[str, object]:
-    """Compute CUSUM structural-change health for total and per-band series."""
-    from src.store.db import get_daily_gap_series, get_expected_realized_gap_by_band
+    """Compute CUSUM structural-change health for total and per-band series.
 
-    total_series = get_daily_gap_series(
-        days=window_days, as_of_date=as_of_date, db_path=db_path
-    )
+    Daily gap series (realized - expected, positive-EV signals) for the total
+    and every band come from one pass over ``daily`` (loaded if None).
+    """
+    if window_days <= 0:
+        daily = []
+    elif daily is None:
+        daily = load_daily_stats(db_path, _window_start(as_of_date, window_days))
+    start = _window_start(as_of_date, window_days) if window_days > 0 else ""
+
+    total_by_day: dict[str, float] = {}
+    band_series: dict[str, list[float]] = {}
+    for row in daily:  # day 昇順
+        if row["day"] < start or row["ev_n"] == 0:
+            continue
+        gap = row["realized_pnl"] - row["expected_pnl"]
+        total_by_day[row["day"]] = total_by_day.get(row["day"], 0.0) + gap
+        if row["band"]:
+            band_series.setdefault(row["band"], []).append(gap)
+
+    total_series = list(total_by_day.values())
     total_score = _cusum_score(total_series, k=cusum_k)
     total = StructuralChangeHealthMetrics(
         scope="total",
@@ -374,17 +443,9 @@ def compute_structural_change_health(
         orange_triggered=total_score >= cusum_h_orange,
     )
 
-    band_raw = get_expected_realized_gap_by_band(
-        days=window_days, as_of_date=as_of_date, db_path=db_path
-    )
     bands: dict[str, StructuralChangeHealthMetrics] = {}
-    for label in sorted(band_raw):
-        series = get_daily_gap_series(
-            days=window_days,
-            as_of_date=as_of_date,
-            band_label=label,
-            db_path=db_path,
-        )
+    for label in sorted(band_series):
+        series = band_series[label]
         score = _cusum_score(series, k=cusum_k)
         bands[label] = StructuralChangeHealthMetrics(
             scope=label,
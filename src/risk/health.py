@@ -72,15 +72,14 @@ def check_local_health(
 
 def check_api_health() -> HealthStatus:
     """Check external API reachability (every 5th tick, ~10 min)."""
-    import httpx
-
     from src.config import settings
+    from src.connectors.http_client import http_get
 
     status = HealthStatus()
 
     # NBA.com
     try:
-        resp = httpx.get(settings.nba_scoreboard_url, timeout=10)
+        resp = http_get(settings.nba_scoreboard_url, timeout=10)
         status.checks["nba_api"] = resp.status_code == 200
         if resp.status_code != 200:
             status.ok = False
@@ -92,7 +91,7 @@ def check_api_health() -> HealthStatus:
 
     # Polymarket Gamma API
     try:
-        resp = httpx.get(f"{settings.gamma_api_url}/markets?limit=1", timeout=10)
+        resp = http_get(f"{settings.gamma_api_url}/markets?limit=1", timeout=10)
         status.checks["polymarket_api"] = resp.status_code == 200
         if resp.status_code != 200:
             status.ok = False
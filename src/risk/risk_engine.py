@@ -16,7 +16,7 @@ from src.risk.models import CircuitBreakerLevel, RiskState
 
 logger = logging.getLogger(__name__)
 
-# --- tick 内キャッシュ (TTL 30s, cron 終了で自動消滅) ---
+# --- tick 内キャッシュ (TTL 30s, cron 終了で自動消滅)。プロセス間は risk_state_cache ---
 _cached_state: RiskState | None = None
 _cached_at: float = 0.0
 _CACHE_TTL = 30.0
@@ -30,10 +30,20 @@ RECOVERY_DAYS_FULL = 7
 BALANCE_ANOMALY_PCT = 10.0  # 10%+ 急減で警告
 
 
-def compute_risk_state(db_path: Path | str) -> RiskState:
+def compute_risk_state(
+    db_path: Path | str,
+    reuse: RiskState | None = None,
+    prev: RiskState | None = None,
+) -> RiskState:
     """Compute all risk metrics in a single pass from DB.
 
     Balance fetched from external API; falls back to last known on failure.
+
+    With ``reuse`` (a state computed today with no results rows since), its
+    results-derived metrics — daily/weekly P&L, consecutive losses and the
+    calibration flags — are taken as-is; balance, exposure and the circuit
+    breaker are recomputed. ``prev`` is the latest risk snapshot when the
+    caller already loaded it.
     """
     from src.store.db import (
         get_consecutive_losses,
@@ -47,30 +57,38 @@ def compute_risk_state(db_path: Path | str) -> RiskState:
     today_str = now.strftime("%Y-%m-%d")
 
     # 前回 snapshot を取得 (balance フォールバック用)
-    prev = get_latest_risk_snapshot(db_path=db_path)
+    if prev is None:
+        prev = get_latest_risk_snapshot(db_path=db_path)
     last_balance = prev.last_known_balance if prev else 0.0
 
     # 残高取得
     current_balance = _fetch_balance_safe(last_balance)
 
     # 日次 P&L
-    daily = get_daily_results(today_str, db_path=db_path)
-    daily_pnl = daily["pnl"]
+    if reuse is not None:
+        daily_pnl = reuse.daily_pnl
+    else:
+        daily_pnl = get_daily_results(today_str, db_path=db_path)["pnl"]
     if current_balance > 0 and daily_pnl < 0:
         daily_loss_pct = abs(daily_pnl / current_balance * 100)
     else:
         daily_loss_pct = 0.0
 
     # 週次 P&L
-    weekly = get_weekly_results(today_str, db_path=db_path)
-    weekly_pnl = weekly["pnl"]
+    if reuse is not None:
+        weekly_pnl = reuse.weekly_pnl
+    else:
+        weekly_pnl = get_weekly_results(today_str, db_path=db_path)["pnl"]
     if current_balance > 0 and weekly_pnl < 0:
         weekly_loss_pct = abs(weekly_pnl / current_balance * 100)
     else:
         weekly_loss_pct = 0.0
 
     # 連敗
-    consecutive_losses = get_consecutive_losses(db_path=db_path)
+    if reuse is not None:
+        consecutive_losses = reuse.consecutive_losses
+    else:
+        consecutive_losses = get_consecutive_losses(db_path=db_path)
 
     # 最大ドローダウン (直近の累積 PnL ベース)
     max_drawdown_pct = _compute_drawdown_pct(daily_pnl, weekly_pnl, current_balance)
@@ -83,66 +101,12 @@ def compute_risk_state(db_path: Path | str) -> RiskState:
     prev_lockout = prev.lockout_until if prev else None
     prev_multiplier = prev.sizing_multiplier if prev else 1.0
 
-    # 校正ドリフトフラグ
+    # 校正ドリフトフラグ (results のみに依存)
     flags: set[str] = set()
-    try:
-        from src.risk.calibration_monitor import (
-            compute_calibration_health,
-            compute_pnl_divergence_health,
-            compute_structural_change_health,
-            evaluate_pnl_divergence_flags,
-            evaluate_structural_change_flags,
-        )
-
-        health = compute_calibration_health(
-            db_path,
-            drift_threshold_sigma=settings.calibration_drift_threshold,
-        )
-        drifted_bands = [h for h in health if h.drifted]
-        if drifted_bands:
-            flags.add("calibration_drift")
-
-        pnl_health = compute_pnl_divergence_health(
-            db_path,
-            as_of_date=today_str,
-            short_days=settings.pnl_divergence_short_days,
-            long_days=settings.pnl_divergence_long_days,
-        )
-        flags.update(
-            evaluate_pnl_divergence_flags(
-                pnl_health,
-                min_total_short=settings.pnl_divergence_min_total_short,
-                min_total_long=settings.pnl_divergence_min_total_long,
-                min_band_short=settings.pnl_divergence_min_band_short,
-                yellow_total_gap_pct=settings.pnl_divergence_yellow_total_gap_pct,
-                yellow_total_gap_usd=settings.pnl_divergence_yellow_total_gap_usd,
-                yellow_band_gap_pct=settings.pnl_divergence_yellow_band_gap_pct,
-                yellow_band_gap_usd=settings.pnl_divergence_yellow_band_gap_usd,
-                yellow_band_count=settings.pnl_divergence_yellow_band_count,
-                orange_short_gap_pct=settings.pnl_divergence_orange_short_gap_pct,
-                orange_short_gap_usd=settings.pnl_divergence_orange_short_gap_usd,
-                orange_long_gap_pct=settings.pnl_divergence_orange_long_gap_pct,
-            )
-        )
-
-        structural_health = compute_structural_change_health(
-            db_path,
-            as_of_date=today_str,
-            window_days=settings.structural_change_window_days,
-            cusum_k=settings.structural_change_cusum_k,
-            cusum_h_yellow=settings.structural_change_cusum_h_yellow,
-            cusum_h_orange=settings.structural_change_cusum_h_orange,
-        )
-        flags.update(
-            evaluate_structural_change_flags(
-                structural_health,
-                min_points=settings.structural_change_min_points,
-                yellow_band_count=settings.structural_change_yellow_band_count,
-                orange_band_count=settings.structural_change_orange_band_count,
-            )
-        )
-    except Exception:
-        logger.warning("Calibration health check failed, skipping")
+    if reuse is not None:
+        flags.update(f for f in reuse.flags if f != "balance_anomaly")
+    else:
+        flags.update(_calibration_flags(db_path, today_str))
 
     # 残高急変検出
     if detect_balance_anomaly(current_balance, last_balance):
@@ -291,33 +255,182 @@ def detect_balance_anomaly(current: float, previous: float) -> bool:
     return drop_pct >= BALANCE_ANOMALY_PCT
 
 
-def load_or_compute_risk_state(db_path: Path | str) -> RiskState:
-    """Load cached state or compute fresh. Used by scheduler main()."""
-    return _get_cached_state(db_path)
+def load_or_compute_risk_state(db_path: Path | str, force: bool = False) -> RiskState:
+    """Load cached state or compute fresh. Used by scheduler main().
+
+    ``force`` skips both the in-process and the persisted cache.
+    """
+    return _get_cached_state(db_path, force=force)
 
 
 # --- Internal helpers ---
 
 
-def _get_cached_state(db_path: Path | str) -> RiskState:
-    """Return cached RiskState if fresh, else recompute."""
+def _get_cached_state(db_path: Path | str, force: bool = False) -> RiskState:
+    """Return cached RiskState if fresh, else recompute.
+
+    Besides the in-process cache, the last computed state is persisted in
+    ``risk_state_cache`` with the results/signals high-water marks it saw, so
+    the scheduler, order tick and settle processes share it. It is reused
+    as-is while no rows landed, the previous snapshot's CB state is unchanged
+    and it is younger than ``risk_state_cache_ttl_sec`` (same UTC day). New
+    signals or a new snapshot without new results trigger a partial recompute.
+    """
     global _cached_state, _cached_at
     now = time.monotonic()
-    if _cached_state is not None and (now - _cached_at) < _CACHE_TTL:
+    if not force and _cached_state is not None and (now - _cached_at) < _CACHE_TTL:
         return _cached_state
-    state = compute_risk_state(db_path)
+    if settings.risk_state_cache_ttl_sec > 0:
+        state = _load_or_compute_persisted(db_path, force=force)
+    else:
+        state = compute_risk_state(db_path)
     _cached_state = state
     _cached_at = now
     return state
 
 
+def _prev_key(prev: RiskState | None) -> str:
+    # CB 再評価の入力になる前回 snapshot の状態
+    if prev is None:
+        return ""
+    return f"{prev.circuit_breaker_level.name}|{prev.lockout_until}|{prev.sizing_multiplier}"
+
+
+def _load_or_compute_persisted(db_path: Path | str, force: bool = False) -> RiskState:
+    from src.store.db import (
+        get_latest_risk_snapshot,
+        get_risk_high_water_marks,
+        get_risk_state_cache,
+        save_risk_state_cache,
+    )
+
+    try:
+        # 計算前に水位を読む (計算中に増えた行は次回の再計算対象になる)
+        results_hwm, signals_hwm = get_risk_high_water_marks(db_path=db_path)
+        prev = get_latest_risk_snapshot(db_path=db_path)
+        cached = None if force else get_risk_state_cache(db_path=db_path)
+    except Exception:
+        logger.warning("Risk state cache unavailable, computing directly")
+        return compute_risk_state(db_path)
+
+    prev_key = _prev_key(prev)
+    reuse = None
+    if cached is not None:
+        state, c_results, c_signals, c_prev_key, computed_at = cached
+        if _cache_fresh(computed_at) and c_results == results_hwm:
+            if c_signals == signals_hwm and c_prev_key == prev_key:
+                logger.debug(
+                    "Risk state cache hit (results=%d signals=%d)", results_hwm, signals_hwm,
+                )
+                return state
+            # 新規シグナル / 前回 snapshot の変化のみ: 残高・エクスポージャー・CB だけ再計算
+            reuse = state
+
+    if reuse is not None:
+        state = compute_risk_state(db_path, reuse=reuse, prev=prev)
+    else:
+        state = compute_risk_state(db_path)
+    try:
+        save_risk_state_cache(state, results_hwm, signals_hwm, prev_key, db_path=db_path)
+    except Exception:
+        logger.warning("Failed to persist risk state cache")
+    return state
+
+
+def _cache_fresh(computed_at: str) -> bool:
+    try:
+        at = datetime.fromisoformat(computed_at)
+    except (ValueError, TypeError):
+        return False
+    now = datetime.now(timezone.utc)
+    # 日次/週次 P&L は UTC 日付に依存するので日を跨いだら作り直す
+    if at.date() != now.date():
+        return False
+    return (now - at).total_seconds() < settings.risk_state_cache_ttl_sec
+
+
 def invalidate_cache() -> None:
-    """Force recomputation on next call. Useful after settle."""
+    """Drop the in-process cache. Useful after settle.
+
+    The persisted ``risk_state_cache`` is still consulted: new results or
+    signals move its high-water marks, so it is recomputed when needed.
+    Pass ``force=True`` to load_or_compute_risk_state to bypass it too.
+    """
     global _cached_state, _cached_at
     _cached_state = None
     _cached_at = 0.0
 
 
+def _calibration_flags(db_path: Path | str, today_str: str) -> set[str]:
+    """Calibration drift / PnL divergence / structural change flags (results-derived)."""
+    flags: set[str] = set()
+    try:
+        from src.risk.calibration_monitor import (
+            compute_calibration_health,
+            compute_pnl_divergence_health,
+            compute_structural_change_health,
+            evaluate_pnl_divergence_flags,
+            evaluate_structural_change_flags,
+            load_daily_stats,
+        )
+
+        # 全バンド・全ウィンドウ分の日次集計を 1 クエリで取得して共有
+        daily = load_daily_stats(db_path)
+        health = compute_calibration_health(
+            db_path,
+            drift_threshold_sigma=settings.calibration_drift_threshold,
+            daily=daily,
+        )
+        drifted_bands = [h for h in health if h.drifted]
+        if drifted_bands:
+            flags.add("calibration_drift")
+
+        pnl_health = compute_pnl_divergence_health(
+            db_path,
+            as_of_date=today_str,
+            short_days=settings.pnl_divergence_short_days,
+            long_days=settings.pnl_divergence_long_days,
+            daily=daily,
+        )
+        flags.update(
+            evaluate_pnl_divergence_flags(
+                pnl_health,
+                min_total_short=settings.pnl_divergence_min_total_short,
+                min_total_long=settings.pnl_divergence_min_total_long,
+                min_band_short=settings.pnl_divergence_min_band_short,
+                yellow_total_gap_pct=settings.pnl_divergence_yellow_total_gap_pct,
+                yellow_total_gap_usd=settings.pnl_divergence_yellow_total_gap_usd,
+                yellow_band_gap_pct=settings.pnl_divergence_yellow_band_gap_pct,
+                yellow_band_gap_usd=settings.pnl_divergence_yellow_band_gap_usd,
+                yellow_band_count=settings.pnl_divergence_yellow_band_count,
+                orange_short_gap_pct=settings.pnl_divergence_orange_short_gap_pct,
+                orange_short_gap_usd=settings.pnl_divergence_orange_short_gap_usd,
+                orange_long_gap_pct=settings.pnl_divergence_orange_long_gap_pct,
+            )
+        )
+
+        structural_health = compute_structural_change_health(
+            db_path,
+            as_of_date=today_str,
+            window_days=settings.structural_change_window_days,
+            cusum_k=settings.structural_change_cusum_k,
+            cusum_h_yellow=settings.structural_change_cusum_h_yellow,
+            cusum_h_orange=settings.structural_change_cusum_h_orange,
+            daily=daily,
+        )
+        flags.update(
+            evaluate_structural_change_flags(
+                structural_health,
+                min_points=settings.structural_change_min_points,
+                yellow_band_count=settings.structural_change_yellow_band_count,
+                orange_band_count=settings.structural_change_orange_band_count,
+            )
+        )
+    except Exception:
+        logger.warning("Calibration health check failed, skipping")
+    return flags
+
+
 def _fetch_balance_safe(fallback: float) -> float:
     """Fetch USDC balance from Polymarket; return fallback on failure."""
     try:
@@ -0,0 +1,261 @@
+"""Timer-driven scheduler daemon (``schedule_trades.py --daemon``).
+
+Instead of launchd spawning a fresh process every 15 minutes, the daemon
+keeps one process alive (warm imports, pooled HTTP clients, cached CLOB
+creds) and sleeps until the next moment work can be due: a job window
+opening or closing, the next DCA TWAP slice, an order TTL expiring, or the
+periodic schedule refresh. Wake-up times are recomputed from the DB after
+every tick, so jobs created or finished by a tick are picked up at once.
+With a PriceTriggerEngine, live price crossings (favorable DCA price,
+re-pricing move) also wake it (src/scheduler/price_triggers.py).
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+from collections.abc import Callable, Collection, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+from src.config import settings
+from src.store.models import JobTimerInput, SignalRecord
+from src.strategy.dca_strategy import _calc_twap_schedule
+
+if TYPE_CHECKING:
+    from src.scheduler.price_triggers import PriceTriggerEngine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(order=True, frozen=True)
+class Wakeup:
+    """A point in time at which the scheduler should run a tick."""
+
+    when: datetime
+    reason: str = field(compare=False)
+
+
+class TimerHeap:
+    """Min-heap of Wakeups ordered by time."""
+
+    def __init__(self, wakeups: Iterable[Wakeup] = ()):
+        self._heap: list[Wakeup] = list(wakeups)
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, wakeup: Wakeup) -> None:
+        heapq.heappush(self._heap, wakeup)
+
+    def peek(self) -> Wakeup | None:
+        return self._heap[0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> list[Wakeup]:
+        """Pop every wakeup at or before ``now`` (earliest first)."""
+        due = []
+        while self._heap and self._heap[0].when <= now:
+            due.append(heapq.heappop(self._heap))
+        return due
+
+    def clear(self) -> None:
+        self._heap.clear()
+
+
+def _parse_utc(ts: str | None) -> datetime | None:
+    if not ts:
+        return None
+    try:
+        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _job_wakeups(
+    job: JobTimerInput, now: datetime, deferred_job_ids: Collection[int],
+) -> list[Wakeup]:
+    after = _parse_utc(job.execute_after)
+    before = _parse_utc(job.execute_before)
+    if after is None or before is None:
+        return []
+
+    # 窓終了: cancel_expired_jobs が expired/executed に遷移させる
+    wakeups = [Wakeup(before, f"window_close:{job.job_id}")]
+
+    if job.status == "pending":
+        if now < after:
+            wakeups.append(Wakeup(after, f"window_open:{job.job_id}"))
+        elif now < before and job.job_id in deferred_job_ids:
+            # max_orders_per_tick で持ち越された窓内ジョブ
+            wakeups.append(Wakeup(now, f"in_window:{job.job_id}"))
+        elif now < before:
+            # 前回 tick で進まなかったジョブ (directional 約定待ちの hedge、他ワーカーの
+            # リース中など) は即 tick せずポーリング間隔で再確認
+            poll_at = now + timedelta(minutes=settings.daemon_pending_poll_min)
+            wakeups.append(Wakeup(min(poll_at, before), f"pending_poll:{job.job_id}"))
+
+    elif job.status == "failed":
+        if job.retry_count >= settings.schedule_max_retries:
+            return wakeups
+        if now < after:
+            wakeups.append(Wakeup(after, f"window_open:{job.job_id}"))
+        elif now < before:
+            retry_at = now + timedelta(minutes=settings.daemon_failed_retry_min)
+            wakeups.append(Wakeup(min(retry_at, before), f"retry:{job.job_id}"))
+
+    elif job.status == "dca_active":
+        wakeups.extend(_dca_wakeups(job, now))
+
+    return wakeups
+
+
+def _dca_wakeups(job: JobTimerInput, now: datetime) -> list[Wakeup]:
+    """Next TWAP slice, favorable-price poll and cutoff for a dca_active job."""
+    tipoff = _parse_utc(job.game_time_utc)
+    first = _parse_utc(job.first_entry_at)
+    last = _parse_utc(job.last_entry_at)
+    if tipoff is None or first is None or last is None:
+        return []
+    if job.dca_entries_count >= job.dca_max_entries:
+        return []
+
+    cutoff = tipoff - timedelta(minutes=settings.dca_cutoff_before_tipoff_min)
+    if now >= cutoff:
+        return []
+
+    wakeups = [Wakeup(cutoff, f"dca_cutoff:{job.job_id}")]
+    earliest = last + timedelta(minutes=settings.dca_min_interval_min)
+
+    # _is_slice_due と同じインデックス: schedule は slice 1 から始まる
+    schedule = _calc_twap_schedule(
+        first, tipoff, job.dca_max_entries, settings.dca_cutoff_before_tipoff_min,
+    )
+    next_idx = job.dca_entries_count - 1
+    if 0 <= next_idx < len(schedule):
+        wakeups.append(Wakeup(max(schedule[next_idx], earliest), f"dca_slice:{job.job_id}"))
+
+    # favorable 価格での前倒し購入を拾うための定期ポーリング
+    poll_at = max(now + timedelta(minutes=settings.daemon_dca_poll_min), earliest)
+    if poll_at < cutoff:
+        wakeups.append(Wakeup(poll_at, f"dca_poll:{job.job_id}"))
+    return wakeups
+
+
+def compute_wakeups(
+    jobs: list[JobTimerInput],
+    now: datetime,
+    placed_orders: Iterable[SignalRecord] = (),
+    deferred_job_ids: Collection[int] = frozenset(),
+    halted: bool = False,
+) -> list[Wakeup]:
+    """Derive wake-up times from open jobs and (optionally) placed orders.
+
+    Sources: execute_after / execute_before per job, the next DCA TWAP slice
+    (never earlier than ``dca_min_interval_min`` after the last entry) and
+    ``order_placed_at + order_ttl_min`` per placed order. Past-due times are
+    kept as-is; the daemon loop applies the minimum tick interval.
+
+    Only in-window pending jobs in ``deferred_job_ids`` (left over by
+    ``max_orders_per_tick``) are due now; other in-window pending jobs are
+    polled every ``daemon_pending_poll_min``. With ``halted`` (circuit
+    breaker RED) no job wakes the daemon; the periodic refresh still runs.
+    """
+    wakeups: list[Wakeup] = []
+    if not halted:
+        for job in jobs:
+            wakeups.extend(_job_wakeups(job, now, deferred_job_ids))
+
+    ttl = timedelta(minutes=settings.order_ttl_min)
+    for order in placed_orders:
+        placed_at = _parse_utc(order.order_placed_at or order.created_at)
+        if placed_at is not None:
+            wakeups.append(Wakeup(placed_at + ttl, f"order_ttl:{order.id}"))
+    return wakeups
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def run_daemon(
+    tick: Callable[[bool, list[Wakeup]], None],
+    load_wakeups: Callable[[datetime], list[Wakeup]],
+    *,
+    stop: threading.Event,
+    clock: Callable[[], datetime] = _utcnow,
+    refresh_interval_sec: float | None = None,
+    min_tick_interval_sec: float | None = None,
+    max_ticks: int | None = None,
+    triggers: PriceTriggerEngine | None = None,
+) -> int:
+    """Run ticks whenever a wakeup or the periodic refresh is due.
+
+    ``tick(refresh, due)`` runs one scheduler pass; ``refresh`` is True when
+    the schedule refresh (NBA API) is due. ``load_wakeups(now)`` rebuilds the
+    timer heap after each tick. Sleeps on ``stop`` so SIGTERM exits promptly.
+    Wakeups fired by ``triggers`` join the heap and are subject to the same
+    minimum tick interval. Returns the number of ticks run.
+    """
+    if refresh_interval_sec is None:
+        refresh_interval_sec = settings.daemon_refresh_interval_min * 60
+    if min_tick_interval_sec is None:
+        min_tick_interval_sec = settings.daemon_min_tick_interval_sec
+    refresh_interval = timedelta(seconds=refresh_interval_sec)
+    min_interval = timedelta(seconds=min_tick_interval_sec)
+
+    heap = TimerHeap()
+    next_refresh = clock()
+    last_tick: datetime | None = None
+    ticks = 0
+
+    while not stop.is_set():
+        now = clock()
+        refresh = now >= next_refresh
+        if triggers is not None:
+            for wakeup in triggers.drain():
+                heap.push(wakeup)
+        # トリガーで早起きしても min_tick_interval 内なら次の tick まで持ち越す
+        throttled = last_tick is not None and now < last_tick + min_interval
+        due = [] if throttled else heap.pop_due(now)
+
+        if refresh or due:
+            logger.info(
+                "Daemon tick (refresh=%s, due=%s)",
+                refresh,
+                ",".join(w.reason for w in due[:5]) + ("..." if len(due) > 5 else ""),
+            )
+            try:
+                tick(refresh, due)
+            except Exception:
+                logger.exception("Daemon tick failed")
+            ticks += 1
+            last_tick = clock()
+            if refresh:
+                next_refresh = last_tick + refresh_interval
+            if max_ticks is not None and ticks >= max_ticks:
+                break
+
+            heap.clear()
+            try:
+                for wakeup in load_wakeups(last_tick):
+                    heap.push(wakeup)
+            except Exception:
+                logger.exception("Failed to load daemon wakeups")
+
+        next_at = next_refresh
+        top = heap.peek()
+        if top is not None:
+            earliest = last_tick + min_interval if last_tick is not None else top.when
+            next_at = min(next_at, max(top.when, earliest))
+        wait_sec = max(0.0, (next_at - clock()).total_seconds())
+        logger.debug("Daemon sleeping %.0fs (next=%s)", wait_sec, top.reason if top else "refresh")
+        if triggers is None:
+            stop.wait(wait_sec)
+        else:
+            triggers.wait(stop, wait_sec)
+
+    return ticks
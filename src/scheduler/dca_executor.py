@@ -9,14 +9,16 @@ import logging
 from datetime import datetime, timezone
 
 from src.config import settings
-from src.scheduler.job_executor import JobResult
+from src.scheduler.job_executor import JobResult, scheduler_worker_id
+from src.scheduler.job_queue import OrderSlots, rank_work, run_queue, work_items
 from src.scheduler.pricing import apply_price_ceiling, below_market_price
 from src.store.db import (
     DEFAULT_DB_PATH,
+    claim_dca_active_jobs,
     compute_position_group_inventory,
-    get_dca_active_jobs,
     get_dca_group_signals,
     get_position_group,
+    release_job_claims,
     update_dca_job,
 )
 
@@ -129,14 +131,11 @@ def _compute_live_dca_order_price(
     """Compute DCA live order price from order book and hedge constraints."""
     dca_order_price = current_price  # fallback
     try:
-        from src.connectors.polymarket import fetch_order_books_batch as _fetch_obs_dca
-        from src.sizing.liquidity import extract_liquidity as _extract_dca
-
-        obs = _fetch_obs_dca([target_token_id])
-        if obs and target_token_id in obs:
-            snap = _extract_dca(obs[target_token_id], target_token_id)
-            if snap and snap.best_ask > 0:
-                dca_order_price = below_market_price(snap.best_ask)
+        from src.connectors.market_snapshot import get_liquidity
+
+        snap = get_liquidity([target_token_id]).get(target_token_id)
+        if snap and snap.best_ask > 0:
+            dca_order_price = below_market_price(snap.best_ask)
     except Exception:
         logger.warning("DCA order book fetch failed for job %d", job.id)
 
@@ -159,23 +158,29 @@ def process_dca_active_jobs(
 ) -> list[JobResult]:
     """Process DCA-active jobs: add entries based on time/price triggers.
 
-    Runs after process_eligible_jobs() in each tick.
+    The scheduler tick runs DCA work through process_tick_jobs() together with
+    eligible jobs; this entry point processes DCA-active jobs alone.
     """
-    from src.connectors.polymarket import fetch_moneyline_for_game, place_limit_buy
-    from src.store.db import log_signal, update_order_status
-    from src.strategy.dca_strategy import DCAConfig, DCAEntry, should_add_dca_entry
-
     path = db_path or DEFAULT_DB_PATH
     now = datetime.now(timezone.utc)
     now_utc = now.isoformat()
 
-    dca_jobs = get_dca_active_jobs(now_utc, db_path=path)
+    # 他ワーカーと同じグループに二重で DCA しないようリースを取る
+    worker = scheduler_worker_id()
+    dca_jobs = claim_dca_active_jobs(now_utc, worker, settings.job_lease_sec, db_path=path)
     if not dca_jobs:
         return []
+    try:
+        return _process_claimed_dca_jobs(dca_jobs, execution_mode, path, now)
+    finally:
+        release_job_claims([j.id for j in dca_jobs], worker, db_path=path)
 
-    logger.info("Found %d DCA-active job(s)", len(dca_jobs))
 
-    dca_config = DCAConfig(
+def build_dca_config():
+    """DCAConfig from the current settings."""
+    from src.strategy.dca_strategy import DCAConfig
+
+    return DCAConfig(
         max_entries=settings.dca_max_entries,
         min_interval_min=settings.dca_min_interval_min,
         max_price_spread=settings.dca_max_price_spread,
@@ -184,333 +189,365 @@ def process_dca_active_jobs(
         cutoff_before_tipoff_min=settings.dca_cutoff_before_tipoff_min,
     )
 
-    max_per_tick = settings.max_orders_per_tick
-    results: list[JobResult] = []
-    orders_this_tick = 0
 
-    for job in dca_jobs:
-        if orders_this_tick >= max_per_tick:
-            logger.warning("max_orders_per_tick reached during DCA processing")
-            break
+def _process_claimed_dca_jobs(
+    dca_jobs: list,
+    execution_mode: str,
+    path: str,
+    now: datetime,
+) -> list[JobResult]:
+    """Evaluate and place DCA entries for the jobs this worker holds leases on.
 
-        if not job.dca_group_id:
-            logger.warning("Job %d has no dca_group_id, skipping", job.id)
-            continue
+    Jobs closest to their DCA cutoff take the ``max_orders_per_tick`` budget first.
+    """
+    from src.connectors.market_snapshot import MarketSnapshot, current_snapshot
 
-        # 既存の DCA エントリーを取得
-        signals = get_dca_group_signals(job.dca_group_id, db_path=path)
-        if not signals:
-            logger.warning("No signals found for DCA group %s", job.dca_group_id)
-            continue
-
-        # live 実運用: 約定済み在庫のみを保有として扱う
-        # placed が残っている間は追加DCAを行わない
-        basis_signals = signals
-        if execution_mode == "live":
-            if any(s.order_status == "placed" for s in signals):
-                logger.debug(
-                    "DCA job %d: waiting existing placed order(s) in group %s",
-                    job.id,
-                    job.dca_group_id,
-                )
-                continue
-            basis_signals = [s for s in signals if s.order_status == "filled"]
-            if not basis_signals:
-                logger.debug(
-                    "DCA job %d: no filled inventory yet in group %s",
-                    job.id,
-                    job.dca_group_id,
-                )
-                continue
+    logger.info("Found %d DCA-active job(s)", len(dca_jobs))
 
-        first_signal = basis_signals[0]
+    snapshot = current_snapshot() or MarketSnapshot()
+    snapshot.register_games([(j.away_team, j.home_team, j.game_date) for j in dca_jobs])
+    config = build_dca_config()
 
-        # 最新価格を取得
-        try:
-            ml = fetch_moneyline_for_game(job.away_team, job.home_team, job.game_date)
-        except Exception:
-            logger.warning("Price fetch failed for DCA job %d", job.id)
-            continue
-
-        if not ml:
-            continue
-
-        # 対象アウトカムの現在価格を取得
-        current_price = None
-        target_token_id = first_signal.token_id
-        target_team = first_signal.team
-        for i, tid in enumerate(ml.token_ids):
-            if tid == target_token_id:
+    queue = rank_work(work_items((), dca_jobs), now)
+    done = run_queue(
+        queue,
+        lambda item: process_dca_job(item.job, execution_mode, path, now, snapshot, config),
+        OrderSlots(settings.max_orders_per_tick),
+    )
+    return [r for _, r in done if r is not None]
+
+
+def process_dca_job(
+    job,
+    execution_mode: str,
+    path: str,
+    now: datetime,
+    snapshot,
+    dca_config,
+) -> JobResult | None:
+    """Evaluate one dca_active job and place its next entry if due.
+
+    Returns None when nothing was attempted (not due, waiting on fills, completed).
+    """
+    from src.connectors.polymarket import place_limit_buy
+    from src.store.db import log_signal, update_order_status
+    from src.strategy.dca_strategy import DCAEntry, should_add_dca_entry
+
+    if not job.dca_group_id:
+        logger.warning("Job %d has no dca_group_id, skipping", job.id)
+        return None
+
+    # 既存の DCA エントリーを取得
+    signals = get_dca_group_signals(job.dca_group_id, db_path=path)
+    if not signals:
+        logger.warning("No signals found for DCA group %s", job.dca_group_id)
+        return None
+
+    # live 実運用: 約定済み在庫のみを保有として扱う
+    # placed が残っている間は追加DCAを行わない
+    basis_signals = signals
+    if execution_mode == "live":
+        if any(s.order_status == "placed" for s in signals):
+            logger.debug(
+                "DCA job %d: waiting existing placed order(s) in group %s",
+                job.id,
+                job.dca_group_id,
+            )
+            return None
+        basis_signals = [s for s in signals if s.order_status == "filled"]
+        if not basis_signals:
+            logger.debug(
+                "DCA job %d: no filled inventory yet in group %s",
+                job.id,
+                job.dca_group_id,
+            )
+            return None
+
+    first_signal = basis_signals[0]
+
+    # 最新価格を取得
+    try:
+        ml = snapshot.moneyline(job.away_team, job.home_team, job.game_date)
+    except Exception:
+        logger.warning("Price fetch failed for DCA job %d", job.id)
+        return None
+
+    if not ml:
+        return None
+
+    # 対象アウトカムの現在価格を取得
+    current_price = None
+    target_token_id = first_signal.token_id
+    target_team = first_signal.team
+    for i, tid in enumerate(ml.token_ids):
+        if tid == target_token_id:
+            current_price = ml.prices[i]
+            break
+
+    if current_price is None:
+        # token_id が変わった場合はチーム名で fallback
+        for i, outcome in enumerate(ml.outcomes):
+            if outcome == target_team:
                 current_price = ml.prices[i]
+                target_token_id = ml.token_ids[i]
                 break
 
-        if current_price is None:
-            # token_id が変わった場合はチーム名で fallback
-            for i, outcome in enumerate(ml.outcomes):
-                if outcome == target_team:
-                    current_price = ml.prices[i]
-                    target_token_id = ml.token_ids[i]
-                    break
-
-        if current_price is None:
-            logger.warning("Cannot find price for %s in job %d", target_team, job.id)
-            continue
-
-        # Hedge DCA: MERGE 経済性ベースの動的限界価格フィルター
-        if job.job_side == "hedge" and settings.bothside_enabled:
-            _dir_vwap, _target_combined = _compute_directional_vwap_and_target(
-                job.paired_job_id, path
-            )
-            if _dir_vwap > 0:
-                _gp = settings.merge_est_gas_usd + settings.merge_min_profit_usd
-                _min_margin = _gp / settings.merge_min_shares_floor
-                _max_hedge = 1.0 - _dir_vwap - _min_margin
-                _max_hedge = min(_max_hedge, settings.bothside_max_combined_vwap - _dir_vwap)
-                if current_price > _max_hedge:
-                    logger.debug(
-                        "Hedge DCA skip: price %.3f > max_hedge %.3f (dir_vwap=%.3f)",
-                        current_price,
-                        _max_hedge,
-                        _dir_vwap,
-                    )
-                    continue
-
-        # DCA エントリーを構築
-        entries = []
-        for sig in basis_signals:
-            try:
-                created = datetime.fromisoformat(sig.created_at.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                created = now
-            entries.append(
-                DCAEntry(
-                    price=sig.poly_price,
-                    size_usd=sig.kelly_size,
-                    created_at=created,
+    if current_price is None:
+        logger.warning("Cannot find price for %s in job %d", target_team, job.id)
+        return None
+
+    # Hedge DCA: MERGE 経済性ベースの動的限界価格フィルター
+    if job.job_side == "hedge" and settings.bothside_enabled:
+        _dir_vwap, _target_combined = _compute_directional_vwap_and_target(
+            job.paired_job_id, path
+        )
+        if _dir_vwap > 0:
+            _gp = settings.merge_est_gas_usd + settings.merge_min_profit_usd
+            _min_margin = _gp / settings.merge_min_shares_floor
+            _max_hedge = 1.0 - _dir_vwap - _min_margin
+            _max_hedge = min(_max_hedge, settings.bothside_max_combined_vwap - _dir_vwap)
+            if current_price > _max_hedge:
+                logger.debug(
+                    "Hedge DCA skip: price %.3f > max_hedge %.3f (dir_vwap=%.3f)",
+                    current_price,
+                    _max_hedge,
+                    _dir_vwap,
                 )
-            )
+                return None
 
-        # ティップオフ時刻をパース
+    # DCA エントリーを構築
+    entries = []
+    for sig in basis_signals:
         try:
-            tipoff = datetime.fromisoformat(job.game_time_utc.replace("Z", "+00:00"))
+            created = datetime.fromisoformat(sig.created_at.replace("Z", "+00:00"))
         except (ValueError, AttributeError):
-            logger.warning("Bad game_time_utc for job %d", job.id)
-            continue
+            created = now
+        entries.append(
+            DCAEntry(
+                price=sig.poly_price,
+                size_usd=sig.kelly_size,
+                created_at=created,
+            )
+        )
 
-        # DCA 判定
-        decision = should_add_dca_entry(current_price, entries, tipoff, now, dca_config)
+    # ティップオフ時刻をパース
+    try:
+        tipoff = datetime.fromisoformat(job.game_time_utc.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        logger.warning("Bad game_time_utc for job %d", job.id)
+        return None
 
-        if not decision.should_buy:
-            logger.debug(
-                "DCA job %d (%s): no buy — %s (price=%.3f vwap=%.3f)",
-                job.id,
-                job.event_slug,
-                decision.reason,
-                current_price,
-                decision.vwap,
-            )
-            # max_reached なら dca_active → executed に遷移
-            if decision.reason == "max_reached":
-                update_dca_job(job.id, status="executed", db_path=path)
-                logger.info("Job %d: DCA max entries reached → executed", job.id)
-            continue
+    # DCA 判定
+    decision = should_add_dca_entry(current_price, entries, tipoff, now, dca_config)
 
-        # DCA エントリーを発注
-        logger.info(
-            "DCA job %d (%s): %s @ %.3f (vwap=%.3f, seq=%d/%d)",
+    if not decision.should_buy:
+        logger.debug(
+            "DCA job %d (%s): no buy — %s (price=%.3f vwap=%.3f)",
             job.id,
             job.event_slug,
             decision.reason,
             current_price,
             decision.vwap,
-            decision.sequence,
-            dca_config.max_entries,
         )
+        # max_reached なら dca_active → executed に遷移
+        if decision.reason == "max_reached":
+            update_dca_job(job.id, status="executed", db_path=path)
+            logger.info("Job %d: DCA max entries reached → executed", job.id)
+        return None
 
-        # サイジング: target-holding 方式 (Phase DCA2)
-        total_budget = job.dca_total_budget
-        target_result = None
-        if total_budget and total_budget > 0:
-            from src.sizing.position_sizer import calculate_target_order_size
+    # DCA エントリーを発注
+    logger.info(
+        "DCA job %d (%s): %s @ %.3f (vwap=%.3f, seq=%d/%d)",
+        job.id,
+        job.event_slug,
+        decision.reason,
+        current_price,
+        decision.vwap,
+        decision.sequence,
+        dca_config.max_entries,
+    )
 
-            target_result = calculate_target_order_size(
-                total_budget=total_budget,
-                costs=[s.kelly_size for s in basis_signals],
-                prices=[s.fill_price or s.poly_price for s in basis_signals],
-                current_price=current_price,
-                max_entries=job.dca_max_entries,
-                entries_done=len(basis_signals),
-                cap_mult=settings.dca_per_entry_cap_mult,
-                min_order_usd=settings.dca_min_order_usd,
-            )
-            dca_size = target_result.order_size_usd
-            if dca_size <= 0:
-                if target_result.completion_reason:
-                    update_dca_job(job.id, status="executed", db_path=path)
-                    logger.info(
-                        "Job %d: DCA %s → executed", job.id, target_result.completion_reason
-                    )
-                continue
-        else:
-            # dca_total_budget が NULL の旧データ: equal split フォールバック
-            dca_size = job.dca_slice_size if job.dca_slice_size else first_signal.kelly_size
-
-        # Track B3: position group target cap (DCA は総目標の分割手段のみ)
-        remaining_target_shares = _remaining_target_shares_for_job(job, path)
-        if remaining_target_shares is not None:
-            remaining_target_usd = remaining_target_shares * current_price
-            if remaining_target_usd < settings.dca_min_order_usd:
+    # サイジング: target-holding 方式 (Phase DCA2)
+    total_budget = job.dca_total_budget
+    target_result = None
+    if total_budget and total_budget > 0:
+        from src.sizing.position_sizer import calculate_target_order_size
+
+        target_result = calculate_target_order_size(
+            total_budget=total_budget,
+            costs=[s.kelly_size for s in basis_signals],
+            prices=[s.fill_price or s.poly_price for s in basis_signals],
+            current_price=current_price,
+            max_entries=job.dca_max_entries,
+            entries_done=len(basis_signals),
+            cap_mult=settings.dca_per_entry_cap_mult,
+            min_order_usd=settings.dca_min_order_usd,
+        )
+        dca_size = target_result.order_size_usd
+        if dca_size <= 0:
+            if target_result.completion_reason:
                 update_dca_job(job.id, status="executed", db_path=path)
                 logger.info(
-                    "Job %d: target reached/too-small (remain=$%.2f) → executed",
-                    job.id,
-                    remaining_target_usd,
+                    "Job %d: DCA %s → executed", job.id, target_result.completion_reason
                 )
-                continue
-            if dca_size > remaining_target_usd:
-                logger.info(
-                    "DCA size capped by position target: %.2f -> %.2f (job=%d side=%s)",
-                    dca_size,
-                    remaining_target_usd,
-                    job.id,
-                    job.job_side,
-                )
-                dca_size = remaining_target_usd
-
-        if execution_mode == "dry-run":
+            return None
+    else:
+        # dca_total_budget が NULL の旧データ: equal split フォールバック
+        dca_size = job.dca_slice_size if job.dca_slice_size else first_signal.kelly_size
+
+    # Track B3: position group target cap (DCA は総目標の分割手段のみ)
+    remaining_target_shares = _remaining_target_shares_for_job(job, path)
+    if remaining_target_shares is not None:
+        remaining_target_usd = remaining_target_shares * current_price
+        if remaining_target_usd < settings.dca_min_order_usd:
+            update_dca_job(job.id, status="executed", db_path=path)
+            logger.info(
+                "Job %d: target reached/too-small (remain=$%.2f) → executed",
+                job.id,
+                remaining_target_usd,
+            )
+            return None
+        if dca_size > remaining_target_usd:
             logger.info(
-                "[dry-run] DCA #%d: BUY %s @ %.3f $%.0f",
-                decision.sequence,
-                target_team,
-                current_price,
+                "DCA size capped by position target: %.2f -> %.2f (job=%d side=%s)",
                 dca_size,
+                remaining_target_usd,
+                job.id,
+                job.job_side,
             )
-            results.append(JobResult(job.id, job.event_slug, "skipped"))
-            continue
-
-        # シグナル記録
-        new_signal_id = log_signal(
-            game_title=first_signal.game_title,
-            event_slug=first_signal.event_slug,
-            team=target_team,
-            side="BUY",
-            poly_price=current_price,
-            book_prob=first_signal.book_prob,
-            edge_pct=first_signal.edge_pct,
-            kelly_size=dca_size,
-            token_id=target_token_id,
-            market_type=first_signal.market_type,
-            calibration_edge_pct=first_signal.calibration_edge_pct,
-            expected_win_rate=first_signal.expected_win_rate,
-            price_band=first_signal.price_band,
-            in_sweet_spot=bool(first_signal.in_sweet_spot),
-            band_confidence=first_signal.band_confidence,
-            strategy_mode="calibration",
-            dca_group_id=job.dca_group_id,
-            dca_sequence=decision.sequence,
-            bothside_group_id=job.bothside_group_id,
-            signal_role=job.job_side,
-            condition_id=first_signal.condition_id,
-            db_path=path,
-        )
-
-        # live モード: below-market 指値で発注
-        if execution_mode == "live":
-            try:
-                dca_order_price = _compute_live_dca_order_price(
-                    job=job,
-                    target_token_id=target_token_id,
-                    current_price=current_price,
-                    db_path=path,
-                )
+            dca_size = remaining_target_usd
 
-                resp = place_limit_buy(target_token_id, dca_order_price, dca_size)
-                order_id = resp.get("orderID") or resp.get("id", "")
-                update_order_status(new_signal_id, order_id, "placed", db_path=path)
-                # Order lifecycle 記録 (Phase O)
-                from src.store.db import log_order_event, update_order_lifecycle
-
-                _now_iso = datetime.now(timezone.utc).isoformat()
-                update_order_lifecycle(
-                    new_signal_id,
-                    order_placed_at=_now_iso,
-                    order_original_price=dca_order_price,
-                    db_path=path,
-                )
-                log_order_event(
-                    signal_id=new_signal_id,
-                    event_type="placed",
-                    order_id=order_id,
-                    price=dca_order_price,
-                    db_path=path,
-                )
-            except Exception as e:
-                update_order_status(new_signal_id, None, "failed", db_path=path)
-                logger.exception("DCA order failed for job %d", job.id)
-                results.append(JobResult(job.id, job.event_slug, "failed", new_signal_id, str(e)))
-                continue
+    if execution_mode == "dry-run":
+        logger.info(
+            "[dry-run] DCA #%d: BUY %s @ %.3f $%.0f",
+            decision.sequence,
+            target_team,
+            current_price,
+            dca_size,
+        )
+        return JobResult(job.id, job.event_slug, "skipped")
+
+    # シグナル記録
+    new_signal_id = log_signal(
+        game_title=first_signal.game_title,
+        event_slug=first_signal.event_slug,
+        team=target_team,
+        side="BUY",
+        poly_price=current_price,
+        book_prob=first_signal.book_prob,
+        edge_pct=first_signal.edge_pct,
+        kelly_size=dca_size,
+        token_id=target_token_id,
+        market_type=first_signal.market_type,
+        calibration_edge_pct=first_signal.calibration_edge_pct,
+        expected_win_rate=first_signal.expected_win_rate,
+        price_band=first_signal.price_band,
+        in_sweet_spot=bool(first_signal.in_sweet_spot),
+        band_confidence=first_signal.band_confidence,
+        strategy_mode="calibration",
+        dca_group_id=job.dca_group_id,
+        dca_sequence=decision.sequence,
+        bothside_group_id=job.bothside_group_id,
+        signal_role=job.job_side,
+        condition_id=first_signal.condition_id,
+        db_path=path,
+    )
 
-        # Fee 記録 (Phase M3 — 監査証跡)
+    # live モード: below-market 指値で発注
+    if execution_mode == "live":
         try:
-            from src.store.db import update_signal_fee
-
-            update_signal_fee(new_signal_id, fee_rate_bps=0.0, fee_usd=0.0, db_path=path)
-        except Exception:
-            logger.debug("Fee recording failed for signal #%d", new_signal_id, exc_info=True)
+            dca_order_price = _compute_live_dca_order_price(
+                job=job,
+                target_token_id=target_token_id,
+                current_price=current_price,
+                db_path=path,
+            )
 
-        # 即時通知 (Phase N)
-        try:
-            from src.notifications.telegram import notify_dca
-            from src.strategy.dca_strategy import calculate_vwap_from_pairs
-
-            _old_vwap = decision.vwap
-            _stub = type("_S", (), {"kelly_size": dca_size, "poly_price": current_price})
-            _new_signals = basis_signals + [_stub]
-            _new_vwap = calculate_vwap_from_pairs(
-                [s.kelly_size for s in _new_signals],
-                [getattr(s, "fill_price", None) or s.poly_price for s in _new_signals],
+            resp = place_limit_buy(target_token_id, dca_order_price, dca_size)
+            order_id = resp.get("orderID") or resp.get("id", "")
+            update_order_status(new_signal_id, order_id, "placed", db_path=path)
+            # Order lifecycle 記録 (Phase O)
+            from src.store.db import log_order_event, update_order_lifecycle
+
+            _now_iso = datetime.now(timezone.utc).isoformat()
+            update_order_lifecycle(
+                new_signal_id,
+                order_placed_at=_now_iso,
+                order_original_price=dca_order_price,
+                db_path=path,
             )
-            notify_dca(
-                outcome_name=target_team,
-                event_slug=job.event_slug,
-                order_price=current_price,
-                size_usd=dca_size,
-                old_vwap=_old_vwap,
-                new_vwap=_new_vwap,
-                dca_seq=decision.sequence,
-                dca_max=dca_config.max_entries,
-                trigger_reason=decision.reason,
+            log_order_event(
                 signal_id=new_signal_id,
+                event_type="placed",
+                order_id=order_id,
+                price=dca_order_price,
+                db_path=path,
             )
-        except Exception:
-            logger.debug("DCA notification failed", exc_info=True)
-
-        # DCA カウント更新
-        new_count = job.dca_entries_count + 1
-        # Target-holding: 3 条件で完了判定
-        if new_count >= job.dca_max_entries:
-            new_status = "executed"
-        elif target_result and target_result.completion_reason:
-            new_status = "executed"
-        else:
-            new_status = "dca_active"
-        update_dca_job(
-            job.id,
-            dca_entries_count=new_count,
-            status=new_status,
+        except Exception as e:
+            update_order_status(new_signal_id, None, "failed", db_path=path)
+            logger.exception("DCA order failed for job %d", job.id)
+            return JobResult(job.id, job.event_slug, "failed", new_signal_id, str(e))
+
+    # Fee 記録 (Phase M3 — 監査証跡)
+    try:
+        from src.store.db import update_signal_fee
+
+        update_signal_fee(new_signal_id, fee_rate_bps=0.0, fee_usd=0.0, db_path=path)
+    except Exception:
+        logger.debug("Fee recording failed for signal #%d", new_signal_id, exc_info=True)
+
+    # 即時通知 (Phase N)
+    try:
+        from src.notifications.telegram import notify_dca
+        from src.strategy.dca_strategy import calculate_vwap_from_pairs
+
+        _old_vwap = decision.vwap
+        _stub = type("_S", (), {"kelly_size": dca_size, "poly_price": current_price})
+        _new_signals = basis_signals + [_stub]
+        _new_vwap = calculate_vwap_from_pairs(
+            [s.kelly_size for s in _new_signals],
+            [getattr(s, "fill_price", None) or s.poly_price for s in _new_signals],
+        )
+        notify_dca(
+            outcome_name=target_team,
+            event_slug=job.event_slug,
+            order_price=current_price,
+            size_usd=dca_size,
+            old_vwap=_old_vwap,
+            new_vwap=_new_vwap,
+            dca_seq=decision.sequence,
+            dca_max=dca_config.max_entries,
+            trigger_reason=decision.reason,
             signal_id=new_signal_id,
-            db_path=path,
         )
+    except Exception:
+        logger.debug("DCA notification failed", exc_info=True)
+
+    # DCA カウント更新
+    new_count = job.dca_entries_count + 1
+    # Target-holding: 3 条件で完了判定
+    if new_count >= job.dca_max_entries:
+        new_status = "executed"
+    elif target_result and target_result.completion_reason:
+        new_status = "executed"
+    else:
+        new_status = "dca_active"
+    update_dca_job(
+        job.id,
+        dca_entries_count=new_count,
+        status=new_status,
+        signal_id=new_signal_id,
+        db_path=path,
+    )
 
-        orders_this_tick += 1
-        results.append(JobResult(job.id, job.event_slug, "executed", new_signal_id))
-        logger.info(
-            "DCA job %d: entry %d/%d → signal #%d [%s]",
-            job.id,
-            new_count,
-            job.dca_max_entries,
-            new_signal_id,
-            execution_mode,
-        )
+    result = JobResult(job.id, job.event_slug, "executed", new_signal_id)
+    logger.info(
+        "DCA job %d: entry %d/%d → signal #%d [%s]",
+        job.id,
+        new_count,
+        job.dca_max_entries,
+        new_signal_id,
+        execution_mode,
+    )
 
-    return results
+    return result
@@ -131,16 +131,13 @@ def _compute_hedge_order_price(
     event_slug: str,
 ) -> tuple[float, float]:
     """Fetch best ask and compute constrained hedge order price."""
-    from src.connectors.polymarket import fetch_order_books_batch as _fetch_obs
-    from src.sizing.liquidity import extract_liquidity as _extract
+    from src.connectors.market_snapshot import get_liquidity
 
     best_ask = hedge_price  # fallback
     try:
-        obs = _fetch_obs([hedge_token_id])
-        if obs and hedge_token_id in obs:
-            snap = _extract(obs[hedge_token_id], hedge_token_id)
-            if snap and snap.best_ask > 0:
-                best_ask = snap.best_ask
+        snap = get_liquidity([hedge_token_id]).get(hedge_token_id)
+        if snap and snap.best_ask > 0:
+            best_ask = snap.best_ask
     except Exception:
         logger.warning("Order book fetch failed for hedge %s", event_slug)
 
@@ -208,6 +205,7 @@ def process_hedge_job(
         estimate_shares_from_pairs,
         resolve_target_combined,
     )
+    from src.strategy.calibration_batch import KELLY_USD_SCALE
     from src.strategy.calibration_scanner import (
         _calibration_kelly,
         _ev_per_dollar,
@@ -403,7 +401,9 @@ def process_hedge_job(
                         settings.bothside_hedge_kelly_mult,
                     )
             kelly *= hedge_mult
-            kelly_usd = min(kelly * settings.max_position_usd * 10, settings.max_position_usd)
+            kelly_usd = min(
+                kelly * settings.max_position_usd * KELLY_USD_SCALE, settings.max_position_usd,
+            )
         else:
             # MERGE-only パス: directional コストベースのサイジング
             from src.strategy.calibration_scanner import _hedge_margin_multiplier
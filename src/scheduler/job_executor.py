@@ -6,6 +6,8 @@ Extracted from src/scheduler/trade_scheduler.py — _process_single_job and help
 from __future__ import annotations
 
 import logging
+import os
+import socket
 import uuid
 from dataclasses import dataclass
 
@@ -14,6 +16,7 @@ from src.scheduler.preflight import preflight_check as _preflight_check  # noqa:
 from src.scheduler.pricing import below_market_price
 from src.store.db import (
     TradeJob,
+    transaction,
     update_dca_job,
     update_job_status,
 )
@@ -21,6 +24,11 @@ from src.store.db import (
 logger = logging.getLogger(__name__)
 
 
+def scheduler_worker_id() -> str:
+    """Owner name written to trade_jobs.claimed_by (settings.scheduler_worker_id or host:pid)."""
+    return settings.scheduler_worker_id or f"{socket.gethostname()}:{os.getpid()}"
+
+
 @dataclass
 class JobResult:
     """Outcome of processing a single trade job."""
@@ -37,18 +45,9 @@ def _build_liquidity_map(token_ids: list[str], event_slug: str):
     if not settings.check_liquidity or not token_ids:
         return None
     try:
-        from src.connectors.polymarket import fetch_order_books_batch
-        from src.sizing.liquidity import extract_liquidity
-
-        order_books = fetch_order_books_batch(token_ids)
-        if not order_books:
-            return None
-
-        liquidity_map = {}
-        for token_id, book in order_books.items():
-            snap = extract_liquidity(book, token_id)
-            if snap:
-                liquidity_map[token_id] = snap
+        from src.connectors.market_snapshot import get_liquidity
+
+        liquidity_map = get_liquidity(token_ids)
         return liquidity_map or None
     except Exception:
         logger.warning("Order book fetch failed for %s, proceeding without", event_slug)
@@ -517,29 +516,30 @@ def process_single_job(
             try:
                 resp = place_limit_buy(opp.token_id, order_price, size_usd)
                 order_id = resp.get("orderID") or resp.get("id", "")
-                update_order_status(signal_id, order_id, "placed", db_path=db_path)
                 # Order lifecycle 記録 (Phase O)
                 from datetime import datetime, timezone
 
                 from src.store.db import log_order_event, update_order_lifecycle
 
                 _now_iso = datetime.now(timezone.utc).isoformat()
-                update_order_lifecycle(
-                    signal_id,
-                    order_placed_at=_now_iso,
-                    order_original_price=order_price,
-                    db_path=db_path,
-                )
-                log_order_event(
-                    signal_id=signal_id,
-                    event_type="placed",
-                    order_id=order_id,
-                    price=order_price,
-                    best_ask_at_event=(
-                        _liq_snap.best_ask if _liq_snap and _liq_snap.best_ask > 0 else None
-                    ),
-                    db_path=db_path,
-                )
+                with transaction(db_path):
+                    update_order_status(signal_id, order_id, "placed", db_path=db_path)
+                    update_order_lifecycle(
+                        signal_id,
+                        order_placed_at=_now_iso,
+                        order_original_price=order_price,
+                        db_path=db_path,
+                    )
+                    log_order_event(
+                        signal_id=signal_id,
+                        event_type="placed",
+                        order_id=order_id,
+                        price=order_price,
+                        best_ask_at_event=(
+                            _liq_snap.best_ask if _liq_snap and _liq_snap.best_ask > 0 else None
+                        ),
+                        db_path=db_path,
+                    )
                 logger.info(
                     "[live] Job %d: BUY %s @ %.3f $%.0f order=%s (liq=%s, bind=%s)",
                     job.id,
@@ -603,16 +603,17 @@ def process_single_job(
         # DCA 有効なら dca_active に遷移
         if dca_max > 1:
             next_status = "dca_active"
-            update_job_status(job.id, next_status, signal_id=signal_id, db_path=db_path)
-            update_dca_job(
-                job.id,
-                dca_entries_count=1,
-                dca_max_entries=dca_max,
-                dca_group_id=dca_group_id,
-                dca_total_budget=budget.total_budget_usd,
-                dca_slice_size=budget.slice_size_usd,
-                db_path=db_path,
-            )
+            with transaction(db_path):
+                update_job_status(job.id, next_status, signal_id=signal_id, db_path=db_path)
+                update_dca_job(
+                    job.id,
+                    dca_entries_count=1,
+                    dca_max_entries=dca_max,
+                    dca_group_id=dca_group_id,
+                    dca_total_budget=budget.total_budget_usd,
+                    dca_slice_size=budget.slice_size_usd,
+                    db_path=db_path,
+                )
             logger.info(
                 "Job %d (%s): -> dca_active (1/%d) budget=$%.0f slice=$%.0f signal #%d [%s]",
                 job.id,
@@ -0,0 +1,283 @@
+"""Deadline-aware work queue spending the tick's order budget across job kinds.
+
+Directional, hedge and DCA jobs used to be processed in DB order, each pass
+truncated by ``max_orders_per_tick`` on its own, so a game about to tip off
+could be crowded out by games with hours of window left. Here every unit of
+work becomes a ``WorkItem`` with a deadline (``execute_before`` for
+directional/hedge, tipoff minus ``dca_cutoff_before_tipoff_min`` for DCA)
+and a value, and ``rank_work`` orders them:
+
+1. items whose deadline falls within ``job_queue_urgent_min`` first, by
+   deadline (then value);
+2. the rest by value (then deadline);
+
+with per-game round-robin inside each bucket (a game's n-th item ranks
+after every other game's (n-1)-th), so one game with several jobs cannot
+take the whole budget. ``run_queue`` then takes ``OrderSlots`` in that order.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 同一ゲーム内の実行順 (hedge は directional のシグナルを前提にする)
+_KIND_ORDER = {"directional": 0, "hedge": 1, "dca": 2}
+
+
+class OrderSlots:
+    """Tick-wide order budget shared by concurrent job workers.
+
+    A worker takes a slot before processing a job and releases it afterwards,
+    counting it only if the job executed. While executed + in-flight jobs fill
+    the budget, ``acquire`` waits for an in-flight job to finish, so at most
+    ``limit`` jobs are executed per tick regardless of concurrency. Work
+    left over once the budget is spent is recorded in ``deferred``.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.executed = 0
+        self.deferred: list[WorkItem] = []
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> bool:
+        """Reserve a slot; False once ``limit`` jobs have executed."""
+        with self._cond:
+            while self.executed + self._in_flight >= self.limit:
+                if self.executed >= self.limit:
+                    return False
+                self._cond.wait()
+            self._in_flight += 1
+            return True
+
+    def release(self, executed: bool) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if executed:
+                self.executed += 1
+            self._cond.notify_all()
+
+
+@dataclass
+class WorkItem:
+    """One job to run this tick.
+
+    ``deadline`` is when the work stops being possible (None = unknown,
+    ranked last); ``value`` is the relative payoff of doing it now.
+    """
+
+    kind: str  # directional / hedge / dca
+    job: object
+    deadline: datetime | None = None
+    value: float = 1.0
+
+    @property
+    def game(self) -> str:
+        return self.job.event_slug
+
+
+def _parse_utc(value) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def job_deadline(job, kind: str) -> datetime | None:
+    """Last moment the job can still place an order."""
+    if kind == "dca":
+        tipoff = _parse_utc(getattr(job, "game_time_utc", None))
+        if tipoff is None:
+            return None
+        return tipoff - timedelta(minutes=settings.dca_cutoff_before_tipoff_min)
+    return _parse_utc(getattr(job, "execute_before", None))
+
+
+def job_value(job, kind: str) -> float:
+    """Relative value of running the job this tick (unitless, directional = 1).
+
+    Directional entries carry the edge; hedges are sized at
+    ``bothside_hedge_kelly_mult`` of it and a DCA slice is one of
+    ``dca_max_entries`` pieces of an entry already taken.
+    """
+    if kind == "hedge":
+        return settings.bothside_hedge_kelly_mult
+    if kind == "dca":
+        return 1.0 / max(getattr(job, "dca_max_entries", 1) or 1, 1)
+    return 1.0
+
+
+def work_items(
+    jobs: Iterable,
+    dca_jobs: Iterable = (),
+    value_fn: Callable[[object, str], float] = job_value,
+) -> list[WorkItem]:
+    """Wrap eligible (directional/hedge) and dca_active jobs as WorkItems."""
+    items = []
+    for job in jobs:
+        kind = "hedge" if getattr(job, "job_side", "directional") == "hedge" else "directional"
+        items.append(WorkItem(kind, job, job_deadline(job, kind), value_fn(job, kind)))
+    for job in dca_jobs:
+        items.append(WorkItem("dca", job, job_deadline(job, "dca"), value_fn(job, "dca")))
+    return items
+
+
+def rank_work(
+    items: Iterable[WorkItem],
+    now: datetime,
+    urgent_min: float | None = None,
+) -> list[WorkItem]:
+    """Order items for budget spending (see module docstring).
+
+    Within a game, items keep directional → hedge → DCA order; an earlier
+    item inherits the earliest deadline behind it so it is never ranked
+    after work that has to wait for it.
+    """
+    if urgent_min is None:
+        urgent_min = settings.job_queue_urgent_min
+    horizon = now + timedelta(minutes=urgent_min)
+
+    by_game: dict[str, list[WorkItem]] = {}
+    for item in items:
+        by_game.setdefault(item.game, []).append(item)
+
+    keyed = []
+    for game_items in by_game.values():
+        game_items.sort(key=lambda it: _KIND_ORDER.get(it.kind, len(_KIND_ORDER)))
+        # 後続の期限を前に伝播 (suffix min)
+        effective: list[datetime | None] = [None] * len(game_items)
+        running: datetime | None = None
+        for i in range(len(game_items) - 1, -1, -1):
+            d = game_items[i].deadline
+            if d is not None and (running is None or d < running):
+                running = d
+            effective[i] = running
+        for rnd, (item, deadline) in enumerate(zip(game_items, effective)):
+            ts = deadline.timestamp() if deadline is not None else float("inf")
+            if deadline is not None and deadline <= horizon:
+                key = (0, rnd, ts, -item.value)
+            else:
+                key = (1, rnd, -item.value, ts)
+            keyed.append((key, item))
+    keyed.sort(key=lambda kv: kv[0])
+    return [item for _, item in keyed]
+
+
+def run_queue(
+    items: list[WorkItem],
+    run_item: Callable[[WorkItem], object],
+    slots: OrderSlots,
+    workers: int = 1,
+    executed: Callable[[object], bool] = lambda r: getattr(r, "status", None) == "executed",
+) -> list[tuple[WorkItem, object]]:
+    """Run ranked ``items`` while the order budget lasts.
+
+    Slots are taken in rank order, so when the budget runs out it is the
+    lowest-ranked work that waits for the next tick. Items of the same game
+    run one after another (the next is submitted when the previous one
+    finishes); different games run on up to ``workers`` threads. ``run_item``
+    is expected to handle its own errors; if it raises, the item is dropped
+    from the results.
+
+    Returns (item, result) pairs for the items that ran, in rank order.
+    """
+    if not items:
+        return []
+
+    def _run(item: WorkItem):
+        ran = False
+        try:
+            result = run_item(item)
+            ran = executed(result)
+            return result
+        finally:
+            slots.release(ran)
+
+    def _deferred(rest: list[WorkItem]) -> None:
+        slots.deferred.extend(rest)
+        logger.warning(
+            "max_orders_per_tick (%d) reached, deferring %d job(s): %s",
+            slots.limit, len(rest), ", ".join(f"{it.kind}:{it.job.id}" for it in rest),
+        )
+
+    futures: list[tuple[WorkItem, Future]] = []
+    if workers <= 1:
+        for i, item in enumerate(items):
+            if not slots.acquire():
+                _deferred(items[i:])
+                break
+            fut: Future = Future()
+            try:
+                fut.set_result(_run(item))
+            except Exception as e:
+                fut.set_exception(e)
+            futures.append((item, fut))
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+        cond = threading.Condition()
+        # ゲームごとの待ち行列 (実行中ゲームの後続はワーカーを塞がずにここで待つ)
+        waiting: dict[str, deque[tuple[WorkItem, Future]]] = {}
+        busy: set[str] = set()
+        remaining = 0
+
+        def _start(item: WorkItem, fut: Future) -> None:
+            inner = pool.submit(_run, item)
+            inner.add_done_callback(lambda f: _finish(item, fut, f))
+
+        def _finish(item: WorkItem, fut: Future, inner: Future) -> None:
+            nonlocal remaining
+            exc = inner.exception()
+            if exc is not None:
+                fut.set_exception(exc)
+            else:
+                fut.set_result(inner.result())
+            with cond:
+                queue = waiting.get(item.game)
+                nxt = queue.popleft() if queue else None
+                if nxt is None:
+                    busy.discard(item.game)
+                remaining -= 1
+                cond.notify_all()
+            if nxt is not None:
+                _start(*nxt)
+
+        try:
+            for i, item in enumerate(items):
+                # 予算が空くまで待つ (実行済みで埋まったら打ち切り)
+                if not slots.acquire():
+                    _deferred(items[i:])
+                    break
+                fut = Future()
+                futures.append((item, fut))
+                with cond:
+                    remaining += 1
+                    if item.game in busy:
+                        waiting.setdefault(item.game, deque()).append((item, fut))
+                        continue
+                    busy.add(item.game)
+                _start(item, fut)
+            with cond:
+                cond.wait_for(lambda: remaining == 0)
+        finally:
+            pool.shutdown(wait=True)
+
+    out: list[tuple[WorkItem, object]] = []
+    for item, fut in futures:
+        try:
+            out.append((item, fut.result()))
+        except Exception:
+            logger.exception("Job %d (%s): unhandled error", item.job.id, item.game)
+    return out
@@ -123,7 +123,7 @@ def process_merge_eligible(
 ) -> list[JobResult]:
     """Process bothside groups eligible for MERGE (post-DCA).
 
-    Called after process_dca_active_jobs() and before auto_settle().
+    Called after process_tick_jobs() and before auto_settle().
     Merges YES+NO token pairs into USDC via CTF mergePositions.
     """
     from src.connectors.ctf import merge_positions as ctf_merge
@@ -6,17 +6,18 @@ Phase O — runs every 2 minutes via launchd, independent of the 15-minute strat
 from __future__ import annotations
 
 import logging
-import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 from src.config import settings
+from src.connectors.market_snapshot import tick_snapshot
 from src.scheduler.pricing import below_market_price
 from src.store.db import (
     DEFAULT_DB_PATH,
     SignalRecord,
     get_active_placed_orders,
     log_order_event,
+    transaction,
     update_order_lifecycle,
     update_order_status,
 )
@@ -73,14 +74,11 @@ def _extract_fill_price(status: dict, fallback_price: float) -> float:
 def _get_best_ask(token_id: str) -> float | None:
     """Fetch current best ask price from the order book."""
     try:
-        from src.connectors.polymarket import fetch_order_book_safe
-        from src.sizing.liquidity import extract_liquidity
-
-        book = fetch_order_book_safe(token_id)
-        if book:
-            snap = extract_liquidity(book, token_id)
-            if snap and snap.best_ask > 0:
-                return snap.best_ask
+        from src.connectors.market_snapshot import get_liquidity
+
+        snap = get_liquidity([token_id]).get(token_id)
+        if snap and snap.best_ask > 0:
+            return snap.best_ask
     except Exception:
         logger.debug("Failed to get best_ask for %s", token_id, exc_info=True)
     return None
@@ -127,9 +125,9 @@ def _check_hedge_target(signal: SignalRecord, new_price: float, db_path: str) ->
         return True  # fail-open: allow re-place
 
 
-def _expire_order(signal: SignalRecord, order_id: str, cancel_order, db_path: str) -> None:
-    """Cancel current order and mark as expired in DB/event log."""
-    if cancel_order(order_id):
+def _record_expired(signal: SignalRecord, order_id: str, db_path: str) -> None:
+    """Mark a cancelled order as expired in DB/event log."""
+    with transaction(db_path):
         update_order_status(signal.id, order_id, "cancelled", db_path=db_path)
         log_order_event(
             signal_id=signal.id,
@@ -195,39 +193,69 @@ def _estimate_current_order_price(signal: SignalRecord, replace_count: int, db_p
     return current_order_price
 
 
-def check_single_order(
+def _fetch_open_orders() -> dict[str, dict] | None:
+    """Open orders for the account in one batch call. None if the call fails."""
+    from src.connectors.polymarket import get_open_orders
+
+    try:
+        return get_open_orders()
+    except Exception:
+        logger.warning("Open orders fetch failed, falling back to per-order status", exc_info=True)
+        return None
+
+
+@dataclass
+class _PendingAction:
+    """Expire or re-place decided by ``_evaluate_order``; the CLOB calls are left
+    to the caller so a tick can cancel / re-place all its orders in batches."""
+
+    kind: str  # 'expire'|'replace'
+    signal: SignalRecord
+    order_id: str
+    now_iso: str
+    reason: str = ""
+    new_price: float | None = None
+    best_ask: float | None = None
+    current_order_price: float | None = None
+    replace_count: int = 0
+
+
+def _evaluate_order(
     signal: SignalRecord,
     db_path: str,
-) -> OrderCheckResult:
-    """Check a single placed order: detect fill, TTL expiry, or re-place."""
-    from src.connectors.polymarket import cancel_order, get_order_status
+    status: dict | None = None,
+) -> OrderCheckResult | _PendingAction:
+    """Handle fills/cancellations/keeps in place; return the expire/re-place still to do."""
+    from src.connectors.polymarket import get_order_status
 
     now = datetime.now(timezone.utc)
     now_iso = now.isoformat()
     order_id = signal.order_id or ""
 
-    # a. CLOB ステータスチェック
-    try:
-        status = get_order_status(order_id)
-    except Exception:
-        logger.warning("Failed to get status for order %s (signal #%d)", order_id, signal.id)
-        update_order_lifecycle(signal.id, order_last_checked_at=now_iso, db_path=db_path)
-        return OrderCheckResult(signal.id, "error", old_order_id=order_id)
+    # a. CLOB ステータスチェック (バッチに無い注文のみ個別取得)
+    if status is None:
+        try:
+            status = get_order_status(order_id)
+        except Exception:
+            logger.warning("Failed to get status for order %s (signal #%d)", order_id, signal.id)
+            update_order_lifecycle(signal.id, order_last_checked_at=now_iso, db_path=db_path)
+            return OrderCheckResult(signal.id, "error", old_order_id=order_id)
 
     order_status = status.get("status", "").lower()
 
     # Filled
     if order_status in ("matched", "filled"):
         fill_price = _extract_fill_price(status, signal.poly_price)
-        update_order_status(signal.id, order_id, "filled", fill_price, db_path=db_path)
-        update_order_lifecycle(signal.id, order_last_checked_at=now_iso, db_path=db_path)
-        log_order_event(
-            signal_id=signal.id,
-            event_type="filled",
-            order_id=order_id,
-            price=fill_price,
-            db_path=db_path,
-        )
+        with transaction(db_path):
+            update_order_status(signal.id, order_id, "filled", fill_price, db_path=db_path)
+            update_order_lifecycle(signal.id, order_last_checked_at=now_iso, db_path=db_path)
+            log_order_event(
+                signal_id=signal.id,
+                event_type="filled",
+                order_id=order_id,
+                price=fill_price,
+                db_path=db_path,
+            )
         logger.info("Order %s filled @ %.3f (signal #%d)", order_id, fill_price, signal.id)
 
         # 約定通知
@@ -250,14 +278,15 @@ def check_single_order(
 
     # Already cancelled
     if order_status in ("cancelled", "expired"):
-        update_order_status(signal.id, order_id, "cancelled", db_path=db_path)
-        update_order_lifecycle(signal.id, order_last_checked_at=now_iso, db_path=db_path)
-        log_order_event(
-            signal_id=signal.id,
-            event_type="cancelled",
-            order_id=order_id,
-            db_path=db_path,
-        )
+        with transaction(db_path):
+            update_order_status(signal.id, order_id, "cancelled", db_path=db_path)
+            update_order_lifecycle(signal.id, order_last_checked_at=now_iso, db_path=db_path)
+            log_order_event(
+                signal_id=signal.id,
+                event_type="cancelled",
+                order_id=order_id,
+                db_path=db_path,
+            )
         logger.info("Order %s already %s (signal #%d)", order_id, order_status, signal.id)
         return OrderCheckResult(signal.id, "cancelled", old_order_id=order_id)
 
@@ -271,19 +300,13 @@ def check_single_order(
 
     # 最大再発注回数超過 → cancel + expired
     if replace_count >= settings.order_max_replaces:
-        _expire_order(signal, order_id, cancel_order, db_path)
-        logger.info(
-            "Order %s expired: max replaces %d (signal #%d)", order_id, replace_count, signal.id,
+        return _PendingAction(
+            "expire", signal, order_id, now_iso, reason=f"max replaces {replace_count}",
         )
-        return OrderCheckResult(signal.id, "expired", old_order_id=order_id)
 
     # ティップオフ過ぎ → cancel + expired
     if _is_past_tipoff(signal, now, db_path):
-        _expire_order(signal, order_id, cancel_order, db_path)
-        logger.info(
-            "Order %s expired: past tipoff (signal #%d)", order_id, signal.id,
-        )
-        return OrderCheckResult(signal.id, "expired", old_order_id=order_id)
+        return _PendingAction("expire", signal, order_id, now_iso, reason="past tipoff")
 
     # best_ask 取得 → re-place 判定
     best_ask = _get_best_ask(signal.token_id)
@@ -303,17 +326,40 @@ def check_single_order(
 
     # Hedge の場合: target_combined 再チェック
     if _is_hedge_signal(signal) and not _check_hedge_target(signal, new_price, db_path):
-        _expire_order(signal, order_id, cancel_order, db_path)
-        return OrderCheckResult(signal.id, "expired", old_order_id=order_id)
+        return _PendingAction("expire", signal, order_id, now_iso, reason="hedge target")
+
+    return _PendingAction(
+        "replace",
+        signal,
+        order_id,
+        now_iso,
+        new_price=new_price,
+        best_ask=best_ask,
+        current_order_price=current_order_price,
+        replace_count=replace_count,
+    )
+
+
+def _finish_expire(action: _PendingAction, cancelled: bool, db_path: str) -> OrderCheckResult:
+    signal = action.signal
+    if cancelled:
+        _record_expired(signal, action.order_id, db_path)
+    logger.info(
+        "Order %s expired: %s (signal #%d)", action.order_id, action.reason, signal.id,
+    )
+    return OrderCheckResult(signal.id, "expired", old_order_id=action.order_id)
 
-    # Cancel + Re-place
-    try:
-        from src.connectors.polymarket import cancel_and_replace_order
 
-        resp = cancel_and_replace_order(order_id, signal.token_id, new_price, signal.kelly_size)
-        new_order_id = resp.get("orderID") or resp.get("id", "")
+def _finish_replace(action: _PendingAction, resp: dict, db_path: str) -> OrderCheckResult:
+    """Record a successful cancel + re-place (DB, order_events, notification)."""
+    signal = action.signal
+    order_id = action.order_id
+    new_order_id = resp.get("orderID") or resp.get("id", "")
+    replace_count = action.replace_count
+    now_iso = action.now_iso
 
-        # DB 更新
+    # DB 更新 + order_events 記録 (cancel + placed) を 1 commit で
+    with transaction(db_path):
         update_order_lifecycle(
             signal.id,
             order_id=new_order_id,
@@ -323,64 +369,133 @@ def check_single_order(
             order_last_checked_at=now_iso,
             db_path=db_path,
         )
-
-        # order_events 記録 (cancel + placed)
         log_order_event(
             signal_id=signal.id,
             event_type="cancelled",
             order_id=order_id,
-            best_ask_at_event=best_ask,
+            best_ask_at_event=action.best_ask,
             db_path=db_path,
         )
         log_order_event(
             signal_id=signal.id,
             event_type="placed",
             order_id=new_order_id,
-            price=new_price,
-            best_ask_at_event=best_ask,
+            price=action.new_price,
+            best_ask_at_event=action.best_ask,
             db_path=db_path,
         )
 
-        logger.info(
-            "Order replaced: %s -> %s @ %.3f (ask %.3f, signal #%d, count %d/%d)",
-            order_id,
-            new_order_id,
-            new_price,
-            best_ask,
-            signal.id,
-            replace_count + 1,
-            settings.order_max_replaces,
+    logger.info(
+        "Order replaced: %s -> %s @ %.3f (ask %.3f, signal #%d, count %d/%d)",
+        order_id,
+        new_order_id,
+        action.new_price,
+        action.best_ask,
+        signal.id,
+        replace_count + 1,
+        settings.order_max_replaces,
+    )
+
+    # 通知
+    try:
+        from src.notifications.telegram import notify_order_replaced
+
+        notify_order_replaced(
+            event_slug=signal.event_slug,
+            outcome_name=signal.team,
+            old_price=action.current_order_price,
+            new_price=action.new_price,
+            best_ask=action.best_ask,
+            replace_count=replace_count + 1,
+            max_replaces=settings.order_max_replaces,
+            signal_id=signal.id,
         )
+    except Exception:
+        pass
 
-        # 通知
-        try:
-            from src.notifications.telegram import notify_order_replaced
+    return OrderCheckResult(
+        signal.id,
+        "replaced",
+        old_order_id=order_id,
+        new_order_id=new_order_id,
+        new_price=action.new_price,
+        best_ask=action.best_ask,
+    )
 
-            notify_order_replaced(
-                event_slug=signal.event_slug,
-                outcome_name=signal.team,
-                old_price=current_order_price,
-                new_price=new_price,
-                best_ask=best_ask,
-                replace_count=replace_count + 1,
-                max_replaces=settings.order_max_replaces,
-                signal_id=signal.id,
+
+def _execute_actions_batch(actions: list[_PendingAction], db_path: str) -> list[OrderCheckResult]:
+    """Run a tick's expires/re-places with one batch cancel and one batch place."""
+    if not actions:
+        return []
+
+    from src.connectors.polymarket import (
+        LimitBuyRequest,
+        cancel_orders_batch,
+        place_limit_buys_batch,
+    )
+
+    cancelled = cancel_orders_batch([a.order_id for a in actions])
+    replaces = [a for a in actions if a.kind == "replace"]
+    for a in replaces:
+        if not cancelled.get(a.order_id):
+            logger.warning(
+                "Could not cancel order %s, proceeding with new order anyway", a.order_id,
             )
-        except Exception:
-            pass
+    placements = place_limit_buys_batch(
+        [LimitBuyRequest(a.signal.token_id, a.new_price, a.signal.kelly_size) for a in replaces],
+    ) if replaces else []
+    placed = {id(a): p for a, p in zip(replaces, placements)}
+
+    results = []
+    for a in actions:
+        if a.kind == "expire":
+            results.append(_finish_expire(a, cancelled.get(a.order_id, False), db_path))
+            continue
+        p = placed.get(id(a))
+        if p is not None and p.ok:
+            results.append(_finish_replace(a, p.response, db_path))
+        else:
+            logger.error(
+                "Re-place failed for signal #%d (order %s): %s",
+                a.signal.id, a.order_id, p.error if p else "not submitted",
+            )
+            results.append(OrderCheckResult(a.signal.id, "error", old_order_id=a.order_id))
+    return results
 
-        return OrderCheckResult(
-            signal.id,
-            "replaced",
-            old_order_id=order_id,
-            new_order_id=new_order_id,
-            new_price=new_price,
-            best_ask=best_ask,
-        )
 
+def check_single_order(
+    signal: SignalRecord,
+    db_path: str,
+    status: dict | None = None,
+) -> OrderCheckResult:
+    """Check a single placed order: detect fill, TTL expiry, or re-place.
+
+    ``status`` is the order's entry from the batch open-orders listing; when
+    None the status is fetched individually (rate limited).
+    """
+    outcome = _evaluate_order(signal, db_path, status=status)
+    if isinstance(outcome, OrderCheckResult):
+        return outcome
+
+    if outcome.kind == "expire":
+        from src.connectors.polymarket import cancel_order
+
+        cancelled = cancel_order(outcome.order_id)
+        return _finish_expire(outcome, cancelled, db_path)
+
+    # Cancel + Re-place
+    try:
+        from src.connectors.polymarket import cancel_and_replace_order
+
+        resp = cancel_and_replace_order(
+            outcome.order_id, signal.token_id, outcome.new_price, signal.kelly_size,
+        )
+        return _finish_replace(outcome, resp, db_path)
     except Exception:
-        logger.exception("Re-place failed for signal #%d (order %s)", signal.id, order_id)
-        return OrderCheckResult(signal.id, "error", old_order_id=order_id)
+        logger.exception(
+            "Re-place failed for signal #%d (order %s)", signal.id, outcome.order_id,
+        )
+        return OrderCheckResult(signal.id, "error", old_order_id=outcome.order_id)
 
 
 def check_and_manage_orders(
@@ -406,17 +521,39 @@ def check_and_manage_orders(
     if not placed_orders:
         return summary
 
-    batch_size = settings.order_check_batch_size
-    orders_to_check = placed_orders[:batch_size]
-
+    # 口座の open 注文を一括取得して DB の placed と突き合わせる。
+    # open に居る注文は追加リクエスト不要、居ない注文 (約定/取消の可能性) だけ個別取得
+    open_orders = _fetch_open_orders()
+    anomalies = (
+        len(placed_orders) if open_orders is None
+        else sum(1 for s in placed_orders if (s.order_id or "") not in open_orders)
+    )
     logger.info(
-        "Order manager: checking %d/%d placed orders",
-        len(orders_to_check),
+        "Order manager: checking %d placed orders (%d need per-order status)",
         len(placed_orders),
+        anomalies,
     )
 
-    for signal in orders_to_check:
-        result = check_single_order(signal, path)
+    # 再発注は token が既知なのでテンプレートを先に準備 (署名のみ hot path に残す)
+    from src.connectors.polymarket import prepare_order_templates
+
+    prepare_order_templates([s.token_id for s in placed_orders])
+
+    # 同一 token の板は tick 内で 1 回だけ取得。
+    # expire / re-place は判定だけ先に済ませ、cancel と発注をそれぞれ 1 リクエストにまとめる
+    pending: list[_PendingAction] = []
+    results: list[OrderCheckResult] = []
+    with tick_snapshot():
+        for signal in placed_orders:
+            status = open_orders.get(signal.order_id or "") if open_orders is not None else None
+            outcome = _evaluate_order(signal, path, status=status)
+            if isinstance(outcome, _PendingAction):
+                pending.append(outcome)
+            else:
+                results.append(outcome)
+    results.extend(_execute_actions_batch(pending, path))
+
+    for result in results:
         summary.results.append(result)
         summary.checked += 1
 
@@ -433,9 +570,6 @@ def check_and_manage_orders(
         else:
             summary.errors += 1
 
-        # レート制限
-        time.sleep(settings.order_rate_limit_sleep)
-
     if summary.filled or summary.replaced or summary.expired:
         logger.info(
             "Order manager tick: checked=%d filled=%d replaced=%d expired=%d kept=%d errors=%d",
@@ -9,12 +9,10 @@ from datetime import datetime, timedelta, timezone
 from src.config import settings
 from src.store.db import (
     DEFAULT_DB_PATH,
-    compute_position_group_inventory,
-    get_group_execute_before,
-    get_open_position_groups,
-    get_position_group_sizing_snapshot,
-    log_position_group_audit_event,
-    update_position_group,
+    get_open_position_group_tick_inputs,
+    log_position_group_audit_events,
+    transaction,
+    update_position_groups,
 )
 from src.strategy.position_group_sizing import (
     PositionGroupSizingInputs,
@@ -235,31 +233,39 @@ def process_position_groups(
     db_path: str | None = None,
     now_utc: datetime | None = None,
 ) -> list[PositionGroupTickResult]:
-    """Advance open position groups by one scheduler tick."""
+    """Advance open position groups by one scheduler tick.
+
+    Inputs for all groups come from one bulk query and all updates/audit rows
+    are written in one transaction, so tick cost stays flat in group count.
+    """
     path = db_path or str(DEFAULT_DB_PATH)
     now_dt = now_utc or datetime.now(timezone.utc)
     now_iso = now_dt.isoformat()
 
-    groups = get_open_position_groups(db_path=path)
-    if not groups:
+    tick_inputs = get_open_position_group_tick_inputs(db_path=path)
+    if not tick_inputs:
         return []
 
     risk_ctx = _load_risk_context(path)
     results: list[PositionGroupTickResult] = []
-
-    for group in groups:
-        q_dir, q_opp, merged_qty = compute_position_group_inventory(group.event_slug, db_path=path)
+    group_updates: list[dict] = []
+    audit_events: list[dict] = []
+
+    for tick_input in tick_inputs:
+        group = tick_input.group
+        q_dir = tick_input.q_dir
+        q_opp = tick_input.q_opp
+        merged_qty = tick_input.merged_qty
         d = q_dir - q_opp
         m = min(q_dir, q_opp)
         base_d_max = group.d_max if group.d_max > 0 else settings.position_group_default_d_max
-        sizing_snapshot = get_position_group_sizing_snapshot(group.event_slug, db_path=path)
         targets = compute_position_group_targets(
-            inputs=PositionGroupSizingInputs(**sizing_snapshot),
+            inputs=PositionGroupSizingInputs(**tick_input.sizing_snapshot),
             balance_usd=risk_ctx.balance_usd,
             u_regime=risk_ctx.sizing_multiplier,
         )
 
-        execute_before = get_group_execute_before(group.event_slug, db_path=path)
+        execute_before = tick_input.execute_before
         d_max_t = _compute_dynamic_d_max(
             base_d_max=base_d_max,
             execute_before=execute_before,
@@ -282,17 +288,18 @@ def process_position_groups(
                 risk_ctx.safe_stop_reason or "unknown",
             )
 
-        update_position_group(
-            group.event_slug,
-            state=next_state,
-            m_target=targets.m_target,
-            d_target=targets.d_target,
-            q_dir=q_dir,
-            q_opp=q_opp,
-            merged_qty=merged_qty,
-            d_max=base_d_max,
-            phase_time=now_iso if next_state != group.state else group.phase_time,
-            db_path=path,
+        group_updates.append(
+            {
+                "event_slug": group.event_slug,
+                "state": next_state,
+                "m_target": targets.m_target,
+                "d_target": targets.d_target,
+                "q_dir": q_dir,
+                "q_opp": q_opp,
+                "merged_qty": merged_qty,
+                "d_max": base_d_max,
+                "phase_time": now_iso if next_state != group.state else group.phase_time,
+            }
         )
         merge_amount = max(merged_qty - max(group.merged_qty, 0.0), 0.0)
         reason = _derive_transition_reason(
@@ -305,27 +312,25 @@ def process_position_groups(
             d_max=d_max_t,
             risk_ctx=risk_ctx,
         )
-        try:
-            log_position_group_audit_event(
-                event_slug=group.event_slug,
-                audit_type="tick",
-                prev_state=group.state,
-                new_state=next_state,
-                reason=reason,
-                m_target=targets.m_target,
-                d_target=targets.d_target,
-                q_dir=q_dir,
-                q_opp=q_opp,
-                d=d,
-                m=m,
-                d_max=d_max_t,
-                merge_amount=merge_amount,
-                merged_qty=merged_qty,
-                created_at=now_iso,
-                db_path=path,
-            )
-        except Exception:
-            logger.exception("PositionGroup audit logging failed: %s", group.event_slug)
+        audit_events.append(
+            {
+                "event_slug": group.event_slug,
+                "audit_type": "tick",
+                "prev_state": group.state,
+                "new_state": next_state,
+                "reason": reason,
+                "m_target": targets.m_target,
+                "d_target": targets.d_target,
+                "q_dir": q_dir,
+                "q_opp": q_opp,
+                "d": d,
+                "m": m,
+                "d_max": d_max_t,
+                "merge_amount": merge_amount,
+                "merged_qty": merged_qty,
+                "created_at": now_iso,
+            }
+        )
 
         results.append(
             PositionGroupTickResult(
@@ -341,4 +346,11 @@ def process_position_groups(
             )
         )
 
+    with transaction(path):
+        update_position_groups(group_updates, db_path=path)
+        try:
+            log_position_group_audit_events(audit_events, db_path=path)
+        except Exception:
+            logger.exception("PositionGroup audit logging failed (%d events)", len(audit_events))
+
     return results
@@ -0,0 +1,202 @@
+"""Price-crossing triggers that wake the scheduler daemon early.
+
+The daemon wakes on timers (window open/close, next TWAP slice, order TTL)
+plus a ``daemon_dca_poll_min`` poll, so a favorable DCA price or a move that
+warrants re-pricing a resting order is only noticed on the next wake-up.
+``PriceTriggerEngine`` listens to the WebSocket feed (src/connectors/market_ws.py)
+and turns a price crossing into a due ``Wakeup``; the tick then runs the
+usual ``process_tick_jobs`` / order-manager pass, so TWAP slices,
+``should_add_dca_entry`` guards, ``max_orders_per_tick`` and the daemon's
+minimum tick interval all still apply. Triggers are one-shot and re-armed
+from the DB after every tick.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from src.config import settings
+from src.scheduler.daemon import Wakeup, _parse_utc, _utcnow
+from src.scheduler.pricing import below_market_price
+from src.sizing.liquidity import LiquiditySnapshot
+from src.store.models import JobTimerInput, SignalRecord
+from src.strategy.dca_strategy import _calc_twap_schedule
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PriceTrigger:
+    """Fire once when the watched price leaves [below, above] on or after active_from.
+
+    ``field`` is the LiquiditySnapshot attribute compared ('midpoint' for DCA,
+    which decides on the Gamma outcome price; 'best_ask' for re-pricing).
+    ``floor`` suppresses firing below it (DCA price-spread guard).
+    """
+
+    token_id: str
+    reason: str
+    field: str = "midpoint"
+    below: float | None = None
+    above: float | None = None
+    floor: float | None = None
+    active_from: datetime | None = None
+
+    def crossed(self, snap: LiquiditySnapshot, now: datetime) -> bool:
+        if self.active_from is not None and now < self.active_from:
+            return False
+        price = getattr(snap, self.field)
+        if self.floor is not None and price < self.floor:
+            return False
+        if self.below is not None and price <= self.below:
+            return True
+        return self.above is not None and price >= self.above
+
+
+def dca_triggers(jobs: Iterable[JobTimerInput], now: datetime) -> list[PriceTrigger]:
+    """Triggers for dca_active jobs mirroring should_add_dca_entry's price rules.
+
+    Before the next TWAP slice is due, a buy happens only at a favorable price
+    (``dca_favorable_price_pct`` below the first entry). Once the slice is due
+    but deferred as unfavorable, dropping back under the unfavorable bound
+    also triggers.
+    """
+    triggers = []
+    for job in jobs:
+        if job.status != "dca_active" or not job.token_id or not job.first_entry_price:
+            continue
+        if job.dca_entries_count >= job.dca_max_entries:
+            continue
+        tipoff = _parse_utc(job.game_time_utc)
+        first = _parse_utc(job.first_entry_at)
+        last = _parse_utc(job.last_entry_at)
+        if tipoff is None or first is None or last is None:
+            continue
+        if now >= tipoff - timedelta(minutes=settings.dca_cutoff_before_tipoff_min):
+            continue
+
+        initial = job.first_entry_price
+        below = initial * (1.0 - settings.dca_favorable_price_pct / 100.0)
+        schedule = _calc_twap_schedule(
+            first, tipoff, job.dca_max_entries, settings.dca_cutoff_before_tipoff_min,
+        )
+        next_idx = job.dca_entries_count - 1
+        if 0 <= next_idx < len(schedule) and now >= schedule[next_idx]:
+            below = max(below, initial * (1.0 + settings.dca_unfavorable_price_pct / 100.0))
+        triggers.append(PriceTrigger(
+            token_id=job.token_id,
+            reason=f"price_dca:{job.job_id}",
+            below=below,
+            floor=initial - settings.dca_max_price_spread,
+            active_from=last + timedelta(minutes=settings.dca_min_interval_min),
+        ))
+    return triggers
+
+
+def reprice_triggers(
+    orders: Iterable[SignalRecord],
+    order_price: Callable[[SignalRecord], float] | None = None,
+) -> list[PriceTrigger]:
+    """Triggers for placed orders: fire once the re-place price moves by order_min_price_move.
+
+    Mirrors order_manager: after the TTL, an order is re-placed at
+    ``below_market_price(best_ask)`` when that differs from the resting price
+    by at least ``order_min_price_move``. ``order_price`` returns the resting
+    price (defaults to order_original_price / poly_price).
+    """
+    ttl = timedelta(minutes=settings.order_ttl_min)
+    move = settings.order_min_price_move
+    # below_market_price は best_ask から 1 tick 下げるだけなので閾値は best_ask 側に直せる
+    offset = 0.5 - below_market_price(0.5)
+    triggers = []
+    for order in orders:
+        if not order.token_id or (order.order_replace_count or 0) >= settings.order_max_replaces:
+            continue
+        placed_at = _parse_utc(order.order_placed_at or order.created_at)
+        if placed_at is None:
+            continue
+        resting = order_price(order) if order_price else (
+            order.order_original_price or order.poly_price
+        )
+        triggers.append(PriceTrigger(
+            token_id=order.token_id,
+            reason=f"price_reprice:{order.id}",
+            field="best_ask",
+            below=resting + offset - move,
+            above=resting + offset + move,
+            active_from=placed_at + ttl,
+        ))
+    return triggers
+
+
+class PriceTriggerEngine:
+    """Armed PriceTriggers keyed by token; feed updates turn crossings into Wakeups."""
+
+    def __init__(self, feed=None, clock: Callable[[], datetime] = _utcnow):
+        self._feed = feed
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._armed: dict[str, list[PriceTrigger]] = {}
+        self._fired: list[Wakeup] = []
+        self._event = threading.Event()
+        self.fired_count = 0
+        if feed is not None:
+            feed.add_listener(self.on_price)
+
+    def arm(self, triggers: Iterable[PriceTrigger]) -> None:
+        """Replace the armed set (called after every tick) and subscribe its tokens."""
+        armed: dict[str, list[PriceTrigger]] = {}
+        for trigger in triggers:
+            armed.setdefault(trigger.token_id, []).append(trigger)
+        with self._lock:
+            self._armed = armed
+        if self._feed is not None and armed:
+            self._feed.subscribe(armed)
+
+    def armed_count(self) -> int:
+        with self._lock:
+            return sum(len(v) for v in self._armed.values())
+
+    def on_price(self, token_id: str, snap: LiquiditySnapshot) -> None:
+        """Feed listener: fire (and disarm) every trigger on ``token_id`` that crossed."""
+        now = self._clock()
+        with self._lock:
+            triggers = self._armed.get(token_id)
+            if not triggers:
+                return
+            fired = [t for t in triggers if t.crossed(snap, now)]
+            if not fired:
+                return
+            self._armed[token_id] = [t for t in triggers if t not in fired]
+            self._fired.extend(Wakeup(now, t.reason) for t in fired)
+            self.fired_count += len(fired)
+        for t in fired:
+            logger.info(
+                "Price trigger %s: %s=%.3f", t.reason, t.field, getattr(snap, t.field),
+            )
+        self._event.set()
+
+    def drain(self) -> list[Wakeup]:
+        """Wakeups fired since the last call."""
+        with self._lock:
+            fired, self._fired = self._fired, []
+            self._event.clear()
+        return fired
+
+    def wait(self, stop, timeout: float, poll_sec: float = 1.0) -> bool:
+        """Sleep until a trigger fires, ``stop`` is set or ``timeout`` passes.
+
+        Returns True when woken by a trigger.
+        """
+        deadline = datetime.now(timezone.utc) + timedelta(seconds=timeout)
+        while not stop.is_set():
+            remaining = (deadline - datetime.now(timezone.utc)).total_seconds()
+            if remaining <= 0:
+                return False
+            if self._event.wait(min(remaining, poll_sec)):
+                return True
+        return False
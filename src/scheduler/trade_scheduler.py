@@ -15,14 +15,19 @@ from zoneinfo import ZoneInfo
 from src.config import settings
 from src.scheduler.dca_executor import process_dca_active_jobs  # noqa: F401
 from src.scheduler.hedge_executor import _schedule_hedge_job
-from src.scheduler.job_executor import JobResult  # noqa: F401
+from src.scheduler.job_executor import JobResult, scheduler_worker_id
+from src.scheduler.job_queue import OrderSlots, rank_work, run_queue, work_items
 from src.scheduler.merge_executor import process_merge_eligible  # noqa: F401
 from src.store.db import (
     DEFAULT_DB_PATH,
-    get_eligible_jobs,
+    claim_dca_active_jobs,
+    claim_eligible_jobs,
     get_executing_jobs,
     get_job_summary,
     has_signal_for_slug_and_side,
+    release_job_claims,
+    renew_job_lease,
+    transaction,
     update_job_status,
     upsert_position_group,
     upsert_trade_job,
@@ -32,6 +37,9 @@ logger = logging.getLogger(__name__)
 
 ET = ZoneInfo("America/New_York")
 
+# 直前の tick で max_orders_per_tick により持ち越されたジョブ (daemon が即 tick する対象)
+_deferred_job_ids: frozenset[int] = frozenset()
+
 
 # ---------------------------------------------------------------------------
 # 1. refresh_schedule — NBA.com → trade_jobs
@@ -63,62 +71,64 @@ def refresh_schedule(
     window_hours = settings.schedule_window_hours
     inserted = 0
 
-    for game in games:
-        # 終了済み試合はスキップ
-        if game.game_status == 3:
-            continue
-
-        slug = build_event_slug(game.away_team, game.home_team, game_date)
-        if not slug:
-            logger.warning(
-                "Cannot build slug for %s @ %s",
-                game.away_team,
-                game.home_team,
-            )
-            continue
+    # 全ゲームの upsert を 1 commit にまとめる
+    with transaction(path):
+        for game in games:
+            # 終了済み試合はスキップ
+            if game.game_status == 3:
+                continue
+
+            slug = build_event_slug(game.away_team, game.home_team, game_date)
+            if not slug:
+                logger.warning(
+                    "Cannot build slug for %s @ %s",
+                    game.away_team,
+                    game.home_team,
+                )
+                continue
 
-        # game_time_utc のパース
-        game_time_utc = game.game_time_utc
-        if not game_time_utc:
-            logger.warning("No game_time_utc for %s", slug)
-            continue
+            # game_time_utc のパース
+            game_time_utc = game.game_time_utc
+            if not game_time_utc:
+                logger.warning("No game_time_utc for %s", slug)
+                continue
 
-        try:
-            gt = datetime.fromisoformat(game_time_utc.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            logger.warning("Bad game_time_utc '%s' for %s", game_time_utc, slug)
-            continue
-
-        execute_after = (gt - timedelta(hours=window_hours)).isoformat()
-        execute_before = gt.isoformat()
-
-        was_inserted = upsert_trade_job(
-            game_date=game_date,
-            event_slug=slug,
-            home_team=game.home_team,
-            away_team=game.away_team,
-            game_time_utc=game_time_utc,
-            execute_after=execute_after,
-            execute_before=execute_before,
-            db_path=path,
-        )
-        if was_inserted:
-            inserted += 1
-            logger.info(
-                "Job created: %s window=[%s, %s)",
-                slug,
-                execute_after,
-                execute_before,
-            )
+            try:
+                gt = datetime.fromisoformat(game_time_utc.replace("Z", "+00:00"))
+            except (ValueError, AttributeError):
+                logger.warning("Bad game_time_utc '%s' for %s", game_time_utc, slug)
+                continue
 
-        if settings.game_position_group_enabled:
-            upsert_position_group(
-                event_slug=slug,
+            execute_after = (gt - timedelta(hours=window_hours)).isoformat()
+            execute_before = gt.isoformat()
+
+            was_inserted = upsert_trade_job(
                 game_date=game_date,
-                state="PLANNED",
-                d_max=settings.position_group_default_d_max,
+                event_slug=slug,
+                home_team=game.home_team,
+                away_team=game.away_team,
+                game_time_utc=game_time_utc,
+                execute_after=execute_after,
+                execute_before=execute_before,
                 db_path=path,
             )
+            if was_inserted:
+                inserted += 1
+                logger.info(
+                    "Job created: %s window=[%s, %s)",
+                    slug,
+                    execute_after,
+                    execute_before,
+                )
+
+            if settings.game_position_group_enabled:
+                upsert_position_group(
+                    event_slug=slug,
+                    game_date=game_date,
+                    state="PLANNED",
+                    d_max=settings.position_group_default_d_max,
+                    db_path=path,
+                )
 
     summary = get_job_summary(game_date, db_path=path)
     logger.info(
@@ -154,9 +164,10 @@ def recover_executing_jobs(db_path: str | None = None) -> int:
         return 0
 
     recovered = 0
-    for job in stuck:
-        _recover_single_executing_job(job, path)
-        recovered += 1
+    with transaction(path):
+        for job in stuck:
+            _recover_single_executing_job(job, path)
+            recovered += 1
 
     return recovered
 
@@ -184,7 +195,7 @@ def _recover_single_executing_job(job, db_path: str) -> None:
 
 
 # ---------------------------------------------------------------------------
-# 3. process_eligible_jobs — scan + place orders (dispatcher)
+# 3. process_tick_jobs — scan + place orders (deadline-ranked dispatcher)
 # ---------------------------------------------------------------------------
 
 
@@ -200,81 +211,180 @@ def process_eligible_jobs(
                        or "dry-run" (log output only).
         sizing_multiplier: Risk-adjusted multiplier for Kelly sizing (1.0 = normal).
     """
-    from src.connectors.polymarket import fetch_moneyline_for_game, place_limit_buy
-    from src.scheduler.hedge_executor import process_hedge_job
-    from src.scheduler.job_executor import process_single_job
-    from src.store.db import log_signal, update_order_status
-    from src.strategy.calibration_scanner import scan_calibration
+    results, _ = process_tick_jobs(
+        execution_mode, db_path=db_path, sizing_multiplier=sizing_multiplier, include_dca=False,
+    )
+    return results
+
+
+def process_tick_jobs(
+    execution_mode: str = "paper",
+    db_path: str | None = None,
+    sizing_multiplier: float = 1.0,
+    include_dca: bool = True,
+) -> tuple[list[JobResult], list[JobResult]]:
+    """Process eligible and DCA-active jobs from one deadline-ranked queue.
 
+    The tick's ``max_orders_per_tick`` budget is spent in rank order across
+    directional, hedge and DCA work (src/scheduler/job_queue.py).
+
+    Returns (eligible job results, DCA results).
+    """
+    global _deferred_job_ids
     path = db_path or DEFAULT_DB_PATH
-    now_utc = datetime.now(timezone.utc).isoformat()
+    now = datetime.now(timezone.utc)
+    now_utc = now.isoformat()
+    _deferred_job_ids = frozenset()
 
     # クラッシュ回復
     recovered = recover_executing_jobs(db_path=path)
     if recovered:
         logger.info("Recovered %d executing jobs", recovered)
 
-    eligible = get_eligible_jobs(
+    # 窓内ジョブをこのワーカーにリース (他ワーカーがリース中のゲームは除外)
+    worker = scheduler_worker_id()
+    eligible = claim_eligible_jobs(
         now_utc,
-        max_retries=settings.schedule_max_retries,
+        settings.schedule_max_retries,
+        worker,
+        settings.job_lease_sec,
         db_path=path,
     )
     if not eligible:
         logger.info("No eligible jobs in execution window")
-        return []
+    dca_jobs = []
+    try:
+        if include_dca:
+            dca_jobs = claim_dca_active_jobs(
+                now_utc, worker, settings.job_lease_sec, db_path=path,
+            )
+        if not eligible and not dca_jobs:
+            return [], []
+        return _process_claimed_jobs(
+            eligible, execution_mode, path, sizing_multiplier, dca_jobs=dca_jobs, now=now,
+        )
+    finally:
+        claimed = [j.id for j in eligible] + [j.id for j in dca_jobs]
+        if claimed:
+            release_job_claims(claimed, worker, db_path=path)
+
+
+def _process_claimed_jobs(
+    eligible: list,
+    execution_mode: str,
+    path: str,
+    sizing_multiplier: float,
+    dca_jobs: list = (),
+    now: datetime | None = None,
+) -> tuple[list[JobResult], list[JobResult]]:
+    """Run the jobs this worker holds leases on, highest-ranked first, games in parallel."""
+    global _deferred_job_ids
+    from src.connectors.market_snapshot import MarketSnapshot, current_snapshot
+    from src.connectors.polymarket import place_limit_buy, prepare_order_templates
+    from src.scheduler.dca_executor import build_dca_config, process_dca_job
+    from src.scheduler.hedge_executor import process_hedge_job
+    from src.scheduler.job_executor import process_single_job
+    from src.store.db import log_signal, update_order_status
+    from src.strategy.calibration_scanner import scan_calibration
 
+    now = now or datetime.now(timezone.utc)
     logger.info(
-        "Found %d eligible job(s) (sizing_multiplier=%.2f)",
-        len(eligible), sizing_multiplier,
+        "Found %d eligible job(s), %d DCA-active job(s) (sizing_multiplier=%.2f)",
+        len(eligible), len(dca_jobs), sizing_multiplier,
     )
+    worker = scheduler_worker_id()
 
-    # 暴走防止: 1 tick あたりの最大発注数
-    max_per_tick = settings.max_orders_per_tick
-    results: list[JobResult] = []
-
-    orders_this_tick = 0
-    for job in eligible:
-        if orders_this_tick >= max_per_tick:
-            logger.warning(
-                "max_orders_per_tick (%d) reached, deferring remaining jobs",
-                max_per_tick,
-            )
-            break
+    # 対象ゲームの moneyline を 1 回の Gamma バッチで取得 (初回参照時)。
+    # tick snapshot があれば DCA / hedge / order manager と共有
+    snapshot = current_snapshot() or MarketSnapshot()
+    snapshot.register_games(
+        [(j.away_team, j.home_team, j.game_date) for j in [*eligible, *dca_jobs]],
+    )
+    fetch_moneyline_for_game = snapshot.moneyline
+    if execution_mode == "live" and eligible:
+        # 発注判断より前に tick size / neg_risk / fee を解決しておき、署名だけを hot path に残す
+        prepare_order_templates(
+            [tid for ml in snapshot.moneylines.values() for tid in ml.token_ids],
+        )
 
+    # 期限の近い順に tick 予算を配分 (同一ゲームは directional → hedge → DCA の順を保つ)。
+    # 暴走防止の max_orders_per_tick はこの tick (= このワーカー) の OrderSlots で保証。
+    # 複数ワーカーでは全体の上限は ワーカー数 × max_orders_per_tick になる
+    queue = rank_work(work_items(eligible, dca_jobs), now)
+    slots = OrderSlots(settings.max_orders_per_tick)
+    games = {item.game for item in queue}
+    workers = max(1, min(settings.job_concurrency, len(games)))
+
+    # 複数ゲーム並列時は同時刻の発注を POST /orders 1 回にまとめる
+    order_fn = place_limit_buy
+    if execution_mode == "live" and workers > 1 and settings.order_batch_window_ms > 0:
+        from src.connectors.order_batcher import OrderBatcher
+
+        order_fn = OrderBatcher(settings.order_batch_window_ms / 1000).place_limit_buy
+    config = build_dca_config() if dca_jobs else None
+
+    def _run_job(item) -> JobResult | None:
+        job = item.job
+        if item.kind == "dca":
+            return process_dca_job(job, execution_mode, path, now, snapshot, config)
         # Hedge ジョブは専用処理
-        if job.job_side == "hedge":
-            result = process_hedge_job(
+        if item.kind == "hedge":
+            return process_hedge_job(
                 job,
                 execution_mode,
                 path,
                 fetch_moneyline_for_game,
                 log_signal,
-                place_limit_buy,
+                order_fn,
                 update_order_status,
             )
-        else:
-            jr, bothside_opp = process_single_job(
-                job,
-                execution_mode,
-                path,
-                fetch_moneyline_for_game,
-                scan_calibration,
-                log_signal,
-                place_limit_buy,
-                update_order_status,
-                sizing_multiplier=sizing_multiplier,
+        jr, bothside_opp = process_single_job(
+            job,
+            execution_mode,
+            path,
+            fetch_moneyline_for_game,
+            scan_calibration,
+            log_signal,
+            order_fn,
+            update_order_status,
+            sizing_multiplier=sizing_multiplier,
+        )
+        # bothside: hedge ジョブをスケジュール (hedge=None でも作成 → 実行時に評価)
+        if bothside_opp:
+            _schedule_hedge_job(job, bothside_opp, path)
+        return jr
+
+    def _run_item(item) -> JobResult | None:
+        job = item.job
+        if not renew_job_lease(job.id, worker, settings.job_lease_sec, db_path=path):
+            # リース切れの間に他ワーカーが取得済み
+            logger.warning("Job %d (%s): lease lost, skipping", job.id, job.event_slug)
+            return None
+        try:
+            return _run_job(item)
+        except Exception as e:
+            # 1 ゲームの想定外エラーで他ゲームを巻き込まない
+            logger.exception("Job %d (%s): worker error", job.id, job.event_slug)
+            if item.kind == "dca":
+                return JobResult(job.id, job.event_slug, "failed", error=str(e))
+            update_job_status(
+                job.id, "failed", error_message=str(e), increment_retry=True, db_path=path,
             )
-            result = jr
+            return JobResult(job.id, job.event_slug, "failed", error=str(e))
 
-            # bothside: hedge ジョブをスケジュール (hedge=None でも作成 → 実行時に評価)
-            if bothside_opp:
-                _schedule_hedge_job(job, bothside_opp, path)
+    done = run_queue(queue, _run_item, slots, workers=workers)
+    _deferred_job_ids = frozenset(item.job.id for item in slots.deferred)
 
-        results.append(result)
-        if result.status == "executed":
-            orders_this_tick += 1
+    # 結果は claim 時の順序で返す
+    by_id = {(item.kind == "dca", item.job.id): r for item, r in done if r is not None}
+    results = [by_id[(False, j.id)] for j in eligible if (False, j.id) in by_id]
+    dca_results = [by_id[(True, j.id)] for j in dca_jobs if (True, j.id) in by_id]
+    return results, dca_results
 
-    return results
+
+def deferred_job_ids() -> frozenset[int]:
+    """Job IDs the last process_tick_jobs left unrun because the order budget ran out."""
+    return _deferred_job_ids
 
 
 def process_position_groups_tick(
@@ -11,8 +11,17 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# score_liquidity の閾値 (size_pct = 発注額 / ask_depth_5c * 100、spread は %)
+HIGH_MAX_SIZE_PCT = 5.0
+HIGH_MAX_SPREAD_PCT = 3.0
+MEDIUM_MAX_SIZE_PCT = 15.0
+MEDIUM_MAX_SPREAD_PCT = 8.0
+INSUFFICIENT_SPREAD_PCT = 15.0
+
 
 @dataclass(frozen=True)
 class LiquiditySnapshot:
@@ -65,6 +74,22 @@ def extract_liquidity(
         key=lambda x: x[0],
         reverse=True,
     )
+    return liquidity_from_levels(token_id, asks, bids, order_size_usd)
+
+
+def liquidity_from_levels(
+    token_id: str,
+    asks: list[tuple[float, float]],
+    bids: list[tuple[float, float]],
+    order_size_usd: float = 100.0,
+) -> LiquiditySnapshot | None:
+    """Build a LiquiditySnapshot from already-sorted (price, size) levels.
+
+    ``asks`` ascending, ``bids`` descending — the layout a locally maintained
+    book (src/connectors/market_ws.py) keeps, so no parsing or sorting here.
+    """
+    if not asks and not bids:
+        return None
 
     best_ask = asks[0][0] if asks else 1.0
     best_bid = bids[0][0] if bids else 0.0
@@ -184,16 +209,42 @@ def score_liquidity(snapshot: LiquiditySnapshot, size_usd: float) -> str:
     size_pct = (size_usd / snapshot.ask_depth_5c) * 100
     spread_pct = snapshot.spread_pct
 
-    if spread_pct > 15.0:
+    if spread_pct > INSUFFICIENT_SPREAD_PCT:
         return "insufficient"
 
-    if size_pct < 5.0 and spread_pct < 3.0:
+    if size_pct < HIGH_MAX_SIZE_PCT and spread_pct < HIGH_MAX_SPREAD_PCT:
         return "high"
 
-    if size_pct < 15.0 and spread_pct < 8.0:
+    if size_pct < MEDIUM_MAX_SIZE_PCT and spread_pct < MEDIUM_MAX_SPREAD_PCT:
         return "medium"
 
-    if spread_pct < 15.0:
+    if spread_pct < INSUFFICIENT_SPREAD_PCT:
         return "low"
 
     return "insufficient"
+
+
+def score_liquidity_many(
+    ask_depth_5c: np.ndarray,
+    spread_pct: np.ndarray,
+    size_usd: np.ndarray,
+) -> np.ndarray:
+    """Vectorized score_liquidity (object array of labels, one per row).
+
+    Rows with NaN depth (no snapshot) are scored "unknown".
+    """
+    depth = np.asarray(ask_depth_5c, dtype=float)
+    spread = np.asarray(spread_pct, dtype=float)
+    safe_depth = np.where(depth > 0, depth, 1.0)
+    size_pct = (np.asarray(size_usd, dtype=float) / safe_depth) * 100
+    return np.select(
+        [
+            np.isnan(depth),
+            (depth <= 0) | (spread > INSUFFICIENT_SPREAD_PCT),
+            (size_pct < HIGH_MAX_SIZE_PCT) & (spread < HIGH_MAX_SPREAD_PCT),
+            (size_pct < MEDIUM_MAX_SIZE_PCT) & (spread < MEDIUM_MAX_SPREAD_PCT),
+            spread < INSUFFICIENT_SPREAD_PCT,
+        ],
+        ["unknown", "insufficient", "high", "medium", "low"],
+        "insufficient",
+    ).astype(object)
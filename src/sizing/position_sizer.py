@@ -8,10 +8,18 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 
-from src.sizing.liquidity import LiquiditySnapshot, score_liquidity
+import numpy as np
+
+from src.sizing.liquidity import LiquiditySnapshot, score_liquidity, score_liquidity_many
 
 logger = logging.getLogger(__name__)
 
+# 3 層制約の名前 (候補順 = 同値時に binding とする優先順)
+CONSTRAINTS = ("kelly", "capital", "liquidity", "max_position")
+# スプレッドが max_spread_pct のこの割合を超えたら流動性キャップを掛けて wait
+SPREAD_WARN_RATIO = 0.75
+SPREAD_WARN_LIQUIDITY_MULT = 0.5
+
 
 @dataclass
 class DCABudget:
@@ -270,10 +278,10 @@ def calculate_position_size(
             )
 
         # スプレッドが閾値の 75% を超えたら流動性キャップ半減
-        spread_warn_threshold = max_spread_pct * 0.75
+        spread_warn_threshold = max_spread_pct * SPREAD_WARN_RATIO
         depth_cap = liquidity.ask_depth_5c * liquidity_fill_pct / 100.0
         if liquidity.spread_pct > spread_warn_threshold:
-            depth_cap *= 0.5
+            depth_cap *= SPREAD_WARN_LIQUIDITY_MULT
             execution = "wait"
 
         liquidity_cap = depth_cap
@@ -284,12 +292,7 @@ def calculate_position_size(
             execution = "wait"
 
     # 最終サイズ = 4つの制約の最小値
-    candidates = {
-        "kelly": raw_kelly,
-        "capital": capital_cap,
-        "liquidity": liquidity_cap,
-        "max_position": max_position_usd,
-    }
+    candidates = dict(zip(CONSTRAINTS, (raw_kelly, capital_cap, liquidity_cap, max_position_usd)))
     final = min(candidates.values())
     final = max(final, 0.0)
 
@@ -314,3 +317,72 @@ def calculate_position_size(
         liquidity_score=liq_score,
         recommended_execution=execution,
     )
+
+
+@dataclass
+class SizingColumns:
+    """calculate_position_size results for many rows (unrounded sizes)."""
+
+    final_size_usd: np.ndarray
+    constraint_binding: np.ndarray
+    liquidity_score: np.ndarray
+    recommended_execution: np.ndarray
+
+
+def calculate_position_size_many(
+    kelly_usd: np.ndarray,
+    balance_usd: np.ndarray,
+    ask_depth_5c: np.ndarray,
+    spread_pct: np.ndarray,
+    max_position_usd: float = 100.0,
+    capital_risk_pct: float = 2.0,
+    liquidity_fill_pct: float = 10.0,
+    max_spread_pct: float = 10.0,
+) -> SizingColumns:
+    """Vectorized calculate_position_size.
+
+    NaN ``balance_usd`` means no capital constraint (None) and NaN
+    ``ask_depth_5c`` / ``spread_pct`` no liquidity snapshot. Sizes are not
+    rounded; ``np.round`` can differ from ``round`` on exact half-cent ties.
+    """
+    kelly_usd = np.asarray(kelly_usd, dtype=float)
+    balance = np.asarray(balance_usd, dtype=float)
+    depth = np.asarray(ask_depth_5c, dtype=float)
+    spread = np.asarray(spread_pct, dtype=float)
+    n = len(kelly_usd)
+
+    raw_kelly = np.maximum(kelly_usd, 0.0)
+    capital_cap = np.where(balance > 0, balance * capital_risk_pct / 100.0, np.inf)
+
+    has_liq = ~np.isnan(depth)
+    liq_score = score_liquidity_many(depth, spread, raw_kelly)
+    spread_skip = has_liq & (spread > max_spread_pct)
+    warn = has_liq & ~spread_skip & (spread > max_spread_pct * SPREAD_WARN_RATIO)
+    depth_cap = depth * liquidity_fill_pct / 100.0
+    liquidity_cap = np.where(
+        has_liq, np.where(warn, depth_cap * SPREAD_WARN_LIQUIDITY_MULT, depth_cap), np.inf,
+    )
+    execution = np.select(
+        [
+            ~has_liq,
+            spread_skip | (liq_score == "insufficient"),
+            warn | (liq_score == "low"),
+        ],
+        ["immediate", "skip", "wait"],
+        "immediate",
+    ).astype(object)
+
+    candidates = np.vstack([raw_kelly, capital_cap, liquidity_cap, np.full(n, max_position_usd)])
+    final = np.maximum(candidates.min(axis=0), 0.0)
+    binding = np.array(CONSTRAINTS, dtype=object)[candidates.argmin(axis=0)]
+    final = np.where(execution == "skip", 0.0, final)
+    # スプレッド超過は binding=liquidity / insufficient で即 skip
+    binding[spread_skip] = "liquidity"
+    liq_score[spread_skip] = "insufficient"
+
+    return SizingColumns(
+        final_size_usd=final,
+        constraint_binding=binding,
+        liquidity_score=liq_score,
+        recommended_execution=execution,
+    )
@@ -5,15 +5,19 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from src.store import risk_ledger
+
 # Re-export models and schema for backward compatibility
 from src.store.models import (  # noqa: F401
     JobStatus,
     JobSummary,
+    JobTimerInput,
     MergeOperation,
     OrderEvent,
     PerformanceStats,
     PositionGroupAuditEvent,
     PositionGroupRecord,
+    PositionGroupTickInput,
     ResultRecord,
     SignalRecord,
     TradeJob,
@@ -25,6 +29,7 @@ from src.store.schema import (  # noqa: F401
     SCHEMA_SQL,
     TRADE_JOBS_SQL,
     _connect,
+    transaction,
 )
 
 
@@ -135,6 +140,8 @@ def log_result(
                VALUES (?, ?, ?, ?, ?, ?)""",
             (signal_id, outcome, int(won), settlement_price, pnl, now),
         )
+        # 同じトランザクションでリスク台帳に反映
+        risk_ledger.apply_pending(conn)
         conn.commit()
         return cur.lastrowid  # type: ignore[return-value]
     finally:
@@ -192,26 +199,23 @@ def get_all_results(db_path: Path | str = DEFAULT_DB_PATH) -> list[ResultRecord]
 
 
 def get_performance(db_path: Path | str = DEFAULT_DB_PATH) -> PerformanceStats:
-    """Compute aggregate paper-trade performance statistics."""
+    """Aggregate paper-trade performance statistics (read from the risk ledger)."""
     conn = _connect(db_path)
     try:
-        total_signals = conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
-        settled_count = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        ledger = risk_ledger.sync(conn)
+        total_signals = ledger["signals_count"]
+        settled_count = ledger["settled_count"]
         unsettled_count = total_signals - settled_count
 
-        wins = conn.execute("SELECT COUNT(*) FROM results WHERE won = 1").fetchone()[0]
+        wins = ledger["wins"]
         losses = settled_count - wins
         win_rate = wins / settled_count if settled_count > 0 else 0.0
 
-        total_pnl_row = conn.execute("SELECT COALESCE(SUM(pnl), 0) FROM results").fetchone()
-        total_pnl = float(total_pnl_row[0])
+        total_pnl = ledger["cum_pnl"]
         avg_pnl = total_pnl / settled_count if settled_count > 0 else 0.0
 
-        pnl_rows = conn.execute("SELECT pnl FROM results ORDER BY settled_at ASC").fetchall()
-        pnl_series = [float(r[0]) for r in pnl_rows]
-
-        max_drawdown = _calc_max_drawdown(pnl_series)
-        sharpe_ratio = _calc_sharpe(pnl_series)
+        max_drawdown = ledger["max_drawdown"]
+        sharpe_ratio = risk_ledger.sharpe(ledger)
 
         return PerformanceStats(
             total_signals=total_signals,
@@ -229,35 +233,6 @@ def get_performance(db_path: Path | str = DEFAULT_DB_PATH) -> PerformanceStats:
         conn.close()
 
 
-def _calc_max_drawdown(pnl_series: list[float]) -> float:
-    """Max drawdown from cumulative PnL series."""
-    if not pnl_series:
-        return 0.0
-    cumulative = 0.0
-    peak = 0.0
-    max_dd = 0.0
-    for pnl in pnl_series:
-        cumulative += pnl
-        if cumulative > peak:
-            peak = cumulative
-        dd = peak - cumulative
-        if dd > max_dd:
-            max_dd = dd
-    return max_dd
-
-
-def _calc_sharpe(pnl_series: list[float], annualize_factor: float = 1.0) -> float:
-    """Sharpe ratio from individual PnL values (risk-free rate = 0)."""
-    if len(pnl_series) < 2:
-        return 0.0
-    mean = sum(pnl_series) / len(pnl_series)
-    variance = sum((x - mean) ** 2 for x in pnl_series) / (len(pnl_series) - 1)
-    std = variance**0.5
-    if std == 0:
-        return 0.0
-    return (mean / std) * annualize_factor
-
-
 # ---------------------------------------------------------------------------
 # Execution tracking helpers
 # ---------------------------------------------------------------------------
@@ -454,13 +429,167 @@ def get_eligible_jobs(
         conn.close()
 
 
+def _lease_times(lease_sec: float) -> tuple[str, str]:
+    now = datetime.now(timezone.utc)
+    return now.isoformat(), (now + timedelta(seconds=lease_sec)).isoformat()
+
+
+def _claim_jobs(
+    filter_sql: str,
+    filter_params: tuple,
+    worker_id: str,
+    lease_sec: float,
+    limit: int | None,
+    db_path: Path | str,
+) -> list[TradeJob]:
+    """Lease matching jobs to ``worker_id`` in one atomic UPDATE ... RETURNING.
+
+    A job is claimable when unclaimed, already ours, or its lease has expired,
+    and no other worker holds a live lease on another job of the same game
+    (directional → hedge of one game stays on one worker).
+    """
+    now_iso, expires = _lease_times(lease_sec)
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(
+            f"""UPDATE trade_jobs
+                SET claimed_by = ?, lease_expires_at = ?
+                WHERE id IN (
+                    SELECT j.id FROM trade_jobs j
+                    WHERE {filter_sql}
+                      AND (j.claimed_by IS NULL OR j.claimed_by = ?
+                           OR j.lease_expires_at <= ?)
+                      AND NOT EXISTS (
+                          SELECT 1 FROM trade_jobs o
+                          WHERE o.event_slug = j.event_slug AND o.id != j.id
+                            AND o.claimed_by IS NOT NULL AND o.claimed_by != ?
+                            AND o.lease_expires_at > ?)
+                    ORDER BY j.game_time_utc ASC
+                    LIMIT ?)
+                RETURNING *""",
+            (
+                worker_id, expires, *filter_params,
+                worker_id, now_iso, worker_id, now_iso,
+                -1 if limit is None else limit,
+            ),
+        ).fetchall()
+        conn.commit()
+        jobs = [TradeJob(**dict(r)) for r in rows]
+        # RETURNING の順序は不定
+        jobs.sort(key=lambda j: (j.game_time_utc, j.id))
+        return jobs
+    finally:
+        conn.close()
+
+
+def claim_eligible_jobs(
+    now_utc: str,
+    max_retries: int,
+    worker_id: str,
+    lease_sec: float,
+    *,
+    limit: int | None = None,
+    db_path: Path | str = DEFAULT_DB_PATH,
+) -> list[TradeJob]:
+    """Claim get_eligible_jobs' jobs for this worker (lease of ``lease_sec``)."""
+    return _claim_jobs(
+        """j.status IN ('pending', 'failed')
+           AND j.execute_after <= ?
+           AND j.execute_before > ?
+           AND j.retry_count < ?""",
+        (now_utc, now_utc, max_retries),
+        worker_id,
+        lease_sec,
+        limit,
+        db_path,
+    )
+
+
+def claim_dca_active_jobs(
+    now_utc: str,
+    worker_id: str,
+    lease_sec: float,
+    *,
+    db_path: Path | str = DEFAULT_DB_PATH,
+) -> list[TradeJob]:
+    """Claim get_dca_active_jobs' jobs for this worker (lease of ``lease_sec``)."""
+    return _claim_jobs(
+        """j.status = 'dca_active'
+           AND j.execute_before > ?
+           AND j.dca_entries_count < j.dca_max_entries""",
+        (now_utc,),
+        worker_id,
+        lease_sec,
+        None,
+        db_path,
+    )
+
+
+def renew_job_lease(
+    job_id: int,
+    worker_id: str,
+    lease_sec: float,
+    db_path: Path | str = DEFAULT_DB_PATH,
+) -> bool:
+    """Extend our lease on a job; False if another worker has taken it over."""
+    _, expires = _lease_times(lease_sec)
+    conn = _connect(db_path)
+    try:
+        cur = conn.execute(
+            "UPDATE trade_jobs SET lease_expires_at = ? WHERE id = ? AND claimed_by = ?",
+            (expires, job_id, worker_id),
+        )
+        conn.commit()
+        return cur.rowcount > 0
+    finally:
+        conn.close()
+
+
+def release_job_claims(
+    job_ids: list[int],
+    worker_id: str,
+    db_path: Path | str = DEFAULT_DB_PATH,
+) -> int:
+    """Drop this worker's leases on ``job_ids``; jobs still 'executing' keep theirs.
+
+    An executing job only stays executing if the worker died mid-order; its
+    lease then expires and recover_executing_jobs picks it up.
+    """
+    if not job_ids:
+        return 0
+    placeholders = ",".join("?" * len(job_ids))
+    conn = _connect(db_path)
+    try:
+        cur = conn.execute(
+            f"""UPDATE trade_jobs SET claimed_by = NULL, lease_expires_at = NULL
+                WHERE id IN ({placeholders}) AND claimed_by = ?
+                  AND status != 'executing'""",
+            (*job_ids, worker_id),
+        )
+        conn.commit()
+        return cur.rowcount
+    finally:
+        conn.close()
+
+
 def get_executing_jobs(
     db_path: Path | str = DEFAULT_DB_PATH,
 ) -> list[TradeJob]:
-    """Get jobs stuck in 'executing' state (crash recovery)."""
+    """Get jobs stuck in 'executing' state (crash recovery).
+
+    Jobs under a live lease are still being worked on by some worker and are
+    excluded; unleased rows (pre-lease runs) are always returned.
+    """
+    now_iso = datetime.now(timezone.utc).isoformat()
     conn = _connect(db_path)
     try:
-        rows = conn.execute("SELECT * FROM trade_jobs WHERE status = 'executing'").fetchall()
+        rows = conn.execute(
+            """SELECT * FROM trade_jobs
+               WHERE status = 'executing'
+                 AND (claimed_by IS NULL OR lease_expires_at IS NULL
+                      OR lease_expires_at <= ?)""",
+            (now_iso,),
+        ).fetchall()
         return [TradeJob(**dict(r)) for r in rows]
     finally:
         conn.close()
@@ -915,35 +1044,175 @@ def get_position_group_sizing_snapshot(
             (event_slug,),
         ).fetchall()
 
-        dir_vwap = None
-        opp_vwap = None
+        role_totals: dict[str, tuple[float, float]] = {}
         for row in role_rows:
-            shares = float(row["shares"] or 0.0)
-            cost = float(row["cost_usd"] or 0.0)
-            if shares <= 0:
-                continue
-            vwap = cost / shares
-            if row["role"] == "directional":
-                dir_vwap = vwap
-            elif row["role"] == "hedge":
-                opp_vwap = vwap
+            role_totals[row["role"]] = (float(row["cost_usd"] or 0.0), float(row["shares"] or 0.0))
+
+        dir_cost, dir_shares = role_totals.get("directional", (0.0, 0.0))
+        opp_cost, opp_shares = role_totals.get("hedge", (0.0, 0.0))
+        return _build_sizing_snapshot(
+            directional_price=dir_row["price"] if dir_row else None,
+            opposite_price=opp_row["price"] if opp_row else None,
+            expected_win_rate=dir_row["expected_win_rate"] if dir_row else None,
+            band_confidence=dir_row["band_confidence"] if dir_row else None,
+            dir_cost=dir_cost,
+            dir_shares=dir_shares,
+            opp_cost=opp_cost,
+            opp_shares=opp_shares,
+        )
+    finally:
+        conn.close()
 
-        return {
-            "directional_price": float(dir_row["price"]) if dir_row and dir_row["price"] else None,
-            "opposite_price": float(opp_row["price"]) if opp_row and opp_row["price"] else None,
-            "directional_expected_win_rate": (
-                float(dir_row["expected_win_rate"])
-                if dir_row and dir_row["expected_win_rate"] is not None
-                else None
-            ),
-            "directional_band_confidence": (
-                str(dir_row["band_confidence"])
-                if dir_row and dir_row["band_confidence"] is not None
-                else ""
-            ),
-            "directional_vwap": dir_vwap,
-            "opposite_vwap": opp_vwap,
-        }
+
+def _build_sizing_snapshot(
+    *,
+    directional_price: float | None,
+    opposite_price: float | None,
+    expected_win_rate: float | None,
+    band_confidence: str | None,
+    dir_cost: float,
+    dir_shares: float,
+    opp_cost: float,
+    opp_shares: float,
+) -> dict:
+    """Shape raw sizing columns into PositionGroupSizingInputs kwargs."""
+    return {
+        "directional_price": float(directional_price) if directional_price else None,
+        "opposite_price": float(opposite_price) if opposite_price else None,
+        "directional_expected_win_rate": (
+            float(expected_win_rate) if expected_win_rate is not None else None
+        ),
+        "directional_band_confidence": (
+            str(band_confidence) if band_confidence is not None else ""
+        ),
+        "directional_vwap": dir_cost / dir_shares if dir_shares > 0 else None,
+        "opposite_vwap": opp_cost / opp_shares if opp_shares > 0 else None,
+    }
+
+
+_OPEN_GROUP_TICK_INPUTS_SQL = """
+WITH open_groups AS (
+    SELECT * FROM position_groups
+    WHERE state NOT IN ('CLOSED', 'SAFE_STOP')
+),
+filled AS (
+    SELECT s.event_slug,
+           s.signal_role,
+           s.kelly_size,
+           CASE
+               WHEN COALESCE(s.fill_price, s.poly_price) > 0
+               THEN s.kelly_size / COALESCE(s.fill_price, s.poly_price)
+               ELSE 0
+           END AS shares
+    FROM signals s
+    JOIN open_groups g ON g.event_slug = s.event_slug
+    LEFT JOIN results r ON r.signal_id = s.id
+    WHERE r.id IS NULL
+      AND s.order_status = 'filled'
+      AND s.signal_role IN ('directional', 'hedge')
+),
+inventory AS (
+    SELECT event_slug,
+           SUM(CASE WHEN signal_role = 'directional' THEN shares ELSE 0 END) AS dir_shares,
+           SUM(CASE WHEN signal_role = 'hedge' THEN shares ELSE 0 END) AS opp_shares,
+           SUM(CASE WHEN signal_role = 'directional' THEN kelly_size ELSE 0 END) AS dir_cost,
+           SUM(CASE WHEN signal_role = 'hedge' THEN kelly_size ELSE 0 END) AS opp_cost
+    FROM filled
+    GROUP BY event_slug
+),
+merged AS (
+    SELECT mo.event_slug, SUM(mo.merge_amount) AS merged_qty
+    FROM merge_operations mo
+    JOIN open_groups g ON g.event_slug = mo.event_slug
+    WHERE mo.status IN ('executed', 'simulated')
+    GROUP BY mo.event_slug
+),
+latest AS (
+    SELECT s.event_slug,
+           s.signal_role,
+           COALESCE(s.fill_price, s.poly_price) AS price,
+           s.expected_win_rate,
+           s.band_confidence,
+           ROW_NUMBER() OVER (
+               PARTITION BY s.event_slug, s.signal_role
+               ORDER BY s.created_at DESC, s.id DESC
+           ) AS rn
+    FROM signals s
+    JOIN open_groups g ON g.event_slug = s.event_slug
+    WHERE s.signal_role IN ('directional', 'hedge')
+),
+deadline AS (
+    SELECT tj.event_slug,
+           tj.execute_before,
+           ROW_NUMBER() OVER (PARTITION BY tj.event_slug ORDER BY tj.id ASC) AS rn
+    FROM trade_jobs tj
+    JOIN open_groups g ON g.event_slug = tj.event_slug
+    WHERE tj.job_side = 'directional'
+)
+SELECT g.*,
+       COALESCE(inv.dir_shares, 0.0) AS inv_dir_shares,
+       COALESCE(inv.opp_shares, 0.0) AS inv_opp_shares,
+       COALESCE(inv.dir_cost, 0.0) AS inv_dir_cost,
+       COALESCE(inv.opp_cost, 0.0) AS inv_opp_cost,
+       COALESCE(mg.merged_qty, 0.0) AS inv_merged_qty,
+       ld.price AS dir_price,
+       ld.expected_win_rate AS dir_expected_win_rate,
+       ld.band_confidence AS dir_band_confidence,
+       lo.price AS opp_price,
+       dl.execute_before AS group_execute_before
+FROM open_groups g
+LEFT JOIN inventory inv ON inv.event_slug = g.event_slug
+LEFT JOIN merged mg ON mg.event_slug = g.event_slug
+LEFT JOIN latest ld
+       ON ld.event_slug = g.event_slug AND ld.signal_role = 'directional' AND ld.rn = 1
+LEFT JOIN latest lo
+       ON lo.event_slug = g.event_slug AND lo.signal_role = 'hedge' AND lo.rn = 1
+LEFT JOIN deadline dl ON dl.event_slug = g.event_slug AND dl.rn = 1
+ORDER BY g.updated_at ASC
+"""
+
+
+def get_open_position_group_tick_inputs(
+    db_path: Path | str = DEFAULT_DB_PATH,
+) -> list[PositionGroupTickInput]:
+    """Bulk-load inventory, sizing snapshot and execute_before for all open groups.
+
+    One joined query equivalent to calling compute_position_group_inventory,
+    get_position_group_sizing_snapshot and get_group_execute_before per group.
+    """
+    group_fields = PositionGroupRecord.__dataclass_fields__
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(_OPEN_GROUP_TICK_INPUTS_SQL).fetchall()
+        out: list[PositionGroupTickInput] = []
+        for row in rows:
+            d = dict(row)
+            dir_shares = float(d["inv_dir_shares"])
+            opp_shares = float(d["inv_opp_shares"])
+            merged_qty = float(d["inv_merged_qty"])
+            out.append(
+                PositionGroupTickInput(
+                    group=PositionGroupRecord(
+                        **{k: v for k, v in d.items() if k in group_fields}
+                    ),
+                    # MERGE 済み在庫を差し引いた純在庫
+                    q_dir=max(dir_shares - merged_qty, 0.0),
+                    q_opp=max(opp_shares - merged_qty, 0.0),
+                    merged_qty=merged_qty,
+                    sizing_snapshot=_build_sizing_snapshot(
+                        directional_price=d["dir_price"],
+                        opposite_price=d["opp_price"],
+                        expected_win_rate=d["dir_expected_win_rate"],
+                        band_confidence=d["dir_band_confidence"],
+                        dir_cost=float(d["inv_dir_cost"]),
+                        dir_shares=dir_shares,
+                        opp_cost=float(d["inv_opp_cost"]),
+                        opp_shares=opp_shares,
+                    ),
+                    execute_before=d["group_execute_before"],
+                )
+            )
+        return out
     finally:
         conn.close()
 
@@ -1001,6 +1270,54 @@ def update_position_group(
         conn.close()
 
 
+def update_position_groups(
+    updates: list[dict],
+    db_path: Path | str = DEFAULT_DB_PATH,
+) -> int:
+    """Bulk version of update_position_group (one executemany, one commit).
+
+    Each dict has event_slug plus any of state, m_target, d_target, q_dir,
+    q_opp, merged_qty, d_max, phase_time. None/missing fields are left unchanged.
+    """
+    if not updates:
+        return 0
+    now = datetime.now(timezone.utc).isoformat()
+    conn = _connect(db_path)
+    try:
+        conn.executemany(
+            """UPDATE position_groups SET
+                   updated_at = ?,
+                   state = COALESCE(?, state),
+                   M_target = COALESCE(?, M_target),
+                   D_target = COALESCE(?, D_target),
+                   q_dir = COALESCE(?, q_dir),
+                   q_opp = COALESCE(?, q_opp),
+                   merged_qty = COALESCE(?, merged_qty),
+                   d_max = COALESCE(?, d_max),
+                   phase_time = COALESCE(?, phase_time)
+               WHERE event_slug = ?""",
+            [
+                (
+                    now,
+                    u.get("state"),
+                    u.get("m_target"),
+                    u.get("d_target"),
+                    u.get("q_dir"),
+                    u.get("q_opp"),
+                    u.get("merged_qty"),
+                    u.get("d_max"),
+                    u.get("phase_time"),
+                    u["event_slug"],
+                )
+                for u in updates
+            ],
+        )
+        conn.commit()
+        return len(updates)
+    finally:
+        conn.close()
+
+
 def log_position_group_audit_event(
     *,
     event_slug: str,
@@ -1054,6 +1371,52 @@ def log_position_group_audit_event(
         conn.close()
 
 
+def log_position_group_audit_events(
+    events: list[dict],
+    db_path: Path | str = DEFAULT_DB_PATH,
+) -> int:
+    """Bulk-insert audit events (same keys as log_position_group_audit_event kwargs).
+
+    Returns the number of rows inserted.
+    """
+    if not events:
+        return 0
+    now = datetime.now(timezone.utc).isoformat()
+    conn = _connect(db_path)
+    try:
+        conn.executemany(
+            """INSERT INTO position_group_audit_events
+               (event_slug, audit_type, prev_state, new_state, reason,
+                M_target, D_target, q_dir, q_opp, d, m, d_max,
+                merge_amount, merged_qty, created_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (
+                    e["event_slug"],
+                    e.get("audit_type", "tick"),
+                    e.get("prev_state"),
+                    e.get("new_state"),
+                    e.get("reason"),
+                    e.get("m_target"),
+                    e.get("d_target"),
+                    e.get("q_dir"),
+                    e.get("q_opp"),
+                    e.get("d"),
+                    e.get("m"),
+                    e.get("d_max"),
+                    e.get("merge_amount"),
+                    e.get("merged_qty"),
+                    e.get("created_at") or now,
+                )
+                for e in events
+            ],
+        )
+        conn.commit()
+        return len(events)
+    finally:
+        conn.close()
+
+
 def get_position_group_audit_events(
     event_slug: str,
     *,
@@ -1207,6 +1570,37 @@ def get_dca_active_jobs(
         conn.close()
 
 
+def get_open_job_timers(
+    db_path: Path | str = DEFAULT_DB_PATH,
+) -> list[JobTimerInput]:
+    """Return window/TWAP timing inputs for all pending/failed/dca_active jobs.
+
+    first/last_entry_at are the earliest/latest signal in the job's DCA group;
+    token_id / first_entry_price come from the group's first entry.
+    """
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(
+            """SELECT j.id, j.status, j.game_time_utc, j.execute_after, j.execute_before,
+                      COALESCE(j.retry_count, 0), COALESCE(j.dca_entries_count, 0),
+                      COALESCE(j.dca_max_entries, 1),
+                      MIN(s.created_at), MAX(s.created_at),
+                      (SELECT f.token_id FROM signals f WHERE f.dca_group_id = j.dca_group_id
+                       ORDER BY f.dca_sequence ASC, f.id ASC LIMIT 1),
+                      (SELECT f.poly_price FROM signals f WHERE f.dca_group_id = j.dca_group_id
+                       ORDER BY f.dca_sequence ASC, f.id ASC LIMIT 1)
+               FROM trade_jobs j
+               LEFT JOIN signals s ON j.dca_group_id IS NOT NULL
+                 AND s.dca_group_id = j.dca_group_id
+               WHERE j.status IN ('pending', 'failed', 'dca_active')
+               GROUP BY j.id
+               ORDER BY j.execute_after ASC""",
+        ).fetchall()
+        return [JobTimerInput(*tuple(r)) for r in rows]
+    finally:
+        conn.close()
+
+
 def get_dca_group_signals(
     dca_group_id: str,
     db_path: Path | str = DEFAULT_DB_PATH,
@@ -1627,16 +2021,7 @@ def get_daily_results(
     """Get aggregated PnL for a single date. Returns {"pnl": float, "wins": int, "losses": int}."""
     conn = _connect(db_path)
     try:
-        row = conn.execute(
-            """SELECT
-                 COALESCE(SUM(r.pnl), 0.0) AS pnl,
-                 COALESCE(SUM(CASE WHEN r.won = 1 THEN 1 ELSE 0 END), 0) AS wins,
-                 COALESCE(SUM(CASE WHEN r.won = 0 THEN 1 ELSE 0 END), 0) AS losses
-               FROM results r
-               WHERE r.settled_at LIKE ?""",
-            (f"{date_str}%",),
-        ).fetchone()
-        return {"pnl": float(row[0]), "wins": int(row[1]), "losses": int(row[2])}
+        return risk_ledger.daily(conn, date_str)
     finally:
         conn.close()
 
@@ -1646,27 +2031,14 @@ def get_weekly_results(
     db_path: Path | str = DEFAULT_DB_PATH,
 ) -> dict:
     """Get aggregated PnL for the 7 days ending on end_date (inclusive)."""
-    from datetime import timedelta
-
     try:
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+        datetime.strptime(end_date, "%Y-%m-%d")
     except ValueError:
         return {"pnl": 0.0, "wins": 0, "losses": 0}
-    start_dt = end_dt - timedelta(days=6)
-    start_str = start_dt.strftime("%Y-%m-%d")
 
     conn = _connect(db_path)
     try:
-        row = conn.execute(
-            """SELECT
-                 COALESCE(SUM(r.pnl), 0.0) AS pnl,
-                 COALESCE(SUM(CASE WHEN r.won = 1 THEN 1 ELSE 0 END), 0) AS wins,
-                 COALESCE(SUM(CASE WHEN r.won = 0 THEN 1 ELSE 0 END), 0) AS losses
-               FROM results r
-               WHERE r.settled_at >= ? AND r.settled_at < ?""",
-            (start_str, end_date + "T99"),  # end_date 当日を含む
-        ).fetchone()
-        return {"pnl": float(row[0]), "wins": int(row[1]), "losses": int(row[2])}
+        return risk_ledger.window(conn, end_date, 7)
     finally:
         conn.close()
 
@@ -1674,28 +2046,13 @@ def get_weekly_results(
 def get_consecutive_losses(
     db_path: Path | str = DEFAULT_DB_PATH,
 ) -> int:
-    """Count consecutive losses from most recent results (DESC order).
+    """Count consecutive losses from the most recent results (by settled_at).
 
     Bothside MERGE ペアは除外 (リスクフリー).
     """
     conn = _connect(db_path)
     try:
-        rows = conn.execute(
-            """SELECT r.won, s.bothside_group_id, s.signal_role
-               FROM results r
-               JOIN signals s ON s.id = r.signal_id
-               ORDER BY r.settled_at DESC
-               LIMIT 50""",
-        ).fetchall()
-        count = 0
-        for row in rows:
-            # MERGE ペアの hedge は連敗カウントから除外
-            if row["signal_role"] == "hedge":
-                continue
-            if row["won"]:
-                break
-            count += 1
-        return count
+        return int(risk_ledger.sync(conn)["loss_streak"])
     finally:
         conn.close()
 
@@ -1706,13 +2063,18 @@ def get_open_exposure(
     """Sum of kelly_size for unsettled signals (bothside ネット考慮)."""
     conn = _connect(db_path)
     try:
-        row = conn.execute(
-            """SELECT COALESCE(SUM(s.kelly_size), 0.0)
-               FROM signals s
-               LEFT JOIN results r ON r.signal_id = s.id
-               WHERE r.id IS NULL""",
-        ).fetchone()
-        return float(row[0])
+        ledger = risk_ledger.sync(conn)
+        # 累積和の差分なので丸め誤差で負にならないようにする
+        return max(ledger["signals_kelly"] - ledger["settled_kelly"], 0.0)
+    finally:
+        conn.close()
+
+
+def rebuild_risk_ledger(db_path: Path | str = DEFAULT_DB_PATH) -> dict:
+    """Recompute the risk ledger from all results/signals (after backfills or edits)."""
+    conn = _connect(db_path)
+    try:
+        return risk_ledger.rebuild(conn)
     finally:
         conn.close()
 
@@ -1796,6 +2158,75 @@ def get_latest_risk_snapshot(
         conn.close()
 
 
+def get_risk_high_water_marks(
+    db_path: Path | str = DEFAULT_DB_PATH,
+) -> tuple[int, int]:
+    """Return (max results.id, max signals.id); 0 for empty tables."""
+    conn = _connect(db_path)
+    try:
+        row = conn.execute(
+            """SELECT (SELECT COALESCE(MAX(id), 0) FROM results),
+                      (SELECT COALESCE(MAX(id), 0) FROM signals)""",
+        ).fetchone()
+        return int(row[0]), int(row[1])
+    finally:
+        conn.close()
+
+
+def save_risk_state_cache(
+    state,  # RiskState (avoid circular import)
+    results_hwm: int,
+    signals_hwm: int,
+    prev_key: str,
+    db_path: Path | str = DEFAULT_DB_PATH,
+) -> None:
+    """Store the latest computed RiskState with the high-water marks it was computed from."""
+    import dataclasses
+    import json
+
+    conn = _connect(db_path)
+    try:
+        conn.execute(
+            """INSERT OR REPLACE INTO risk_state_cache
+               (id, computed_at, results_hwm, signals_hwm, prev_key, state_json)
+               VALUES (1, ?, ?, ?, ?, ?)""",
+            (
+                state.checked_at or datetime.now(timezone.utc).isoformat(),
+                results_hwm,
+                signals_hwm,
+                prev_key,
+                json.dumps(dataclasses.asdict(state)),
+            ),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def get_risk_state_cache(
+    db_path: Path | str = DEFAULT_DB_PATH,
+) -> tuple | None:
+    """Return (RiskState, results_hwm, signals_hwm, prev_key, computed_at) or None."""
+    import json
+
+    from src.risk.models import CircuitBreakerLevel, RiskState
+
+    conn = _connect(db_path)
+    try:
+        row = conn.execute("SELECT * FROM risk_state_cache WHERE id = 1").fetchone()
+    finally:
+        conn.close()
+    if not row:
+        return None
+    try:
+        d = json.loads(row["state_json"])
+        d["circuit_breaker_level"] = CircuitBreakerLevel(d["circuit_breaker_level"])
+        state = RiskState(**d)
+    except (json.JSONDecodeError, TypeError, ValueError, KeyError):
+        return None
+    return state, row["results_hwm"], row["signals_hwm"], row["prev_key"], row["computed_at"]
+
+
 def log_circuit_breaker_event(
     level: int,
     trigger: str,
@@ -2087,6 +2518,26 @@ def get_daily_gap_series(
         conn.close()
 
 
+def get_band_daily_stats(
+    start_date: str | None = None,
+    strategy_mode: str = "calibration",
+    db_path: Path | str = DEFAULT_DB_PATH,
+) -> list[dict]:
+    """Per-day, per-price-band settlement aggregates from the risk ledger.
+
+    One row per (day, band) with day >= start_date (every day when None),
+    ordered by day. band is "" for signals without a price band. Keys:
+    day, band, n, wins, trade_profitable, and ev_n / expected_pnl /
+    realized_pnl restricted to positive-EV signals (same filter as
+    get_expected_realized_gap_summary).
+    """
+    conn = _connect(db_path)
+    try:
+        return risk_ledger.band_days(conn, start_date, strategy_mode)
+    finally:
+        conn.close()
+
+
 def get_results_with_signals(
     db_path: Path | str = DEFAULT_DB_PATH,
 ) -> list[tuple[ResultRecord, SignalRecord]]:
@@ -128,6 +128,9 @@ class TradeJob:
     # MERGE フィールド
     merge_status: str = "none"  # none/pending/executed/failed
     merge_operation_id: int | None = None
+    # ワーカーリース (claimed_by が NULL または lease 切れなら取得可能)
+    claimed_by: str | None = None
+    lease_expires_at: str | None = None
 
 
 @dataclass
@@ -198,6 +201,36 @@ class PositionGroupRecord:
     updated_at: str
 
 
+@dataclass
+class PositionGroupTickInput:
+    """Per-tick inputs for one open position group (bulk-loaded)."""
+
+    group: PositionGroupRecord
+    q_dir: float
+    q_opp: float
+    merged_qty: float
+    sizing_snapshot: dict
+    execute_before: str | None
+
+
+@dataclass
+class JobTimerInput:
+    """Timing inputs for one open trade job (scheduler daemon wake-ups)."""
+
+    job_id: int
+    status: str
+    game_time_utc: str
+    execute_after: str
+    execute_before: str
+    retry_count: int
+    dca_entries_count: int
+    dca_max_entries: int
+    first_entry_at: str | None
+    last_entry_at: str | None
+    token_id: str | None = None  # DCA グループ初回エントリーの token (価格トリガー用)
+    first_entry_price: float | None = None
+
+
 @dataclass
 class PositionGroupAuditEvent:
     id: int
@@ -0,0 +1,314 @@
+"""Incrementally maintained risk/performance ledger over results and signals.
+
+Daily P&L buckets (``risk_daily_pnl``) plus one ``risk_ledger`` row holding
+running totals: settled/win counts, the non-hedge loss streak, cumulative
+P&L with its peak and max drawdown, Welford mean/M2 of per-result P&L, and
+the Kelly sums behind open exposure. Per-(day, strategy_mode, price_band)
+win / expected-vs-realized P&L buckets (``risk_band_daily``) feed the
+calibration monitor the same way. ``log_result`` applies its row in the
+same transaction; rows written any other way (backfills, manual SQL) are
+picked up by ``sync`` on the next read via the results/signals id
+high-water marks, so reads cost O(new rows) instead of a full scan.
+
+Results normally arrive in settled_at order. A row settled before the last
+applied one makes the path-dependent fields (streak, drawdown) re-derive
+from one ordered scan; ``rebuild`` recomputes everything (run
+``scripts/rebuild_risk_ledger.py`` after deleting or editing results).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timedelta
+
+_LEDGER_FIELDS = (
+    "last_result_id",
+    "last_signal_id",
+    "last_settled_at",
+    "signals_count",
+    "signals_kelly",
+    "settled_kelly",
+    "settled_count",
+    "wins",
+    "loss_streak",
+    "cum_pnl",
+    "peak_pnl",
+    "max_drawdown",
+    "pnl_mean",
+    "pnl_m2",
+)
+
+
+def _load(conn: sqlite3.Connection) -> dict:
+    row = conn.execute("SELECT * FROM risk_ledger WHERE id = 1").fetchone()
+    if row is None:
+        conn.execute("INSERT OR IGNORE INTO risk_ledger (id) VALUES (1)")
+        row = conn.execute("SELECT * FROM risk_ledger WHERE id = 1").fetchone()
+    return {k: row[k] for k in _LEDGER_FIELDS}
+
+
+def _store(conn: sqlite3.Connection, ledger: dict) -> None:
+    sets = ", ".join(f"{k} = ?" for k in _LEDGER_FIELDS)
+    conn.execute(
+        f"UPDATE risk_ledger SET {sets} WHERE id = 1",
+        tuple(ledger[k] for k in _LEDGER_FIELDS),
+    )
+
+
+def _pending(conn: sqlite3.Connection, ledger: dict) -> bool:
+    row = conn.execute(
+        """SELECT (SELECT COALESCE(MAX(id), 0) FROM results),
+                  (SELECT COALESCE(MAX(id), 0) FROM signals)""",
+    ).fetchone()
+    return row[0] > ledger["last_result_id"] or row[1] > ledger["last_signal_id"]
+
+
+def _apply_signals(conn: sqlite3.Connection, ledger: dict) -> None:
+    row = conn.execute(
+        """SELECT COUNT(*), COALESCE(SUM(kelly_size), 0.0), COALESCE(MAX(id), ?)
+           FROM signals WHERE id > ?""",
+        (ledger["last_signal_id"], ledger["last_signal_id"]),
+    ).fetchone()
+    ledger["signals_count"] += int(row[0])
+    ledger["signals_kelly"] += float(row[1])
+    ledger["last_signal_id"] = int(row[2])
+
+
+def _apply_results(conn: sqlite3.Connection, ledger: dict) -> bool:
+    """Fold results with id > last_result_id into the ledger.
+
+    Returns False when a row settled before the last applied one (the
+    streak/drawdown path then has to be re-derived).
+    """
+    rows = conn.execute(
+        """SELECT r.id, r.won, r.pnl, r.settled_at, s.id AS sid, s.kelly_size, s.signal_role
+           FROM results r
+           LEFT JOIN signals s ON s.id = r.signal_id
+           WHERE r.id > ?
+           ORDER BY r.id""",
+        (ledger["last_result_id"],),
+    ).fetchall()
+    in_order = True
+    days: dict[str, list] = {}
+    for row in rows:
+        pnl = float(row["pnl"] or 0.0)
+        won = row["won"]
+        settled_at = row["settled_at"] or ""
+
+        ledger["settled_count"] += 1
+        if won == 1:
+            ledger["wins"] += 1
+        ledger["settled_kelly"] += float(row["kelly_size"] or 0.0)
+
+        # Welford: 順序に依存しない平均/分散
+        n = ledger["settled_count"]
+        delta = pnl - ledger["pnl_mean"]
+        ledger["pnl_mean"] += delta / n
+        ledger["pnl_m2"] += delta * (pnl - ledger["pnl_mean"])
+
+        if settled_at < ledger["last_settled_at"]:
+            in_order = False
+        else:
+            ledger["last_settled_at"] = settled_at
+        _step_path(ledger, pnl, won, _in_streak(row))
+
+        bucket = days.setdefault(settled_at[:10], [0.0, 0, 0])
+        bucket[0] += pnl
+        if won == 1:
+            bucket[1] += 1
+        elif won == 0:
+            bucket[2] += 1
+        ledger["last_result_id"] = row["id"]
+
+    conn.executemany(
+        """INSERT INTO risk_daily_pnl (day, pnl, wins, losses) VALUES (?, ?, ?, ?)
+           ON CONFLICT(day) DO UPDATE SET
+             pnl = pnl + excluded.pnl,
+             wins = wins + excluded.wins,
+             losses = losses + excluded.losses""",
+        [(day, *vals) for day, vals in days.items()],
+    )
+    return in_order
+
+
+def _in_streak(row: sqlite3.Row) -> bool:
+    # MERGE ペアの hedge (とシグナルの無い result) は連敗カウントから除外
+    return row["sid"] is not None and row["signal_role"] != "hedge"
+
+
+# expectation_tracker と同じ期待値条件: ev_per_dollar = expected_win_rate / poly_price - 1 > 0
+_EV_OK = """(s.expected_win_rate IS NOT NULL AND s.expected_win_rate > 0
+            AND s.poly_price > 0 AND (s.expected_win_rate / s.poly_price) - 1.0 > 0)"""
+
+
+def _apply_band_days(conn: sqlite3.Connection, after_id: int, upto_id: int) -> None:
+    """Fold results in (after_id, upto_id] into the per-day/band buckets."""
+    if upto_id <= after_id:
+        return
+    conn.execute(
+        f"""INSERT INTO risk_band_daily
+             (day, strategy_mode, band, n, wins, trade_profitable,
+              ev_n, expected_pnl, realized_pnl)
+           SELECT date(r.settled_at), COALESCE(s.strategy_mode, ''), COALESCE(s.price_band, ''),
+                  COUNT(*),
+                  SUM(CASE WHEN r.won = 1 THEN 1 ELSE 0 END),
+                  SUM(CASE WHEN r.pnl > 0 THEN 1 ELSE 0 END),
+                  SUM(CASE WHEN {_EV_OK} THEN 1 ELSE 0 END),
+                  COALESCE(SUM(CASE WHEN {_EV_OK}
+                      THEN ((s.expected_win_rate / s.poly_price) - 1.0) * s.kelly_size END), 0.0),
+                  COALESCE(SUM(CASE WHEN {_EV_OK} THEN r.pnl END), 0.0)
+           FROM results r
+           JOIN signals s ON s.id = r.signal_id
+           WHERE r.id > ? AND r.id <= ? AND date(r.settled_at) IS NOT NULL
+           GROUP BY 1, 2, 3
+           ON CONFLICT(strategy_mode, day, band) DO UPDATE SET
+             n = n + excluded.n,
+             wins = wins + excluded.wins,
+             trade_profitable = trade_profitable + excluded.trade_profitable,
+             ev_n = ev_n + excluded.ev_n,
+             expected_pnl = expected_pnl + excluded.expected_pnl,
+             realized_pnl = realized_pnl + excluded.realized_pnl""",
+        (after_id, upto_id),
+    )
+
+
+def _step_path(ledger: dict, pnl: float, won, in_streak: bool) -> None:
+    ledger["cum_pnl"] += pnl
+    if ledger["cum_pnl"] > ledger["peak_pnl"]:
+        ledger["peak_pnl"] = ledger["cum_pnl"]
+    ledger["max_drawdown"] = max(ledger["max_drawdown"], ledger["peak_pnl"] - ledger["cum_pnl"])
+    if in_streak:
+        ledger["loss_streak"] = 0 if won else ledger["loss_streak"] + 1
+
+
+def _rederive_path(conn: sqlite3.Connection, ledger: dict) -> None:
+    """Recompute streak / cumulative / peak / drawdown in settled_at order."""
+    for key in ("loss_streak", "cum_pnl", "peak_pnl", "max_drawdown"):
+        ledger[key] = 0 if key == "loss_streak" else 0.0
+    ledger["last_settled_at"] = ""
+    rows = conn.execute(
+        """SELECT r.won, r.pnl, r.settled_at, s.id AS sid, s.signal_role
+           FROM results r
+           LEFT JOIN signals s ON s.id = r.signal_id
+           WHERE r.id <= ?
+           ORDER BY r.settled_at, r.id""",
+        (ledger["last_result_id"],),
+    ).fetchall()
+    for row in rows:
+        _step_path(ledger, float(row["pnl"] or 0.0), row["won"], _in_streak(row))
+        ledger["last_settled_at"] = max(ledger["last_settled_at"], row["settled_at"] or "")
+
+
+def _catch_up(conn: sqlite3.Connection, ledger: dict) -> None:
+    # シグナルを先に反映 (result の kelly_size は既存シグナル分)
+    _apply_signals(conn, ledger)
+    after_id = ledger["last_result_id"]
+    if not _apply_results(conn, ledger):
+        _rederive_path(conn, ledger)
+    _apply_band_days(conn, after_id, ledger["last_result_id"])
+    _store(conn, ledger)
+
+
+def apply_pending(conn: sqlite3.Connection) -> None:
+    """Fold new rows into the ledger inside the caller's open write transaction."""
+    ledger = _load(conn)
+    if _pending(conn, ledger):
+        _catch_up(conn, ledger)
+
+
+def sync(conn: sqlite3.Connection) -> dict:
+    """Bring the ledger up to date and return it.
+
+    The common case (nothing new) is two primary-key lookups and no write.
+    """
+    ledger = _load(conn)
+    if not _pending(conn, ledger):
+        return ledger
+    started = not conn.in_transaction
+    if started:
+        # 他プロセスとの二重適用を防ぐため書き込みロックを取ってから読み直す
+        conn.execute("BEGIN IMMEDIATE")
+    try:
+        ledger = _load(conn)
+        if _pending(conn, ledger):
+            _catch_up(conn, ledger)
+    except BaseException:
+        if started:
+            conn.rollback()
+        raise
+    conn.commit()
+    return ledger
+
+
+def reset(conn: sqlite3.Connection) -> None:
+    """Drop the ledger; the next sync rebuilds it from scratch."""
+    conn.execute("DELETE FROM risk_ledger")
+    conn.execute("DELETE FROM risk_daily_pnl")
+    conn.execute("DELETE FROM risk_band_daily")
+
+
+def rebuild(conn: sqlite3.Connection) -> dict:
+    """Recompute the ledger from all results and signals."""
+    reset(conn)
+    ledger = _load(conn)
+    _apply_signals(conn, ledger)
+    _apply_results(conn, ledger)
+    _rederive_path(conn, ledger)
+    _apply_band_days(conn, 0, ledger["last_result_id"])
+    _store(conn, ledger)
+    conn.commit()
+    return ledger
+
+
+# ---------------------------------------------------------------------------
+# Reads
+# ---------------------------------------------------------------------------
+
+
+def daily(conn: sqlite3.Connection, date_str: str) -> dict:
+    sync(conn)
+    row = conn.execute(
+        "SELECT pnl, wins, losses FROM risk_daily_pnl WHERE day = ?", (date_str,),
+    ).fetchone()
+    if row is None:
+        return {"pnl": 0.0, "wins": 0, "losses": 0}
+    return {"pnl": float(row[0]), "wins": int(row[1]), "losses": int(row[2])}
+
+
+def window(conn: sqlite3.Connection, end_date: str, days: int) -> dict:
+    """Sum of the ``days`` daily buckets ending on end_date (inclusive)."""
+    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+    start = (end_dt - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+    sync(conn)
+    row = conn.execute(
+        """SELECT COALESCE(SUM(pnl), 0.0), COALESCE(SUM(wins), 0), COALESCE(SUM(losses), 0)
+           FROM risk_daily_pnl WHERE day >= ? AND day <= ?""",
+        (start, end_date),
+    ).fetchone()
+    return {"pnl": float(row[0]), "wins": int(row[1]), "losses": int(row[2])}
+
+
+def band_days(
+    conn: sqlite3.Connection, start_date: str | None, strategy_mode: str,
+) -> list[dict]:
+    """Per-day/band buckets with day >= start_date (all days when None), by day."""
+    sync(conn)
+    rows = conn.execute(
+        """SELECT day, band, n, wins, trade_profitable, ev_n, expected_pnl, realized_pnl
+           FROM risk_band_daily
+           WHERE strategy_mode = ? AND day >= ?
+           ORDER BY day, band""",
+        (strategy_mode, start_date or ""),
+    ).fetchall()
+    return [dict(r) for r in rows]
+
+
+def sharpe(ledger: dict) -> float:
+    """Per-result Sharpe (risk-free rate = 0) from the Welford accumulators."""
+    n = ledger["settled_count"]
+    if n < 2:
+        return 0.0
+    variance = ledger["pnl_m2"] / (n - 1)
+    if variance <= 0:
+        return 0.0
+    return ledger["pnl_mean"] / variance**0.5
@@ -1,15 +1,23 @@
-"""Database schema DDL and migration helpers.
+"""Database schema DDL, migration helpers and connection management.
 
-Extracted from src/store/db.py — schema definitions and column migrations only.
+Extracted from src/store/db.py — schema definitions, column migrations and _connect.
 """
 
 from __future__ import annotations
 
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "paper_trades.db"
 
+# PRAGMA user_version に記録するスキーマ版数。
+# _migrate() に DDL / _ensure_* を追加したら必ずインクリメントすること
+# (既存 DB は user_version < SCHEMA_VERSION を検知して 1 回だけ再マイグレーションする)。
+SCHEMA_VERSION = 5
+
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS signals (
     id          INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -213,6 +221,22 @@ def _ensure_dca_columns(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
+# 複数ワーカーのジョブ取得用リース (claim_eligible_jobs / claim_dca_active_jobs)
+_LEASE_JOB_COLUMNS = [
+    ("claimed_by", "TEXT"),
+    ("lease_expires_at", "TEXT"),
+]
+
+
+def _ensure_lease_columns(conn: sqlite3.Connection) -> None:
+    """Add job lease columns to trade_jobs if they don't exist."""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(trade_jobs)").fetchall()}
+    for col_name, col_def in _LEASE_JOB_COLUMNS:
+        if col_name not in existing:
+            conn.execute(f"ALTER TABLE trade_jobs ADD COLUMN {col_name} {col_def}")
+    conn.commit()
+
+
 # Both-side 用カラム (signals)
 _BOTHSIDE_SIGNAL_COLUMNS = [
     ("bothside_group_id", "TEXT"),
@@ -567,6 +591,60 @@ CREATE TABLE IF NOT EXISTS risk_snapshots (
     last_balance_usd    REAL,
     flags               TEXT DEFAULT '[]'
 );
+
+-- 直近に計算した RiskState (1 行)。別プロセスから再利用できるよう
+-- 計算時点の results / signals の最大 id と前回 snapshot の CB 状態を保持する
+CREATE TABLE IF NOT EXISTS risk_state_cache (
+    id              INTEGER PRIMARY KEY CHECK (id = 1),
+    computed_at     TEXT NOT NULL,
+    results_hwm     INTEGER NOT NULL DEFAULT 0,
+    signals_hwm     INTEGER NOT NULL DEFAULT 0,
+    prev_key        TEXT NOT NULL DEFAULT '',
+    state_json      TEXT NOT NULL
+);
+
+-- results / signals から増分で維持するリスク台帳 (src/store/risk_ledger.py)。
+-- last_*_id までの行を反映済み
+CREATE TABLE IF NOT EXISTS risk_ledger (
+    id              INTEGER PRIMARY KEY CHECK (id = 1),
+    last_result_id  INTEGER NOT NULL DEFAULT 0,
+    last_signal_id  INTEGER NOT NULL DEFAULT 0,
+    last_settled_at TEXT NOT NULL DEFAULT '',
+    signals_count   INTEGER NOT NULL DEFAULT 0,
+    signals_kelly   REAL NOT NULL DEFAULT 0.0,
+    settled_kelly   REAL NOT NULL DEFAULT 0.0,
+    settled_count   INTEGER NOT NULL DEFAULT 0,
+    wins            INTEGER NOT NULL DEFAULT 0,
+    loss_streak     INTEGER NOT NULL DEFAULT 0,
+    cum_pnl         REAL NOT NULL DEFAULT 0.0,
+    peak_pnl        REAL NOT NULL DEFAULT 0.0,
+    max_drawdown    REAL NOT NULL DEFAULT 0.0,
+    pnl_mean        REAL NOT NULL DEFAULT 0.0,
+    pnl_m2          REAL NOT NULL DEFAULT 0.0
+);
+
+-- 決済日 (settled_at の日付部分) ごとの P&L
+CREATE TABLE IF NOT EXISTS risk_daily_pnl (
+    day     TEXT PRIMARY KEY,
+    pnl     REAL NOT NULL DEFAULT 0.0,
+    wins    INTEGER NOT NULL DEFAULT 0,
+    losses  INTEGER NOT NULL DEFAULT 0
+);
+
+-- 決済日 × strategy_mode × price_band ごとの較正/期待値ギャップ集計 (calibration_monitor 用)。
+-- ev_* は期待値 > 0 のシグナル (expectation_tracker と同じ条件) のみ
+CREATE TABLE IF NOT EXISTS risk_band_daily (
+    day               TEXT NOT NULL,
+    strategy_mode     TEXT NOT NULL,
+    band              TEXT NOT NULL,
+    n                 INTEGER NOT NULL DEFAULT 0,
+    wins              INTEGER NOT NULL DEFAULT 0,
+    trade_profitable  INTEGER NOT NULL DEFAULT 0,
+    ev_n              INTEGER NOT NULL DEFAULT 0,
+    expected_pnl      REAL NOT NULL DEFAULT 0.0,
+    realized_pnl      REAL NOT NULL DEFAULT 0.0,
+    PRIMARY KEY (strategy_mode, day, band)
+);
 """
 
 
@@ -586,6 +664,7 @@ def _ensure_indexes(conn: sqlite3.Connection) -> None:
         "CREATE INDEX IF NOT EXISTS idx_results_settled_at ON results(settled_at)",
         "CREATE INDEX IF NOT EXISTS idx_trade_jobs_status ON trade_jobs(status)",
         "CREATE INDEX IF NOT EXISTS idx_trade_jobs_game_date ON trade_jobs(game_date)",
+        "CREATE INDEX IF NOT EXISTS idx_trade_jobs_event_slug ON trade_jobs(event_slug)",
         "CREATE INDEX IF NOT EXISTS idx_position_groups_state ON position_groups(state)",
         "CREATE INDEX IF NOT EXISTS idx_position_groups_event_slug ON position_groups(event_slug)",
         (
@@ -602,12 +681,8 @@ def _ensure_indexes(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
-def _connect(db_path: Path | str = DEFAULT_DB_PATH) -> sqlite3.Connection:
-    """Open (or create) the SQLite database and ensure schema exists."""
-    db_path = Path(db_path)
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Run all idempotent DDL / column migrations and stamp SCHEMA_VERSION."""
     conn.execute("PRAGMA journal_mode=WAL")
     conn.executescript(SCHEMA_SQL)
     conn.executescript(TRADE_JOBS_SQL)
@@ -623,5 +698,121 @@ def _connect(db_path: Path | str = DEFAULT_DB_PATH) -> sqlite3.Connection:
     _ensure_llm_analyses_table(conn)
     _ensure_position_groups_table(conn)
     _ensure_position_group_audit_table(conn)
+    _ensure_lease_columns(conn)
     _ensure_indexes(conn)
+    # マイグレーションは results を書き換えうるので台帳は次回読み出し時に再構築
+    conn.execute("DELETE FROM risk_ledger")
+    conn.execute("DELETE FROM risk_daily_pnl")
+    conn.execute("DELETE FROM risk_band_daily")
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.commit()
+
+
+def _schema_version(conn: sqlite3.Connection) -> int:
+    """Return the schema version stamped on the DB file (0 = never migrated)."""
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
+_migrate_lock = threading.Lock()
+
+
+class _TxConnection(sqlite3.Connection):
+    """Connection shared by a transaction() block.
+
+    db.py helpers call commit()/close() after every write; while the block is
+    open those calls are deferred so the whole unit of work commits once.
+    """
+
+    in_transaction_block: bool = False
+
+    def commit(self) -> None:
+        if self.in_transaction_block:
+            return
+        super().commit()
+
+    def close(self) -> None:
+        if self.in_transaction_block:
+            return
+        super().close()
+
+
+# thread ごとの {resolved db path: 実行中 transaction の接続}
+_tx_local = threading.local()
+
+
+def _active_transactions() -> dict[str, _TxConnection]:
+    active = getattr(_tx_local, "active", None)
+    if active is None:
+        active = {}
+        _tx_local.active = active
+    return active
+
+
+def _tx_key(db_path: Path | str) -> str:
+    return str(Path(db_path).resolve())
+
+
+def _open(db_path: Path, factory: type[sqlite3.Connection]) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), factory=factory)
+    conn.row_factory = sqlite3.Row
+    if _schema_version(conn) < SCHEMA_VERSION:
+        with _migrate_lock:
+            # 別スレッドが先にマイグレーション済みなら再実行しない
+            if _schema_version(conn) < SCHEMA_VERSION:
+                _migrate(conn)
     return conn
+
+
+def _connect(db_path: Path | str = DEFAULT_DB_PATH) -> sqlite3.Connection:
+    """Open (or create) the SQLite database and ensure schema exists.
+
+    Migrations run only when the file's user_version is behind SCHEMA_VERSION,
+    so steady-state opens cost one PRAGMA read instead of the full DDL pass.
+    Inside a transaction() block for the same DB (same thread), the block's
+    shared connection is returned instead of a new one.
+    """
+    db_path = Path(db_path)
+    active = _active_transactions()
+    if active:
+        tx_conn = active.get(_tx_key(db_path))
+        if tx_conn is not None:
+            return tx_conn
+    return _open(db_path, sqlite3.Connection)
+
+
+@contextmanager
+def transaction(db_path: Path | str = DEFAULT_DB_PATH) -> Iterator[sqlite3.Connection]:
+    """Unit of work: every store write on this thread/DB inside the block commits once.
+
+    Usage:
+        with transaction(db_path) as tx:
+            update_order_status(..., db_path=db_path)
+            log_order_event(..., db_path=db_path)
+
+    Reads inside the block see the block's own uncommitted writes. On exception
+    everything is rolled back. Nested blocks join the outermost one.
+    Keep network calls outside the block: the write lock is held from the
+    first write until commit.
+    """
+    key = _tx_key(db_path)
+    active = _active_transactions()
+    existing = active.get(key)
+    if existing is not None:
+        yield existing
+        return
+
+    conn = _open(Path(db_path), _TxConnection)
+    conn.in_transaction_block = True
+    active[key] = conn
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    else:
+        sqlite3.Connection.commit(conn)
+    finally:
+        del active[key]
+        conn.in_transaction_block = False
+        conn.close()
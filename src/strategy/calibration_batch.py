@@ -0,0 +1,235 @@
+"""Vectorized calibration scan: every outcome of a slate as NumPy arrays.
+
+``scan_calibration`` / ``scan_calibration_bothside`` evaluate each outcome
+with scalar calls (curve estimate, Kelly, confidence multiplier, 3-layer
+sizing). ``evaluate_outcomes`` computes the same quantities for whole price
+/ liquidity / balance arrays at once and returns them as
+``CalibrationColumns`` (columnar, for backtests and replays);
+``select_sides`` / ``rank_within_games`` do the per-game side selection.
+The scanners build their ``CalibrationOpportunity`` objects from these
+columns, so live scans and research runs share one implementation.
+
+Every column matches the scalar path (``evaluate_single_outcome``)
+bit for bit except ``position_usd``, which is rounded with ``np.round``;
+the scanners re-round the rows they materialise with Python ``round`` (the
+two can differ by a cent on exact half-cent ties). Sizing, liquidity
+scoring and band confidence use the vectorized variants kept next to their
+scalar versions (position_sizer.py, liquidity.py, calibration_curve.py);
+the Kelly constants below are shared with calibration_scanner.py.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.config import settings
+from src.sizing.position_sizer import calculate_position_size_many
+from src.strategy.calibration import NBA_ML_CALIBRATION
+from src.strategy.calibration_curve import (
+    ContinuousCalibration,
+    _confidence_from_sample_size_many,
+    get_default_curve,
+)
+
+# _confidence_multiplier の範囲 (lower_bound / point_estimate をこの範囲に clip)
+CONFIDENCE_MULT_MIN = 0.5
+CONFIDENCE_MULT_MAX = 1.0
+# Kelly 比率 → USD: min(kelly * max_position_usd * KELLY_USD_SCALE, max_position_usd)
+KELLY_USD_SCALE = 10
+
+
+@dataclass
+class SlateArrays:
+    """Outcomes of active moneylines flattened to rows."""
+
+    game: np.ndarray  # moneylines のインデックス
+    outcome: np.ndarray  # ml.outcomes のインデックス
+    price: np.ndarray
+    ask_depth_5c: np.ndarray  # 板情報なしは NaN
+    spread_pct: np.ndarray  # 板情報なしは NaN
+
+
+@dataclass
+class CalibrationColumns:
+    """Per-outcome scan quantities (one entry per input price).
+
+    ``eligible`` marks rows the scalar scanner would turn into a candidate:
+    valid price, inside the curve, positive EV and not skipped for
+    liquidity. Other columns are still filled where computable (NaN for
+    prices outside the curve).
+    """
+
+    price: np.ndarray
+    point_estimate: np.ndarray
+    expected_win_rate: np.ndarray  # Beta 下限 (保守的推定)
+    effective_sample_size: np.ndarray
+    ev_per_dollar: np.ndarray
+    calibration_edge_pct: np.ndarray
+    kelly: np.ndarray  # 信頼度乗数適用後の Kelly 比率
+    confidence_multiplier: np.ndarray
+    kelly_usd: np.ndarray
+    position_usd: np.ndarray
+    position_raw: np.ndarray  # 丸め前 (制約なしの行は kelly_usd のまま)
+    sized: np.ndarray  # 3 層制約を適用した行
+    constraint_binding: np.ndarray
+    liquidity_score: np.ndarray
+    recommended_execution: np.ndarray
+    in_sweet_spot: np.ndarray
+    price_band: np.ndarray
+    band_confidence: np.ndarray
+    eligible: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+
+def slate_arrays(moneylines, liquidity_map: dict | None = None) -> SlateArrays:
+    """Flatten the outcomes of active moneylines (same filtering as the scanners)."""
+    game, outcome, price, depth, spread = [], [], [], [], []
+    for g, ml in enumerate(moneylines):
+        if not ml.active:
+            continue
+        for i in range(len(ml.outcomes)):
+            if i >= len(ml.prices) or i >= len(ml.token_ids):
+                continue
+            liq = liquidity_map.get(ml.token_ids[i]) if liquidity_map else None
+            game.append(g)
+            outcome.append(i)
+            price.append(ml.prices[i])
+            depth.append(liq.ask_depth_5c if liq is not None else np.nan)
+            spread.append(liq.spread_pct if liq is not None else np.nan)
+    return SlateArrays(
+        game=np.array(game, dtype=np.int64),
+        outcome=np.array(outcome, dtype=np.int64),
+        price=np.array(price, dtype=float),
+        ask_depth_5c=np.array(depth, dtype=float),
+        spread_pct=np.array(spread, dtype=float),
+    )
+
+
+def _band_labels(price: np.ndarray) -> np.ndarray:
+    """lookup_band の価格帯ラベル (該当なしは f"{price:.2f}")."""
+    labels = np.empty(len(price), dtype=object)
+    unmatched = np.ones(len(price), dtype=bool)
+    for band in NBA_ML_CALIBRATION:
+        mask = unmatched & (price >= band.price_lo) & (price < band.price_hi)
+        labels[mask] = f"{band.price_lo:.2f}-{band.price_hi:.2f}"
+        unmatched &= ~mask
+    for i in np.flatnonzero(unmatched):
+        labels[i] = f"{price[i]:.2f}"
+    return labels
+
+
+def evaluate_outcomes(
+    price: np.ndarray,
+    balance_usd: float | np.ndarray | None = None,
+    ask_depth_5c: np.ndarray | None = None,
+    spread_pct: np.ndarray | None = None,
+    curve: ContinuousCalibration | None = None,
+) -> CalibrationColumns:
+    """Vectorized EV / Kelly / confidence / 3-layer sizing for every price.
+
+    ``balance_usd`` is a scalar or per-row array (NaN = unknown, like None).
+    ``ask_depth_5c`` / ``spread_pct`` are per-row liquidity (NaN = no
+    snapshot). Sizing parameters come from settings, as in the scanners.
+    """
+    price = np.asarray(price, dtype=float)
+    n = len(price)
+    curve = curve or get_default_curve()
+    depth = np.full(n, np.nan) if ask_depth_5c is None else np.asarray(ask_depth_5c, float)
+    spread = np.full(n, np.nan) if spread_pct is None else np.asarray(spread_pct, float)
+    if balance_usd is None:
+        balance = np.full(n, np.nan)
+    else:
+        balance = np.broadcast_to(np.asarray(balance_usd, dtype=float), (n,))
+
+    valid_price = (price > 0) & (price < 1)
+    safe_price = np.where(valid_price, price, 0.5)
+    est = curve.estimate_many(np.where(valid_price, price, np.nan))
+    in_curve = valid_price & est.valid
+
+    lower = est.lower_bound
+    point = est.point_estimate
+    ev = lower / safe_price - 1
+    edge_pct = (lower - price) * 100
+
+    # _calibration_kelly + _confidence_multiplier
+    b = (1 / safe_price) - 1
+    kelly_full = (b * lower - (1 - lower)) / b
+    kelly = np.maximum(0.0, kelly_full) * settings.kelly_fraction
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = lower / point
+    conf = np.where(
+        point <= 0, CONFIDENCE_MULT_MIN, np.clip(ratio, CONFIDENCE_MULT_MIN, CONFIDENCE_MULT_MAX),
+    )
+    kelly = kelly * conf
+
+    max_pos = settings.max_position_usd
+    kelly_usd = np.minimum(kelly * max_pos * KELLY_USD_SCALE, max_pos)
+
+    # --- calculate_position_size (3 層制約) — 残高か板情報がある行のみ ---
+    sized = ~np.isnan(balance) | ~np.isnan(depth)
+    sizing = calculate_position_size_many(
+        kelly_usd,
+        balance,
+        depth,
+        spread,
+        max_position_usd=max_pos,
+        capital_risk_pct=settings.capital_risk_pct,
+        liquidity_fill_pct=settings.liquidity_fill_pct,
+        max_spread_pct=settings.max_spread_pct,
+    )
+    final = sizing.final_size_usd
+    binding = sizing.constraint_binding
+    liq_score = sizing.liquidity_score
+    execution = sizing.recommended_execution
+
+    position_raw = np.where(sized, final, kelly_usd)
+    position = np.where(sized, np.round(final, 2), kelly_usd)
+    binding[~sized] = "kelly"
+    liq_score[~sized] = "unknown"
+    execution[~sized] = "immediate"
+
+    ess = est.effective_sample_size
+    band_confidence = _confidence_from_sample_size_many(ess)
+
+    return CalibrationColumns(
+        price=price,
+        point_estimate=point,
+        expected_win_rate=lower,
+        effective_sample_size=ess,
+        ev_per_dollar=ev,
+        calibration_edge_pct=edge_pct,
+        kelly=kelly,
+        confidence_multiplier=conf,
+        kelly_usd=kelly_usd,
+        position_usd=position,
+        position_raw=position_raw,
+        sized=sized,
+        constraint_binding=binding,
+        liquidity_score=liq_score,
+        recommended_execution=execution,
+        in_sweet_spot=(price >= settings.sweet_spot_lo) & (price <= settings.sweet_spot_hi),
+        price_band=_band_labels(price),
+        band_confidence=band_confidence,
+        eligible=in_curve & (ev > 0) & (execution != "skip"),
+    )
+
+
+def rank_within_games(game: np.ndarray, cols: CalibrationColumns) -> np.ndarray:
+    """Eligible row indices ordered by game, then EV desc (ties: outcome order)."""
+    rows = np.flatnonzero(cols.eligible)
+    order = np.lexsort((rows, -cols.ev_per_dollar[rows], game[rows]))
+    return rows[order]
+
+
+def select_sides(game: np.ndarray, cols: CalibrationColumns) -> np.ndarray:
+    """Row index of the highest-EV eligible outcome per game (one per game)."""
+    ranked = rank_within_games(game, cols)
+    if len(ranked) == 0:
+        return ranked
+    g = game[ranked]
+    first = np.concatenate([[True], g[1:] != g[:-1]])
+    return ranked[first]
@@ -3,15 +3,30 @@
 Provides pure functions for:
 - Building calibration tables from condition-level P&L data
 - Walk-forward train/test splits to detect in-sample bias
+
+Walk-forward windows are assembled from ``WalkForwardIndex``: conditions
+are bucketed by month and 5-cent band once, and each training table is
+read off per-month prefix sums instead of refiltering every row.
+Window evaluation (``evaluate_walk_forward`` / ``walk_forward_sweep``)
+runs across a process pool.
 """
 
 from __future__ import annotations
 
+import os
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 
+import numpy as np
+
 from src.strategy.calibration import CalibrationBand
 
+# 5-cent バンド境界 (0.20-0.95、build_calibration_from_conditions と同じ浮動小数)
+_BAND_EDGES = [lo_int / 100 for lo_int in range(20, 100, 5)]
+_SETTLED = ("WIN", "LOSS_OR_OPEN")
+
 
 @dataclass(frozen=True)
 class CalibrationBuildResult:
@@ -109,6 +124,131 @@ def build_calibration_from_conditions(
     )
 
 
+class WalkForwardIndex:
+    """Conditions pre-bucketed by month and price band for walk-forward builds.
+
+    Built once in O(conditions). A training table over any month range is
+    then assembled from per-month prefix sums in O(bands), and test
+    conditions are sliced from a month-sorted index, so one index serves
+    every train/test setting of a sweep. Results match
+    ``build_calibration_from_conditions`` except for float rounding in
+    the cost / P&L sums behind ``historical_roi_pct``.
+    """
+
+    def __init__(self, conditions: list[dict], price_key: str = "avg_buy_price") -> None:
+        self.conditions = conditions
+        self.months = sorted({c["date"][:7] for c in conditions if c.get("date")})
+        month_of = {m: k for k, m in enumerate(self.months)}
+        n_months = len(self.months)
+        n_bands = len(_BAND_EDGES) - 1
+
+        counts = np.zeros((n_months, n_bands), dtype=np.int64)
+        wins = np.zeros((n_months, n_bands), dtype=np.int64)
+        cost = np.zeros((n_months, n_bands))
+        pnl = np.zeros((n_months, n_bands))
+        settled = np.zeros(n_months, dtype=np.int64)
+        self._first_date: list[str | None] = [None] * n_months
+        self._last_date: list[str | None] = [None] * n_months
+        rows: list[int] = []
+        row_months: list[int] = []
+
+        for idx, c in enumerate(conditions):
+            d = c.get("date", "")
+            if not d or c.get("status") not in _SETTLED:
+                continue
+            m = month_of[d[:7]]
+            settled[m] += 1
+            rows.append(idx)
+            row_months.append(m)
+            if self._first_date[m] is None or d < self._first_date[m]:
+                self._first_date[m] = d
+            if self._last_date[m] is None or d > self._last_date[m]:
+                self._last_date[m] = d
+
+            b = bisect_right(_BAND_EDGES, c.get(price_key, 0)) - 1
+            if 0 <= b < n_bands:
+                counts[m, b] += 1
+                wins[m, b] += c["status"] == "WIN"
+                cost[m, b] += c.get("net_cost", 0)
+                pnl[m, b] += c.get("pnl", 0)
+
+        # 先頭に 0 行を足した累積和: 月 [i, j) の合計 = cum[j] - cum[i]
+        def _prefix(a: np.ndarray) -> np.ndarray:
+            return np.concatenate([np.zeros((1,) + a.shape[1:], dtype=a.dtype), a.cumsum(axis=0)])
+
+        self._counts = _prefix(counts)
+        self._wins = _prefix(wins)
+        self._cost = _prefix(cost)
+        self._pnl = _prefix(pnl)
+        self._settled = _prefix(settled)
+        # 決済済み condition を月順に (同月内は入力順)
+        self._rows = np.array(rows, dtype=np.int64)[
+            np.argsort(np.array(row_months, dtype=np.int64), kind="stable")
+        ]
+
+    def build(self, start: int, end: int) -> CalibrationBuildResult:
+        """Calibration table from the months ``self.months[start:end]``."""
+        n = self._counts[end] - self._counts[start]
+        wins = self._wins[end] - self._wins[start]
+        cost = self._cost[end] - self._cost[start]
+        pnl = self._pnl[end] - self._pnl[start]
+
+        bands: list[CalibrationBand] = []
+        for b in np.flatnonzero(n):
+            size = int(n[b])
+            roi = pnl[b] / cost[b] * 100 if cost[b] > 0 else 0.0
+            if size >= 100:
+                conf = "high"
+            elif size >= 40:
+                conf = "medium"
+            else:
+                conf = "low"
+            bands.append(CalibrationBand(
+                price_lo=_BAND_EDGES[b],
+                price_hi=_BAND_EDGES[b + 1],
+                expected_win_rate=round(int(wins[b]) / size, 3),
+                historical_roi_pct=round(float(roi), 1),
+                sample_size=size,
+                confidence=conf,
+            ))
+
+        firsts = [d for d in self._first_date[start:end] if d is not None]
+        lasts = [d for d in self._last_date[start:end] if d is not None]
+        return CalibrationBuildResult(
+            bands=bands,
+            train_start=firsts[0] if firsts else f"{self.months[start]}-01",
+            train_end=lasts[-1] if lasts else self._month_start(end),
+            total_conditions=int(self._settled[end] - self._settled[start]),
+        )
+
+    def settled_conditions(self, start: int, end: int) -> list[dict]:
+        """WIN / LOSS_OR_OPEN conditions of ``self.months[start:end]`` in input order."""
+        rows = np.sort(self._rows[self._settled[start]:self._settled[end]])
+        return [self.conditions[k] for k in rows]
+
+    def splits(
+        self,
+        train_months: int = 6,
+        test_months: int = 2,
+        step_months: int = 1,
+    ) -> list[tuple[CalibrationBuildResult, list[dict]]]:
+        """(train_table, test_conditions) pairs, as ``walk_forward_split``."""
+        n_months = len(self.months)
+        results: list[tuple[CalibrationBuildResult, list[dict]]] = []
+        for i in range(0, n_months - train_months - test_months + 1, step_months):
+            train_end = i + train_months
+            build_result = self.build(i, train_end)
+            if not build_result.bands:
+                continue
+            test_conds = self.settled_conditions(train_end, train_end + test_months)
+            if test_conds:
+                results.append((build_result, test_conds))
+        return results
+
+    def _month_start(self, k: int) -> str:
+        return f"{self.months[k]}-01" if k < len(self.months) else ""
+
+
 def walk_forward_split(
     conditions: list[dict],
     train_months: int = 6,
@@ -126,55 +266,7 @@ def walk_forward_split(
     Returns:
         List of (CalibrationBuildResult, test_conditions) tuples.
     """
-    dates = sorted({c["date"] for c in conditions if c.get("date")})
-    if not dates:
-        return []
-
-    # Get unique months
-    months = sorted({d[:7] for d in dates})
-    if len(months) < train_months + test_months:
-        return []
-
-    results: list[tuple[CalibrationBuildResult, list[dict]]] = []
-
-    for i in range(0, len(months) - train_months - test_months + 1, step_months):
-        train_start_month = months[i]
-        train_end_month = months[i + train_months]
-        test_end_idx = i + train_months + test_months
-        test_end_month = months[test_end_idx] if test_end_idx < len(months) else None
-
-        train_start = f"{train_start_month}-01"
-        train_end = f"{train_end_month}-01"
-        test_start = train_end
-        test_end = f"{test_end_month}-01" if test_end_month else None
-
-        # Build calibration table from training data
-        build_result = build_calibration_from_conditions(
-            conditions,
-            train_start=train_start,
-            train_end=train_end,
-        )
-
-        if not build_result.bands:
-            continue
-
-        # Filter test conditions
-        test_conds = []
-        for c in conditions:
-            d = c.get("date", "")
-            if not d:
-                continue
-            if d < test_start:
-                continue
-            if test_end and d >= test_end:
-                continue
-            if c.get("status") in ("WIN", "LOSS_OR_OPEN"):
-                test_conds.append(c)
-
-        if test_conds:
-            results.append((build_result, test_conds))
-
-    return results
+    return WalkForwardIndex(conditions).splits(train_months, test_months, step_months)
 
 
 def evaluate_split(
@@ -332,6 +424,96 @@ def evaluate_split_continuous(
     }
 
 
+# evaluate_split が読むキー (ワーカーへ送る condition はこれだけに絞る)
+_EVAL_KEYS = ("date", "status", "net_cost", "pnl")
+
+
+def _evaluate_window(
+    job: tuple[CalibrationBuildResult, list[dict], str, float, str],
+) -> dict:
+    train_result, test_conds, method, confidence_level, price_key = job
+    if method == "continuous":
+        return evaluate_split_continuous(
+            train_result, test_conds, confidence_level, price_key=price_key,
+        )
+    return evaluate_split(train_result, test_conds, price_key=price_key)
+
+
+def _map_windows(
+    splits: list[tuple[CalibrationBuildResult, list[dict]]],
+    method: str,
+    confidence_level: float,
+    price_key: str,
+    workers: int | None,
+) -> list[dict]:
+    if method not in ("discrete", "continuous"):
+        raise ValueError(f"Unknown method: {method}")
+    keys = _EVAL_KEYS + (price_key,)
+    jobs = [
+        (train, [{k: c[k] for k in keys if k in c} for c in test], method,
+         confidence_level, price_key)
+        for train, test in splits
+    ]
+    n_workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if n_workers <= 1:
+        return [_evaluate_window(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        chunk = max(1, len(jobs) // (n_workers * 4))
+        return list(pool.map(_evaluate_window, jobs, chunksize=chunk))
+
+
+def evaluate_walk_forward(
+    splits: list[tuple[CalibrationBuildResult, list[dict]]],
+    method: str = "discrete",
+    confidence_level: float = 0.90,
+    price_key: str = "avg_buy_price",
+    workers: int | None = None,
+) -> list[dict]:
+    """Evaluate every walk-forward split across a process pool.
+
+    ``method`` is "discrete" (evaluate_split) or "continuous"
+    (evaluate_split_continuous). Results keep the order of ``splits``.
+    ``workers`` defaults to the CPU count; 1 evaluates in-process.
+    """
+    return _map_windows(splits, method, confidence_level, price_key, workers)
+
+
+def walk_forward_sweep(
+    datasets: dict[str, list[dict]],
+    windows: list[tuple[int, int, int]],
+    method: str = "discrete",
+    confidence_level: float = 0.90,
+    price_key: str = "avg_buy_price",
+    workers: int | None = None,
+) -> dict[tuple[str, int, int, int], list[dict]]:
+    """Walk-forward evaluation for many datasets and window settings at once.
+
+    Args:
+        datasets: Condition lists keyed by name (e.g. one per trader).
+        windows: (train_months, test_months, step_months) settings.
+
+    Returns:
+        Evaluations keyed by (dataset, train_months, test_months, step_months),
+        in split order. Every dataset is indexed once and all windows share
+        one process pool.
+    """
+    keys: list[tuple[str, int, int, int]] = []
+    splits: list[tuple[CalibrationBuildResult, list[dict]]] = []
+    out: dict[tuple[str, int, int, int], list[dict]] = {}
+    for name, conditions in datasets.items():
+        index = WalkForwardIndex(conditions, price_key=price_key)
+        for train_months, test_months, step_months in windows:
+            key = (name, train_months, test_months, step_months)
+            out[key] = []
+            for split in index.splits(train_months, test_months, step_months):
+                keys.append(key)
+                splits.append(split)
+
+    for key, ev in zip(keys, _map_windows(splits, method, confidence_level, price_key, workers)):
+        out[key].append(ev)
+    return out
+
+
 def _add_months(date_str: str, months: int) -> str:
     """Add months to a YYYY-MM-DD date string."""
     dt = datetime.strptime(date_str, "%Y-%m-%d")
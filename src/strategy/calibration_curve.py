@@ -6,18 +6,34 @@ price→win_rate function.  Uses:
   - PCHIP interpolation for monotone smoothness between knots
   - Beta posterior (Jeffreys prior) for credible-interval lower bounds
 
-Dependencies: scipy >= 1.12  (isotonic_regression, PchipInterpolator, beta)
+``compile()`` optionally tabulates the three interpolators on a fine price
+grid (default: the 0.001 CLOB tick), turning ``estimate`` into array
+indexing plus a linear blend of two grid nodes; ``estimate_many`` evaluates
+a whole price array at once in either mode.
+
+A compiled curve can be saved as a versioned JSON artifact (knots + grid,
+``save_artifact`` / ``scripts/build_calibration_artifact.py``) and loaded
+with NumPy only (``load_artifact``). ``get_default_curve`` prefers the
+artifact at ``calibration_artifact_path`` and refits when it is missing,
+corrupt (content hash) or built from a different band table (source hash).
+
+Dependencies: scipy >= 1.12  (isotonic_regression, PchipInterpolator, beta),
+imported lazily — only fitting and uncompiled evaluation need it.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import math
+import os
+import tempfile
+from bisect import bisect_left
 from dataclasses import dataclass
+from pathlib import Path
 
 import numpy as np
-from scipy.interpolate import PchipInterpolator
-from scipy.optimize import isotonic_regression
-from scipy.stats import beta as beta_dist
 
 from src.strategy.calibration import NBA_ML_CALIBRATION, CalibrationBand
 
@@ -35,6 +51,25 @@ class WinRateEstimate:
     effective_sample_size: float  # nearest knot sample size (diagnostic)
 
 
+@dataclass(frozen=True)
+class WinRateEstimates:
+    """Vectorized WinRateEstimate: one array entry per input price.
+
+    Prices outside the curve's range get NaN in every estimate array.
+    """
+
+    prices: np.ndarray
+    point_estimate: np.ndarray
+    lower_bound: np.ndarray
+    upper_bound: np.ndarray
+    effective_sample_size: np.ndarray
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Boolean mask of prices inside the curve's range."""
+        return ~np.isnan(self.point_estimate)
+
+
 class ContinuousCalibration:
     """Continuous monotonic price->win_rate function with uncertainty."""
 
@@ -64,10 +99,8 @@ class ContinuousCalibration:
         self.train_end = train_end
         self.n_observations = n_observations
 
-        # PCHIP 補間器 (単調性保持)
-        self._point_interp = PchipInterpolator(knot_prices, knot_point_estimates)
-        self._lower_interp = PchipInterpolator(knot_prices, knot_lower_bounds)
-        self._upper_interp = PchipInterpolator(knot_prices, knot_upper_bounds)
+        # PCHIP 補間器 (単調性保持)。SciPy を避けるため初回評価時に生成
+        self._interp_cache: tuple | None = None
 
         # 有効価格範囲 (バンド端を含む — ミッドポイントより広い)
         if price_range is not None:
@@ -76,6 +109,59 @@ class ContinuousCalibration:
             self._price_lo = knot_prices[0]
             self._price_hi = knot_prices[-1]
 
+        # 最近傍 knot の境界 (隣接 knot の中点)。等距離なら低い側の knot
+        self._knot_edges = [
+            (a + b) / 2 for a, b in zip(self.knot_prices, self.knot_prices[1:])
+        ]
+        self._knot_ess = np.asarray(self.knot_sample_sizes, dtype=float)
+
+        # compile() 後の価格グリッド: (先頭価格, 刻み, [point, lower, upper] x グリッド)
+        self._grid: tuple[float, float, np.ndarray] | None = None
+        # estimate() 用の同じ表の list 版 (numpy スカラー生成を避ける)
+        self._grid_rows: list[list[float]] = []
+
+    @property
+    def compiled(self) -> bool:
+        return self._grid is not None
+
+    def _interpolators(self) -> tuple:
+        """(point, lower, upper) PCHIP interpolators, built on first use."""
+        if self._interp_cache is None:
+            from scipy.interpolate import PchipInterpolator
+
+            self._interp_cache = tuple(
+                PchipInterpolator(self.knot_prices, values)
+                for values in (
+                    self.knot_point_estimates,
+                    self.knot_lower_bounds,
+                    self.knot_upper_bounds,
+                )
+            )
+        return self._interp_cache
+
+    def _set_grid(self, lo: float, step: float, table: np.ndarray) -> None:
+        self._grid = (lo, step, table)
+        self._grid_rows = table.tolist()
+
+    def compile(self, step: float = 0.001) -> ContinuousCalibration:
+        """Tabulate point / lower / upper on a ``step`` price grid; returns self.
+
+        Afterwards ``estimate``/``estimate_many`` linearly blend the two
+        surrounding grid nodes instead of evaluating the PCHIP interpolators
+        (|error| is O(step^2), ~1e-5 at the 0.001 tick).
+        """
+        if step <= 0:
+            raise ValueError("step must be positive")
+        lo, hi = self._price_lo, self._price_hi
+        n = max(int(math.ceil((hi - lo) / step - 1e-9)) + 1, 2)
+        grid = lo + step * np.arange(n)
+        table = np.clip(np.vstack([f(grid) for f in self._interpolators()]), 0.0, 1.0)
+        self._set_grid(lo, step, table)
+        return self
+
+    def _nearest_ess(self, price: float) -> float:
+        return self.knot_sample_sizes[bisect_left(self._knot_edges, price)]
+
     def estimate(self, price: float) -> WinRateEstimate | None:
         """Return continuous win rate estimate for a price.
 
@@ -84,20 +170,51 @@ class ContinuousCalibration:
         if price < self._price_lo or price > self._price_hi:
             return None
 
-        point = float(np.clip(self._point_interp(price), 0.0, 1.0))
-        lower = float(np.clip(self._lower_interp(price), 0.0, 1.0))
-        upper = float(np.clip(self._upper_interp(price), 0.0, 1.0))
-
-        # 最近傍の knot からサンプルサイズ取得
-        idx = int(np.argmin([abs(p - price) for p in self.knot_prices]))
-        ess = self.knot_sample_sizes[idx]
+        if self._grid is not None:
+            lo, step, _ = self._grid
+            x = (price - lo) / step
+            pts, lows, ups = self._grid_rows
+            i = min(int(x), len(pts) - 2)
+            frac = x - i
+            point = pts[i] + frac * (pts[i + 1] - pts[i])
+            lower = lows[i] + frac * (lows[i + 1] - lows[i])
+            upper = ups[i] + frac * (ups[i + 1] - ups[i])
+        else:
+            point, lower, upper = (
+                float(np.clip(f(price), 0.0, 1.0)) for f in self._interpolators()
+            )
 
         return WinRateEstimate(
             price=price,
             point_estimate=point,
             lower_bound=lower,
             upper_bound=upper,
-            effective_sample_size=ess,
+            effective_sample_size=self._nearest_ess(price),
+        )
+
+    def estimate_many(self, prices: np.ndarray) -> WinRateEstimates:
+        """Vectorized ``estimate`` over an array of prices (NaN outside range)."""
+        prices = np.asarray(prices, dtype=float)
+        inside = (prices >= self._price_lo) & (prices <= self._price_hi)
+        p = np.where(inside, prices, self._price_lo)
+
+        if self._grid is not None:
+            lo, step, table = self._grid
+            x = (p - lo) / step
+            i = np.minimum(x.astype(np.int64), table.shape[1] - 2)
+            frac = x - i
+            values = table[:, i] + frac * (table[:, i + 1] - table[:, i])
+        else:
+            values = np.clip(np.stack([f(p) for f in self._interpolators()]), 0.0, 1.0)
+        ess = self._knot_ess[np.searchsorted(self._knot_edges, p, side="left")]
+
+        values = np.where(inside, values, np.nan)
+        return WinRateEstimates(
+            prices=prices,
+            point_estimate=values[0],
+            lower_bound=values[1],
+            upper_bound=values[2],
+            effective_sample_size=np.where(inside, ess, np.nan),
         )
 
     @classmethod
@@ -250,6 +367,9 @@ def _fit_isotonic_beta(
 
     Returns (point_estimates, lower_bounds, upper_bounds) as lists.
     """
+    from scipy.optimize import isotonic_regression
+    from scipy.stats import beta as beta_dist
+
     weights = np.array(sample_sizes, dtype=float)
     wr_arr = np.array(win_rates, dtype=float)
 
@@ -286,15 +406,113 @@ def _fit_isotonic_beta(
     return monotone_wr, lower_bounds, upper_bounds
 
 
+# band_confidence の閾値 (有効サンプルサイズ)
+HIGH_CONFIDENCE_ESS = 100
+MEDIUM_CONFIDENCE_ESS = 40
+
+
 def _confidence_from_sample_size(ess: float) -> str:
     """Derive confidence label from effective sample size."""
-    if ess >= 100:
+    if ess >= HIGH_CONFIDENCE_ESS:
         return "high"
-    elif ess >= 40:
+    elif ess >= MEDIUM_CONFIDENCE_ESS:
         return "medium"
     return "low"
 
 
+def _confidence_from_sample_size_many(ess: np.ndarray) -> np.ndarray:
+    """Vectorized _confidence_from_sample_size (object array of labels)."""
+    ess = np.asarray(ess, dtype=float)
+    return np.select(
+        [ess >= HIGH_CONFIDENCE_ESS, ess >= MEDIUM_CONFIDENCE_ESS], ["high", "medium"], "low",
+    ).astype(object)
+
+
+# --- 事前計算アーティファクト ---
+
+# フォーマットを変えたらインクリメント (古いアーティファクトは再フィットにフォールバック)
+ARTIFACT_VERSION = 1
+
+
+def _digest(obj) -> str:
+    raw = json.dumps(obj, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def source_hash(bands: list[CalibrationBand], confidence_level: float, step: float) -> str:
+    """Hash of everything an artifact is built from (band table + fit parameters)."""
+    return _digest({
+        "version": ARTIFACT_VERSION,
+        "bands": [[b.price_lo, b.price_hi, b.expected_win_rate, b.sample_size] for b in bands],
+        "confidence_level": confidence_level,
+        "step": step,
+    })
+
+
+def save_artifact(curve: ContinuousCalibration, path: str | Path, source: str) -> Path:
+    """Write a compiled curve (knots + dense grid) as a hashed JSON artifact."""
+    if curve._grid is None:
+        raise ValueError("curve must be compiled before saving an artifact")
+    lo, step, table = curve._grid
+    payload = {
+        "version": ARTIFACT_VERSION,
+        "source_hash": source,
+        "curve": curve.to_dict(),
+        "grid": {
+            "lo": lo,
+            "step": step,
+            "point": table[0].tolist(),
+            "lower": table[1].tolist(),
+            "upper": table[2].tolist(),
+        },
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".calibration_curve_")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"content_hash": _digest(payload), **payload}, f)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return path
+
+
+def load_artifact(path: str | Path, source: str | None = None) -> ContinuousCalibration | None:
+    """Load a compiled curve without SciPy; None if missing, corrupt or stale.
+
+    ``source`` (a ``source_hash``) rejects artifacts built from other inputs.
+    """
+    path = Path(path)
+    try:
+        data = json.loads(path.read_text())
+        content_hash = data.pop("content_hash")
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, AttributeError):
+        logger.warning("Unreadable calibration artifact %s, ignoring", path)
+        return None
+    if data.get("version") != ARTIFACT_VERSION:
+        logger.info("Calibration artifact %s has version %s, ignoring", path, data.get("version"))
+        return None
+    if _digest(data) != content_hash:
+        logger.warning("Calibration artifact %s failed its content hash, ignoring", path)
+        return None
+    if source is not None and data.get("source_hash") != source:
+        logger.info("Calibration artifact %s is stale (inputs changed), ignoring", path)
+        return None
+    try:
+        curve = ContinuousCalibration.from_dict(data["curve"])
+        grid = data["grid"]
+        table = np.array([grid["point"], grid["lower"], grid["upper"]], dtype=float)
+        curve._set_grid(float(grid["lo"]), float(grid["step"]), table)
+    except (KeyError, TypeError, ValueError):
+        logger.warning("Malformed calibration artifact %s, ignoring", path)
+        return None
+    return curve
+
+
 # --- デフォルトカーブ (遅延初期化 + キャッシュ) ---
 
 _default_curve_cache: dict[float, ContinuousCalibration] = {}
@@ -307,7 +525,21 @@ def get_default_curve(confidence_level: float | None = None) -> ContinuousCalibr
     cl = confidence_level if confidence_level is not None else settings.calibration_confidence_level
 
     if cl not in _default_curve_cache:
-        _default_curve_cache[cl] = ContinuousCalibration.from_bands(
-            NBA_ML_CALIBRATION, confidence_level=cl
-        )
+        step = settings.calibration_lookup_step
+        curve = None
+        if step > 0 and settings.calibration_artifact_path:
+            curve = load_artifact(
+                settings.calibration_artifact_path,
+                source=source_hash(NBA_ML_CALIBRATION, cl, step),
+            )
+            if curve is None:
+                logger.info(
+                    "No valid calibration artifact at %s, fitting the default curve",
+                    settings.calibration_artifact_path,
+                )
+        if curve is None:
+            curve = ContinuousCalibration.from_bands(NBA_ML_CALIBRATION, confidence_level=cl)
+            if step > 0:
+                curve.compile(step)
+        _default_curve_cache[cl] = curve
     return _default_curve_cache[cl]
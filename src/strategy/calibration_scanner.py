@@ -14,11 +14,24 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 
+import numpy as np
+
 from src.config import settings
 from src.connectors.polymarket import MoneylineMarket
 from src.sizing.liquidity import LiquiditySnapshot
 from src.sizing.position_sizer import calculate_position_size
 from src.strategy.calibration import is_in_sweet_spot, lookup_band
+from src.strategy.calibration_batch import (
+    CONFIDENCE_MULT_MAX,
+    CONFIDENCE_MULT_MIN,
+    KELLY_USD_SCALE,
+    CalibrationColumns,
+    SlateArrays,
+    evaluate_outcomes,
+    rank_within_games,
+    select_sides,
+    slate_arrays,
+)
 from src.strategy.calibration_curve import (
     WinRateEstimate,
     _confidence_from_sample_size,
@@ -84,10 +97,10 @@ def _confidence_multiplier(est: WinRateEstimate) -> float:
     Uses lower_bound / point_estimate ratio: tighter CI → higher multiplier.
     """
     if est.point_estimate <= 0:
-        return 0.5
+        return CONFIDENCE_MULT_MIN
     ratio = est.lower_bound / est.point_estimate
     # Clip to [0.5, 1.0] — 0.5 matches old minimum
-    return max(0.5, min(1.0, ratio))
+    return max(CONFIDENCE_MULT_MIN, min(CONFIDENCE_MULT_MAX, ratio))
 
 
 def _hedge_margin_multiplier(merge_margin: float) -> float:
@@ -107,6 +120,93 @@ def _ev_per_dollar(expected_win_rate: float, price: float) -> float:
     return expected_win_rate / price - 1
 
 
+def _log_skips(
+    moneylines: list[MoneylineMarket], slate: SlateArrays, cols: CalibrationColumns,
+) -> None:
+    """Log why each rejected outcome was dropped, in slate order."""
+    valid_price = (cols.price > 0) & (cols.price < 1)
+    no_band = valid_price & np.isnan(cols.expected_win_rate)
+    in_curve = valid_price & ~no_band
+    positive = in_curve & (cols.ev_per_dollar > 0)
+    skipped = positive & (cols.recommended_execution == "skip")
+    logged = skipped
+    if logger.isEnabledFor(logging.DEBUG):
+        logged = logged | ~valid_price | no_band | (in_curve & ~positive)
+
+    for row in np.flatnonzero(logged):
+        name = moneylines[slate.game[row]].outcomes[slate.outcome[row]]
+        price = cols.price[row]
+        if not valid_price[row]:
+            logger.debug("Skipping %s: invalid price %.3f", name, price)
+        elif no_band[row]:
+            logger.debug("No calibration band for %s @ %.3f", name, price)
+        elif not positive[row]:
+            logger.debug(
+                "Non-positive EV for %s: %.3f (wr=%.3f, price=%.3f)",
+                name,
+                cols.ev_per_dollar[row],
+                cols.expected_win_rate[row],
+                price,
+            )
+        else:
+            spread = slate.spread_pct[row]
+            logger.info(
+                "Skipping %s: %s (spread=%.1f%%)",
+                name,
+                cols.liquidity_score[row],
+                0 if np.isnan(spread) else spread,
+            )
+
+
+def _evaluate_slate(
+    moneylines: list[MoneylineMarket],
+    balance_usd: float | None,
+    liquidity_map: dict[str, LiquiditySnapshot] | None,
+    log_skips: bool = False,
+) -> tuple[SlateArrays, CalibrationColumns]:
+    """Evaluate every outcome of the slate at once (src/strategy/calibration_batch.py)."""
+    slate = slate_arrays(moneylines, liquidity_map)
+    cols = evaluate_outcomes(
+        slate.price,
+        balance_usd=balance_usd,
+        ask_depth_5c=slate.ask_depth_5c,
+        spread_pct=slate.spread_pct,
+        curve=get_default_curve(),
+    )
+    # スキップ理由のログは scan_calibration のみ (bothside は従来通り出さない)
+    if log_skips:
+        _log_skips(moneylines, slate, cols)
+    return slate, cols
+
+
+def _opportunity(
+    ml: MoneylineMarket, i: int, cols: CalibrationColumns, row: int,
+) -> CalibrationOpportunity:
+    """CalibrationOpportunity for outcome ``i`` of ``ml`` from its batch row."""
+    position = float(cols.position_raw[row])
+    if cols.sized[row]:
+        position = round(position, 2)
+    return CalibrationOpportunity(
+        event_slug=ml.event_slug,
+        event_title=ml.event_title,
+        market_type="moneyline",
+        outcome_name=ml.outcomes[i],
+        token_id=ml.token_ids[i],
+        poly_price=ml.prices[i],
+        calibration_edge_pct=float(cols.calibration_edge_pct[row]),
+        expected_win_rate=float(cols.expected_win_rate[row]),
+        ev_per_dollar=float(cols.ev_per_dollar[row]),
+        price_band=cols.price_band[row],
+        in_sweet_spot=bool(cols.in_sweet_spot[row]),
+        band_confidence=cols.band_confidence[row],
+        position_usd=position,
+        point_estimate_wr=float(cols.point_estimate[row]),
+        liquidity_score=cols.liquidity_score[row],
+        constraint_binding=cols.constraint_binding[row],
+        recommended_execution=cols.recommended_execution[row],
+    )
+
+
 def scan_calibration(
     moneylines: list[MoneylineMarket],
     balance_usd: float | None = None,
@@ -122,127 +222,12 @@ def scan_calibration(
       5. Kelly sizing with continuous confidence multiplier (CI-based)
       6. Apply 3-layer constraints (kelly, capital, liquidity) if provided
     """
-    _curve = get_default_curve()
-    opportunities: list[CalibrationOpportunity] = []
-
-    for ml in moneylines:
-        if not ml.active:
-            continue
-
-        # 各アウトカムの候補を評価
-        best: CalibrationOpportunity | None = None
-        best_ev: float = -999.0
-
-        for i, outcome_name in enumerate(ml.outcomes):
-            if i >= len(ml.prices) or i >= len(ml.token_ids):
-                continue
-
-            price = ml.prices[i]
-
-            if price <= 0 or price >= 1:
-                logger.debug("Skipping %s: invalid price %.3f", outcome_name, price)
-                continue
-
-            est = _curve.estimate(price)
-            if est is None:
-                logger.debug("No calibration band for %s @ %.3f", outcome_name, price)
-                continue
-
-            # 保守的推定 (Beta 下限) を使用
-            expected_wr = est.lower_bound
-            point_wr = est.point_estimate
-            edge = expected_wr - price  # raw edge (0-1 scale)
-            edge_pct = edge * 100
-
-            ev = _ev_per_dollar(expected_wr, price)
-
-            # 正の EV のみ
-            if ev <= 0:
-                logger.debug(
-                    "Non-positive EV for %s: %.3f (wr=%.3f, price=%.3f)",
-                    outcome_name,
-                    ev,
-                    expected_wr,
-                    price,
-                )
-                continue
-
-            # Kelly sizing with continuous confidence scaling
-            kelly = _calibration_kelly(expected_wr, price)
-            confidence_mult = _confidence_multiplier(est)
-            kelly *= confidence_mult
-
-            # メタデータ用 (DB 互換 — Kelly サイジングからは分離)
-            sweet = is_in_sweet_spot(price, settings.sweet_spot_lo, settings.sweet_spot_hi)
-
-            kelly_usd = min(kelly * settings.max_position_usd * 10, settings.max_position_usd)
-
-            # メタデータは既存バンドから (DB 互換)
-            band = lookup_band(price)
-            band_label = f"{band.price_lo:.2f}-{band.price_hi:.2f}" if band else f"{price:.2f}"
-            band_confidence = _confidence_from_sample_size(est.effective_sample_size)
-
-            # 3層制約の適用
-            liq_score = "unknown"
-            binding = "kelly"
-            rec_exec = "immediate"
-            position_usd = kelly_usd
-
-            token_id = ml.token_ids[i]
-            liq = liquidity_map.get(token_id) if liquidity_map else None
-
-            if balance_usd is not None or liq is not None:
-                sizing = calculate_position_size(
-                    kelly_usd=kelly_usd,
-                    balance_usd=balance_usd,
-                    liquidity=liq,
-                    max_position_usd=settings.max_position_usd,
-                    capital_risk_pct=settings.capital_risk_pct,
-                    liquidity_fill_pct=settings.liquidity_fill_pct,
-                    max_spread_pct=settings.max_spread_pct,
-                )
-                position_usd = sizing.final_size_usd
-                liq_score = sizing.liquidity_score
-                binding = sizing.constraint_binding
-                rec_exec = sizing.recommended_execution
-
-                if rec_exec == "skip":
-                    logger.info(
-                        "Skipping %s: %s (spread=%.1f%%)",
-                        outcome_name,
-                        liq_score,
-                        liq.spread_pct if liq else 0,
-                    )
-                    continue
-
-            candidate = CalibrationOpportunity(
-                event_slug=ml.event_slug,
-                event_title=ml.event_title,
-                market_type="moneyline",
-                outcome_name=outcome_name,
-                token_id=token_id,
-                poly_price=price,
-                calibration_edge_pct=edge_pct,
-                expected_win_rate=expected_wr,
-                ev_per_dollar=ev,
-                price_band=band_label,
-                in_sweet_spot=sweet,
-                band_confidence=band_confidence,
-                position_usd=position_usd,
-                point_estimate_wr=point_wr,
-                liquidity_score=liq_score,
-                constraint_binding=binding,
-                recommended_execution=rec_exec,
-            )
-
-            # 1 試合 1 シグナル: EV が最も高いアウトカムを選択
-            if ev > best_ev:
-                best_ev = ev
-                best = candidate
-
-        if best is not None:
-            opportunities.append(best)
-
+    slate, cols = _evaluate_slate(moneylines, balance_usd, liquidity_map, log_skips=True)
+    # 1 試合 1 シグナル: EV が最も高いアウトカムを選択
+    opportunities = [
+        _opportunity(moneylines[slate.game[row]], int(slate.outcome[row]), cols, row)
+        for row in select_sides(slate.game, cols)
+    ]
     opportunities.sort(key=lambda o: o.ev_per_dollar, reverse=True)
     return opportunities
 
@@ -288,7 +273,7 @@ def evaluate_single_outcome(
 
     sweet = is_in_sweet_spot(price, settings.sweet_spot_lo, settings.sweet_spot_hi)
 
-    kelly_usd = min(kelly * settings.max_position_usd * 10, settings.max_position_usd)
+    kelly_usd = min(kelly * settings.max_position_usd * KELLY_USD_SCALE, settings.max_position_usd)
     edge_pct = (expected_wr - price) * 100
 
     band = lookup_band(price)
@@ -371,98 +356,17 @@ def scan_calibration_bothside(
       4. Hedge guard: combined < max_combined_vwap only (MERGE-first)
       5. Dynamic sizing based on MERGE margin
     """
-    _curve = get_default_curve()
-    results: list[BothsideOpportunity] = []
-
-    for ml in moneylines:
-        if not ml.active:
-            continue
-
-        candidates: list[CalibrationOpportunity] = []
-
-        for i, outcome_name in enumerate(ml.outcomes):
-            if i >= len(ml.prices) or i >= len(ml.token_ids):
-                continue
-
-            price = ml.prices[i]
-            if price <= 0 or price >= 1:
-                continue
-
-            est = _curve.estimate(price)
-            if est is None:
-                continue
-
-            expected_wr = est.lower_bound
-            point_wr = est.point_estimate
-            ev = _ev_per_dollar(expected_wr, price)
-            if ev <= 0:
-                continue
-
-            kelly = _calibration_kelly(expected_wr, price)
-            confidence_mult = _confidence_multiplier(est)
-            kelly *= confidence_mult
-
-            sweet = is_in_sweet_spot(price, settings.sweet_spot_lo, settings.sweet_spot_hi)
-
-            kelly_usd = min(kelly * settings.max_position_usd * 10, settings.max_position_usd)
-            edge_pct = (expected_wr - price) * 100
-
-            band = lookup_band(price)
-            band_label = f"{band.price_lo:.2f}-{band.price_hi:.2f}" if band else f"{price:.2f}"
-            band_confidence = _confidence_from_sample_size(est.effective_sample_size)
-
-            # 3層制約
-            liq_score = "unknown"
-            binding = "kelly"
-            rec_exec = "immediate"
-            position_usd = kelly_usd
-            token_id = ml.token_ids[i]
-            liq = liquidity_map.get(token_id) if liquidity_map else None
-
-            if balance_usd is not None or liq is not None:
-                sizing = calculate_position_size(
-                    kelly_usd=kelly_usd,
-                    balance_usd=balance_usd,
-                    liquidity=liq,
-                    max_position_usd=settings.max_position_usd,
-                    capital_risk_pct=settings.capital_risk_pct,
-                    liquidity_fill_pct=settings.liquidity_fill_pct,
-                    max_spread_pct=settings.max_spread_pct,
-                )
-                position_usd = sizing.final_size_usd
-                liq_score = sizing.liquidity_score
-                binding = sizing.constraint_binding
-                rec_exec = sizing.recommended_execution
-                if rec_exec == "skip":
-                    continue
-
-            candidates.append(
-                CalibrationOpportunity(
-                    event_slug=ml.event_slug,
-                    event_title=ml.event_title,
-                    market_type="moneyline",
-                    outcome_name=outcome_name,
-                    token_id=token_id,
-                    poly_price=price,
-                    calibration_edge_pct=edge_pct,
-                    expected_win_rate=expected_wr,
-                    ev_per_dollar=ev,
-                    price_band=band_label,
-                    in_sweet_spot=sweet,
-                    band_confidence=band_confidence,
-                    position_usd=position_usd,
-                    point_estimate_wr=point_wr,
-                    liquidity_score=liq_score,
-                    constraint_binding=binding,
-                    recommended_execution=rec_exec,
-                )
-            )
-
-        if not candidates:
-            continue
+    slate, cols = _evaluate_slate(moneylines, balance_usd, liquidity_map)
+    # 正の EV の候補を試合ごとに EV 降順で
+    by_game: dict[int, list[CalibrationOpportunity]] = {}
+    for row in rank_within_games(slate.game, cols):
+        g = int(slate.game[row])
+        candidates = by_game.setdefault(g, [])
+        if len(candidates) < 2:
+            candidates.append(_opportunity(moneylines[g], int(slate.outcome[row]), cols, row))
 
-        # EV でソート (高い方 = directional)
-        candidates.sort(key=lambda c: c.ev_per_dollar, reverse=True)
+    results: list[BothsideOpportunity] = []
+    for candidates in by_game.values():
         directional = candidates[0]
 
         hedge: CalibrationOpportunity | None = None
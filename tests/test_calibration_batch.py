@@ -0,0 +1,162 @@
+"""Tests for the vectorized calibration scan (src/strategy/calibration_batch.py)."""
+
+from __future__ import annotations
+
+import dataclasses
+import random
+
+import numpy as np
+import pytest
+
+from src.connectors.polymarket import MoneylineMarket
+from src.sizing.liquidity import LiquiditySnapshot
+from src.strategy.calibration_batch import evaluate_outcomes, select_sides, slate_arrays
+from src.strategy.calibration_scanner import (
+    evaluate_single_outcome,
+    scan_calibration,
+    scan_calibration_bothside,
+)
+
+
+def _slate(rng: random.Random, n_games: int) -> list[MoneylineMarket]:
+    slate = []
+    for g in range(n_games):
+        p = round(rng.uniform(0.05, 0.95), 3)
+        # 合計が 1 前後に散らばるよう独立にずらす
+        q = round(min(max(1 - p + rng.uniform(-0.04, 0.02), 0.001), 0.999), 3)
+        if rng.random() < 0.05:
+            q = p  # 同 EV のタイ
+        slate.append(MoneylineMarket(
+            condition_id=f"cond{g}",
+            event_slug=f"nba-g{g}",
+            event_title=f"Game {g}",
+            home_team="Home",
+            away_team="Away",
+            outcomes=[f"Away{g}", f"Home{g}"],
+            prices=[p, q],
+            token_ids=[f"tok{g}a", f"tok{g}b"],
+            sports_market_type="moneyline",
+            active=rng.random() > 0.1,
+        ))
+    return slate
+
+
+def _liquidity(rng: random.Random, slate: list[MoneylineMarket]) -> dict:
+    liq = {}
+    for ml in slate:
+        for token in ml.token_ids:
+            if rng.random() < 0.3:
+                continue
+            liq[token] = LiquiditySnapshot(
+                token_id=token,
+                timestamp="2026-02-08T00:00:00+00:00",
+                best_ask=0.42,
+                best_bid=0.40,
+                ask_depth_5c=rng.choice([0.0, 20.0, 100.0, 400.0, 5000.0]),
+                ask_depth_10c=5000.0,
+                bid_depth_5c=500.0,
+                spread=0.02,
+                spread_pct=rng.choice([0.5, 2.0, 5.0, 7.0, 9.0, 12.0, 20.0]),
+                midpoint=0.41,
+                impact_estimate=0.0,
+                ask_levels=5,
+                bid_levels=5,
+            )
+    return liq
+
+
+def _reference_candidates(slate, balance, liq) -> list[list]:
+    """Old per-outcome loop: positive-EV, non-skipped candidates per game."""
+    games = []
+    for ml in slate:
+        if not ml.active:
+            continue
+        cands = []
+        for i, name in enumerate(ml.outcomes):
+            opp = evaluate_single_outcome(
+                ml.prices[i], name, ml.token_ids[i], ml.event_slug, ml.event_title,
+                balance_usd=balance,
+                liquidity=liq.get(ml.token_ids[i]) if liq else None,
+            )
+            if opp is not None:
+                cands.append(opp)
+        games.append(cands)
+    return games
+
+
+CASES = [(seed, balance, with_liq)
+         for seed in range(4)
+         for balance in (None, 0.0, 80.0, 5000.0)
+         for with_liq in (False, True)]
+
+
+@pytest.mark.parametrize("seed,balance,with_liq", CASES)
+def test_scan_matches_scalar_path(seed, balance, with_liq):
+    rng = random.Random(seed)
+    slate = _slate(rng, 40)
+    liq = _liquidity(rng, slate) if with_liq else None
+
+    expected = []
+    for cands in _reference_candidates(slate, balance, liq):
+        best = None
+        for c in cands:
+            if best is None or c.ev_per_dollar > best.ev_per_dollar:
+                best = c
+        if best is not None:
+            expected.append(best)
+    expected.sort(key=lambda o: o.ev_per_dollar, reverse=True)
+
+    got = scan_calibration(slate, balance_usd=balance, liquidity_map=liq)
+    assert [dataclasses.asdict(o) for o in got] == [dataclasses.asdict(o) for o in expected]
+
+
+@pytest.mark.parametrize("seed,balance,with_liq", CASES)
+def test_bothside_matches_scalar_path(seed, balance, with_liq):
+    rng = random.Random(seed)
+    slate = _slate(rng, 40)
+    liq = _liquidity(rng, slate) if with_liq else None
+
+    got = scan_calibration_bothside(slate, balance_usd=balance, liquidity_map=liq)
+    expected = [
+        sorted(cands, key=lambda c: c.ev_per_dollar, reverse=True)
+        for cands in _reference_candidates(slate, balance, liq) if cands
+    ]
+    expected.sort(key=lambda c: c[0].ev_per_dollar, reverse=True)
+    assert len(got) == len(expected)
+    for opp, cands in zip(got, expected):
+        assert opp.directional == cands[0]
+        if opp.hedge is not None:
+            assert opp.hedge == cands[1]
+        else:
+            assert len(cands) < 2 or opp.combined_price >= 0.995
+
+
+def test_columns_match_single_outcome():
+    prices = np.round(np.linspace(0.01, 0.99, 197), 3)
+    cols = evaluate_outcomes(prices, balance_usd=1000.0)
+    assert len(cols) == len(prices)
+    for row, price in enumerate(prices):
+        opp = evaluate_single_outcome(float(price), "x", "t", "s", "e", balance_usd=1000.0)
+        assert bool(cols.eligible[row]) == (opp is not None)
+        if opp is None:
+            continue
+        assert cols.ev_per_dollar[row] == opp.ev_per_dollar
+        assert cols.expected_win_rate[row] == opp.expected_win_rate
+        assert cols.position_usd[row] == pytest.approx(opp.position_usd, abs=0.01)
+        assert cols.constraint_binding[row] == opp.constraint_binding
+        assert cols.price_band[row] == opp.price_band
+        assert cols.band_confidence[row] == opp.band_confidence
+
+
+def test_per_row_balance_and_empty_slate():
+    prices = np.array([0.35, 0.35, 0.35])
+    cols = evaluate_outcomes(prices, balance_usd=np.array([np.nan, 100.0, 0.0]))
+    assert list(cols.sized) == [False, True, True]
+    assert cols.constraint_binding[1] == "capital"
+    assert cols.position_usd[1] <= 100.0 * 0.5
+
+    empty = slate_arrays([])
+    cols = evaluate_outcomes(empty.price)
+    assert len(cols) == 0
+    assert len(select_sides(empty.game, cols)) == 0
+    assert scan_calibration([]) == []
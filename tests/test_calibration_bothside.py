@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import logging
+
 import pytest
 
 from src.connectors.polymarket import MoneylineMarket
@@ -83,6 +85,14 @@ class TestScanCalibrationBothside:
         results = scan_calibration_bothside([ml])
         assert results == []
 
+    def test_skips_not_logged(self, monkeypatch, caplog):
+        """Rejected outcomes are dropped silently (only scan_calibration logs them)."""
+        _patch_settings(monkeypatch)
+        ml = _make_ml(["Knicks", "Celtics"], [1.0, 0.03])
+        with caplog.at_level(logging.DEBUG, logger="src.strategy.calibration_scanner"):
+            assert scan_calibration_bothside([ml]) == []
+        assert caplog.records == []
+
     def test_combined_price_correct(self, monkeypatch):
         """combined_price = directional.price + hedge.price when both present."""
         _patch_settings(monkeypatch)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import random
 import sys
 from pathlib import Path
 
@@ -12,9 +13,12 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from src.strategy.calibration import load_calibration_table
 from src.strategy.calibration_builder import (
     CalibrationBuildResult,
+    WalkForwardIndex,
     build_calibration_from_conditions,
     evaluate_split,
+    evaluate_walk_forward,
     walk_forward_split,
+    walk_forward_sweep,
 )
 
 
@@ -143,6 +147,103 @@ class TestWalkForwardSplit:
                 assert c["date"] >= train_result.train_end
 
 
+def _random_conditions(seed: int, n: int = 1500) -> list[dict]:
+    """Unsorted conditions over ~14 months with a gap month and odd rows."""
+    rng = random.Random(seed)
+    months = [f"2025-{m:02d}" for m in range(1, 13) if m != 7] + ["2026-01", "2026-03"]
+    conds = []
+    for _ in range(n):
+        cond = {
+            "date": f"{rng.choice(months)}-{rng.randint(1, 28):02d}",
+            "avg_buy_price": rng.choice([rng.uniform(0.1, 0.99), 0.25, 0.95, 0.20]),
+            "status": rng.choice(["WIN", "WIN", "LOSS_OR_OPEN", "MERGED"]),
+            "net_cost": rng.uniform(-5, 50),
+            "pnl": rng.uniform(-50, 80),
+        }
+        if rng.random() < 0.02:
+            cond["date"] = ""
+        conds.append(cond)
+    return conds
+
+
+def _reference_walk_forward(conditions, train_months, test_months, step_months):
+    """Previous implementation: rebuild and rescan every window."""
+    months = sorted({c["date"][:7] for c in conditions if c.get("date")})
+    out = []
+    for i in range(0, len(months) - train_months - test_months + 1, step_months):
+        train_end = f"{months[i + train_months]}-01"
+        end_idx = i + train_months + test_months
+        test_end = f"{months[end_idx]}-01" if end_idx < len(months) else None
+        build = build_calibration_from_conditions(
+            conditions, train_start=f"{months[i]}-01", train_end=train_end,
+        )
+        if not build.bands:
+            continue
+        test = [
+            c for c in conditions
+            if c.get("date") and c["date"] >= train_end
+            and (test_end is None or c["date"] < test_end)
+            and c.get("status") in ("WIN", "LOSS_OR_OPEN")
+        ]
+        if test:
+            out.append((build, test))
+    return out
+
+
+class TestWalkForwardIndex:
+
+    @pytest.mark.parametrize("seed", range(3))
+    @pytest.mark.parametrize("window", [(6, 2, 1), (3, 1, 2), (1, 1, 1), (12, 2, 1)])
+    def test_matches_full_rebuild(self, seed, window):
+        conds = _random_conditions(seed)
+        got = walk_forward_split(conds, *window)
+        expected = _reference_walk_forward(conds, *window)
+        assert len(got) == len(expected)
+        for (g_train, g_test), (e_train, e_test) in zip(got, expected):
+            assert g_test == e_test
+            assert g_train.train_start == e_train.train_start
+            assert g_train.train_end == e_train.train_end
+            assert g_train.total_conditions == e_train.total_conditions
+            assert len(g_train.bands) == len(e_train.bands)
+            for gb, eb in zip(g_train.bands, e_train.bands):
+                assert (gb.price_lo, gb.price_hi) == (eb.price_lo, eb.price_hi)
+                assert gb.sample_size == eb.sample_size
+                assert gb.expected_win_rate == eb.expected_win_rate
+                assert gb.confidence == eb.confidence
+                assert gb.historical_roi_pct == pytest.approx(eb.historical_roi_pct, abs=0.1)
+
+    def test_build_full_range_matches_builder(self):
+        conds = _random_conditions(7)
+        index = WalkForwardIndex(conds)
+        got = index.build(0, len(index.months))
+        expected = build_calibration_from_conditions(conds)
+        assert got.total_conditions == expected.total_conditions
+        assert [b.sample_size for b in got.bands] == [b.sample_size for b in expected.bands]
+        assert (got.train_start, got.train_end) == (expected.train_start, expected.train_end)
+
+    def test_pool_matches_inline(self):
+        splits = walk_forward_split(_random_conditions(1), 3, 1, 1)
+        assert len(splits) > 2
+        inline = evaluate_walk_forward(splits, workers=1)
+        assert inline == [evaluate_split(train, test) for train, test in splits]
+        assert evaluate_walk_forward(splits, workers=2) == inline
+        continuous = evaluate_walk_forward(splits, method="continuous", workers=2)
+        assert len(continuous) == len(splits)
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            evaluate_walk_forward([], method="nope")
+
+    def test_sweep(self):
+        datasets = {"a": _random_conditions(1), "b": _make_conditions(30)}
+        windows = [(3, 1, 1), (6, 2, 1)]
+        out = walk_forward_sweep(datasets, windows, workers=2)
+        assert set(out) == {(name, *w) for name in datasets for w in windows}
+        assert out[("b", 3, 1, 1)] == []
+        splits = walk_forward_split(datasets["a"], 6, 2, 1)
+        assert out[("a", 6, 2, 1)] == evaluate_walk_forward(splits, workers=1)
+
+
 class TestEvaluateSplit:
 
     def test_evaluate_basic(self):
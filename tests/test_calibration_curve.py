@@ -6,6 +6,7 @@ import json
 import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -15,6 +16,9 @@ from src.strategy.calibration_curve import (
     ContinuousCalibration,
     _confidence_from_sample_size,
     get_default_curve,
+    load_artifact,
+    save_artifact,
+    source_hash,
 )
 
 # --- Helper fixtures ---
@@ -357,3 +361,129 @@ class TestConstructorValidation:
             ContinuousCalibration.from_bands(
                 [CalibrationBand(0.30, 0.35, 0.80, 10.0, 50, "medium")],
             )
+
+
+class TestCompiledLookup:
+
+    @pytest.mark.parametrize("bands", [NBA_ML_CALIBRATION, _make_nonmonotone_bands()])
+    def test_grid_within_tolerance_of_interpolators(self, bands):
+        exact = ContinuousCalibration.from_bands(bands)
+        compiled = ContinuousCalibration.from_bands(bands).compile(0.001)
+        assert compiled.compiled and not exact.compiled
+
+        lo, hi = bands[0].price_lo, bands[-1].price_hi
+        rng = np.random.default_rng(0)
+        prices = np.concatenate([
+            rng.uniform(lo, hi, 2000),
+            np.round(np.arange(lo, hi, 0.001), 3),  # CLOB tick 上の価格
+            [lo, hi],
+        ])
+        for price in prices:
+            a = exact.estimate(float(price))
+            b = compiled.estimate(float(price))
+            if a is None:
+                assert b is None
+                continue
+            assert b.point_estimate == pytest.approx(a.point_estimate, abs=1e-4)
+            assert b.lower_bound == pytest.approx(a.lower_bound, abs=1e-4)
+            assert b.upper_bound == pytest.approx(a.upper_bound, abs=1e-4)
+            assert b.effective_sample_size == a.effective_sample_size
+
+    def test_estimate_many_matches_estimate(self):
+        for curve in (
+            ContinuousCalibration.from_bands(_make_simple_bands()),
+            ContinuousCalibration.from_bands(_make_simple_bands()).compile(),
+        ):
+            prices = np.array([0.10, 0.20, 0.231, 0.3, 0.333, 0.449, 0.45, 0.46])
+            many = curve.estimate_many(prices)
+            assert list(many.valid) == [curve.estimate(p) is not None for p in prices]
+            for i, price in enumerate(prices):
+                est = curve.estimate(float(price))
+                if est is None:
+                    assert np.isnan(many.point_estimate[i])
+                    continue
+                assert many.point_estimate[i] == pytest.approx(est.point_estimate)
+                assert many.lower_bound[i] == pytest.approx(est.lower_bound)
+                assert many.upper_bound[i] == pytest.approx(est.upper_bound)
+                assert many.effective_sample_size[i] == est.effective_sample_size
+
+    def test_nearest_knot_sample_size(self):
+        curve = ContinuousCalibration.from_bands(_make_simple_bands())
+        # knots 0.225 (n=50) / 0.275 (n=60): 0.249 は前者、0.251 は後者
+        assert curve.estimate(0.249).effective_sample_size == 50
+        assert curve.estimate(0.251).effective_sample_size == 60
+
+    def test_default_curve_compiled_per_setting(self, monkeypatch):
+        from src.config import settings
+        from src.strategy import calibration_curve
+
+        monkeypatch.setattr(calibration_curve, "_default_curve_cache", {})
+        monkeypatch.setattr(settings, "calibration_lookup_step", 0.0)
+        assert not get_default_curve().compiled
+        monkeypatch.setattr(calibration_curve, "_default_curve_cache", {})
+        monkeypatch.setattr(settings, "calibration_lookup_step", 0.001)
+        assert get_default_curve().compiled
+
+    def test_invalid_step(self):
+        with pytest.raises(ValueError, match="step"):
+            ContinuousCalibration.from_bands(_make_simple_bands()).compile(0)
+
+
+class TestArtifact:
+
+    @pytest.fixture()
+    def built(self, tmp_path):
+        curve = ContinuousCalibration.from_bands(NBA_ML_CALIBRATION).compile(0.001)
+        source = source_hash(NBA_ML_CALIBRATION, 0.90, 0.001)
+        path = save_artifact(curve, tmp_path / "curve.json", source)
+        return curve, source, path
+
+    def test_roundtrip_without_interpolators(self, built):
+        curve, source, path = built
+        loaded = load_artifact(path, source=source)
+        assert loaded is not None and loaded.compiled
+        for price in np.linspace(0.20, 0.95, 301):
+            a, b = curve.estimate(float(price)), loaded.estimate(float(price))
+            assert (a is None) == (b is None)
+            if a is not None:
+                assert b == a
+        # グリッドだけで評価し PCHIP (SciPy) は構築しない
+        assert loaded._interp_cache is None
+
+    def test_rejects_tampered_content(self, built):
+        _, source, path = built
+        data = json.loads(path.read_text())
+        data["grid"]["point"][100] += 0.01
+        path.write_text(json.dumps(data))
+        assert load_artifact(path, source=source) is None
+
+    def test_rejects_stale_source(self, built):
+        _, _, path = built
+        assert load_artifact(path, source=source_hash(NBA_ML_CALIBRATION, 0.95, 0.001)) is None
+        assert load_artifact(path) is not None
+
+    def test_missing_or_garbage(self, tmp_path):
+        assert load_artifact(tmp_path / "missing.json") is None
+        garbage = tmp_path / "garbage.json"
+        garbage.write_text("{not json")
+        assert load_artifact(garbage) is None
+
+    def test_uncompiled_curve_cannot_be_saved(self, tmp_path):
+        curve = ContinuousCalibration.from_bands(NBA_ML_CALIBRATION)
+        with pytest.raises(ValueError, match="compiled"):
+            save_artifact(curve, tmp_path / "x.json", "src")
+
+    def test_default_curve_prefers_artifact_and_falls_back(self, built, monkeypatch):
+        from src.config import settings
+        from src.strategy import calibration_curve
+
+        _, _, path = built
+        monkeypatch.setattr(settings, "calibration_lookup_step", 0.001)
+        monkeypatch.setattr(settings, "calibration_artifact_path", str(path))
+        monkeypatch.setattr(calibration_curve, "_default_curve_cache", {})
+        assert get_default_curve(0.90)._interp_cache is None
+
+        monkeypatch.setattr(settings, "calibration_artifact_path", str(path.parent / "no.json"))
+        monkeypatch.setattr(calibration_curve, "_default_curve_cache", {})
+        refit = get_default_curve(0.90)
+        assert refit.compiled and refit._interp_cache is not None
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import logging
+
 import pytest
 
 from src.connectors.polymarket import MoneylineMarket
@@ -286,3 +288,15 @@ class TestScanCalibration:
                 f"Band {band.price_lo:.2f}-{band.price_hi:.2f} "
                 f"produced no signal at price {mid:.3f}"
             )
+
+    def test_logs_skipped_outcomes(self, monkeypatch, caplog):
+        """Rejected outcomes are logged at DEBUG with the reason."""
+        self._patch(monkeypatch)
+        ml = _make_ml(["Knicks", "Celtics"], [1.0, 0.03])
+        with caplog.at_level(logging.DEBUG, logger="src.strategy.calibration_scanner"):
+            assert scan_calibration([ml]) == []
+        messages = [r.getMessage() for r in caplog.records]
+        assert messages == [
+            "Skipping Knicks: invalid price 1.000",
+            "No calibration band for Celtics @ 0.030",
+        ]
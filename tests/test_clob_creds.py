@@ -0,0 +1,56 @@
+"""Tests for the on-disk CLOB API credential cache."""
+
+from __future__ import annotations
+
+import stat
+from datetime import datetime, timedelta, timezone
+
+from src.connectors.clob_creds import clear_api_creds, load_api_creds, save_api_creds
+
+HOST = "https://clob.polymarket.com"
+ADDR = "0xAbC0000000000000000000000000000000000001"
+T0 = datetime(2026, 2, 8, 12, 0, tzinfo=timezone.utc)
+
+
+def _save(path, address=ADDR, now=T0, key="k1"):
+    save_api_creds(path, HOST, address, key, "secret", "pass", now=now)
+
+
+class TestClobCredsCache:
+    def test_roundtrip(self, tmp_path):
+        path = tmp_path / "creds.json"
+        _save(path)
+        creds = load_api_creds(path, HOST, ADDR.lower(), ttl_hours=24, now=T0)
+        assert creds == {"api_key": "k1", "api_secret": "secret", "api_passphrase": "pass"}
+
+    def test_file_is_private(self, tmp_path):
+        path = tmp_path / "creds.json"
+        _save(path)
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    def test_expired_entry_ignored(self, tmp_path):
+        path = tmp_path / "creds.json"
+        _save(path)
+        later = T0 + timedelta(hours=25)
+        assert load_api_creds(path, HOST, ADDR, ttl_hours=24, now=later) is None
+
+    def test_missing_and_corrupt_file(self, tmp_path):
+        path = tmp_path / "creds.json"
+        assert load_api_creds(path, HOST, ADDR, ttl_hours=24) is None
+        path.write_text("{not json")
+        assert load_api_creds(path, HOST, ADDR, ttl_hours=24) is None
+
+    def test_entries_keyed_by_address(self, tmp_path):
+        path = tmp_path / "creds.json"
+        other = "0x0000000000000000000000000000000000000002"
+        _save(path, key="k1")
+        _save(path, address=other, key="k2")
+        assert load_api_creds(path, HOST, ADDR, 24, now=T0)["api_key"] == "k1"
+        assert load_api_creds(path, HOST, other, 24, now=T0)["api_key"] == "k2"
+
+        clear_api_creds(path, HOST, ADDR)
+        assert load_api_creds(path, HOST, ADDR, 24, now=T0) is None
+        assert load_api_creds(path, HOST, other, 24, now=T0)["api_key"] == "k2"
+
+        clear_api_creds(path, HOST, other)
+        assert not path.exists()
@@ -67,7 +67,7 @@ def test_live_dca_waits_when_placed_exists(monkeypatch):
     placed_signal = SimpleNamespace(order_status="placed")
 
     monkeypatch.setattr(
-        "src.scheduler.dca_executor.get_dca_active_jobs",
+        "src.scheduler.dca_executor.claim_dca_active_jobs",
         lambda *_args, **_kwargs: [job],
     )
     monkeypatch.setattr(
@@ -91,7 +91,7 @@ def test_live_dca_waits_until_filled_inventory_exists(monkeypatch):
     failed_signal = SimpleNamespace(order_status="failed")
 
     monkeypatch.setattr(
-        "src.scheduler.dca_executor.get_dca_active_jobs",
+        "src.scheduler.dca_executor.claim_dca_active_jobs",
         lambda *_args, **_kwargs: [job],
     )
     monkeypatch.setattr(
@@ -117,8 +117,9 @@ def test_dca_stops_when_position_group_target_already_reached(monkeypatch):
 
     monkeypatch.setattr("src.scheduler.dca_executor.settings.game_position_group_enabled", True)
     monkeypatch.setattr("src.scheduler.dca_executor.settings.dca_min_order_usd", 1.0)
-    monkeypatch.setattr("src.scheduler.dca_executor.get_dca_active_jobs", lambda *_a, **_k: [job])
+    monkeypatch.setattr("src.scheduler.dca_executor.claim_dca_active_jobs", lambda *_a, **_k: [job])
     monkeypatch.setattr("src.scheduler.dca_executor.get_dca_group_signals", lambda *_a, **_k: [sig])
+    monkeypatch.setattr("src.connectors.polymarket.fetch_moneylines_batch", lambda *_a: {})
     monkeypatch.setattr(
         "src.connectors.polymarket.fetch_moneyline_for_game",
         lambda *_a, **_k: SimpleNamespace(
@@ -171,8 +172,9 @@ def test_dca_size_is_capped_by_position_group_remaining_target(monkeypatch):
 
     monkeypatch.setattr("src.scheduler.dca_executor.settings.game_position_group_enabled", True)
     monkeypatch.setattr("src.scheduler.dca_executor.settings.dca_min_order_usd", 1.0)
-    monkeypatch.setattr("src.scheduler.dca_executor.get_dca_active_jobs", lambda *_a, **_k: [job])
+    monkeypatch.setattr("src.scheduler.dca_executor.claim_dca_active_jobs", lambda *_a, **_k: [job])
     monkeypatch.setattr("src.scheduler.dca_executor.get_dca_group_signals", lambda *_a, **_k: [sig])
+    monkeypatch.setattr("src.connectors.polymarket.fetch_moneylines_batch", lambda *_a: {})
     monkeypatch.setattr(
         "src.connectors.polymarket.fetch_moneyline_for_game",
         lambda *_a, **_k: SimpleNamespace(
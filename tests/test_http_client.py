@@ -0,0 +1,117 @@
+"""Tests for the shared pooled HTTP client registry."""
+
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.connectors import http_client
+from src.connectors.http_client import (
+    close_http_clients,
+    get_http_client,
+    http_get,
+    http_post,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    wbufsize = 64 * 1024
+
+    def _reply(self) -> None:
+        self.server.peers.add(self.client_address)
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._reply()
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._reply()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture()
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.peers = set()
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    close_http_clients()
+    yield
+    close_http_clients()
+
+
+def _url(srv, path: str = "/") -> str:
+    host, port = srv.server_address
+    return f"http://{host}:{port}{path}"
+
+
+class TestRegistry:
+    def test_same_origin_shares_client(self):
+        a = get_http_client("https://gamma-api.polymarket.com/events?slug=x")
+        b = get_http_client("https://gamma-api.polymarket.com/markets")
+        assert a is b
+
+    def test_different_hosts_get_separate_pools(self):
+        a = get_http_client("https://gamma-api.polymarket.com/events")
+        b = get_http_client("https://cdn.nba.com/static/json/x.json")
+        assert a is not b
+
+    def test_proxy_and_direct_are_separate(self):
+        a = get_http_client("https://gamma-api.polymarket.com/", use_proxy=True)
+        b = get_http_client("https://gamma-api.polymarket.com/", use_proxy=False)
+        assert a is not b
+
+    def test_relative_url_rejected(self):
+        with pytest.raises(ValueError):
+            get_http_client("/events")
+
+    def test_close_rebuilds_on_next_use(self):
+        a = get_http_client("https://cdn.nba.com/")
+        close_http_clients()
+        assert a.is_closed
+        b = get_http_client("https://cdn.nba.com/")
+        assert b is not a and not b.is_closed
+
+    def test_http2_falls_back_without_h2(self, monkeypatch):
+        import builtins
+
+        real_import = builtins.__import__
+
+        def fake_import(name, *args, **kwargs):
+            if name == "h2":
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(http_client.settings, "http2_enabled", True)
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+        assert http_client._http2_available() is False
+
+
+class TestKeepAlive:
+    def test_requests_reuse_one_connection(self, server):
+        for _ in range(5):
+            resp = http_get(_url(server, "/ping"), timeout=5)
+            assert resp.status_code == 200
+        resp = http_post(_url(server, "/send"), json={"x": 1}, timeout=5)
+        assert resp.json() == {"ok": True}
+        assert len(server.peers) == 1
@@ -0,0 +1,150 @@
+"""Tests for lease-based trade_jobs claiming across scheduler workers."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from src.store.db import (
+    _connect,
+    claim_dca_active_jobs,
+    claim_eligible_jobs,
+    get_executing_jobs,
+    release_job_claims,
+    renew_job_lease,
+    upsert_trade_job,
+)
+
+NOW = "2026-02-10T20:00:00+00:00"
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "leases.db"
+
+
+def _job(db_path: Path, slug: str, job_side: str = "directional", tipoff_h: int = 1) -> int:
+    upsert_trade_job(
+        game_date="2026-02-10",
+        event_slug=slug,
+        home_team="Boston Celtics",
+        away_team="New York Knicks",
+        game_time_utc=f"2026-02-11T0{tipoff_h}:00:00+00:00",
+        execute_after="2026-02-10T17:00:00+00:00",
+        execute_before=f"2026-02-11T0{tipoff_h}:00:00+00:00",
+        job_side=job_side,
+        db_path=db_path,
+    )
+    conn = _connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT id FROM trade_jobs WHERE event_slug = ? AND job_side = ?", (slug, job_side),
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _set(db_path: Path, job_id: int, **cols) -> None:
+    conn = _connect(db_path)
+    sets = ", ".join(f"{k} = ?" for k in cols)
+    conn.execute(f"UPDATE trade_jobs SET {sets} WHERE id = ?", (*cols.values(), job_id))
+    conn.commit()
+    conn.close()
+
+
+def _claim(db_path: Path, worker: str, **kwargs):
+    return claim_eligible_jobs(NOW, 3, worker, 600, db_path=db_path, **kwargs)
+
+
+class TestClaimEligibleJobs:
+    def test_claimed_jobs_are_invisible_to_other_workers(self, db_path: Path):
+        _job(db_path, "nba-a", tipoff_h=2)
+        _job(db_path, "nba-b", tipoff_h=1)
+
+        mine = _claim(db_path, "w1")
+        assert [j.event_slug for j in mine] == ["nba-b", "nba-a"]
+        assert {j.claimed_by for j in mine} == {"w1"}
+        assert _claim(db_path, "w2") == []
+        # 同じワーカーは自分のリースを再取得できる
+        assert len(_claim(db_path, "w1")) == 2
+
+    def test_limit_splits_jobs_between_workers(self, db_path: Path):
+        for slug in ("nba-a", "nba-b", "nba-c"):
+            _job(db_path, slug)
+        first = _claim(db_path, "w1", limit=2)
+        second = _claim(db_path, "w2", limit=2)
+        assert len(first) == 2 and len(second) == 1
+        assert {j.id for j in first}.isdisjoint({j.id for j in second})
+
+    def test_expired_lease_can_be_taken_over(self, db_path: Path):
+        job_id = _job(db_path, "nba-a")
+        past = (datetime.now(timezone.utc) - timedelta(seconds=1)).isoformat()
+        _set(db_path, job_id, claimed_by="dead", lease_expires_at=past)
+
+        (job,) = _claim(db_path, "w2")
+        assert job.claimed_by == "w2"
+        assert not renew_job_lease(job_id, "dead", 600, db_path=db_path)
+        assert renew_job_lease(job_id, "w2", 600, db_path=db_path)
+
+    def test_game_with_live_lease_stays_on_its_worker(self, db_path: Path):
+        dir_id = _job(db_path, "nba-a")
+        _job(db_path, "nba-a", job_side="hedge")
+        _set(db_path, dir_id, status="executing")
+        assert len(_claim(db_path, "w1")) == 1  # hedge (directional は executing)
+        _set(db_path, dir_id, status="pending")
+
+        assert _claim(db_path, "w2") == []
+        assert len(_claim(db_path, "w1")) == 2
+
+    def test_concurrent_workers_never_share_a_job(self, db_path: Path):
+        for i in range(20):
+            _job(db_path, f"nba-{i:02d}")
+        claimed: dict[str, list[int]] = {}
+        barrier = threading.Barrier(4)
+
+        def worker(name: str) -> None:
+            barrier.wait()
+            claimed[name] = [j.id for j in _claim(db_path, name, limit=6)]
+
+        threads = [threading.Thread(target=worker, args=(f"w{i}",)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        ids = [i for v in claimed.values() for i in v]
+        assert len(ids) == len(set(ids)) == 20
+
+
+class TestReleaseAndRecovery:
+    def test_release_keeps_executing_jobs_leased(self, db_path: Path):
+        done = _job(db_path, "nba-a")
+        stuck = _job(db_path, "nba-b")
+        _claim(db_path, "w1")
+        _set(db_path, done, status="executed")
+        _set(db_path, stuck, status="executing")
+
+        assert release_job_claims([done, stuck], "w1", db_path=db_path) == 1
+        assert release_job_claims([done], "w2", db_path=db_path) == 0
+        # 実行中ワーカーのリースが生きている間は回復対象にしない
+        assert get_executing_jobs(db_path) == []
+
+        past = (datetime.now(timezone.utc) - timedelta(seconds=1)).isoformat()
+        _set(db_path, stuck, lease_expires_at=past)
+        assert [j.id for j in get_executing_jobs(db_path)] == [stuck]
+
+    def test_unleased_executing_jobs_are_recovered(self, db_path: Path):
+        job_id = _job(db_path, "nba-a")
+        _set(db_path, job_id, status="executing")
+        assert [j.id for j in get_executing_jobs(db_path)] == [job_id]
+
+
+def test_claim_dca_active_jobs(db_path: Path):
+    job_id = _job(db_path, "nba-a")
+    _set(db_path, job_id, status="dca_active", dca_entries_count=1, dca_max_entries=3)
+    (job,) = claim_dca_active_jobs(NOW, "w1", 600, db_path=db_path)
+    assert job.id == job_id
+    assert claim_dca_active_jobs(NOW, "w2", 600, db_path=db_path) == []
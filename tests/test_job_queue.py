@@ -0,0 +1,190 @@
+"""Tests for the deadline-aware tick work queue (src/scheduler/job_queue.py)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.config import settings
+from src.scheduler.job_executor import JobResult
+from src.scheduler.job_queue import (
+    OrderSlots,
+    WorkItem,
+    job_deadline,
+    rank_work,
+    run_queue,
+    work_items,
+)
+
+NOW = datetime(2026, 2, 10, 23, 0, tzinfo=timezone.utc)
+
+
+def _job(
+    job_id: int, slug: str, tipoff_min: float, side: str = "directional", base=NOW, **extra,
+):
+    tipoff = (base + timedelta(minutes=tipoff_min)).isoformat()
+    return SimpleNamespace(
+        id=job_id, event_slug=slug, job_side=side, execute_before=tipoff, game_time_utc=tipoff,
+        away_team="New York Knicks", home_team="Boston Celtics", game_date="2026-02-10",
+        dca_max_entries=5, **extra,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _settings(monkeypatch):
+    monkeypatch.setattr(settings, "job_queue_urgent_min", 60.0)
+    monkeypatch.setattr(settings, "dca_cutoff_before_tipoff_min", 30)
+    monkeypatch.setattr(settings, "bothside_hedge_kelly_mult", 0.5)
+
+
+def _ids(items: list[WorkItem]) -> list[tuple[str, int]]:
+    return [(it.kind, it.job.id) for it in items]
+
+
+class TestRankWork:
+    def test_deadlines_inside_urgent_window_go_first(self):
+        jobs = [_job(1, "a", 300), _job(2, "b", 45), _job(3, "c", 20)]
+        assert _ids(rank_work(work_items(jobs), NOW)) == [
+            ("directional", 3), ("directional", 2), ("directional", 1),
+        ]
+
+    def test_dca_deadline_is_cutoff_before_tipoff(self):
+        (item,) = work_items([], [_job(1, "a", 80)])
+        assert item.deadline == NOW + timedelta(minutes=50)
+        # 80 分後のティップオフでもカットオフは 50 分後 → 緊急扱い
+        ranked = rank_work(work_items([_job(2, "b", 70)], [_job(1, "a", 80)]), NOW)
+        assert _ids(ranked) == [("dca", 1), ("directional", 2)]
+
+    def test_non_urgent_work_ranked_by_value(self):
+        ranked = rank_work(
+            work_items([_job(1, "a", 300, side="hedge"), _job(2, "b", 400)], [_job(3, "c", 200)]),
+            NOW,
+        )
+        assert _ids(ranked) == [("directional", 2), ("hedge", 1), ("dca", 3)]
+
+    def test_round_robin_between_games(self):
+        jobs = [_job(1, "a", 200), _job(2, "a", 200, side="hedge"), _job(3, "b", 300)]
+        dca = [_job(4, "a", 200)]
+        ranked = rank_work(work_items(jobs, dca), NOW)
+        assert _ids(ranked) == [
+            ("directional", 1), ("directional", 3), ("hedge", 2), ("dca", 4),
+        ]
+
+    def test_same_game_keeps_directional_before_urgent_hedge(self):
+        # hedge の期限が directional より早くても directional が先 (期限を継承して緊急扱い)
+        directional = _job(1, "a", 300)
+        hedge = _job(2, "a", 300, side="hedge")
+        hedge.execute_before = (NOW + timedelta(minutes=10)).isoformat()
+        ranked = rank_work(work_items([hedge, directional, _job(3, "b", 40)]), NOW)
+        assert _ids(ranked) == [("directional", 1), ("directional", 3), ("hedge", 2)]
+
+    def test_missing_deadline_ranks_last(self):
+        undated = SimpleNamespace(id=9, event_slug="z", job_side="directional")
+        assert job_deadline(undated, "directional") is None
+        ranked = rank_work(work_items([undated, _job(1, "a", 300)]), NOW)
+        assert _ids(ranked) == [("directional", 1), ("directional", 9)]
+
+
+class TestRunQueue:
+    @staticmethod
+    def _items(n: int, per_game: int = 1) -> list[WorkItem]:
+        return [
+            WorkItem("directional", _job(i, f"g{i // per_game}", 100)) for i in range(n)
+        ]
+
+    def test_budget_spent_in_rank_order(self):
+        ran = []
+
+        def run(item):
+            ran.append(item.job.id)
+            return JobResult(item.job.id, item.game, "executed")
+
+        slots = OrderSlots(2)
+        done = run_queue(self._items(5), run, slots)
+        assert ran == [0, 1]
+        assert [it.job.id for it, _ in done] == [0, 1]
+        assert [it.job.id for it in slots.deferred] == [2, 3, 4]
+
+    def test_skipped_work_does_not_consume_budget(self):
+        def run(item):
+            status = "skipped" if item.job.id < 3 else "executed"
+            return JobResult(item.job.id, item.game, status)
+
+        done = run_queue(self._items(5), run, OrderSlots(1))
+        assert [r.status for _, r in done] == ["skipped"] * 3 + ["executed"]
+
+    def test_parallel_games_but_sequential_within_game(self):
+        lock = threading.Lock()
+        spans: dict[int, tuple[float, float]] = {}
+
+        def run(item):
+            start = time.monotonic()
+            time.sleep(0.05)
+            with lock:
+                spans[item.job.id] = (start, time.monotonic())
+            return JobResult(item.job.id, item.game, "executed")
+
+        # g0: 0,1  g1: 2,3
+        done = run_queue(self._items(4, per_game=2), run, OrderSlots(10), workers=2)
+        assert len(done) == 4
+        assert spans[1][0] >= spans[0][1]
+        assert spans[3][0] >= spans[2][1]
+        assert spans[2][0] < spans[0][1]  # 別ゲームは並列
+
+    def test_raising_item_is_dropped_and_frees_slot(self):
+        def run(item):
+            if item.job.id == 0:
+                raise RuntimeError("boom")
+            return JobResult(item.job.id, item.game, "executed")
+
+        done = run_queue(self._items(3), run, OrderSlots(2), workers=2)
+        assert sorted(it.job.id for it, _ in done) == [1, 2]
+
+
+class TestProcessTickJobs:
+    @pytest.fixture()
+    def scheduler(self, monkeypatch):
+        state = {"eligible": [], "dca": [], "calls": [], "released": []}
+        ts = "src.scheduler.trade_scheduler"
+        monkeypatch.setattr(f"{ts}.recover_executing_jobs", lambda **_: 0)
+        monkeypatch.setattr(f"{ts}.claim_eligible_jobs", lambda *a, **k: state["eligible"])
+        monkeypatch.setattr(f"{ts}.claim_dca_active_jobs", lambda *a, **k: state["dca"])
+        monkeypatch.setattr(f"{ts}.renew_job_lease", lambda *_a, **_k: True)
+        monkeypatch.setattr(
+            f"{ts}.release_job_claims",
+            lambda ids, worker, **_: state["released"].extend(ids),
+        )
+        monkeypatch.setattr(f"{ts}.settings.job_concurrency", 1)
+        monkeypatch.setattr(f"{ts}.settings.max_orders_per_tick", 2)
+
+        def fake_single(job, *a, **k):
+            state["calls"].append(("directional", job.id))
+            return JobResult(job.id, job.event_slug, "executed"), None
+
+        def fake_dca(job, *a, **k):
+            state["calls"].append(("dca", job.id))
+            return JobResult(job.id, job.event_slug, "executed")
+
+        monkeypatch.setattr("src.scheduler.job_executor.process_single_job", fake_single)
+        monkeypatch.setattr("src.scheduler.dca_executor.process_dca_job", fake_dca)
+        return state
+
+    def test_shared_budget_goes_to_nearest_deadline(self, scheduler):
+        from src.scheduler.trade_scheduler import process_tick_jobs
+
+        now = datetime.now(timezone.utc)
+        scheduler["eligible"] = [_job(1, "a", 400, base=now), _job(2, "b", 300, base=now)]
+        scheduler["dca"] = [_job(11, "c", 60, base=now), _job(12, "d", 200, base=now)]
+
+        results, dca_results = process_tick_jobs("paper", db_path="unused.db")
+
+        # c の DCA カットオフ (30 分後) が最優先、残り 1 枠は DCA より価値の高い
+        # directional のうち期限の近い方
+        assert scheduler["calls"] == [("dca", 11), ("directional", 2)]
+        assert [r.job_id for r in results] == [2]
+        assert [r.job_id for r in dca_results] == [11]
+        assert sorted(scheduler["released"]) == [1, 2, 11, 12]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from src.sizing.liquidity import (
@@ -11,6 +12,7 @@ from src.sizing.liquidity import (
     _sum_depth_bid,
     extract_liquidity,
     score_liquidity,
+    score_liquidity_many,
 )
 
 
@@ -164,3 +166,11 @@ class TestScoreLiquidity:
 
     def test_zero_depth(self):
         assert score_liquidity(self._snap(ask_depth_5c=0), 100.0) == "insufficient"
+
+    def test_many_matches_scalar(self):
+        cases = [(5000, 1.0), (1000, 5.0), (200, 10.0), (5000, 20.0), (0, 1.0), (1000, 15.0)]
+        depth = np.array([d for d, _ in cases] + [np.nan], dtype=float)
+        spread = np.array([s for _, s in cases] + [np.nan], dtype=float)
+        labels = score_liquidity_many(depth, spread, np.full(len(depth), 100.0))
+        expected = [score_liquidity(self._snap(d, s), 100.0) for d, s in cases] + ["unknown"]
+        assert list(labels) == expected
@@ -0,0 +1,155 @@
+"""Tests for the tick-scoped MarketSnapshot cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.connectors import market_snapshot as ms
+from src.connectors.market_snapshot import (
+    MarketSnapshot,
+    current_snapshot,
+    get_order_books,
+    tick_snapshot,
+)
+from src.connectors.polymarket import MoneylineMarket
+from src.connectors.team_mapping import build_event_slug
+
+GAMES = [
+    ("New York Knicks", "Boston Celtics", "2026-02-08"),
+    ("Washington Wizards", "Miami Heat", "2026-02-08"),
+    ("Denver Nuggets", "Utah Jazz", "2026-02-08"),
+]
+
+
+def _ml(away: str, home: str, date: str, price: float = 0.40) -> MoneylineMarket:
+    return MoneylineMarket(
+        condition_id="c",
+        event_slug=build_event_slug(away, home, date),
+        event_title=f"{away} vs {home}",
+        home_team=home,
+        away_team=away,
+        outcomes=[away, home],
+        prices=[price, 1 - price],
+        token_ids=["tok-a", "tok-b"],
+        sports_market_type="moneyline",
+        active=True,
+    )
+
+
+class _Clock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
+@pytest.fixture()
+def calls(monkeypatch):
+    """Fake connector: records batch / single / book fetches."""
+    rec = {"batch": [], "single": [], "books": [], "unlisted": set()}
+
+    def fake_batch(games):
+        rec["batch"].append(list(games))
+        return {
+            build_event_slug(*g): _ml(*g)
+            for g in games
+            if build_event_slug(*g) not in rec["unlisted"]
+        }
+
+    def fake_single(away, home, date):
+        rec["single"].append((away, home, date))
+        return None if build_event_slug(away, home, date) in rec["unlisted"] else _ml(
+            away, home, date,
+        )
+
+    def fake_books(token_ids):
+        rec["books"].append(list(token_ids))
+        return {tid: {"asks": [{"price": "0.41", "size": "100"}], "bids": []} for tid in token_ids}
+
+    monkeypatch.setattr(ms.polymarket, "fetch_moneylines_batch", fake_batch)
+    monkeypatch.setattr(ms.polymarket, "fetch_moneyline_for_game", fake_single)
+    monkeypatch.setattr(ms.polymarket, "fetch_order_books_batch", fake_books)
+    return rec
+
+
+class TestMoneylines:
+    def test_registered_games_fetched_in_one_batch(self, calls):
+        snap = MarketSnapshot()
+        snap.register_games(GAMES)
+        for g in GAMES:
+            assert snap.moneyline(*g).event_slug == build_event_slug(*g)
+        for g in GAMES:
+            snap.moneyline(*g)
+        assert len(calls["batch"]) == 1
+        assert calls["single"] == []
+
+    def test_lazy_until_first_lookup(self, calls):
+        MarketSnapshot().register_games(GAMES)
+        assert calls["batch"] == []
+
+    def test_unlisted_slug_falls_back_once(self, calls):
+        calls["unlisted"].add(build_event_slug(*GAMES[2]))
+        snap = MarketSnapshot()
+        snap.register_games(GAMES)
+        assert snap.moneyline(*GAMES[2]) is None
+        assert snap.moneyline(*GAMES[2]) is None
+        assert calls["single"] == [GAMES[2]]
+        assert set(snap.moneylines) == {build_event_slug(*g) for g in GAMES[:2]}
+
+    def test_unregistered_game_uses_single_fetch(self, calls):
+        snap = MarketSnapshot()
+        snap.moneyline(*GAMES[0])
+        snap.moneyline(*GAMES[0])
+        assert calls["batch"] == []
+        assert calls["single"] == [GAMES[0]]
+
+    def test_stale_entry_refetched(self, calls):
+        clock = _Clock()
+        snap = MarketSnapshot(max_age_sec=30, clock=clock)
+        snap.moneyline(*GAMES[0])
+        clock.t = 29
+        snap.moneyline(*GAMES[0])
+        assert len(calls["single"]) == 1
+        clock.t = 31
+        snap.moneyline(*GAMES[0])
+        assert len(calls["single"]) == 2
+
+
+class TestOrderBooks:
+    def test_only_missing_tokens_fetched(self, calls):
+        snap = MarketSnapshot()
+        snap.order_books(["a", "b"])
+        books = snap.order_books(["b", "c"])
+        assert set(books) == {"b", "c"}
+        assert calls["books"] == [["a", "b"], ["c"]]
+        assert snap.order_book("a") is not None
+        assert len(calls["books"]) == 2
+
+
+class TestTickScope:
+    def test_helpers_share_snapshot_within_tick(self, calls):
+        assert current_snapshot() is None
+        with tick_snapshot() as snap:
+            assert current_snapshot() is snap
+            get_order_books(["a"])
+            get_order_books(["a"])
+            with tick_snapshot() as inner:
+                assert inner is snap
+            assert current_snapshot() is snap
+        assert current_snapshot() is None
+        assert calls["books"] == [["a"]]
+
+    def test_helpers_pass_through_outside_tick(self, calls):
+        get_order_books(["a"])
+        get_order_books(["a"])
+        assert calls["books"] == [["a"], ["a"]]
+
+    def test_scheduler_and_dca_share_prices(self, calls):
+        """Directional and DCA passes in one tick see the same moneyline object."""
+        with tick_snapshot() as snap:
+            snap.register_games(GAMES[:2])
+            first = snap.moneyline(*GAMES[0])
+            snap.register_games(GAMES[:1])  # DCA 側の再登録は新鮮なら no-op
+            assert snap.moneyline(*GAMES[0]) is first
+        assert len(calls["batch"]) == 1
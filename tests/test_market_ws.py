@@ -0,0 +1,239 @@
+"""Tests for the WebSocket market-data feed (src/connectors/market_ws.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from src.config import settings
+from src.connectors import market_snapshot as ms
+from src.connectors import market_ws
+from src.connectors.market_ws import LocalOrderBook, MarketDataFeed
+from src.sizing.liquidity import extract_liquidity
+
+pytest.importorskip("websockets")
+
+# 市場チャネルの記録 (book snapshot → 差分 → tick size 変更)。1 行目は配列で届くケース
+RECORDED = [
+    '[{"event_type": "book", "asset_id": "111", "market": "0xm", "timestamp": "1",'
+    ' "bids": [{"price": "0.40", "size": "100"}, {"price": "0.39", "size": "50"}],'
+    ' "asks": [{"price": "0.43", "size": "80"}, {"price": "0.42", "size": "60"}]}]',
+    '{"event_type": "book", "asset_id": "222", "market": "0xm", "timestamp": "1",'
+    ' "bids": [{"price": "0.57", "size": "70"}], "asks": [{"price": "0.60", "size": "90"}]}',
+    '{"event_type": "price_change", "market": "0xm", "timestamp": "2", "price_changes": ['
+    '{"asset_id": "111", "price": "0.42", "size": "0", "side": "SELL"},'
+    '{"asset_id": "111", "price": "0.41", "size": "25", "side": "SELL"},'
+    '{"asset_id": "222", "price": "0.58", "size": "40", "side": "BUY"}]}',
+    '{"event_type": "last_trade_price", "asset_id": "111", "price": "0.41", "size": "5"}',
+    '{"event_type": "tick_size_change", "asset_id": "111",'
+    ' "old_tick_size": "0.01", "new_tick_size": "0.001"}',
+]
+
+
+class _ReplayServer:
+    """Local market-channel stand-in: replays RECORDED after the subscribe message."""
+
+    def __init__(self, messages: list[str]):
+        self.messages = messages
+        self.received: list[dict] = []
+        self.connections = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=lambda: asyncio.run(self._main()), daemon=True)
+
+    async def _handler(self, ws) -> None:
+        self.connections += 1
+        self.received.append(json.loads(await ws.recv()))
+        for msg in self.messages:
+            await ws.send(msg)
+        async for raw in ws:
+            self.received.append(json.loads(raw))
+
+    async def _main(self) -> None:
+        from websockets.asyncio.server import serve
+
+        self._loop = asyncio.get_running_loop()
+        async with serve(self._handler, "127.0.0.1", 0) as server:
+            self._server = server
+            self.port = server.sockets[0].getsockname()[1]
+            self._ready.set()
+            await server.serve_forever()
+
+    @property
+    def url(self) -> str:
+        return f"ws://127.0.0.1:{self.port}"
+
+    def start(self) -> _ReplayServer:
+        self._thread.start()
+        self._ready.wait(5)
+        return self
+
+    def drop_connections(self) -> None:
+        async def _close():
+            for conn in list(self._server.connections):
+                await conn.close()
+
+        asyncio.run_coroutine_threadsafe(_close(), self._loop).result(5)
+
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._server.close)
+        self._thread.join(5)
+
+
+def _wait_until(cond, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not cond():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def server():
+    srv = _ReplayServer(RECORDED).start()
+    yield srv
+    srv.stop()
+
+
+@pytest.fixture
+def feed(server, monkeypatch):
+    monkeypatch.setattr(settings, "market_ws_reconnect_min_sec", 0.05)
+    f = MarketDataFeed(server.url)
+    f.subscribe(["111", "222"])
+    f.start()
+    yield f
+    f.stop()
+
+
+class TestLocalOrderBook:
+    def test_snapshot_then_deltas_match_rest_extract(self):
+        book = LocalOrderBook("t")
+        book.apply_snapshot(
+            [{"price": "0.40", "size": "100"}],
+            [{"price": "0.43", "size": "80"}, {"price": "0.42", "size": "60"}],
+        )
+        book.apply_change("SELL", 0.42, 0.0)
+        book.apply_change("BUY", 0.41, 30.0)
+
+        snap = book.liquidity()
+        rest = extract_liquidity(book.to_dict(), "t")
+        assert (snap.best_ask, snap.best_bid) == (0.43, 0.41)
+        assert snap.ask_depth_5c == rest.ask_depth_5c
+        assert snap.bid_depth_5c == rest.bid_depth_5c
+        assert snap.impact_estimate == rest.impact_estimate
+
+    def test_liquidity_is_cached_until_next_update(self):
+        book = LocalOrderBook("t")
+        book.apply_snapshot([{"price": "0.40", "size": "10"}], [{"price": "0.45", "size": "10"}])
+        first = book.liquidity()
+        assert book.liquidity() is first
+        book.apply_change("SELL", 0.44, 5.0)
+        assert book.liquidity() is not first
+        assert book.liquidity().best_ask == 0.44
+
+    def test_empty_book_has_no_snapshot(self):
+        book = LocalOrderBook("t")
+        book.apply_snapshot([], [])
+        assert book.liquidity() is None
+
+
+class TestMessageHandling:
+    def test_legacy_price_change_format(self):
+        feed = MarketDataFeed("ws://unused")
+        feed.handle_message({
+            "event_type": "book", "asset_id": "9",
+            "buys": [{"price": "0.3", "size": "10"}], "sells": [{"price": "0.35", "size": "10"}],
+        })
+        feed.handle_message({
+            "event_type": "price_change", "asset_id": "9",
+            "changes": [{"price": "0.34", "size": "7", "side": "SELL"}],
+        })
+        assert feed.best_ask("9") == 0.34
+        assert feed.best_bid("9") == 0.3
+
+    def test_delta_before_snapshot_is_ignored(self):
+        feed = MarketDataFeed("ws://unused")
+        feed.handle_message({
+            "event_type": "price_change",
+            "price_changes": [{"asset_id": "9", "price": "0.5", "size": "1", "side": "BUY"}],
+        })
+        assert not feed.has_book("9")
+        assert feed.liquidity("9") is None
+
+
+class TestMarketDataFeed:
+    def test_replayed_stream_builds_books(self, feed, server):
+        _wait_until(lambda: feed.messages >= 5)
+
+        assert server.received[0] == {"assets_ids": ["111", "222"], "type": "market"}
+        assert feed.best_ask("111") == 0.41
+        assert feed.best_bid("111") == 0.40
+        assert feed.best_bid("222") == 0.58
+        assert feed.liquidity("111").ask_levels == 2
+
+    def test_tick_size_change_invalidates_order_template(self, server, monkeypatch):
+        invalidated = []
+        monkeypatch.setattr(market_ws.order_prep.cache, "invalidate", invalidated.append)
+        f = MarketDataFeed(server.url)
+        f.subscribe(["111"])
+        f.start()
+        try:
+            _wait_until(lambda: invalidated)
+        finally:
+            f.stop()
+        assert invalidated == ["111"]
+
+    def test_dynamic_subscribe_sends_incremental_message(self, feed, server):
+        _wait_until(lambda: feed.messages >= 5)
+        feed.subscribe(["222", "333"])
+        _wait_until(lambda: len(server.received) >= 2)
+        assert server.received[1] == {"assets_ids": ["333"], "operation": "subscribe"}
+
+    def test_reconnect_resubscribes_and_rebuilds(self, feed, server):
+        _wait_until(lambda: feed.messages >= 5)
+        server.drop_connections()
+        _wait_until(lambda: server.connections >= 2 and feed.has_book("111"))
+        assert server.received[-1] == {"assets_ids": ["111", "222"], "type": "market"}
+        assert feed.best_ask("111") == 0.41
+
+
+class TestGetLiquidity:
+    def test_prefers_feed_books_and_subscribes_missing(self, monkeypatch):
+        feed = MarketDataFeed("ws://unused")
+        feed.handle_message({
+            "event_type": "book", "asset_id": "a",
+            "bids": [{"price": "0.3", "size": "10"}], "asks": [{"price": "0.35", "size": "10"}],
+        })
+        monkeypatch.setattr(market_ws, "_feed", feed)
+        fetched = []
+
+        def fake_books(token_ids):
+            fetched.extend(token_ids)
+            return {t: {"bids": [], "asks": [{"price": "0.6", "size": "5"}]} for t in token_ids}
+
+        monkeypatch.setattr(ms.polymarket, "fetch_order_books_batch", fake_books)
+
+        out = ms.get_liquidity(["a", "b"])
+        assert out["a"].best_ask == 0.35
+        assert out["b"].best_ask == 0.6
+        assert fetched == ["b"]
+        assert feed._tokens == {"b"}
+
+    def test_rest_only_without_feed(self, monkeypatch):
+        monkeypatch.setattr(market_ws, "_feed", None)
+        monkeypatch.setattr(
+            ms.polymarket, "fetch_order_books_batch",
+            lambda ids: {t: {"bids": [], "asks": [{"price": "0.5", "size": "1"}]} for t in ids},
+        )
+        assert ms.get_liquidity(["x"])["x"].best_ask == 0.5
+
+
+def test_start_market_feed_disabled_is_noop(monkeypatch):
+    monkeypatch.setattr(settings, "market_ws_enabled", False)
+    monkeypatch.setattr(market_ws, "_feed", None)
+    assert market_ws.start_market_feed(["1"]) is None
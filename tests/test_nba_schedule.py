@@ -33,7 +33,7 @@ SAMPLE_SCOREBOARD = {
 
 
 class TestFetchTodaysGames:
-    @patch("src.connectors.nba_schedule.httpx.get")
+    @patch("src.connectors.nba_schedule.http_get")
     def test_parses_games(self, mock_get):
         mock_resp = httpx.Response(200, request=_DUMMY_REQUEST, json=SAMPLE_SCOREBOARD)
         mock_get.return_value = mock_resp
@@ -47,7 +47,7 @@ class TestFetchTodaysGames:
         assert games[0].game_time_utc == "2026-02-08T17:30:00Z"
         assert games[0].game_status == 1
 
-    @patch("src.connectors.nba_schedule.httpx.get")
+    @patch("src.connectors.nba_schedule.http_get")
     def test_team_name_concatenation(self, mock_get):
         """teamCity + " " + teamName forms the full name."""
         mock_resp = httpx.Response(200, request=_DUMMY_REQUEST, json=SAMPLE_SCOREBOARD)
@@ -58,7 +58,7 @@ class TestFetchTodaysGames:
         assert games[1].home_team == "Miami Heat"
         assert games[1].away_team == "Washington Wizards"
 
-    @patch("src.connectors.nba_schedule.httpx.get")
+    @patch("src.connectors.nba_schedule.http_get")
     def test_empty_games(self, mock_get):
         mock_resp = httpx.Response(200, request=_DUMMY_REQUEST, json={"scoreboard": {"games": []}})
         mock_get.return_value = mock_resp
@@ -66,7 +66,7 @@ class TestFetchTodaysGames:
         games = fetch_todays_games()
         assert games == []
 
-    @patch("src.connectors.nba_schedule.httpx.get")
+    @patch("src.connectors.nba_schedule.http_get")
     def test_empty_scoreboard(self, mock_get):
         mock_resp = httpx.Response(200, request=_DUMMY_REQUEST, json={})
         mock_get.return_value = mock_resp
@@ -74,14 +74,14 @@ class TestFetchTodaysGames:
         games = fetch_todays_games()
         assert games == []
 
-    @patch("src.connectors.nba_schedule.httpx.get")
+    @patch("src.connectors.nba_schedule.http_get")
     def test_network_error(self, mock_get):
         mock_get.side_effect = httpx.ConnectError("Connection refused")
 
         games = fetch_todays_games()
         assert games == []
 
-    @patch("src.connectors.nba_schedule.httpx.get")
+    @patch("src.connectors.nba_schedule.http_get")
     def test_http_error(self, mock_get):
         mock_resp = httpx.Response(500, request=_DUMMY_REQUEST)
         mock_get.return_value = mock_resp
@@ -89,7 +89,7 @@ class TestFetchTodaysGames:
         games = fetch_todays_games()
         assert games == []
 
-    @patch("src.connectors.nba_schedule.httpx.get")
+    @patch("src.connectors.nba_schedule.http_get")
     def test_skips_missing_team_info(self, mock_get):
         data = {
             "scoreboard": {
@@ -118,7 +118,7 @@ class TestFetchTodaysGames:
         assert len(games) == 1
         assert games[0].game_id == "002"
 
-    @patch("src.connectors.nba_schedule.httpx.get")
+    @patch("src.connectors.nba_schedule.http_get")
     def test_skips_none_team_fields(self, mock_get):
         """None in teamCity/teamName should be treated as missing and skipped."""
         data = {
@@ -148,7 +148,7 @@ class TestFetchTodaysGames:
         assert len(games) == 1
         assert games[0].game_id == "002"
 
-    @patch("src.connectors.nba_schedule.httpx.get")
+    @patch("src.connectors.nba_schedule.http_get")
     def test_skips_non_standard_matchups(self, mock_get):
         """Non-30-team special matchups should be filtered out."""
         data = {
@@ -178,7 +178,7 @@ class TestFetchTodaysGames:
         assert len(games) == 1
         assert games[0].game_id == "002"
 
-    @patch("src.connectors.nba_schedule.httpx.get")
+    @patch("src.connectors.nba_schedule.http_get")
     def test_all_game_statuses_returned(self, mock_get):
         """All statuses (scheduled, in-progress, final) are returned."""
         data = {
@@ -210,7 +210,7 @@ class TestFetchTodaysGames:
         assert games[1].game_status == 3
 
 
-    @patch("src.connectors.nba_schedule.httpx.get")
+    @patch("src.connectors.nba_schedule.http_get")
     def test_normalizes_la_clippers(self, mock_get):
         """NBA.com 'LA Clippers' should be normalized to 'Los Angeles Clippers'."""
         data = {
@@ -234,7 +234,7 @@ class TestFetchTodaysGames:
         assert games[0].home_team == "Los Angeles Clippers"
 
 
-    @patch("src.connectors.nba_schedule.httpx.get")
+    @patch("src.connectors.nba_schedule.http_get")
     def test_parses_scores(self, mock_get):
         """Scores are parsed from homeTeam/awayTeam score fields."""
         data = {
@@ -266,7 +266,7 @@ class TestFetchTodaysGames:
         assert games[0].home_score == 112
         assert games[0].away_score == 105
 
-    @patch("src.connectors.nba_schedule.httpx.get")
+    @patch("src.connectors.nba_schedule.http_get")
     def test_scores_default_zero(self, mock_get):
         """Games without scores (scheduled) default to 0."""
         mock_resp = httpx.Response(200, request=_DUMMY_REQUEST, json=SAMPLE_SCOREBOARD)
@@ -135,7 +135,7 @@ class TestFetchNbaOdds:
                 return api_response
 
         monkeypatch.setattr("src.connectors.odds_api.settings.odds_api_key", "test-key")
-        monkeypatch.setattr("src.connectors.odds_api.httpx.get", lambda *a, **kw: MockResponse())
+        monkeypatch.setattr("src.connectors.odds_api.http_get", lambda *a, **kw: MockResponse())
 
         games = fetch_nba_odds()
         assert len(games) == 1
@@ -154,7 +154,7 @@ class TestFetchNbaOdds:
                 return []
 
         monkeypatch.setattr("src.connectors.odds_api.settings.odds_api_key", "test-key")
-        monkeypatch.setattr("src.connectors.odds_api.httpx.get", lambda *a, **kw: MockResponse())
+        monkeypatch.setattr("src.connectors.odds_api.http_get", lambda *a, **kw: MockResponse())
 
         games = fetch_nba_odds()
         assert games == []
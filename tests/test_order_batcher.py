@@ -0,0 +1,82 @@
+"""Tests for OrderBatcher (coalesced limit-buy submission)."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from src.connectors.order_batcher import OrderBatcher
+from src.connectors.polymarket import OrderPlacement
+
+
+class _Recorder:
+    def __init__(self, reject=()):
+        self.batches: list[list[str]] = []
+        self.reject = set(reject)
+        self.lock = threading.Lock()
+
+    def __call__(self, requests):
+        with self.lock:
+            self.batches.append([r.token_id for r in requests])
+        return [
+            OrderPlacement(r, error="rejected") if r.token_id in self.reject
+            else OrderPlacement(r, response={"orderID": f"ord-{r.token_id}"})
+            for r in requests
+        ]
+
+
+def _place_concurrently(batcher: OrderBatcher, tokens: list[str]) -> dict[str, object]:
+    out: dict[str, object] = {}
+    barrier = threading.Barrier(len(tokens))
+
+    def worker(tid):
+        barrier.wait()
+        try:
+            out[tid] = batcher.place_limit_buy(tid, 0.4, 10.0)
+        except Exception as e:
+            out[tid] = e
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in tokens]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+    return out
+
+
+class TestOrderBatcher:
+    def test_concurrent_calls_share_one_batch(self):
+        submit = _Recorder()
+        batcher = OrderBatcher(window_sec=0.5, submit=submit)
+
+        out = _place_concurrently(batcher, ["a", "b", "c"])
+
+        assert out == {t: {"orderID": f"ord-{t}"} for t in "abc"}
+        assert len(submit.batches) == 1
+        assert sorted(submit.batches[0]) == ["a", "b", "c"]
+
+    def test_full_batch_flushes_without_waiting_window(self):
+        submit = _Recorder()
+        batcher = OrderBatcher(window_sec=30, max_batch=2, submit=submit)
+
+        out = _place_concurrently(batcher, ["a", "b"])
+
+        assert len(out) == 2 and submit.batches and len(submit.batches[0]) == 2
+
+    def test_rejected_order_raises_for_its_caller_only(self):
+        submit = _Recorder(reject={"b"})
+        batcher = OrderBatcher(window_sec=0.5, submit=submit)
+
+        out = _place_concurrently(batcher, ["a", "b"])
+
+        assert out["a"] == {"orderID": "ord-a"}
+        assert isinstance(out["b"], RuntimeError)
+
+    def test_submit_exception_fails_whole_batch(self):
+        def boom(requests):
+            raise ConnectionError("down")
+
+        batcher = OrderBatcher(window_sec=0, submit=boom)
+        with pytest.raises(RuntimeError, match="down"):
+            batcher.place_limit_buy("a", 0.4, 10.0)
@@ -313,6 +313,123 @@ class TestCheckAndManageOrders:
         assert summary.checked == 0
 
 
+class TestBatchStatusPolling:
+    """Open orders are fetched in one call; only missing orders are queried individually."""
+
+    def _placed(self, db_path: Path, n: int) -> list[SignalRecord]:
+        slug = "nba-nyk-bos-2026-02-15"
+        _make_trade_job(db_path, event_slug=slug)
+        for i in range(n):
+            sig_id = _make_signal(db_path, event_slug=slug, token_id=f"tok_{i}")
+            update_order_status(sig_id, f"order_{i}", "placed", db_path=db_path)
+            update_order_lifecycle(
+                sig_id,
+                order_placed_at=datetime.now(timezone.utc).isoformat(),
+                order_original_price=0.44,
+                db_path=db_path,
+            )
+        return get_active_placed_orders(db_path=db_path)
+
+    @patch("src.connectors.polymarket.get_order_status")
+    @patch("src.connectors.polymarket.get_open_orders")
+    def test_every_order_checked_with_single_batch_call(
+        self, mock_open, mock_status, db_path: Path,
+    ):
+        placed = self._placed(db_path, 15)
+        mock_open.return_value = {
+            s.order_id: {"id": s.order_id, "status": "LIVE"} for s in placed[1:]
+        }
+        mock_status.return_value = {"status": "matched", "price": "0.44"}
+
+        from src.scheduler.order_manager import check_and_manage_orders
+
+        summary = check_and_manage_orders(execution_mode="live", db_path=str(db_path))
+
+        assert summary.checked == 15  # order_check_batch_size の上限なし
+        assert summary.filled == 1
+        assert summary.kept == 14
+        mock_open.assert_called_once()
+        # open 一覧に無い注文だけ個別取得
+        mock_status.assert_called_once_with(placed[0].order_id)
+
+    @patch("src.connectors.polymarket.get_order_status", return_value={"status": "open"})
+    @patch("src.connectors.polymarket.get_open_orders", side_effect=RuntimeError("down"))
+    def test_batch_failure_falls_back_to_per_order(self, mock_open, mock_status, db_path: Path):
+        self._placed(db_path, 3)
+
+        from src.scheduler.order_manager import check_and_manage_orders
+
+        summary = check_and_manage_orders(execution_mode="live", db_path=str(db_path))
+
+        assert summary.checked == 3
+        assert mock_status.call_count == 3
+
+    @patch("src.scheduler.order_manager._get_best_ask", return_value=None)
+    @patch("src.connectors.polymarket.get_order_status")
+    def test_check_single_order_uses_given_status(self, mock_status, mock_ask, db_path: Path):
+        signal = self._placed(db_path, 1)[0]
+
+        from src.scheduler.order_manager import check_single_order
+
+        result = check_single_order(signal, str(db_path), status={"status": "LIVE"})
+
+        assert result.action == "kept"
+        mock_status.assert_not_called()
+
+
+
+class TestBatchCancelReplace:
+    """A tick's expires and re-places go out as one batch cancel + one batch place."""
+
+    def _stale(self, db_path: Path, replace_counts: list[int]) -> None:
+        slug = "nba-nyk-bos-2026-02-15"
+        _make_trade_job(db_path, event_slug=slug)
+        placed_at = (datetime.now(timezone.utc) - timedelta(minutes=10)).isoformat()
+        for i, count in enumerate(replace_counts):
+            sig_id = _make_signal(db_path, event_slug=slug, token_id=f"tok_{i}")
+            update_order_status(sig_id, f"order_{i}", "placed", db_path=db_path)
+            update_order_lifecycle(
+                sig_id,
+                order_placed_at=placed_at,
+                order_original_price=0.44,
+                order_replace_count=count,
+                db_path=db_path,
+            )
+
+    @patch("src.scheduler.order_manager._get_best_ask", return_value=0.48)
+    @patch("src.connectors.polymarket.place_limit_buys_batch")
+    @patch("src.connectors.polymarket.cancel_orders_batch")
+    @patch("src.connectors.polymarket.get_open_orders")
+    def test_expire_and_replace_batched(
+        self, mock_open, mock_cancel, mock_place, mock_ask, db_path: Path,
+    ):
+        from src.connectors.polymarket import OrderPlacement
+
+        self._stale(db_path, [3, 0, 1])  # order_0: max replaces → expire
+        mock_open.return_value = {
+            f"order_{i}": {"id": f"order_{i}", "status": "LIVE"} for i in range(3)
+        }
+        mock_cancel.side_effect = lambda ids: {oid: True for oid in ids}
+        mock_place.side_effect = lambda reqs: [
+            OrderPlacement(r, response={"orderID": f"new_{r.token_id}"}) if r.token_id == "tok_1"
+            else OrderPlacement(r, error="rejected")
+            for r in reqs
+        ]
+
+        from src.scheduler.order_manager import check_and_manage_orders
+
+        summary = check_and_manage_orders(execution_mode="live", db_path=str(db_path))
+
+        assert (summary.expired, summary.replaced, summary.errors) == (1, 1, 1)
+        mock_cancel.assert_called_once()
+        assert sorted(mock_cancel.call_args[0][0]) == ["order_0", "order_1", "order_2"]
+        mock_place.assert_called_once()
+        assert [r.token_id for r in mock_place.call_args[0][0]] == ["tok_1", "tok_2"]
+        replaced = [r for r in summary.results if r.action == "replaced"][0]
+        assert replaced.new_order_id == "new_tok_1"
+        assert {o.order_id for o in get_active_placed_orders(db_path=db_path)} >= {"new_tok_1"}
+
+
 class TestSignalRecordFields:
     """Verify new SignalRecord fields work correctly."""
 
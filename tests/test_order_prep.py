@@ -0,0 +1,185 @@
+"""Tests for the order-preparation cache and latency tracker (src/connectors/order_prep.py)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.connectors import order_prep
+from src.connectors.order_prep import (
+    OrderLatencyTracker,
+    OrderPrepCache,
+    OrderTemplate,
+    sign_limit_buy,
+)
+
+KEY = "0x" + "11" * 32
+
+
+def _tpl(token_id: str = "123", prepared_at: float = 1000.0, **kw) -> OrderTemplate:
+    fields = {"tick_size": "0.01", "neg_risk": False, "fee_rate_bps": 0}
+    fields.update(kw)
+    return OrderTemplate(token_id=token_id, prepared_at=prepared_at, **fields)
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def sdk_client():
+    """Real SDK client (no network) with market lookups counted."""
+    from py_clob_client.client import ClobClient
+
+    client = ClobClient("https://clob.test", key=KEY, chain_id=137)
+    client.lookups = 0
+
+    def lookup(value):
+        def _fn(token_id):
+            client.lookups += 1
+            return value
+        return _fn
+
+    client.get_tick_size = lookup("0.01")
+    client.get_neg_risk = lookup(False)
+    client.get_fee_rate_bps = lookup(0)
+    return client
+
+
+class TestOrderPrepCache:
+    def test_ttl_expiry(self):
+        clock = _Clock()
+        cache = OrderPrepCache(ttl_sec=60, path="", clock=clock)
+        cache.put(_tpl())
+        clock.now += 59
+        assert cache.get("123") is not None
+        clock.now += 1
+        assert cache.get("123") is None
+
+    def test_persisted_across_instances(self, tmp_path: Path):
+        path = tmp_path / "templates.json"
+        clock = _Clock()
+        OrderPrepCache(ttl_sec=60, path=path, clock=clock).put(_tpl(neg_risk=True))
+
+        reloaded = OrderPrepCache(ttl_sec=60, path=path, clock=clock).get("123")
+
+        assert reloaded == _tpl(neg_risk=True)
+
+    def test_invalidate_is_persisted(self, tmp_path: Path):
+        path = tmp_path / "templates.json"
+        clock = _Clock()
+        cache = OrderPrepCache(ttl_sec=60, path=path, clock=clock)
+        cache.put(_tpl("a"))
+        cache.put(_tpl("b"))
+        cache.invalidate("a")
+
+        fresh = OrderPrepCache(ttl_sec=60, path=path, clock=clock)
+        assert fresh.get("a") is None
+        assert fresh.get("b") is not None
+
+    def test_corrupt_file_ignored(self, tmp_path: Path):
+        path = tmp_path / "templates.json"
+        path.write_text("{not json")
+        assert OrderPrepCache(ttl_sec=60, path=path).get("123") is None
+
+
+class TestSignLimitBuy:
+    # sign_limit_buy は SDK の create_order を内部 API で再現しているので、
+    # pyproject の py-clob-client 上限を上げるときはここで一致を確認する
+    @pytest.mark.parametrize(
+        ("tick_size", "neg_risk", "fee_rate_bps", "price", "size"),
+        [
+            ("0.01", False, 0, 0.41, 24.39),
+            ("0.001", True, 0, 0.413, 24.39),
+            ("0.1", False, 100, 0.4, 10),
+            ("0.0001", True, 25, 0.4137, 7.5),
+        ],
+    )
+    def test_matches_sdk_order(self, sdk_client, tick_size, neg_risk, fee_rate_bps, price, size):
+        from eth_account import Account
+        from py_clob_client.clob_types import OrderArgs
+        from py_clob_client.order_builder.constants import BUY
+
+        sdk_client.get_tick_size = lambda token_id: tick_size
+        sdk_client.get_neg_risk = lambda token_id: neg_risk
+        sdk_client.get_fee_rate_bps = lambda token_id: fee_rate_bps
+        sdk = sdk_client.create_order(OrderArgs(token_id="123", price=price, size=size, side=BUY))
+        tpl = _tpl(tick_size=tick_size, neg_risk=neg_risk, fee_rate_bps=fee_rate_bps)
+        signed = sign_limit_buy(sdk_client.builder, tpl, price, size)
+
+        ours, theirs = signed.dict(), sdk.dict()
+        for volatile in ("salt", "signature"):
+            ours.pop(volatile)
+            theirs.pop(volatile)
+        assert ours == theirs
+
+        # 署名は SDK と同じ exchange (neg-risk なら NegRisk exchange) の domain で検証できる
+        exchange = order_prep._exchange_builder(sdk_client.builder, neg_risk)
+        for order in (signed, sdk):
+            digest = bytes.fromhex(exchange._create_struct_hash(order.order)[2:])
+            assert Account._recover_hash(digest, signature=order.signature) == ours["signer"]
+
+    def test_rejects_price_outside_tick_range(self, sdk_client):
+        with pytest.raises(ValueError, match="price"):
+            sign_limit_buy(sdk_client.builder, _tpl(tick_size="0.01"), 0.995, 10)
+
+
+class TestPlaceLimitBuyLatency:
+    @pytest.fixture()
+    def placed(self, sdk_client, monkeypatch, tmp_path):
+        from src.connectors import polymarket
+        from src.connectors.rate_limit import HostRateLimiter
+
+        posts = []
+        sdk_client.post_order = lambda order, order_type: posts.append(order) or {
+            "success": True, "orderID": f"ord-{len(posts)}",
+        }
+        monkeypatch.setattr(polymarket, "_create_client", lambda authenticated=False: sdk_client)
+        limiter = HostRateLimiter("clob.test", 1000, burst=1000)
+        monkeypatch.setattr(polymarket, "_get_clob_rate_limiter", lambda: limiter)
+        monkeypatch.setattr(polymarket.settings, "polymarket_private_key", KEY)
+        monkeypatch.setattr(order_prep, "cache", OrderPrepCache(path=tmp_path / "t.json"))
+        monkeypatch.setattr(order_prep, "latency", OrderLatencyTracker())
+        return polymarket, posts
+
+    def test_cold_then_warm(self, placed, sdk_client):
+        polymarket, posts = placed
+
+        polymarket.place_limit_buy("123", 0.41, 10.0)
+        assert sdk_client.lookups == 3
+        polymarket.place_limit_buy("123", 0.42, 10.0)
+        assert sdk_client.lookups == 3  # テンプレート再利用で解決なし
+
+        paths = {s.path: s for s in order_prep.latency.summary()}
+        assert paths["cold"].count == 1
+        assert paths["warm"].count == 1
+        assert len(posts) == 2
+
+    def test_prepare_order_templates_warms_ahead(self, placed, sdk_client):
+        polymarket, _ = placed
+
+        assert polymarket.prepare_order_templates(["123", "456", "123"]) == 2
+        assert polymarket.prepare_order_templates(["123"]) == 0
+        polymarket.place_limit_buy("456", 0.41, 10.0)
+
+        assert [s.path for s in order_prep.latency.summary()] == ["warm"]
+
+
+class TestOrderLatencyTracker:
+    def test_summary_and_reset(self):
+        tracker = OrderLatencyTracker()
+        for ms in (100, 110, 120, 400):
+            tracker.record(False, prep_ms=ms - 20, ack_ms=ms)
+        tracker.record(True, prep_ms=3, ack_ms=60)
+
+        summary = {s.path: s for s in tracker.summary(reset=True)}
+
+        assert summary["cold"].count == 4
+        assert summary["cold"].ack_p50_ms == pytest.approx(115)
+        assert summary["warm"].ack_p95_ms == pytest.approx(60)
+        assert tracker.summary() == []
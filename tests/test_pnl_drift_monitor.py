@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from src.risk.calibration_monitor import (
     PnLGapHealthMetrics,
     StructuralChangeHealthMetrics,
@@ -138,3 +140,89 @@ def test_cusum_score_detects_distribution_shift() -> None:
     assert flat_score == 0.0
     assert shifted_score > flat_score
     assert shifted_score > 1.0
+
+
+def test_band_checks_match_per_band_queries(tmp_path) -> None:
+    """Single-query health equals the per-band/per-window SQL it replaced."""
+    import random
+
+    from src.risk.calibration_monitor import (
+        compute_calibration_health,
+        compute_pnl_divergence_health,
+        compute_structural_change_health,
+    )
+    from src.store.db import (
+        _connect,
+        get_band_decomposed_stats,
+        get_band_win_rates,
+        get_daily_gap_series,
+        get_expected_realized_gap_by_band,
+        get_expected_realized_gap_summary,
+        log_result,
+        log_signal,
+        rebuild_risk_ledger,
+    )
+
+    db = tmp_path / "bands.db"
+    rng = random.Random(7)
+    bands = ["0.20-0.25", "0.25-0.30", "0.35-0.40", "0.55-0.60", ""]
+    for i in range(240):
+        price = rng.uniform(0.2, 0.6)
+        sid = log_signal(
+            game_title=f"g{i}", event_slug=f"nba-{i}", team="BOS", side="BUY",
+            poly_price=price, book_prob=0.5, edge_pct=3.0, kelly_size=rng.uniform(5, 40),
+            token_id=f"t{i}", expected_win_rate=price + rng.uniform(-0.05, 0.1),
+            price_band=rng.choice(bands),
+            strategy_mode=rng.choice(["calibration", "calibration", "bookmaker"]),
+            db_path=db,
+        )
+        won = rng.random() < 0.5
+        log_result(signal_id=sid, outcome="x", won=won,
+                   pnl=rng.uniform(1, 30) if won else -rng.uniform(1, 30), db_path=db)
+        if i % 60 == 0:
+            # 途中の読み出しで台帳を細切れに更新させる
+            compute_calibration_health(db)
+    # 過去 40 日に散らばらせる (log_result を通さない書き換え → 再構築)
+    conn = _connect(db)
+    for rid in range(1, 241):
+        day = 1 + rng.randrange(40)
+        conn.execute(
+            "UPDATE results SET settled_at = ? WHERE id = ?",
+            (f"2026-0{1 + day // 31}-{1 + day % 31:02d}T12:00:00+00:00", rid),
+        )
+    conn.commit()
+    conn.close()
+    rebuild_risk_ledger(db_path=db)
+    as_of = "2026-02-09"
+
+    health = {h.band_label: h for h in compute_calibration_health(db, min_sample=5)}
+    win_rates = get_band_win_rates(db_path=db)
+    decomposed = get_band_decomposed_stats(db_path=db)
+    assert health
+    for label, h in health.items():
+        assert h.sample_size == win_rates[label]["total"] == decomposed[label]["total"]
+        assert h.rolling_win_rate == pytest.approx(
+            win_rates[label]["wins"] / win_rates[label]["total"]
+        )
+
+    div = compute_pnl_divergence_health(db, as_of_date=as_of, short_days=7, long_days=28)
+    for key, days in (("short", 7), ("long", 28)):
+        ref = get_expected_realized_gap_summary(days=days, as_of_date=as_of, db_path=db)
+        got = div["total"][key]
+        assert got.sample_size == ref["total"]
+        assert got.gap_usd == pytest.approx(ref["gap_usd"])
+        ref_bands = get_expected_realized_gap_by_band(days=days, as_of_date=as_of, db_path=db)
+        assert set(div["bands"][key]) == set(ref_bands)
+        for label, stats in ref_bands.items():
+            assert div["bands"][key][label].sample_size == stats["total"]
+            assert div["bands"][key][label].expected_pnl == pytest.approx(stats["expected_pnl"])
+
+    structural = compute_structural_change_health(db, as_of_date=as_of, window_days=28)
+    ref_total = get_daily_gap_series(days=28, as_of_date=as_of, db_path=db)
+    assert structural["bands"]
+    assert structural["total"].sample_points == len(ref_total)
+    assert structural["total"].cusum_score == pytest.approx(_cusum_score(ref_total))
+    for label, metrics in structural["bands"].items():
+        series = get_daily_gap_series(days=28, as_of_date=as_of, band_label=label, db_path=db)
+        assert metrics.sample_points == len(series)
+        assert metrics.cusum_score == pytest.approx(_cusum_score(series))
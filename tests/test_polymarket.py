@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from src.connectors.polymarket import (
     MarketToken,
     NBAMarket,
@@ -105,3 +107,351 @@ class TestNBAMarketProperties:
         )
         assert market.yes_price is None
         assert market.no_price is None
+
+
+class _FakeClobClient:
+    """Stand-in for py_clob_client.client.ClobClient that counts derivations."""
+
+    instances: list[_FakeClobClient] = []
+    derive_calls = 0
+
+    def __init__(self, host, key=None, **kwargs):
+        self.host = host
+        self.key = key
+        self.creds = None
+        _FakeClobClient.instances.append(self)
+
+    def get_address(self):
+        return "0x00000000000000000000000000000000000000aa" if self.key else None
+
+    def create_or_derive_api_creds(self):
+        from py_clob_client.clob_types import ApiCreds
+
+        _FakeClobClient.derive_calls += 1
+        return ApiCreds("key", "secret", "pass")
+
+    def set_api_creds(self, creds):
+        self.creds = creds
+
+
+@pytest.fixture()
+def fake_clob(monkeypatch, tmp_path):
+    import py_clob_client.client
+
+    from src.connectors import polymarket
+
+    _FakeClobClient.instances = []
+    _FakeClobClient.derive_calls = 0
+    monkeypatch.setattr(py_clob_client.client, "ClobClient", _FakeClobClient)
+    monkeypatch.setattr(polymarket.settings, "polymarket_private_key", "0x" + "11" * 32)
+    monkeypatch.setattr(polymarket.settings, "http_proxy", "")
+    monkeypatch.setattr(
+        polymarket.settings, "clob_creds_cache_path", str(tmp_path / "creds.json"),
+    )
+    polymarket.reset_clob_clients()
+    yield polymarket
+    polymarket.reset_clob_clients()
+
+
+class TestClobClientCache:
+    def test_authenticated_client_reused(self, fake_clob):
+        a = fake_clob._create_client(authenticated=True)
+        b = fake_clob._create_client(authenticated=True)
+        assert a is b
+        assert a.creds.api_key == "key"
+        assert _FakeClobClient.derive_calls == 1
+
+    def test_public_client_reused_and_separate(self, fake_clob):
+        pub = fake_clob._create_client()
+        assert pub is fake_clob._create_client()
+        assert pub is not fake_clob._create_client(authenticated=True)
+
+    def test_creds_loaded_from_disk_after_restart(self, fake_clob):
+        fake_clob._create_client(authenticated=True)
+        fake_clob.reset_clob_clients()  # 新プロセス相当
+        client = fake_clob._create_client(authenticated=True)
+        assert client.creds.api_key == "key"
+        assert _FakeClobClient.derive_calls == 1
+
+    def test_clear_creds_forces_rederive(self, fake_clob):
+        fake_clob._create_client(authenticated=True)
+        fake_clob.reset_clob_clients(clear_creds=True)
+        fake_clob._create_client(authenticated=True)
+        assert _FakeClobClient.derive_calls == 2
+
+    def test_concurrent_first_use_builds_once(self, fake_clob):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: fake_clob._create_client(True), range(32)))
+        assert all(c is clients[0] for c in clients)
+        assert _FakeClobClient.derive_calls == 1
+
+
+def _gamma_event(slug: str) -> dict:
+    return {
+        "slug": slug,
+        "title": slug,
+        "markets": [
+            {
+                "sportsMarketType": "moneyline",
+                "conditionId": f"cond-{slug}",
+                "outcomes": '["Away", "Home"]',
+                "outcomePrices": '["0.4", "0.6"]',
+                "clobTokenIds": '["tok-a", "tok-b"]',
+            }
+        ],
+    }
+
+
+@pytest.fixture()
+def gamma_stub(monkeypatch):
+    """Route Gamma /events through an in-memory transport; records requested slugs."""
+    import httpx
+
+    from src.connectors import polymarket
+
+    state = {"requests": [], "unlisted": set()}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        slugs = request.url.params.get_list("slug")
+        state["requests"].append(slugs)
+        events = [_gamma_event(s) for s in slugs if s not in state["unlisted"]]
+        return httpx.Response(200, json=events)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(polymarket, "_get_httpx_client", lambda: client)
+    yield state
+    client.close()
+
+
+def _slate(n: int, date: str = "2026-02-08") -> list[tuple[str, str, str]]:
+    from src.connectors.team_mapping import NBA_TEAMS
+
+    teams = list(NBA_TEAMS)
+    return [(teams[i % 30], teams[(i + 1) % 30], date) for i in range(n)]
+
+
+class TestBatchedDiscovery:
+    def test_requests_scale_with_batches_not_games(self, gamma_stub):
+        from src.connectors.polymarket import GAMMA_SLUG_BATCH_SIZE, fetch_moneylines_batch
+
+        games = _slate(GAMMA_SLUG_BATCH_SIZE + 5)
+        index = fetch_moneylines_batch(games)
+
+        assert len(gamma_stub["requests"]) == 2
+        assert len(index) == len(games)
+        ml = next(iter(index.values()))
+        assert ml.prices == [0.4, 0.6]
+        assert ml.token_ids == ["tok-a", "tok-b"]
+
+    def test_snapshot_batches_then_falls_back_for_unlisted_slug(self, gamma_stub):
+        from src.connectors.market_snapshot import MarketSnapshot
+        from src.connectors.team_mapping import build_event_slug
+
+        games = _slate(3) + _slate(2, date="2026-02-09")
+        missing = build_event_slug(*games[2])
+        gamma_stub["unlisted"].add(missing)
+
+        snapshot = MarketSnapshot()
+        snapshot.register_games(games)
+        assert gamma_stub["requests"] == []  # 初回参照まで取得しない
+        for game in games:
+            snapshot.moneyline(*game)
+        assert snapshot.moneyline(*games[2]) is None  # 2 回目はキャッシュ
+
+        # 日付を跨いでも 1 バッチ + 未掲載 slug の個別取得 1 回のみ
+        assert gamma_stub["requests"] == [[build_event_slug(*g) for g in games], [missing]]
+        assert set(snapshot.moneylines) == {build_event_slug(*g) for g in games} - {missing}
+
+
+def _raw_book(tid: str) -> dict:
+    return {
+        "asset_id": tid,
+        "asks": [{"price": "0.42", "size": "100"}],
+        "bids": [{"price": "0.40", "size": "50"}],
+    }
+
+
+@pytest.fixture()
+def clob_stub(monkeypatch):
+    """In-memory CLOB: POST /books (optionally disabled) and GET /book."""
+    import json
+
+    import httpx
+
+    from src.connectors import polymarket
+    from src.connectors.rate_limit import HostRateLimiter
+
+    state = {"bulk": [], "single": [], "bulk_enabled": True, "missing": set()}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST" and request.url.path == "/books":
+            ids = [p["token_id"] for p in json.loads(request.content)]
+            state["bulk"].append(ids)
+            if not state["bulk_enabled"]:
+                return httpx.Response(404)
+            return httpx.Response(
+                200, json=[_raw_book(t) for t in ids if t not in state["missing"]],
+            )
+        if request.url.path == "/book":
+            tid = request.url.params["token_id"]
+            state["single"].append(tid)
+            if tid in state["missing"]:
+                return httpx.Response(404)
+            return httpx.Response(200, json=_raw_book(tid))
+        return httpx.Response(404)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(polymarket.settings, "polymarket_host", "https://clob.test")
+    monkeypatch.setattr(polymarket, "_get_clob_http_client", lambda: client)
+    limiter = HostRateLimiter("clob.test", 1000, burst=1000)
+    monkeypatch.setattr(polymarket, "_get_clob_rate_limiter", lambda: limiter)
+    yield state
+    client.close()
+
+
+class TestFetchOrderBooksBatch:
+    def test_bulk_endpoint_chunks_and_dedupes(self, clob_stub):
+        from src.connectors.polymarket import ORDER_BOOKS_BULK_CHUNK, fetch_order_books_batch
+
+        ids = [f"t{i}" for i in range(ORDER_BOOKS_BULK_CHUNK + 3)]
+        books = fetch_order_books_batch(ids + ids[:5])
+
+        assert set(books) == set(ids)
+        assert [len(c) for c in clob_stub["bulk"]] == [ORDER_BOOKS_BULK_CHUNK, 3]
+        assert clob_stub["single"] == []
+
+    def test_falls_back_to_concurrent_single_fetch(self, clob_stub):
+        from src.connectors.polymarket import fetch_order_books_batch
+
+        clob_stub["bulk_enabled"] = False
+        clob_stub["missing"].add("t2")
+        books = fetch_order_books_batch(["t0", "t1", "t2", "t3"])
+
+        assert set(books) == {"t0", "t1", "t3"}
+        assert sorted(clob_stub["single"]) == ["t0", "t1", "t2", "t3"]
+
+    def test_books_feed_extract_liquidity(self, clob_stub):
+        from src.connectors.polymarket import fetch_order_book_safe
+        from src.sizing.liquidity import extract_liquidity
+
+        snap = extract_liquidity(fetch_order_book_safe("t9"), "t9")
+        assert snap.best_ask == pytest.approx(0.42)
+        assert snap.best_bid == pytest.approx(0.40)
+
+    def test_empty_input(self, clob_stub):
+        from src.connectors.polymarket import fetch_order_books_batch
+
+        assert fetch_order_books_batch([]) == {}
+        assert clob_stub["bulk"] == []
+
+
+class _FakeTradingClient:
+    """SDK stand-in for create_order / post_orders / cancel_orders."""
+
+    def __init__(self):
+        self.posts: list[list] = []
+        self.cancels: list[list[str]] = []
+        self.reject: set[str] = set()
+        self.sign_fail: set[str] = set()
+        self.cancel_error: Exception | None = None
+
+    def create_order(self, args):
+        if args.token_id in self.sign_fail:
+            raise ValueError("bad tick size")
+        return {"token_id": args.token_id, "price": args.price, "size": args.size}
+
+    def post_orders(self, args):
+        self.posts.append([a.order for a in args])
+        out = []
+        for a in args:
+            tid = a.order["token_id"]
+            if tid in self.reject:
+                out.append({"success": False, "errorMsg": "not enough balance", "orderID": ""})
+            else:
+                out.append({"success": True, "errorMsg": "", "orderID": f"ord-{tid}"})
+        return out
+
+    def cancel_orders(self, order_ids):
+        if self.cancel_error:
+            raise self.cancel_error
+        self.cancels.append(list(order_ids))
+        return {
+            "canceled": [o for o in order_ids if o != "gone"],
+            "not_canceled": {"gone": "order already matched"} if "gone" in order_ids else {},
+        }
+
+    def cancel(self, order_id):
+        self.cancels.append([order_id])
+        return {"canceled": [order_id]}
+
+
+@pytest.fixture()
+def trading_stub(monkeypatch):
+    from src.connectors import polymarket
+    from src.connectors.rate_limit import HostRateLimiter
+
+    client = _FakeTradingClient()
+    monkeypatch.setattr(polymarket, "_create_client", lambda authenticated=False: client)
+    monkeypatch.setattr(polymarket.settings, "order_prep_enabled", False)
+    limiter = HostRateLimiter("clob.test", 1000, burst=1000)
+    monkeypatch.setattr(polymarket, "_get_clob_rate_limiter", lambda: limiter)
+    return client
+
+
+class TestPlaceLimitBuysBatch:
+    def test_one_post_with_per_order_results(self, trading_stub):
+        from src.connectors.polymarket import LimitBuyRequest, place_limit_buys_batch
+
+        trading_stub.reject.add("t1")
+        trading_stub.sign_fail.add("t2")
+        reqs = [LimitBuyRequest(f"t{i}", 0.40, 20.0) for i in range(4)]
+
+        results = place_limit_buys_batch(reqs)
+
+        assert [r.ok for r in results] == [True, False, False, True]
+        assert results[0].order_id == "ord-t0"
+        assert results[1].error == "not enough balance"
+        assert results[2].error.startswith("sign failed")
+        assert len(trading_stub.posts) == 1
+        assert [o["token_id"] for o in trading_stub.posts[0]] == ["t0", "t1", "t3"]
+        assert trading_stub.posts[0][0]["size"] == pytest.approx(50.0)
+
+    def test_chunks_by_post_limit(self, trading_stub):
+        from src.connectors.polymarket import (
+            POST_ORDERS_MAX_BATCH,
+            LimitBuyRequest,
+            place_limit_buys_batch,
+        )
+
+        reqs = [LimitBuyRequest(f"t{i}", 0.5, 10.0) for i in range(POST_ORDERS_MAX_BATCH + 2)]
+        results = place_limit_buys_batch(reqs)
+
+        assert all(r.ok for r in results)
+        assert [len(p) for p in trading_stub.posts] == [POST_ORDERS_MAX_BATCH, 2]
+
+    def test_empty(self, trading_stub):
+        from src.connectors.polymarket import place_limit_buys_batch
+
+        assert place_limit_buys_batch([]) == []
+        assert trading_stub.posts == []
+
+
+class TestCancelOrdersBatch:
+    def test_single_request_with_per_order_flags(self, trading_stub):
+        from src.connectors.polymarket import cancel_orders_batch
+
+        result = cancel_orders_batch(["a", "gone", "b", "a", ""])
+
+        assert result == {"a": True, "gone": False, "b": True}
+        assert trading_stub.cancels == [["a", "gone", "b"]]
+
+    def test_falls_back_to_single_cancels(self, trading_stub):
+        from src.connectors.polymarket import cancel_orders_batch
+
+        trading_stub.cancel_error = RuntimeError("500")
+        result = cancel_orders_batch(["a", "b"])
+
+        assert result == {"a": True, "b": True}
+        assert trading_stub.cancels == [["a"], ["b"]]
@@ -40,103 +40,120 @@ def _make_moneyline(
     )
 
 
+_BATCH = "src.connectors.polymarket.fetch_moneylines_batch"
+_SINGLE = "src.connectors.polymarket.fetch_moneyline_for_game"
+
+
 class TestFetchAllNbaMoneylines:
-    @patch("src.connectors.polymarket_discovery.fetch_moneyline_for_game")
+    @patch(_SINGLE)
+    @patch(_BATCH)
     @patch("src.connectors.polymarket_discovery.fetch_todays_games")
-    def test_basic_flow(self, mock_games, mock_ml):
+    def test_basic_flow(self, mock_games, mock_batch, mock_ml):
         mock_games.return_value = [_make_game()]
-        mock_ml.return_value = _make_moneyline()
+        mock_batch.return_value = {"nba-nyk-bos-2026-02-08": _make_moneyline()}
 
         result = fetch_all_nba_moneylines()
 
         assert len(result) == 1
         assert result[0].event_slug == "nba-nyk-bos-2026-02-08"
-        mock_ml.assert_called_once_with(
-            "New York Knicks", "Boston Celtics", "2026-02-08",
+        mock_batch.assert_called_once_with(
+            [("New York Knicks", "Boston Celtics", "2026-02-08")],
         )
+        mock_ml.assert_not_called()
 
-    @patch("src.connectors.polymarket_discovery.fetch_moneyline_for_game")
+    @patch(_SINGLE)
+    @patch(_BATCH)
     @patch("src.connectors.polymarket_discovery.fetch_todays_games")
-    def test_utc_to_eastern_date_conversion(self, mock_games, mock_ml):
+    def test_utc_to_eastern_date_conversion(self, mock_games, mock_batch, mock_ml):
         """Game at 2026-02-09T03:00:00Z = 2026-02-08 22:00 ET → date=2026-02-08."""
         mock_games.return_value = [
             _make_game(time_utc="2026-02-09T03:00:00Z"),
         ]
-        mock_ml.return_value = _make_moneyline()
+        mock_batch.return_value = {"nba-nyk-bos-2026-02-08": _make_moneyline()}
 
         fetch_all_nba_moneylines()
 
-        mock_ml.assert_called_once_with(
-            "New York Knicks", "Boston Celtics", "2026-02-08",
+        mock_batch.assert_called_once_with(
+            [("New York Knicks", "Boston Celtics", "2026-02-08")],
         )
 
-    @patch("src.connectors.polymarket_discovery.fetch_moneyline_for_game")
+    @patch(_SINGLE)
+    @patch(_BATCH)
     @patch("src.connectors.polymarket_discovery.fetch_todays_games")
-    def test_utc_to_eastern_same_day(self, mock_games, mock_ml):
+    def test_utc_to_eastern_same_day(self, mock_games, mock_batch, mock_ml):
         """Game at 2026-02-08T20:00:00Z = 2026-02-08 15:00 ET → date=2026-02-08."""
         mock_games.return_value = [
             _make_game(time_utc="2026-02-08T20:00:00Z"),
         ]
-        mock_ml.return_value = _make_moneyline()
+        mock_batch.return_value = {"nba-nyk-bos-2026-02-08": _make_moneyline()}
 
         fetch_all_nba_moneylines()
 
-        mock_ml.assert_called_once_with(
-            "New York Knicks", "Boston Celtics", "2026-02-08",
+        mock_batch.assert_called_once_with(
+            [("New York Knicks", "Boston Celtics", "2026-02-08")],
         )
 
-    @patch("src.connectors.polymarket_discovery.fetch_moneyline_for_game")
+    @patch(_SINGLE)
+    @patch(_BATCH)
     @patch("src.connectors.polymarket_discovery.fetch_todays_games")
-    def test_no_games(self, mock_games, mock_ml):
+    def test_no_games(self, mock_games, mock_batch, mock_ml):
         mock_games.return_value = []
 
         result = fetch_all_nba_moneylines()
 
         assert result == []
+        mock_batch.assert_not_called()
         mock_ml.assert_not_called()
 
-    @patch("src.connectors.polymarket_discovery.fetch_moneyline_for_game")
+    @patch(_SINGLE)
+    @patch(_BATCH)
     @patch("src.connectors.polymarket_discovery.fetch_todays_games")
-    def test_moneyline_not_found(self, mock_games, mock_ml):
+    def test_moneyline_not_found(self, mock_games, mock_batch, mock_ml):
         mock_games.return_value = [_make_game()]
+        mock_batch.return_value = {}
         mock_ml.return_value = None
 
         result = fetch_all_nba_moneylines()
 
         assert result == []
+        # バッチに無い slug は個別取得にフォールバック
+        mock_ml.assert_called_once_with("New York Knicks", "Boston Celtics", "2026-02-08")
 
-    @patch("src.connectors.polymarket_discovery.fetch_moneyline_for_game")
+    @patch(_SINGLE)
+    @patch(_BATCH)
     @patch("src.connectors.polymarket_discovery.fetch_todays_games")
-    def test_bad_game_time_skipped(self, mock_games, mock_ml):
+    def test_bad_game_time_skipped(self, mock_games, mock_batch, mock_ml):
         mock_games.return_value = [
             _make_game(time_utc="not-a-date"),
             _make_game(game_id="002", time_utc="2026-02-08T20:00:00Z"),
         ]
-        mock_ml.return_value = _make_moneyline()
+        mock_batch.return_value = {"nba-nyk-bos-2026-02-08": _make_moneyline()}
 
         result = fetch_all_nba_moneylines()
 
         # First game skipped, second succeeds
         assert len(result) == 1
-        assert mock_ml.call_count == 1
+        assert len(mock_batch.call_args.args[0]) == 1
 
-    @patch("src.connectors.polymarket_discovery.fetch_moneyline_for_game")
+    @patch(_SINGLE)
+    @patch(_BATCH)
     @patch("src.connectors.polymarket_discovery.fetch_todays_games")
-    def test_unknown_team_skipped(self, mock_games, mock_ml):
+    def test_unknown_team_skipped(self, mock_games, mock_batch, mock_ml):
         mock_games.return_value = [
             _make_game(home="Unknown Team", away="Another Team"),
         ]
-        mock_ml.return_value = None
 
         result = fetch_all_nba_moneylines()
 
         # build_event_slug returns None for unknown teams → skipped
         assert result == []
+        mock_batch.assert_not_called()
         mock_ml.assert_not_called()
 
-    @patch("src.connectors.polymarket_discovery.fetch_moneyline_for_game")
+    @patch(_SINGLE)
+    @patch(_BATCH)
     @patch("src.connectors.polymarket_discovery.fetch_todays_games")
-    def test_multiple_games(self, mock_games, mock_ml):
+    def test_multiple_games(self, mock_games, mock_batch, mock_ml):
         games = [
             _make_game(game_id="001", home="Boston Celtics", away="New York Knicks",
                        time_utc="2026-02-08T20:00:00Z"),
@@ -147,9 +164,10 @@ class TestFetchAllNbaMoneylines:
 
         ml1 = _make_moneyline(slug="nba-nyk-bos-2026-02-08")
         ml2 = _make_moneyline(slug="nba-was-mia-2026-02-08", home="Miami Heat", away="Washington Wizards")
-        mock_ml.side_effect = [ml1, ml2]
+        mock_batch.return_value = {ml1.event_slug: ml1, ml2.event_slug: ml2}
 
         result = fetch_all_nba_moneylines()
 
         assert len(result) == 2
-        assert mock_ml.call_count == 2
+        assert mock_batch.call_count == 1
+        mock_ml.assert_not_called()
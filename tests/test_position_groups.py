@@ -13,11 +13,17 @@ from src.scheduler.position_group_manager import process_position_groups
 from src.scheduler.trade_scheduler import refresh_schedule
 from src.store.db import (
     compute_position_group_inventory,
+    get_group_execute_before,
+    get_open_position_group_tick_inputs,
     get_position_group,
     get_position_group_audit_events,
+    get_position_group_sizing_snapshot,
     log_merge_operation,
+    log_position_group_audit_events,
     log_result,
     log_signal,
+    update_position_group,
+    update_position_groups,
     upsert_position_group,
     upsert_trade_job,
 )
@@ -525,3 +531,104 @@ def test_refresh_schedule_creates_position_group_when_enabled(db_path: Path, mon
     assert group is not None
     assert group.state == "PLANNED"
     assert group.d_max == pytest.approx(33.0)
+
+
+def test_bulk_tick_inputs_match_per_group_queries(db_path: Path):
+    slugs = [f"nba-nyk-bos-2026-02-1{i}" for i in range(3)]
+    for i, slug in enumerate(slugs):
+        _insert_job(db_path, event_slug=slug, execute_before=f"2026-02-1{i}T01:00:00+00:00")
+        upsert_position_group(event_slug=slug, game_date="2026-02-10", db_path=db_path)
+    # group 0: both legs + merge, group 1: directional only, group 2: empty
+    _log_sig(
+        db_path,
+        event_slug=slugs[0],
+        signal_role="directional",
+        kelly_size=40.0,
+        poly_price=0.40,
+        order_status="filled",
+        expected_win_rate=0.7,
+    )
+    _log_sig(
+        db_path,
+        event_slug=slugs[0],
+        signal_role="hedge",
+        kelly_size=20.0,
+        poly_price=0.50,
+        order_status="filled",
+    )
+    _log_sig(
+        db_path,
+        event_slug=slugs[0],
+        signal_role="hedge",
+        kelly_size=5.0,
+        poly_price=0.55,
+        order_status="placed",
+    )
+    log_merge_operation(
+        bothside_group_id="bs-bulk",
+        condition_id="cond-bulk",
+        event_slug=slugs[0],
+        dir_shares=100.0,
+        hedge_shares=40.0,
+        merge_amount=15.0,
+        remainder_shares=25.0,
+        remainder_side="directional",
+        dir_vwap=0.40,
+        hedge_vwap=0.50,
+        combined_vwap=0.90,
+        status="executed",
+        db_path=db_path,
+    )
+    _log_sig(
+        db_path,
+        event_slug=slugs[1],
+        signal_role="directional",
+        kelly_size=6.0,
+        poly_price=0.30,
+        order_status="filled",
+        band_confidence="medium",
+    )
+    upsert_position_group(event_slug="nba-closed", game_date="2026-02-10", db_path=db_path)
+    update_position_group("nba-closed", state="CLOSED", db_path=db_path)
+
+    inputs = {ti.group.event_slug: ti for ti in get_open_position_group_tick_inputs(db_path)}
+    assert set(inputs) == set(slugs)
+    for slug in slugs:
+        ti = inputs[slug]
+        q_dir, q_opp, merged = compute_position_group_inventory(slug, db_path=db_path)
+        assert ti.q_dir == pytest.approx(q_dir)
+        assert ti.q_opp == pytest.approx(q_opp)
+        assert ti.merged_qty == pytest.approx(merged)
+        assert ti.sizing_snapshot == pytest.approx(
+            get_position_group_sizing_snapshot(slug, db_path=db_path)
+        )
+        assert ti.execute_before == get_group_execute_before(slug, db_path=db_path)
+
+
+def test_bulk_update_and_audit_insert(db_path: Path):
+    for slug in ("a", "b"):
+        upsert_position_group(event_slug=slug, game_date="2026-02-10", db_path=db_path)
+    count = update_position_groups(
+        [
+            {"event_slug": "a", "state": "ACQUIRE", "q_dir": 3.0},
+            {"event_slug": "b", "m_target": 7.0},
+        ],
+        db_path=db_path,
+    )
+    assert count == 2
+    a = get_position_group("a", db_path=db_path)
+    b = get_position_group("b", db_path=db_path)
+    assert a.state == "ACQUIRE" and a.q_dir == pytest.approx(3.0)
+    assert b.state == "PLANNED" and b.M_target == pytest.approx(7.0)
+
+    inserted = log_position_group_audit_events(
+        [
+            {"event_slug": "a", "prev_state": "PLANNED", "new_state": "ACQUIRE"},
+            {"event_slug": "a", "audit_type": "merge", "merge_amount": 2.0},
+        ],
+        db_path=db_path,
+    )
+    assert inserted == 2
+    events = get_position_group_audit_events("a", db_path=db_path)
+    assert [e.audit_type for e in events] == ["tick", "merge"]
+    assert events[1].merge_amount == pytest.approx(2.0)
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import numpy as np
+import pytest
+
 from src.sizing.liquidity import LiquiditySnapshot
 from src.sizing.position_sizer import (
     SizingResult,
     TargetOrderResult,
     calculate_position_size,
+    calculate_position_size_many,
     calculate_target_order_size,
 )
 
@@ -320,3 +324,32 @@ class TestCalculateTargetOrderSize:
         assert result.raw_gap == 41.25
         assert result.remaining_budget == 40.0
         assert result.per_entry_cap == 20.0
+
+
+class TestCalculatePositionSizeMany:
+    def test_matches_scalar(self):
+        # (kelly_usd, balance, depth, spread): no constraints / capital / liquidity /
+        # spread warn / spread skip / insufficient depth / max_position
+        rows = [
+            (50.0, None, None, None),
+            (50.0, 1000.0, None, None),
+            (50.0, None, 300.0, 2.0),
+            (50.0, 5000.0, 3000.0, 8.0),
+            (50.0, 5000.0, 3000.0, 12.0),
+            (50.0, 5000.0, 0.0, 2.0),
+            (500.0, 1e6, 1e6, 1.0),
+        ]
+        nan = float("nan")
+        cols = calculate_position_size_many(
+            np.array([r[0] for r in rows]),
+            np.array([nan if r[1] is None else r[1] for r in rows]),
+            np.array([nan if r[2] is None else r[2] for r in rows]),
+            np.array([nan if r[3] is None else r[3] for r in rows]),
+        )
+        for i, (kelly, balance, depth, spread) in enumerate(rows):
+            snap = None if depth is None else _make_snap(ask_depth_5c=depth, spread_pct=spread)
+            expected = calculate_position_size(kelly, balance_usd=balance, liquidity=snap)
+            assert round(cols.final_size_usd[i], 2) == pytest.approx(expected.final_size_usd)
+            assert cols.constraint_binding[i] == expected.constraint_binding
+            assert cols.liquidity_score[i] == expected.liquidity_score
+            assert cols.recommended_execution[i] == expected.recommended_execution
@@ -0,0 +1,221 @@
+"""Tests for price-crossing daemon triggers (src/scheduler/price_triggers.py)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.config import settings
+from src.connectors.market_ws import MarketDataFeed
+from src.scheduler.daemon import Wakeup, run_daemon
+from src.scheduler.price_triggers import (
+    PriceTrigger,
+    PriceTriggerEngine,
+    dca_triggers,
+    reprice_triggers,
+)
+from src.sizing.liquidity import liquidity_from_levels
+from src.store.models import JobTimerInput, SignalRecord
+
+T0 = datetime(2026, 2, 10, 20, 31, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _settings(monkeypatch):
+    monkeypatch.setattr(settings, "dca_favorable_price_pct", 0.0)
+    monkeypatch.setattr(settings, "dca_unfavorable_price_pct", 10.0)
+    monkeypatch.setattr(settings, "dca_max_price_spread", 0.15)
+    monkeypatch.setattr(settings, "dca_min_interval_min", 2)
+    monkeypatch.setattr(settings, "dca_cutoff_before_tipoff_min", 30)
+    monkeypatch.setattr(settings, "order_ttl_min", 5)
+    monkeypatch.setattr(settings, "order_min_price_move", 0.01)
+    monkeypatch.setattr(settings, "order_max_replaces", 3)
+
+
+def _job(**overrides) -> JobTimerInput:
+    # first entry 19:00, tipoff 01:30 → 5 slices at 90-min intervals (次は 22:00)
+    defaults = {
+        "job_id": 1,
+        "status": "dca_active",
+        "game_time_utc": "2026-02-11T01:30:00+00:00",
+        "execute_after": "2026-02-10T19:00:00+00:00",
+        "execute_before": "2026-02-11T01:30:00+00:00",
+        "retry_count": 0,
+        "dca_entries_count": 2,
+        "dca_max_entries": 5,
+        "first_entry_at": "2026-02-10T19:00:00+00:00",
+        "last_entry_at": "2026-02-10T20:30:00+00:00",
+        "token_id": "tok",
+        "first_entry_price": 0.40,
+    }
+    defaults.update(overrides)
+    return JobTimerInput(**defaults)
+
+
+def _order(**overrides) -> SignalRecord:
+    defaults = {
+        "id": 7, "game_title": "", "event_slug": "", "team": "", "side": "BUY",
+        "poly_price": 0.40, "book_prob": 0.5, "edge_pct": 0.0, "kelly_size": 1.0,
+        "token_id": "tok", "bookmakers_count": 0, "consensus_std": 0.0, "commence_time": "",
+        "created_at": "2026-02-10T20:00:00+00:00",
+        "order_placed_at": "2026-02-10T20:30:00+00:00",
+        "order_original_price": 0.40,
+    }
+    defaults.update(overrides)
+    return SignalRecord(**defaults)
+
+
+def _snap(token_id: str, bid: float, ask: float):
+    return liquidity_from_levels(token_id, [(ask, 100.0)], [(bid, 100.0)])
+
+
+class TestDcaTriggers:
+    def test_favorable_threshold_before_slice_due(self):
+        (t,) = dca_triggers([_job()], T0)
+        assert t.reason == "price_dca:1"
+        assert t.below == pytest.approx(0.40)
+        assert t.floor == pytest.approx(0.25)
+        assert t.active_from == datetime(2026, 2, 10, 20, 32, tzinfo=timezone.utc)
+
+    def test_deferred_slice_fires_below_unfavorable_bound(self):
+        now = datetime(2026, 2, 10, 22, 5, tzinfo=timezone.utc)
+        (t,) = dca_triggers([_job()], now)
+        assert t.below == pytest.approx(0.44)
+
+    def test_skips_completed_past_cutoff_and_non_dca(self):
+        jobs = [
+            _job(dca_entries_count=5),
+            _job(status="pending"),
+            _job(token_id=None),
+        ]
+        assert dca_triggers(jobs, T0) == []
+        assert dca_triggers([_job()], datetime(2026, 2, 11, 1, 0, tzinfo=timezone.utc)) == []
+
+    def test_matches_should_add_dca_entry_favorable_rule(self):
+        from src.strategy.dca_strategy import DCAConfig, DCAEntry, should_add_dca_entry
+
+        (t,) = dca_triggers([_job()], T0)
+        entries = [
+            DCAEntry(0.40, 10.0, datetime(2026, 2, 10, 19, 0, tzinfo=timezone.utc)),
+            DCAEntry(0.41, 10.0, datetime(2026, 2, 10, 20, 30, tzinfo=timezone.utc)),
+        ]
+        tipoff = datetime(2026, 2, 11, 1, 30, tzinfo=timezone.utc)
+        now = T0 + timedelta(minutes=5)
+        for bid, ask, expected in ((0.38, 0.40, True), (0.40, 0.42, False)):
+            snap = _snap("tok", bid, ask)
+            decision = should_add_dca_entry(snap.midpoint, entries, tipoff, now, DCAConfig())
+            assert t.crossed(snap, now) is expected
+            assert decision.should_buy is expected
+
+
+class TestRepriceTriggers:
+    def test_band_around_resting_price_after_ttl(self):
+        (t,) = reprice_triggers([_order()])
+        assert t.field == "best_ask"
+        assert t.active_from == datetime(2026, 2, 10, 20, 35, tzinfo=timezone.utc)
+        after_ttl = datetime(2026, 2, 10, 20, 36, tzinfo=timezone.utc)
+        # 再発注価格 = best_ask - 0.01。0.41 の ask なら 0.40 で据え置き
+        assert not t.crossed(_snap("tok", 0.39, 0.41), after_ttl)
+        assert t.crossed(_snap("tok", 0.40, 0.43), after_ttl)
+        assert t.crossed(_snap("tok", 0.37, 0.39), after_ttl)
+        assert not t.crossed(_snap("tok", 0.40, 0.43), after_ttl - timedelta(minutes=2))
+
+    def test_uses_resting_price_callback_and_skips_exhausted(self):
+        orders = [_order(), _order(id=8, order_replace_count=3)]
+        (t,) = reprice_triggers(orders, order_price=lambda o: 0.45)
+        assert t.reason == "price_reprice:7"
+        assert t.above == pytest.approx(0.47)
+
+
+class TestPriceTriggerEngine:
+    def test_fires_once_until_rearmed(self):
+        engine = PriceTriggerEngine(clock=lambda: T0)
+        trigger = PriceTrigger("tok", "price_dca:1", below=0.40)
+        engine.arm([trigger])
+
+        engine.on_price("tok", _snap("tok", 0.40, 0.42))
+        assert engine.drain() == []
+        engine.on_price("tok", _snap("tok", 0.37, 0.39))
+        engine.on_price("tok", _snap("tok", 0.36, 0.38))
+        assert engine.drain() == [Wakeup(T0, "price_dca:1")]
+        assert engine.armed_count() == 0
+
+        engine.arm([trigger])
+        engine.on_price("other", _snap("other", 0.1, 0.2))
+        assert engine.drain() == []
+
+    def test_feed_updates_drive_triggers_and_subscribe_tokens(self):
+        feed = MarketDataFeed("ws://unused")
+        engine = PriceTriggerEngine(feed, clock=lambda: T0)
+        engine.arm([PriceTrigger("tok", "price_dca:1", below=0.40)])
+        assert feed._tokens == {"tok"}
+
+        feed.handle_message({
+            "event_type": "book", "asset_id": "tok",
+            "bids": [{"price": "0.40", "size": "10"}], "asks": [{"price": "0.42", "size": "10"}],
+        })
+        assert engine.drain() == []
+        feed.handle_message({
+            "event_type": "price_change", "price_changes": [
+                {"asset_id": "tok", "price": "0.40", "size": "0", "side": "BUY"},
+                {"asset_id": "tok", "price": "0.37", "size": "5", "side": "BUY"},
+            ],
+        })
+        assert [w.reason for w in engine.drain()] == ["price_dca:1"]
+
+
+class _FakeStop:
+    def __init__(self, clock: list[datetime], until: datetime):
+        self.clock = clock
+        self.until = until
+
+    def is_set(self) -> bool:
+        return self.clock[0] >= self.until
+
+
+class _FakeTriggers:
+    """Fires a wakeup at given fake times; wait() advances the clock."""
+
+    def __init__(self, clock: list[datetime], fire_at: list[datetime]):
+        self.clock = clock
+        self.fire_at = sorted(fire_at)
+        self.pending: list[Wakeup] = []
+
+    def drain(self) -> list[Wakeup]:
+        out, self.pending = self.pending, []
+        return out
+
+    def wait(self, stop, timeout: float) -> bool:
+        target = self.clock[0] + timedelta(seconds=timeout)
+        if self.fire_at and self.fire_at[0] <= target:
+            self.clock[0] = max(self.clock[0], self.fire_at.pop(0))
+            self.pending.append(Wakeup(self.clock[0], "price_dca:1"))
+            return True
+        self.clock[0] = target
+        return False
+
+
+class TestRunDaemonWithTriggers:
+    def test_trigger_wakes_daemon_but_respects_min_interval(self):
+        clock = [T0]
+        ticks: list[tuple[datetime, list[str]]] = []
+        fire_early = T0 + timedelta(seconds=10)  # 前回 tick から 30s 未満 → 持ち越し
+        fire_late = T0 + timedelta(minutes=3)
+        triggers = _FakeTriggers(clock, [fire_early, fire_late])
+
+        run_daemon(
+            lambda refresh, due: ticks.append((clock[0], [w.reason for w in due])),
+            lambda now: [],
+            stop=_FakeStop(clock, T0 + timedelta(minutes=5)),
+            clock=lambda: clock[0],
+            refresh_interval_sec=900,
+            min_tick_interval_sec=30,
+            triggers=triggers,
+        )
+
+        assert ticks == [
+            (T0, []),
+            (T0 + timedelta(seconds=30), ["price_dca:1"]),
+            (fire_late, ["price_dca:1"]),
+        ]
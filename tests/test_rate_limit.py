@@ -0,0 +1,168 @@
+"""Tests for the token-bucket rate limiter."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.connectors.rate_limit import (
+    HostRateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+    parse_retry_after,
+    rate_limit_stats,
+    reset_rate_limiters,
+)
+
+
+class _FakeTime:
+    def __init__(self):
+        self.now = 0.0
+        self.slept: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, sec: float) -> None:
+        self.slept.append(sec)
+        self.now += sec
+
+
+class TestTokenBucket:
+    def test_burst_then_paced(self):
+        t = _FakeTime()
+        bucket = TokenBucket(rate=10, burst=3, clock=t.clock, sleep=t.sleep)
+        waits = [bucket.acquire() for _ in range(5)]
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(0.1)
+        assert waits[4] == pytest.approx(0.1)
+
+    def test_refills_over_time(self):
+        t = _FakeTime()
+        bucket = TokenBucket(rate=2, burst=2, clock=t.clock, sleep=t.sleep)
+        bucket.acquire()
+        bucket.acquire()
+        t.now += 1.0  # 2 トークン回復
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(0.5)
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class _Resp:
+    def __init__(self, status_code: int, retry_after: str | None = None):
+        self.status_code = status_code
+        self.headers = {"Retry-After": retry_after} if retry_after else {}
+
+
+def _limiter(t: _FakeTime, rate: float = 10, burst: int = 10, **kw) -> HostRateLimiter:
+    return HostRateLimiter("api.test", rate, burst, clock=t.clock, sleep=t.sleep, **kw)
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date_in_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_invalid(self):
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestHostRateLimiter:
+    def test_429_halves_rate_and_holds_requests(self):
+        t = _FakeTime()
+        lim = _limiter(t)
+        lim.on_response(429, retry_after=2.0)
+
+        assert lim.rate == 5.0
+        assert lim.acquire() == pytest.approx(2.0)
+        assert lim.stats().throttled == 1
+
+    def test_exponential_backoff_without_retry_after(self):
+        t = _FakeTime()
+        lim = _limiter(t, max_backoff_sec=3.0)
+        lim.on_response(429)
+        assert lim.acquire() == pytest.approx(1.0)
+        lim.on_response(429)
+        assert lim.acquire() == pytest.approx(2.0)
+        lim.on_response(429)
+        assert lim.acquire() == pytest.approx(3.0)  # max_backoff_sec で頭打ち
+
+    def test_rate_floor_and_recovery(self):
+        t = _FakeTime()
+        lim = _limiter(t)
+        for _ in range(10):
+            lim.on_response(429, retry_after=0)
+        assert lim.rate == pytest.approx(1.0)  # base の 10% が下限
+        for _ in range(20):
+            lim.on_response(200)
+        assert lim.rate == pytest.approx(10.0)
+
+    def test_send_retries_429(self):
+        t = _FakeTime()
+        lim = _limiter(t)
+        responses = iter([_Resp(429, "1"), _Resp(200)])
+
+        resp = lim.send(lambda: next(responses), max_retries=2)
+
+        assert resp.status_code == 200
+        assert t.slept == [pytest.approx(1.0)]
+        assert lim.stats().requests == 2
+
+    def test_send_gives_up_after_max_retries(self):
+        t = _FakeTime()
+        lim = _limiter(t)
+        resp = lim.send(lambda: _Resp(429, "0"), max_retries=1)
+        assert resp.status_code == 429
+        assert lim.stats().throttled == 2
+
+    def test_stats_utilization_and_reset(self):
+        t = _FakeTime()
+        lim = _limiter(t, rate=10, burst=10)
+        for _ in range(10):
+            lim.acquire()
+        t.now += 1.0  # 窓 1 秒 → 予算 10*1 + 10 = 20
+        stats = lim.stats()
+        assert stats.requests == 10
+        assert stats.utilization == pytest.approx(0.5)
+
+        lim.reset_stats()
+        assert lim.stats().requests == 0
+
+
+class TestRegistry:
+    @pytest.fixture(autouse=True)
+    def _fresh(self):
+        reset_rate_limiters()
+        yield
+        reset_rate_limiters()
+
+    def test_one_limiter_per_host(self):
+        a = get_rate_limiter("https://Example.com/a")
+        b = get_rate_limiter("https://example.com:443/b?x=1")
+        assert a is b
+        assert get_rate_limiter("https://other.com") is not a
+
+    def test_budgets_from_settings(self, monkeypatch):
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "polymarket_host", "https://clob.example")
+        monkeypatch.setattr(settings, "clob_requests_per_sec", 7.0)
+        monkeypatch.setattr(settings, "data_api_requests_per_sec", 1.5)
+        monkeypatch.setattr(settings, "http_default_requests_per_sec", 3.0)
+
+        assert get_rate_limiter("https://clob.example/book").base_rate == 7.0
+        assert get_rate_limiter("https://data-api.polymarket.com/activity").base_rate == 1.5
+        assert get_rate_limiter("https://cdn.nba.com/x").base_rate == 3.0
+
+    def test_stats_cover_all_hosts(self):
+        get_rate_limiter("https://a.test").acquire()
+        get_rate_limiter("https://b.test")
+        stats = {s.host: s.requests for s in rate_limit_stats(reset=True)}
+        assert stats == {"a.test": 1, "b.test": 0}
+        assert all(s.requests == 0 for s in rate_limit_stats())
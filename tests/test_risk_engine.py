@@ -422,6 +422,100 @@ class TestRiskStatePersistence:
         assert loaded is None
 
 
+class TestCrossProcessRiskCache:
+    """risk_state_cache: reuse across processes keyed by results/signals high-water marks."""
+
+    @pytest.fixture
+    def engine(self, tmp_db, monkeypatch):
+        from src.config import settings
+        from src.risk import risk_engine
+
+        calls = {"calibration": 0, "balance": 0}
+
+        def _flags(db_path, today_str):
+            calls["calibration"] += 1
+            return {"pnl_divergence_yellow"}
+
+        def _balance(fallback):
+            calls["balance"] += 1
+            return 1000.0
+
+        monkeypatch.setattr(settings, "risk_state_cache_ttl_sec", 300.0)
+        monkeypatch.setattr(risk_engine, "_calibration_flags", _flags)
+        monkeypatch.setattr(risk_engine, "_fetch_balance_safe", _balance)
+        self.calls = calls
+        return risk_engine
+
+    @staticmethod
+    def _new_process(risk_engine, monkeypatch):
+        # プロセス内キャッシュだけを捨てる (別プロセスからの読み込みに相当)
+        monkeypatch.setattr(risk_engine, "_cached_state", None)
+        monkeypatch.setattr(risk_engine, "_cached_at", 0.0)
+
+    def test_reused_until_rows_land(self, engine, tmp_db, monkeypatch):
+        signal_id = _insert_signal(tmp_db, kelly_size=10.0)
+        self._new_process(engine, monkeypatch)
+        first = engine.load_or_compute_risk_state(tmp_db)
+        assert first.open_exposure == 10.0
+
+        self._new_process(engine, monkeypatch)
+        again = engine.load_or_compute_risk_state(tmp_db)
+        assert again == first
+        assert self.calls == {"calibration": 1, "balance": 1}
+
+        # 新規シグナル: 残高/エクスポージャーのみ再計算
+        _insert_signal(tmp_db, kelly_size=5.0)
+        self._new_process(engine, monkeypatch)
+        partial = engine.load_or_compute_risk_state(tmp_db)
+        assert partial.open_exposure == 15.0
+        assert partial.flags == ["pnl_divergence_yellow"]
+        assert self.calls == {"calibration": 1, "balance": 2}
+
+        # 新規 result: 全再計算
+        _insert_result(tmp_db, signal_id, won=False, pnl=-10.0)
+        self._new_process(engine, monkeypatch)
+        full = engine.load_or_compute_risk_state(tmp_db)
+        assert full.daily_pnl == -10.0
+        assert full.consecutive_losses == 1
+        assert self.calls == {"calibration": 2, "balance": 3}
+
+    def test_new_snapshot_or_expiry_recomputes(self, engine, tmp_db, monkeypatch):
+        from src.config import settings
+        from src.store.db import save_risk_snapshot
+
+        self._new_process(engine, monkeypatch)
+        engine.load_or_compute_risk_state(tmp_db)
+        save_risk_snapshot(
+            RiskState(circuit_breaker_level=CircuitBreakerLevel.ORANGE, sizing_multiplier=0.0),
+            db_path=tmp_db,
+        )
+        self._new_process(engine, monkeypatch)
+        engine.load_or_compute_risk_state(tmp_db)
+        assert self.calls["balance"] == 2
+        assert self.calls["calibration"] == 1  # CB 状態の変化だけなら results 由来の値を再利用
+
+        monkeypatch.setattr(settings, "risk_state_cache_ttl_sec", 0.0)
+        self._new_process(engine, monkeypatch)
+        engine.load_or_compute_risk_state(tmp_db)
+        assert self.calls["calibration"] == 2
+
+    def test_invalidate_cache_keeps_persisted_state(self, engine, tmp_db, monkeypatch):
+        self._new_process(engine, monkeypatch)
+        engine.load_or_compute_risk_state(tmp_db)
+        engine.invalidate_cache()
+        engine.load_or_compute_risk_state(tmp_db)
+        assert self.calls == {"calibration": 1, "balance": 1}
+
+    def test_force_skips_persisted_state(self, engine, tmp_db, monkeypatch):
+        self._new_process(engine, monkeypatch)
+        engine.load_or_compute_risk_state(tmp_db)
+        engine.load_or_compute_risk_state(tmp_db, force=True)
+        assert self.calls["calibration"] == 2
+        self._new_process(engine, monkeypatch)
+        engine.load_or_compute_risk_state(tmp_db)
+        assert self.calls["calibration"] == 2
+
+
 # ---------------------------------------------------------------------------
 # Calibration drift detection
 # ---------------------------------------------------------------------------
@@ -0,0 +1,191 @@
+"""Tests for the incremental risk ledger (src/store/risk_ledger.py)."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from src.store.db import (
+    _connect,
+    get_consecutive_losses,
+    get_daily_results,
+    get_open_exposure,
+    get_performance,
+    get_weekly_results,
+    log_result,
+    log_signal,
+    rebuild_risk_ledger,
+    transaction,
+)
+
+BASE = datetime(2026, 1, 1, 18, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "ledger.db"
+
+
+def _signal(db_path: Path, i: int, role: str = "directional", kelly: float = 10.0) -> int:
+    return log_signal(
+        game_title=f"Game {i}",
+        event_slug=f"nba-g{i}",
+        team="Boston Celtics",
+        side="BUY",
+        poly_price=0.5,
+        book_prob=0.55,
+        edge_pct=5.0,
+        kelly_size=kelly,
+        token_id=f"tok{i}",
+        signal_role=role,
+        db_path=db_path,
+    )
+
+
+def _raw_result(db_path: Path, sid: int, won: bool, pnl: float, settled_at: str) -> None:
+    # log_result を通さない書き込み (バックフィル相当)
+    conn = _connect(db_path)
+    conn.execute(
+        """INSERT INTO results (signal_id, outcome, won, pnl, settled_at)
+           VALUES (?, 'x', ?, ?, ?)""",
+        (sid, int(won), pnl, settled_at),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _scan(db_path: Path) -> dict:
+    """Reference values computed the old way, by scanning every row."""
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(
+            """SELECT r.won, r.pnl, r.settled_at, s.signal_role
+               FROM results r JOIN signals s ON s.id = r.signal_id
+               ORDER BY r.settled_at, r.id""",
+        ).fetchall()
+        open_kelly = conn.execute(
+            """SELECT COALESCE(SUM(s.kelly_size), 0.0) FROM signals s
+               LEFT JOIN results r ON r.signal_id = s.id WHERE r.id IS NULL""",
+        ).fetchone()[0]
+    finally:
+        conn.close()
+    streak = 0
+    for row in reversed(rows):
+        if row["signal_role"] == "hedge":
+            continue
+        if row["won"]:
+            break
+        streak += 1
+    pnls = [r["pnl"] for r in rows]
+    cumulative = peak = max_dd = 0.0
+    for pnl in pnls:
+        cumulative += pnl
+        peak = max(peak, cumulative)
+        max_dd = max(max_dd, peak - cumulative)
+    sharpe = 0.0
+    if len(pnls) >= 2:
+        mean = sum(pnls) / len(pnls)
+        std = (sum((x - mean) ** 2 for x in pnls) / (len(pnls) - 1)) ** 0.5
+        sharpe = mean / std if std else 0.0
+    days: dict[str, float] = {}
+    for r in rows:
+        days[r["settled_at"][:10]] = days.get(r["settled_at"][:10], 0.0) + r["pnl"]
+    return {
+        "streak": streak,
+        "total": sum(pnls),
+        "wins": sum(1 for r in rows if r["won"]),
+        "max_dd": max_dd,
+        "sharpe": sharpe,
+        "open": open_kelly,
+        "days": days,
+    }
+
+
+def _assert_matches(db_path: Path) -> None:
+    ref = _scan(db_path)
+    stats = get_performance(db_path=db_path)
+    assert stats.total_pnl == pytest.approx(ref["total"])
+    assert stats.wins == ref["wins"]
+    assert stats.max_drawdown == pytest.approx(ref["max_dd"])
+    assert stats.sharpe_ratio == pytest.approx(ref["sharpe"])
+    assert get_consecutive_losses(db_path=db_path) == ref["streak"]
+    assert get_open_exposure(db_path=db_path) == pytest.approx(ref["open"])
+    for day, pnl in ref["days"].items():
+        assert get_daily_results(day, db_path=db_path)["pnl"] == pytest.approx(pnl)
+    last = max(ref["days"])
+    end = datetime.strptime(last, "%Y-%m-%d")
+    week = sum(
+        pnl for day, pnl in ref["days"].items()
+        if (end - datetime.strptime(day, "%Y-%m-%d")).days < 7
+    )
+    assert get_weekly_results(last, db_path=db_path)["pnl"] == pytest.approx(week)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_history_matches_full_scan(db_path: Path, seed: int):
+    rng = random.Random(seed)
+    sids = [
+        _signal(db_path, i, role=rng.choice(["directional", "directional", "hedge"]),
+                kelly=rng.uniform(5, 50))
+        for i in range(60)
+    ]
+    settled_at = BASE
+    for n, sid in enumerate(sids[:50]):
+        settled_at += timedelta(hours=rng.uniform(1, 20))
+        won = rng.random() < 0.5
+        pnl = rng.uniform(1, 30) if won else -rng.uniform(1, 30)
+        _raw_result(db_path, sid, won, pnl, settled_at.isoformat())
+        # 途中で読み出しを挟み増分適用を細切れにする
+        if n % 7 == 0:
+            get_open_exposure(db_path=db_path)
+    _assert_matches(db_path)
+
+
+def test_out_of_order_settlement_rederives_path(db_path: Path):
+    sids = [_signal(db_path, i) for i in range(4)]
+    _raw_result(db_path, sids[0], True, 10.0, "2026-01-05T12:00:00+00:00")
+    _raw_result(db_path, sids[1], False, -4.0, "2026-01-06T12:00:00+00:00")
+    get_performance(db_path=db_path)
+    # 過去日付のバックフィル: 最新の結果は依然 01-06 の負け
+    _raw_result(db_path, sids[2], False, -8.0, "2026-01-01T12:00:00+00:00")
+    _raw_result(db_path, sids[3], True, 3.0, "2026-01-02T12:00:00+00:00")
+    _assert_matches(db_path)
+    assert get_consecutive_losses(db_path=db_path) == 1
+
+
+def test_log_result_updates_ledger_in_same_transaction(db_path: Path):
+    sid = _signal(db_path, 0, kelly=20.0)
+    log_result(signal_id=sid, outcome="x", won=False, pnl=-20.0, db_path=db_path)
+    conn = _connect(db_path)
+    row = conn.execute("SELECT last_result_id, loss_streak FROM risk_ledger").fetchone()
+    conn.close()
+    assert tuple(row) == (1, 1)
+
+    sid2 = _signal(db_path, 1, kelly=15.0)
+    with pytest.raises(RuntimeError):
+        with transaction(db_path):
+            log_result(signal_id=sid2, outcome="x", won=True, pnl=15.0, db_path=db_path)
+            raise RuntimeError("abort")
+    # ロールバックで台帳も巻き戻る
+    assert get_consecutive_losses(db_path=db_path) == 1
+    assert get_open_exposure(db_path=db_path) == pytest.approx(15.0)
+
+
+def test_rebuild_after_deleting_results(db_path: Path):
+    sids = [_signal(db_path, i) for i in range(3)]
+    for i, sid in enumerate(sids):
+        _raw_result(db_path, sid, i != 1, 5.0 if i != 1 else -5.0,
+                    f"2026-01-0{i + 1}T12:00:00+00:00")
+    get_performance(db_path=db_path)
+
+    conn = _connect(db_path)
+    conn.execute("DELETE FROM results WHERE signal_id = ?", (sids[2],))
+    conn.commit()
+    conn.close()
+    ledger = rebuild_risk_ledger(db_path=db_path)
+    assert ledger["settled_count"] == 2
+    _assert_matches(db_path)
+    assert get_consecutive_losses(db_path=db_path) == 1
@@ -0,0 +1,283 @@
+"""Tests for the timer-driven scheduler daemon (src/scheduler/daemon.py)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from src.scheduler.daemon import TimerHeap, Wakeup, compute_wakeups, run_daemon
+from src.store.db import (
+    _connect,
+    get_open_job_timers,
+    log_signal,
+    upsert_trade_job,
+)
+from src.store.models import JobTimerInput, SignalRecord
+
+T0 = datetime(2026, 2, 10, 18, 0, tzinfo=timezone.utc)
+
+
+def _job(**overrides) -> JobTimerInput:
+    defaults = {
+        "job_id": 1,
+        "status": "pending",
+        "game_time_utc": "2026-02-11T01:00:00+00:00",
+        "execute_after": "2026-02-10T19:00:00+00:00",
+        "execute_before": "2026-02-11T01:00:00+00:00",
+        "retry_count": 0,
+        "dca_entries_count": 0,
+        "dca_max_entries": 1,
+        "first_entry_at": None,
+        "last_entry_at": None,
+    }
+    defaults.update(overrides)
+    return JobTimerInput(**defaults)
+
+
+def _reasons(wakeups: list[Wakeup]) -> dict[str, datetime]:
+    return {w.reason.split(":")[0]: w.when for w in wakeups}
+
+
+class TestTimerHeap:
+    def test_pop_due_returns_earliest_first(self):
+        heap = TimerHeap()
+        heap.push(Wakeup(T0 + timedelta(minutes=10), "b"))
+        heap.push(Wakeup(T0, "a"))
+        heap.push(Wakeup(T0 + timedelta(hours=1), "c"))
+
+        due = heap.pop_due(T0 + timedelta(minutes=10))
+
+        assert [w.reason for w in due] == ["a", "b"]
+        assert heap.peek().reason == "c"
+        assert len(heap) == 1
+
+    def test_empty_heap(self):
+        heap = TimerHeap()
+        assert heap.peek() is None
+        assert heap.pop_due(T0) == []
+
+
+class TestComputeWakeups:
+    def test_pending_before_window(self):
+        wakeups = _reasons(compute_wakeups([_job()], T0))
+        assert wakeups["window_open"] == datetime(2026, 2, 10, 19, tzinfo=timezone.utc)
+        assert wakeups["window_close"] == datetime(2026, 2, 11, 1, tzinfo=timezone.utc)
+
+    def test_deferred_pending_in_window_is_due_now(self):
+        now = T0 + timedelta(hours=2)
+        wakeups = _reasons(compute_wakeups([_job()], now, deferred_job_ids={1}))
+        assert wakeups["in_window"] == now
+        assert "window_open" not in wakeups
+
+    def test_pending_in_window_not_deferred_is_polled(self):
+        # hedge の directional 約定待ちなど、tick しても進まない pending は即 tick しない
+        now = T0 + timedelta(hours=2)
+        wakeups = _reasons(compute_wakeups([_job()], now, deferred_job_ids={2}))
+        assert "in_window" not in wakeups
+        assert wakeups["pending_poll"] == now + timedelta(minutes=5)
+
+    def test_halted_suppresses_job_wakeups(self):
+        now = T0 + timedelta(hours=2)
+        order = SignalRecord(
+            id=7, game_title="", event_slug="", team="", side="BUY", poly_price=0.4,
+            book_prob=0.5, edge_pct=0.0, kelly_size=1.0, token_id="t", bookmakers_count=0,
+            consensus_std=0.0, commence_time="", created_at="2026-02-10T19:55:00+00:00",
+        )
+        wakeups = compute_wakeups([_job()], now, [order], deferred_job_ids={1}, halted=True)
+        assert [w.reason for w in wakeups] == ["order_ttl:7"]
+
+    def test_failed_retry_is_delayed(self):
+        now = T0 + timedelta(hours=2)
+        wakeups = _reasons(compute_wakeups([_job(status="failed", retry_count=1)], now))
+        assert wakeups["retry"] > now
+
+    def test_failed_exhausted_only_expires(self):
+        job = _job(status="failed", retry_count=99)
+        wakeups = _reasons(compute_wakeups([job], T0 + timedelta(hours=2)))
+        assert set(wakeups) == {"window_close"}
+
+    def test_dca_next_slice_matches_twap(self):
+        # first entry 19:00, tipoff 01:30, cutoff 30 分前 → 5 slices at 90-min intervals
+        job = _job(
+            status="dca_active",
+            game_time_utc="2026-02-11T01:30:00+00:00",
+            dca_entries_count=2,
+            dca_max_entries=5,
+            first_entry_at="2026-02-10T19:00:00+00:00",
+            last_entry_at="2026-02-10T20:30:00+00:00",
+        )
+        now = datetime(2026, 2, 10, 20, 31, tzinfo=timezone.utc)
+        wakeups = _reasons(compute_wakeups([job], now))
+        assert wakeups["dca_slice"] == datetime(2026, 2, 10, 22, 0, tzinfo=timezone.utc)
+        assert wakeups["dca_cutoff"] == datetime(2026, 2, 11, 1, 0, tzinfo=timezone.utc)
+
+    def test_dca_slice_respects_min_interval(self):
+        job = _job(
+            status="dca_active",
+            game_time_utc="2026-02-11T01:30:00+00:00",
+            dca_entries_count=2,
+            dca_max_entries=5,
+            first_entry_at="2026-02-10T19:00:00+00:00",
+            last_entry_at="2026-02-10T21:59:00+00:00",  # favorable で前倒し購入済み
+        )
+        now = datetime(2026, 2, 10, 21, 59, tzinfo=timezone.utc)
+        wakeups = _reasons(compute_wakeups([job], now))
+        assert wakeups["dca_slice"] == datetime(2026, 2, 10, 22, 1, tzinfo=timezone.utc)
+
+    def test_dca_completed_has_no_slice(self):
+        job = _job(
+            status="dca_active",
+            dca_entries_count=5,
+            dca_max_entries=5,
+            first_entry_at="2026-02-10T19:00:00+00:00",
+            last_entry_at="2026-02-10T23:00:00+00:00",
+        )
+        wakeups = _reasons(compute_wakeups([job], T0 + timedelta(hours=5)))
+        assert "dca_slice" not in wakeups
+        assert "dca_poll" not in wakeups
+
+    def test_order_ttl(self):
+        order = SignalRecord(
+            id=7, game_title="", event_slug="", team="", side="BUY", poly_price=0.4,
+            book_prob=0.5, edge_pct=0.0, kelly_size=1.0, token_id="t", bookmakers_count=0,
+            consensus_std=0.0, commence_time="", created_at="2026-02-10T17:55:00+00:00",
+            order_placed_at="2026-02-10T17:58:00+00:00",
+        )
+        wakeups = compute_wakeups([], T0, [order])
+        assert wakeups == [Wakeup(datetime(2026, 2, 10, 18, 3, tzinfo=timezone.utc), "order_ttl:7")]
+
+
+class _FakeStop:
+    """threading.Event stand-in whose wait() advances a fake clock."""
+
+    def __init__(self, clock: list[datetime], until: datetime):
+        self.clock = clock
+        self.until = until
+        self.waits: list[float] = []
+
+    def is_set(self) -> bool:
+        return self.clock[0] >= self.until
+
+    def wait(self, timeout: float) -> bool:
+        self.waits.append(timeout)
+        self.clock[0] += timedelta(seconds=timeout)
+        return self.is_set()
+
+
+class TestRunDaemon:
+    def _run(self, wakeups, until, **kwargs):
+        clock = [T0]
+        ticks: list[tuple[datetime, bool, list[str]]] = []
+
+        def tick(refresh, due):
+            ticks.append((clock[0], refresh, [w.reason for w in due]))
+
+        def load(now):
+            return [w for w in wakeups if w.when > now]
+
+        stop = _FakeStop(clock, until)
+        count = run_daemon(
+            tick, load, stop=stop, clock=lambda: clock[0],
+            refresh_interval_sec=900, min_tick_interval_sec=30, **kwargs,
+        )
+        return count, ticks
+
+    def test_wakes_exactly_at_due_time(self):
+        slice_at = T0 + timedelta(minutes=7, seconds=13)
+        count, ticks = self._run([Wakeup(slice_at, "dca_slice:1")], T0 + timedelta(minutes=10))
+
+        assert count == 2
+        assert ticks[0] == (T0, True, [])
+        assert ticks[1] == (slice_at, False, ["dca_slice:1"])
+
+    def test_periodic_refresh_keeps_heartbeat_alive(self):
+        count, ticks = self._run([], T0 + timedelta(minutes=31))
+        assert [t[0] for t in ticks] == [T0, T0 + timedelta(minutes=15), T0 + timedelta(minutes=30)]
+        assert all(t[1] for t in ticks)
+
+    def test_min_tick_interval_prevents_spinning(self):
+        # 常に past-due なウェイクアップでも min_tick_interval (30s) ごとにしか tick しない
+        clock = [T0]
+        ticks = []
+        stop = _FakeStop(clock, T0 + timedelta(minutes=2))
+        count = run_daemon(
+            lambda refresh, due: ticks.append(clock[0]),
+            lambda now: [Wakeup(now - timedelta(minutes=1), "in_window:1")],
+            stop=stop, clock=lambda: clock[0],
+            refresh_interval_sec=900, min_tick_interval_sec=30,
+        )
+        assert count == 4
+        assert all(b - a == timedelta(seconds=30) for a, b in zip(ticks, ticks[1:]))
+
+    def test_tick_exception_does_not_stop_daemon(self):
+        clock = [T0]
+        calls = []
+
+        def tick(refresh, due):
+            calls.append(clock[0])
+            raise RuntimeError("boom")
+
+        stop = _FakeStop(clock, T0 + timedelta(minutes=20))
+        count = run_daemon(
+            tick, lambda now: [], stop=stop, clock=lambda: clock[0],
+            refresh_interval_sec=600, min_tick_interval_sec=30,
+        )
+        assert count == 2
+
+    def test_max_ticks(self):
+        count, _ = self._run([], T0 + timedelta(days=1), max_ticks=1)
+        assert count == 1
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "test_daemon.db"
+
+
+class TestGetOpenJobTimers:
+    def test_returns_open_jobs_with_dca_entry_times(self, db_path: Path):
+        for slug in ("nba-nyk-bos-2026-02-10", "nba-was-mia-2026-02-10"):
+            upsert_trade_job(
+                game_date="2026-02-10",
+                event_slug=slug,
+                home_team="Boston Celtics",
+                away_team="New York Knicks",
+                game_time_utc="2026-02-11T01:00:00+00:00",
+                execute_after="2026-02-10T17:00:00+00:00",
+                execute_before="2026-02-11T01:00:00+00:00",
+                db_path=db_path,
+            )
+        for created_at in ("2026-02-10T17:05:00+00:00", "2026-02-10T18:35:00+00:00"):
+            sid = log_signal(
+                game_title="Knicks vs Celtics", event_slug="nba-nyk-bos-2026-02-10",
+                team="Celtics", side="BUY", poly_price=0.4, book_prob=0.6, edge_pct=5.0,
+                kelly_size=25.0, token_id="tok", dca_group_id="grp-1", db_path=db_path,
+            )
+            conn = _connect(db_path)
+            conn.execute("UPDATE signals SET created_at = ? WHERE id = ?", (created_at, sid))
+            conn.commit()
+            conn.close()
+
+        conn = _connect(db_path)
+        conn.execute(
+            """UPDATE trade_jobs SET status='dca_active', dca_entries_count=2,
+               dca_max_entries=5, dca_group_id='grp-1'
+               WHERE event_slug='nba-nyk-bos-2026-02-10'""",
+        )
+        conn.execute(
+            "UPDATE trade_jobs SET status='executed' WHERE event_slug='nba-was-mia-2026-02-10'",
+        )
+        conn.commit()
+        conn.close()
+
+        timers = get_open_job_timers(db_path)
+
+        assert len(timers) == 1
+        t = timers[0]
+        assert t.status == "dca_active"
+        assert (t.dca_entries_count, t.dca_max_entries) == (2, 5)
+        assert t.first_entry_at == "2026-02-10T17:05:00+00:00"
+        assert t.last_entry_at == "2026-02-10T18:35:00+00:00"
+        assert (t.token_id, t.first_entry_price) == ("tok", 0.4)
@@ -51,11 +51,11 @@ def test_process_eligible_jobs_passes_configured_max_retries(monkeypatch, tmp_pa
 
     monkeypatch.setattr("src.scheduler.trade_scheduler.recover_executing_jobs", lambda **_: 0)
 
-    def _fake_get_eligible(now_utc: str, max_retries: int, db_path: str):
+    def _fake_claim_eligible(now_utc: str, max_retries: int, worker_id, lease_sec, db_path: str):
         captured["max_retries"] = max_retries
         return []
 
-    monkeypatch.setattr("src.scheduler.trade_scheduler.get_eligible_jobs", _fake_get_eligible)
+    monkeypatch.setattr("src.scheduler.trade_scheduler.claim_eligible_jobs", _fake_claim_eligible)
     monkeypatch.setattr("src.scheduler.trade_scheduler.settings.schedule_max_retries", 7)
 
     process_eligible_jobs(execution_mode="paper", db_path=db_path)
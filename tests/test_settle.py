@@ -110,6 +110,12 @@ class TestCalcPnl:
         assert pnl == -50.0
 
 
+@pytest.fixture(autouse=True)
+def _tmp_default_db(tmp_path, monkeypatch):
+    """auto_settle() without db_path must not touch data/paper_trades.db."""
+    monkeypatch.setattr("src.store.db.DEFAULT_DB_PATH", tmp_path / "settle.db")
+
+
 class TestAutoSettle:
     @patch("src.connectors.nba_schedule.fetch_todays_games")
     @patch("src.store.db.get_unsettled")
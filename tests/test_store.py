@@ -7,17 +7,20 @@ from pathlib import Path
 
 import pytest
 
+from src.store import schema
 from src.store.db import (
-    _calc_max_drawdown,
-    _calc_sharpe,
     _connect,
     get_all_results,
     get_all_signals,
     get_performance,
+    get_signal_by_id,
     get_unsettled,
     log_result,
     log_signal,
+    transaction,
+    update_order_status,
 )
+from src.store.schema import SCHEMA_VERSION
 
 
 @pytest.fixture()
@@ -71,6 +74,77 @@ class TestConnect:
         conn2 = _connect(db_path)
         conn2.close()
 
+    def test_stamps_schema_version(self, db_path: Path):
+        """Migration records SCHEMA_VERSION in PRAGMA user_version."""
+        conn = _connect(db_path)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        conn.close()
+        assert version == SCHEMA_VERSION
+
+    def test_migrates_only_once(self, db_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Opening an up-to-date DB skips the DDL pass."""
+        _connect(db_path).close()
+        calls: list[int] = []
+        monkeypatch.setattr(schema, "_migrate", lambda conn: calls.append(1))
+        _connect(db_path).close()
+        assert calls == []
+
+    def test_legacy_db_is_migrated(self, db_path: Path):
+        """A pre-versioning DB (user_version=0) gets the missing columns."""
+        raw = sqlite3.connect(str(db_path))
+        raw.executescript(schema.SCHEMA_SQL)
+        raw.close()
+        conn = _connect(db_path)
+        cols = {r[1] for r in conn.execute("PRAGMA table_info(signals)").fetchall()}
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        conn.close()
+        assert "order_placed_at" in cols
+        assert version == SCHEMA_VERSION
+
+
+class TestTransaction:
+    def test_writes_commit_once_at_exit(self, db_path: Path):
+        """Writes inside the block are invisible to other connections until exit."""
+        _connect(db_path).close()
+        with transaction(db_path):
+            sid = _insert_signal(db_path)
+            update_order_status(sid, "order-1", "placed", db_path=db_path)
+            other = sqlite3.connect(str(db_path))
+            assert other.execute("SELECT COUNT(*) FROM signals").fetchone()[0] == 0
+            other.close()
+        signals = get_all_signals(db_path=db_path)
+        assert len(signals) == 1
+        assert signals[0].order_status == "placed"
+
+    def test_reads_see_own_writes(self, db_path: Path):
+        with transaction(db_path):
+            sid = _insert_signal(db_path)
+            assert get_signal_by_id(sid, db_path=db_path) is not None
+
+    def test_rollback_on_error(self, db_path: Path):
+        with pytest.raises(RuntimeError):
+            with transaction(db_path):
+                _insert_signal(db_path)
+                raise RuntimeError("boom")
+        assert get_all_signals(db_path=db_path) == []
+
+    def test_nested_blocks_join_outer(self, db_path: Path):
+        with pytest.raises(RuntimeError):
+            with transaction(db_path) as outer:
+                with transaction(db_path) as inner:
+                    assert inner is outer
+                    _insert_signal(db_path)
+                raise RuntimeError("boom")
+        assert get_all_signals(db_path=db_path) == []
+
+    def test_other_db_not_affected(self, db_path: Path, tmp_path: Path):
+        other_db = tmp_path / "other.db"
+        with transaction(db_path):
+            _insert_signal(other_db)
+            raw = sqlite3.connect(str(other_db))
+            assert raw.execute("SELECT COUNT(*) FROM signals").fetchone()[0] == 1
+            raw.close()
+
 
 class TestLogSignal:
     def test_returns_row_id(self, db_path: Path):
@@ -185,37 +259,48 @@ class TestGetPerformance:
         assert stats.max_drawdown == 0.0
 
 
-class TestCalcMaxDrawdown:
-    def test_empty(self):
-        assert _calc_max_drawdown([]) == 0.0
+def _performance_for(db_path: Path, pnls: list[float]):
+    """get_performance after settling one signal per P&L value, in order."""
+    for pnl in pnls:
+        sid = _insert_signal(db_path)
+        log_result(
+            signal_id=sid, outcome="Boston Celtics", won=pnl > 0, pnl=pnl, db_path=db_path,
+        )
+    return get_performance(db_path=db_path)
+
+
+class TestPerformanceMaxDrawdown:
+    def test_empty(self, db_path: Path):
+        assert _performance_for(db_path, []).max_drawdown == 0.0
 
-    def test_no_drawdown(self):
-        assert _calc_max_drawdown([10, 20, 30]) == 0.0
+    def test_no_drawdown(self, db_path: Path):
+        assert _performance_for(db_path, [10, 20, 30]).max_drawdown == 0.0
 
-    def test_single_drawdown(self):
+    def test_single_drawdown(self, db_path: Path):
         # cumulative: 10, 5, 15 → peak=10, dd=5 at step 2
-        assert _calc_max_drawdown([10, -5, 10]) == 5.0
+        assert _performance_for(db_path, [10, -5, 10]).max_drawdown == 5.0
 
-    def test_multiple_drawdowns(self):
+    def test_multiple_drawdowns(self, db_path: Path):
         # cumulative: 10, 5, 25, 5 → max dd = 25-5 = 20
-        assert _calc_max_drawdown([10, -5, 20, -20]) == 20.0
+        assert _performance_for(db_path, [10, -5, 20, -20]).max_drawdown == 20.0
 
 
-class TestCalcSharpe:
-    def test_empty(self):
-        assert _calc_sharpe([]) == 0.0
+class TestPerformanceSharpe:
+    def test_empty(self, db_path: Path):
+        assert _performance_for(db_path, []).sharpe_ratio == 0.0
 
-    def test_single_value(self):
-        assert _calc_sharpe([10]) == 0.0
+    def test_single_value(self, db_path: Path):
+        assert _performance_for(db_path, [10]).sharpe_ratio == 0.0
 
-    def test_zero_std(self):
+    def test_zero_std(self, db_path: Path):
         """All same values → std=0 → Sharpe=0."""
-        assert _calc_sharpe([5, 5, 5]) == 0.0
+        assert _performance_for(db_path, [5, 5, 5]).sharpe_ratio == 0.0
 
-    def test_positive_sharpe(self):
-        sr = _calc_sharpe([10, 12, 11, 13, 10])
-        assert sr > 0
+    def test_positive_sharpe(self, db_path: Path):
+        # mean=11.2, sample std=sqrt(1.7)
+        sr = _performance_for(db_path, [10, 12, 11, 13, 10]).sharpe_ratio
+        assert sr == pytest.approx(11.2 / 1.7**0.5)
 
-    def test_negative_sharpe(self):
-        sr = _calc_sharpe([-10, -12, -11, -13, -10])
+    def test_negative_sharpe(self, db_path: Path):
+        sr = _performance_for(db_path, [-10, -12, -11, -13, -10]).sharpe_ratio
         assert sr < 0
@@ -117,7 +117,7 @@ class TestSendMessage:
                 pass
 
         monkeypatch.setattr(
-            "src.notifications.telegram.httpx.post",
+            "src.notifications.telegram.http_post",
             lambda *a, **kw: MockResponse(),
         )
         assert send_message("hello") is True
@@ -129,7 +129,7 @@ class TestSendMessage:
         def raise_error(*a, **kw):
             raise Exception("network error")
 
-        monkeypatch.setattr("src.notifications.telegram.httpx.post", raise_error)
+        monkeypatch.setattr("src.notifications.telegram.http_post", raise_error)
         assert send_message("hello") is False
 
     def test_markdown_400_falls_back_to_plain_text(self, monkeypatch):
@@ -152,7 +152,7 @@ class TestSendMessage:
 
             return OkResponse()
 
-        monkeypatch.setattr("src.notifications.telegram.httpx.post", mock_post)
+        monkeypatch.setattr("src.notifications.telegram.http_post", mock_post)
 
         result = send_message("text with _underscore_")
         assert result is True
@@ -171,7 +171,7 @@ class TestSendMessage:
             resp = httpx.Response(500, request=httpx.Request("POST", url))
             raise httpx.HTTPStatusError("Server Error", request=resp.request, response=resp)
 
-        monkeypatch.setattr("src.notifications.telegram.httpx.post", mock_post)
+        monkeypatch.setattr("src.notifications.telegram.http_post", mock_post)
 
         result = send_message("hello")
         assert result is False
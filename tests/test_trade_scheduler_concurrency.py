@@ -0,0 +1,187 @@
+"""Tests for concurrent job processing in process_eligible_jobs."""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.scheduler.job_executor import JobResult
+from src.scheduler.trade_scheduler import OrderSlots, process_eligible_jobs
+
+
+def _job(job_id: int, slug: str, side: str = "directional") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=job_id,
+        event_slug=slug,
+        job_side=side,
+        away_team="New York Knicks",
+        home_team="Boston Celtics",
+        game_date="2026-02-10",
+    )
+
+
+@pytest.fixture()
+def scheduler(monkeypatch):
+    """Patch the DB/network edges of process_eligible_jobs; returns a job registry."""
+    state = {"jobs": [], "status": {}, "calls": []}
+    monkeypatch.setattr("src.scheduler.trade_scheduler.recover_executing_jobs", lambda **_: 0)
+    monkeypatch.setattr(
+        "src.scheduler.trade_scheduler.claim_eligible_jobs",
+        lambda now_utc, max_retries, worker_id, lease_sec, db_path: state["jobs"],
+    )
+    monkeypatch.setattr("src.scheduler.trade_scheduler.renew_job_lease", lambda *_a, **_k: True)
+    monkeypatch.setattr("src.scheduler.trade_scheduler.release_job_claims", lambda *_a, **_k: 0)
+    monkeypatch.setattr(
+        "src.scheduler.trade_scheduler.update_job_status",
+        lambda job_id, status, **_: state["status"].__setitem__(job_id, status),
+    )
+    monkeypatch.setattr("src.scheduler.trade_scheduler.settings.job_concurrency", 4)
+    return state
+
+
+def _patch_job_runner(monkeypatch, state, delay: float = 0.0, status: str = "executed", fail=()):
+    lock = threading.Lock()
+
+    def _fake(job, *args, **kwargs):
+        with lock:
+            state["calls"].append((job.id, time.monotonic()))
+        time.sleep(delay)
+        if job.id in fail:
+            raise RuntimeError("boom")
+        return JobResult(job.id, job.event_slug, status, signal_id=job.id), None
+
+    monkeypatch.setattr("src.scheduler.job_executor.process_single_job", _fake)
+    monkeypatch.setattr(
+        "src.scheduler.hedge_executor.process_hedge_job",
+        lambda job, *a, **k: _fake(job)[0],
+    )
+
+
+class TestOrderSlots:
+    def test_stops_after_limit_executed(self):
+        slots = OrderSlots(2)
+        for _ in range(2):
+            assert slots.acquire()
+            slots.release(executed=True)
+        assert not slots.acquire()
+
+    def test_non_executed_jobs_free_their_slot(self):
+        slots = OrderSlots(1)
+        assert slots.acquire()
+        slots.release(executed=False)
+        assert slots.acquire()
+
+    def test_zero_limit(self):
+        assert not OrderSlots(0).acquire()
+
+    def test_waits_for_in_flight_job(self):
+        slots = OrderSlots(1)
+        assert slots.acquire()
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(slots.acquire()))
+        waiter.start()
+        time.sleep(0.05)
+        assert acquired == []  # in-flight が埋めている間は待つ
+        slots.release(executed=False)
+        waiter.join(timeout=1)
+        assert acquired == [True]
+
+    def test_concurrent_workers_never_exceed_limit(self):
+        slots = OrderSlots(3)
+        executed = []
+
+        def worker():
+            if slots.acquire():
+                time.sleep(0.01)
+                executed.append(1)
+                slots.release(executed=True)
+
+        threads = [threading.Thread(target=worker) for _ in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(executed) == 3
+
+
+class TestProcessEligibleJobsConcurrency:
+    def test_games_run_in_parallel(self, scheduler, monkeypatch):
+        monkeypatch.setattr("src.scheduler.trade_scheduler.settings.max_orders_per_tick", 10)
+        scheduler["jobs"] = [_job(i, f"nba-g{i}-2026-02-10") for i in range(4)]
+        _patch_job_runner(monkeypatch, scheduler, delay=0.2)
+
+        results = process_eligible_jobs("paper", db_path="unused.db")
+
+        assert [r.job_id for r in results] == [0, 1, 2, 3]
+        assert all(r.status == "executed" for r in results)
+        # 4 ゲームとも最初のジョブ完了を待たずに着手 (直列なら 0.2s 間隔)
+        starts = [t for _, t in scheduler["calls"]]
+        assert max(starts) - min(starts) < 0.15
+
+    def test_max_orders_per_tick_is_global(self, scheduler, monkeypatch):
+        monkeypatch.setattr("src.scheduler.trade_scheduler.settings.max_orders_per_tick", 2)
+        scheduler["jobs"] = [_job(i, f"nba-g{i}-2026-02-10") for i in range(6)]
+        _patch_job_runner(monkeypatch, scheduler, delay=0.05)
+
+        results = process_eligible_jobs("paper", db_path="unused.db")
+
+        assert len([r for r in results if r.status == "executed"]) == 2
+        assert len(scheduler["calls"]) == 2  # 残りは着手せず次 tick へ
+
+    def test_skipped_jobs_do_not_consume_budget(self, scheduler, monkeypatch):
+        monkeypatch.setattr("src.scheduler.trade_scheduler.settings.max_orders_per_tick", 1)
+        scheduler["jobs"] = [_job(i, f"nba-g{i}-2026-02-10") for i in range(3)]
+        _patch_job_runner(monkeypatch, scheduler, status="skipped")
+
+        results = process_eligible_jobs("paper", db_path="unused.db")
+
+        assert [r.status for r in results] == ["skipped"] * 3
+
+    def test_same_game_jobs_run_in_order(self, scheduler, monkeypatch):
+        monkeypatch.setattr("src.scheduler.trade_scheduler.settings.max_orders_per_tick", 10)
+        slug = "nba-nyk-bos-2026-02-10"
+        scheduler["jobs"] = [_job(1, slug), _job(2, slug, side="hedge")]
+        _patch_job_runner(monkeypatch, scheduler, delay=0.05)
+
+        process_eligible_jobs("paper", db_path="unused.db")
+
+        calls = dict(scheduler["calls"])
+        assert calls[2] - calls[1] >= 0.05
+
+    def test_worker_error_is_isolated(self, scheduler, monkeypatch):
+        monkeypatch.setattr("src.scheduler.trade_scheduler.settings.max_orders_per_tick", 10)
+        scheduler["jobs"] = [_job(i, f"nba-g{i}-2026-02-10") for i in range(3)]
+        _patch_job_runner(monkeypatch, scheduler, fail={1})
+
+        results = process_eligible_jobs("paper", db_path="unused.db")
+
+        assert [r.status for r in results] == ["executed", "failed", "executed"]
+        assert scheduler["status"] == {1: "failed"}
+
+    def test_live_orders_from_parallel_games_are_batched(self, scheduler, monkeypatch):
+        from src.connectors.polymarket import OrderPlacement
+
+        monkeypatch.setattr("src.scheduler.trade_scheduler.settings.max_orders_per_tick", 10)
+        monkeypatch.setattr("src.scheduler.trade_scheduler.settings.order_batch_window_ms", 200)
+        scheduler["jobs"] = [_job(i, f"nba-g{i}-2026-02-10") for i in range(3)]
+        batches = []
+
+        def fake_batch(requests):
+            batches.append([r.token_id for r in requests])
+            return [OrderPlacement(r, response={"orderID": f"o-{r.token_id}"}) for r in requests]
+
+        def fake_job(job, mode, path, ml, scan, log_signal, place_limit_buy, *a, **k):
+            assert place_limit_buy(f"tok{job.id}", 0.4, 10.0) == {"orderID": f"o-tok{job.id}"}
+            return JobResult(job.id, job.event_slug, "executed", signal_id=job.id), None
+
+        monkeypatch.setattr("src.connectors.order_batcher.place_limit_buys_batch", fake_batch)
+        monkeypatch.setattr("src.scheduler.job_executor.process_single_job", fake_job)
+
+        results = process_eligible_jobs("live", db_path="unused.db")
+
+        assert [r.status for r in results] == ["executed"] * 3
+        assert len(batches) == 1
+        assert sorted(batches[0]) == ["tok0", "tok1", "tok2"]